@@ -0,0 +1,89 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares the throughput of the vectorized entity row Avro writer against
+pandavro, which converts every row into a record first.
+
+Usage:
+    python benchmarks/entity_avro.py --rows 1000000 --codec deflate
+"""
+
+import argparse
+import io
+import time
+
+import fastavro
+import numpy as np
+import pandas as pd
+from pandavro import to_avro
+
+from feast.constants import DATETIME_COLUMN
+from feast.loaders.avro import write_entity_rows_avro
+
+
+def make_entity_rows(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            DATETIME_COLUMN: pd.date_range(
+                "2020-01-01", periods=rows, freq="s", tz="UTC"
+            ),
+            "driver_id": rng.integers(0, 1_000_000, rows),
+            "customer_id": rng.integers(0, 1_000_000, rows).astype(np.int32),
+            "city": rng.choice(["jakarta", "singapore", "bangkok"], rows),
+        }
+    )
+
+
+def write_pandavro(df, codec):
+    buffer = io.BytesIO()
+    df = df.rename(columns={DATETIME_COLUMN: "event_timestamp"})
+    to_avro(buffer, df, codec=codec)
+    return buffer.getvalue()
+
+
+def write_vectorized(df, codec):
+    buffer = io.BytesIO()
+    write_entity_rows_avro(df, buffer, codec=codec)
+    return buffer.getvalue()
+
+
+def run(name, func, df, codec):
+    start = time.perf_counter()
+    data = func(df, codec)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:<11} {elapsed:8.3f}s {len(df) / elapsed:12,.0f} rows/s "
+        f"{len(data) / 2 ** 20:8,.1f} MiB"
+    )
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--codec", default="null")
+    args = parser.parse_args()
+
+    df = make_entity_rows(args.rows)
+    expected = run("pandavro", write_pandavro, df, args.codec)
+    actual = run("vectorized", write_vectorized, df, args.codec)
+    records = zip(
+        fastavro.reader(io.BytesIO(expected)), fastavro.reader(io.BytesIO(actual))
+    )
+    assert all(a == b for a, b in records), "Writers produced different records"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares converting a DataFrame to FeatureRows column by column against
+converting every row with the per-row functions of feast.type_map.
+
+Usage:
+    python benchmarks/feature_rows_from_df.py --rows 100000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from feast.entity import Entity
+from feast.feature_set import Feature, FeatureSet
+from feast.type_map import (
+    convert_df_to_feature_row_protos,
+    convert_df_to_feature_rows,
+    convert_dict_to_proto_values,
+)
+from feast.value_type import ValueType
+
+
+def make_feature_set() -> FeatureSet:
+    feature_set = FeatureSet(
+        "driver",
+        project="benchmark",
+        entities=[Entity(name="driver_id", dtype=ValueType.INT64)],
+        features=[
+            Feature(name="trips", dtype=ValueType.INT32),
+            Feature(name="rating", dtype=ValueType.FLOAT),
+            Feature(name="earnings", dtype=ValueType.DOUBLE),
+            Feature(name="city", dtype=ValueType.STRING),
+        ],
+    )
+    feature_set.version = 1
+    return feature_set
+
+
+def make_dataframe(rows: int, tz: str) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    cities = np.array(["jakarta", "singapore", "bangkok"], dtype=object)
+    return pd.DataFrame(
+        {
+            "datetime": pd.date_range("2020-01-01", periods=rows, freq="s", tz=tz),
+            "driver_id": np.arange(rows, dtype=np.int64),
+            "trips": rng.integers(1000, size=rows, dtype=np.int32),
+            "rating": rng.random(rows, dtype=np.float32),
+            "earnings": rng.random(rows),
+            "city": cities[np.arange(rows) % len(cities)],
+        }
+    )
+
+
+def series_row_by_row(df, feature_set):
+    convert = convert_df_to_feature_rows(df, feature_set)
+    return [convert(row) for _, row in df.iterrows()]
+
+
+def dict_row_by_row(df, feature_set):
+    dtype = df["datetime"].dtype
+    return [
+        convert_dict_to_proto_values(row, dtype, feature_set)
+        for row in df.to_dict("records")
+    ]
+
+
+def run(name, func, df, feature_set):
+    start = time.perf_counter()
+    result = func(df, feature_set)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<18} {elapsed:8.3f}s {len(df) / elapsed:12,.0f} rows/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument(
+        "--tz", default=None, help="Time zone of the datetime column, if any"
+    )
+    args = parser.parse_args()
+
+    df = make_dataframe(args.rows, args.tz)
+    feature_set = make_feature_set()
+
+    series_rows = run("per row (Series)", series_row_by_row, df, feature_set)
+    dict_rows = run("per row (dict)", dict_row_by_row, df, feature_set)
+    feature_rows = run(
+        "per DataFrame", convert_df_to_feature_row_protos, df, feature_set
+    )
+    assert feature_rows == dict_rows
+    assert [row.event_timestamp for row in feature_rows] == [
+        row.event_timestamp for row in series_rows
+    ]
+
+
+if __name__ == "__main__":
+    main()
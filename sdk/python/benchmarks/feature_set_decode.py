@@ -0,0 +1,122 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares decoding the feature sets of a ListFeatureSets response with
+fields built on access against building every field eagerly.
+
+Usage:
+    python benchmarks/feature_set_decode.py --feature-sets 100 --features 100
+"""
+
+import argparse
+import time
+
+from feast.core.CoreService_pb2 import ListFeatureSetsResponse
+from feast.core.FeatureSet_pb2 import EntitySpec
+from feast.core.FeatureSet_pb2 import FeatureSet as FeatureSetProto
+from feast.core.FeatureSet_pb2 import (
+    FeatureSetMeta,
+    FeatureSetSpec,
+    FeatureSetStatus,
+    FeatureSpec,
+)
+from feast.feature_set import FeatureSet
+from feast.types.Value_pb2 import ValueType as ValueTypeProto
+from tensorflow_metadata.proto.v0 import schema_pb2
+
+
+def make_response(feature_sets: int, features: int) -> ListFeatureSetsResponse:
+    response = ListFeatureSetsResponse()
+    for fs_idx in range(feature_sets):
+        response.feature_sets.append(
+            FeatureSetProto(
+                spec=FeatureSetSpec(
+                    project="benchmark",
+                    name=f"feature_set_{fs_idx}",
+                    version=1,
+                    entities=[
+                        EntitySpec(name="driver_id", value_type=ValueTypeProto.INT64)
+                    ],
+                    features=[
+                        FeatureSpec(
+                            name=f"feature_{feature_idx}",
+                            value_type=ValueTypeProto.FLOAT,
+                            presence=schema_pb2.FeaturePresence(min_fraction=1.0),
+                            float_domain=schema_pb2.FloatDomain(min=0, max=1),
+                        )
+                        for feature_idx in range(features)
+                    ],
+                ),
+                meta=FeatureSetMeta(status=FeatureSetStatus.STATUS_READY),
+            )
+        )
+    return response
+
+
+def eager(response):
+    """
+    Builds every field, as FeatureSet.from_proto did before fields were built
+    on access
+    """
+    feature_sets = [FeatureSet.from_proto(fs) for fs in response.feature_sets]
+    for feature_set in feature_sets:
+        feature_set.fields
+    return feature_sets
+
+
+def lazy(response):
+    return [FeatureSet.from_proto(fs) for fs in response.feature_sets]
+
+
+def eager_round_trip(response):
+    return [feature_set.to_proto() for feature_set in eager(response)]
+
+
+def lazy_round_trip(response):
+    return [feature_set.to_proto() for feature_set in lazy(response)]
+
+
+def run(name, func, data):
+    # Parse a fresh response every run, as protobuf creates the Python objects
+    # of messages lazily and caches them
+    response = ListFeatureSetsResponse.FromString(data)
+    start = time.perf_counter()
+    result = func(response)
+    elapsed = time.perf_counter() - start
+    feature_sets = len(response.feature_sets)
+    print(f"{name:<18} {elapsed:8.3f}s {feature_sets / elapsed:12,.0f} sets/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--feature-sets", type=int, default=100)
+    parser.add_argument("--features", type=int, default=100)
+    args = parser.parse_args()
+
+    data = make_response(args.feature_sets, args.features).SerializeToString()
+
+    expected = run("eager", eager, data)
+    actual = run("lazy", lazy, data)
+    assert [fs.name for fs in actual] == [fs.name for fs in expected]
+    assert actual[-1].fields == expected[-1].fields
+
+    expected = run("eager round trip", eager_round_trip, data)
+    actual = run("lazy round trip", lazy_round_trip, data)
+    for actual_proto, expected_proto in zip(actual, expected):
+        assert actual_proto.spec.features == expected_proto.spec.features
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares inferring the fields of a feature set from the footer of a Parquet
+file against reading its first row group, as Client.ingest did when
+force_update was set.
+
+Usage:
+    python benchmarks/infer_parquet.py --rows 1000000 --columns 100
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from feast.feature_set import FeatureSet
+
+
+def write_file(path: str, rows: int, columns: int):
+    rng = np.random.default_rng(0)
+    data = {
+        "datetime": pa.array(pd.date_range("2020-01-01", periods=rows, freq="s")),
+        "driver_id": pa.array(np.arange(rows)),
+    }
+    for column_idx in range(columns):
+        data[f"feature_{column_idx}"] = pa.array(rng.random(rows))
+    # A single row group, like the files written by Client.ingest for
+    # DataFrames of up to chunk_size rows
+    pq.write_table(pa.table(data), path, row_group_size=rows)
+
+
+def first_row_group(path):
+    feature_set = FeatureSet("benchmark")
+    with contextlib.redirect_stdout(io.StringIO()):
+        feature_set.infer_fields_from_pa(pq.ParquetFile(path).read_row_group(0))
+    return feature_set.fields
+
+
+def footer(path):
+    feature_set = FeatureSet("benchmark")
+    with contextlib.redirect_stdout(io.StringIO()):
+        feature_set.infer_fields_from_parquet(path)
+    return feature_set.fields
+
+
+def run(name, func, path):
+    start = time.perf_counter()
+    result = func(path)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<16} {elapsed:8.3f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--columns", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as dir_path:
+        path = os.path.join(dir_path, "benchmark.parquet")
+        write_file(path, args.rows, args.columns)
+
+        expected = run("first row group", first_row_group, path)
+        actual = run("footer", footer, path)
+        assert actual == expected
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares inferring the fields of a feature set from a wide DataFrame with
+FeatureSet.infer_fields_from_df against inspecting every value of every
+column.
+
+Usage:
+    python benchmarks/infer_schema.py --rows 10000 --columns 1000
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+import numpy as np
+import pandas as pd
+
+from feast.feature_set import FeatureSet
+from feast.type_map import python_type_to_feast_value_type
+
+
+def make_dataframe(rows: int, columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    cities = np.array(["jakarta", "singapore", "bangkok"], dtype=object)
+    embeddings = [rng.random(8, dtype=np.float32) for _ in range(rows)]
+    generators = [
+        lambda: rng.integers(1000, size=rows),
+        lambda: rng.integers(1000, size=rows, dtype=np.int32),
+        lambda: rng.random(rows),
+        lambda: rng.random(rows, dtype=np.float32),
+        lambda: rng.random(rows) > 0.5,
+        lambda: cities[rng.integers(len(cities), size=rows)],
+        lambda: embeddings,
+    ]
+    data = {
+        "datetime": pd.date_range("2020-01-01", periods=rows, freq="s"),
+        "driver_id": np.arange(rows),
+    }
+    for column_idx in range(columns):
+        data[f"feature_{column_idx}"] = generators[column_idx % len(generators)]()
+    return pd.DataFrame(data)
+
+
+def per_value(df, rows_to_sample):
+    """
+    The inference previously used by FeatureSet.infer_fields_from_df, which
+    inspected every value while only taking the sampled ones into account
+    """
+    fields = {}
+    for column in df.columns:
+        if column == "datetime":
+            continue
+        dtype = None
+        sample_count = 0
+        for key, value in df[column].items():
+            sample_count += 1
+            if sample_count > rows_to_sample:
+                continue
+            current_dtype = python_type_to_feast_value_type(name=column, value=value)
+            if dtype and dtype != current_dtype:
+                raise ValueError(f"Type mismatch detected in column {column}")
+            dtype = current_dtype
+        fields[column] = dtype
+    return fields
+
+
+def by_dtype(df, rows_to_sample):
+    feature_set = FeatureSet("benchmark")
+    # Do not time printing the inferred fields
+    with contextlib.redirect_stdout(io.StringIO()):
+        feature_set.infer_fields_from_df(df, rows_to_sample=rows_to_sample)
+    return {name: field.dtype for name, field in feature_set.fields.items()}
+
+
+def run(name, func, df, rows_to_sample):
+    start = time.perf_counter()
+    result = func(df, rows_to_sample)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {elapsed:8.3f}s {len(df.columns) / elapsed:12,.0f} columns/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--columns", type=int, default=1000)
+    parser.add_argument("--rows-to-sample", type=int, default=100)
+    args = parser.parse_args()
+
+    df = make_dataframe(args.rows, args.columns)
+
+    expected = run("per value", per_value, df, args.rows_to_sample)
+    actual = run("by dtype", by_dtype, df, args.rows_to_sample)
+    assert actual == expected
+
+
+if __name__ == "__main__":
+    main()
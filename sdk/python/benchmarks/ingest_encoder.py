@@ -0,0 +1,124 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares the throughput of the columnar FeatureRow encoder against encoding
+one FeatureRow protobuf message per row.
+
+Usage:
+    python benchmarks/ingest_encoder.py --rows 200000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from feast.constants import DATETIME_COLUMN
+from feast.loaders.encoder import encode_pa_table
+from feast.type_map import (
+    pa_column_to_proto_column,
+    pa_column_to_timestamp_proto_column,
+)
+from feast.types import Field_pb2 as FieldProto
+from feast.types.FeatureRow_pb2 import FeatureRow
+from feast.value_type import ValueType
+
+FEATURE_SET_REF = "benchmark/driver:1"
+INGESTION_ID = "3f5bd7a2-aa8f-3f1c-a2f0-8a83e5d54d4b"
+
+
+def encode_row_by_row(table, feature_set, fields, ingestion_id):
+    """
+    The encoding loop previously used by feast.loaders.ingest._encode_pa_tables
+    """
+    datetime_col = pa_column_to_timestamp_proto_column(table.column(DATETIME_COLUMN))
+    proto_columns = {
+        name: pa_column_to_proto_column(dtype, table.column(name))
+        for name, dtype in fields.items()
+    }
+    feature_rows = []
+    field = FieldProto.Field
+    proto_items = proto_columns.items()
+    append = feature_rows.append
+    for row_idx in range(table.num_rows):
+        feature_row = FeatureRow(
+            event_timestamp=datetime_col[row_idx],
+            feature_set=feature_set,
+            ingestion_id=ingestion_id,
+        )
+        ext = feature_row.fields.extend
+        for k, v in proto_items:
+            ext([field(name=k, value=v[row_idx])])
+        append(feature_row.SerializeToString())
+    return feature_rows
+
+
+def make_table(rows: int, list_length: int) -> pa.Table:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            DATETIME_COLUMN: pd.date_range(
+                "2020-01-01", periods=rows, freq="s", tz="UTC"
+            ),
+            "driver_id": rng.integers(0, 1_000_000, rows),
+            "trips": rng.integers(-1000, 1000, rows).astype(np.int32),
+            "rating": rng.random(rows).astype(np.float32),
+            "earnings": rng.random(rows) * 1000,
+            "city": rng.choice(["jakarta", "singapore", "bangkok"], rows),
+            "active": rng.random(rows) > 0.5,
+            "embedding": list(rng.random((rows, list_length)).astype(np.float32)),
+        }
+    )
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+FIELDS = {
+    "driver_id": ValueType.INT64,
+    "trips": ValueType.INT32,
+    "rating": ValueType.FLOAT,
+    "earnings": ValueType.DOUBLE,
+    "city": ValueType.STRING,
+    "active": ValueType.BOOL,
+    "embedding": ValueType.FLOAT_LIST,
+}
+
+
+def run(name, func, table):
+    start = time.perf_counter()
+    rows = func(table, FEATURE_SET_REF, FIELDS, INGESTION_ID)
+    elapsed = time.perf_counter() - start
+    size = sum(len(row) for row in rows)
+    print(
+        f"{name:<14} {elapsed:8.3f}s {table.num_rows / elapsed:12,.0f} rows/s "
+        f"{size / elapsed / 2 ** 20:10,.1f} MiB/s"
+    )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--list-length", type=int, default=16)
+    args = parser.parse_args()
+
+    table = make_table(args.rows, args.list_length)
+    expected = run("row-by-row", encode_row_by_row, table)
+    actual = run("columnar", encode_pa_table, table)
+    assert actual == expected, "Encoders produced different bytes"
+
+
+if __name__ == "__main__":
+    main()
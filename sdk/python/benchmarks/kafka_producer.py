@@ -0,0 +1,248 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares the throughput of producing FeatureRows to Kafka with and without
+producer batching options, against an in-process broker stand-in.
+
+The stand-in replaces the confluent_kafka module. Like librdkafka it groups
+messages into batches by linger time and batch size, and compresses every
+batch. A single broker connection thread then delivers the batches one
+request at a time, where every request costs a fixed overhead plus its size
+divided by the bandwidth.
+
+Usage:
+    python benchmarks/kafka_producer.py --rows 200000
+"""
+
+import argparse
+import sys
+import threading
+import time
+import types
+import zlib
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from feast.constants import DATETIME_COLUMN
+from feast.loaders.abstract_producer import BatchingOptions, ConfluentProducer
+from feast.loaders.encoder import encode_pa_table
+from feast.value_type import ValueType
+
+FEATURE_SET_REF = "benchmark/driver:1"
+INGESTION_ID = "3f5bd7a2-aa8f-3f1c-a2f0-8a83e5d54d4b"
+TOPIC = "feast-features"
+
+FIELDS = {
+    "driver_id": ValueType.INT64,
+    "trips": ValueType.INT32,
+    "rating": ValueType.FLOAT,
+    "city": ValueType.STRING,
+}
+
+# Supported codecs of the stand-in broker
+COMPRESSORS = {"none": lambda data: data, "gzip": zlib.compress}
+
+
+class StandInBroker:
+    """
+    Delivers batches of messages on a background thread, simulating a fixed
+    cost per produce request and a limited bandwidth.
+    """
+
+    def __init__(self, request_overhead: float, bandwidth: float):
+        self.request_overhead = request_overhead
+        self.bandwidth = bandwidth
+        self.wire_bytes = 0
+        self.requests = 0
+        self._batches = deque()
+        self._ready = threading.Condition()
+        thread = threading.Thread(target=self._serve, daemon=True)
+        thread.start()
+
+    def send(self, batch, on_delivered):
+        with self._ready:
+            self._batches.append((batch, on_delivered))
+            self._ready.notify()
+
+    def _serve(self):
+        while True:
+            with self._ready:
+                while not self._batches:
+                    self._ready.wait()
+                (payload, callbacks), on_delivered = self._batches.popleft()
+            time.sleep(self.request_overhead + len(payload) / self.bandwidth)
+            self.wire_bytes += len(payload)
+            self.requests += 1
+            on_delivered(callbacks)
+
+
+class StandInProducer:
+    """
+    Stand-in for confluent_kafka.Producer with librdkafka's batching
+    semantics and its 2020 default settings.
+    """
+
+    broker = None  # type: StandInBroker
+
+    def __init__(self, config):
+        self._linger = float(config.get("linger.ms", 0.5)) / 1000
+        self._batch_size = int(config.get("batch.size", 1000000))
+        self._compress = COMPRESSORS[config.get("compression.codec", "none")]
+        self._batch = []
+        self._batch_bytes = 0
+        self._batch_started = 0.0
+        self._in_flight = 0
+        self._delivered = deque()
+        self._lock = threading.Lock()
+        self.delivered = 0
+
+    def produce(self, topic, value, callback):
+        if not self._batch:
+            self._batch_started = time.perf_counter()
+        self._batch.append((value, callback))
+        self._batch_bytes += len(value)
+        if self._batch_bytes >= self._batch_size:
+            self._send_batch()
+        elif time.perf_counter() - self._batch_started >= self._linger:
+            self._send_batch()
+
+    def poll(self, timeout=0):
+        if self._batch and time.perf_counter() - self._batch_started >= self._linger:
+            self._send_batch()
+        served = 0
+        while True:
+            with self._lock:
+                if not self._delivered:
+                    break
+                callback, value = self._delivered.popleft()
+            callback(None, value)
+            served += 1
+        self.delivered += served
+        return served
+
+    def flush(self, timeout=None):
+        if self._batch:
+            self._send_batch()
+        while True:
+            self.poll(0)
+            with self._lock:
+                if self._in_flight == 0 and not self._delivered:
+                    return 0
+            time.sleep(0.0001)
+
+    def _send_batch(self):
+        payload = self._compress(b"".join(value for value, _ in self._batch))
+        callbacks = [(callback, value) for value, callback in self._batch]
+        with self._lock:
+            self._in_flight += 1
+        self.broker.send((payload, callbacks), self._on_delivered)
+        self._batch = []
+        self._batch_bytes = 0
+
+    def _on_delivered(self, callbacks):
+        with self._lock:
+            self._delivered.extend(callbacks)
+            self._in_flight -= 1
+
+
+def make_rows(rows: int):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            DATETIME_COLUMN: pd.date_range(
+                "2020-01-01", periods=rows, freq="s", tz="UTC"
+            ),
+            "driver_id": rng.integers(0, 1_000_000, rows),
+            "trips": rng.integers(0, 1000, rows).astype(np.int32),
+            "rating": rng.random(rows).astype(np.float32),
+            "city": rng.choice(["jakarta", "singapore", "bangkok"], rows),
+        }
+    )
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    return encode_pa_table(table, FEATURE_SET_REF, FIELDS, INGESTION_ID)
+
+
+def run(name, batching, rows, request_overhead, bandwidth):
+    broker = StandInBroker(request_overhead, bandwidth)
+    StandInProducer.broker = broker
+    producer = ConfluentProducer("localhost:9092", len(rows), True, batching)
+
+    start = time.perf_counter()
+    produce = producer.produce
+    for row in rows:
+        produce(TOPIC, row)
+    producer.flush(timeout=None)
+    elapsed = time.perf_counter() - start
+
+    assert producer.error_count == 0
+    assert producer.producer.delivered == len(rows), "Not all messages delivered"
+    size = sum(len(row) for row in rows)
+    print(
+        f"{name:<28} {elapsed:8.3f}s {len(rows) / elapsed:12,.0f} msgs/s "
+        f"{size / elapsed / 2 ** 20:8,.1f} MiB/s "
+        f"{broker.wire_bytes / elapsed / 2 ** 20:8,.1f} MiB/s on the wire "
+        f"{broker.requests:8,} requests"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument(
+        "--request-overhead-ms",
+        type=float,
+        default=0.5,
+        help="Simulated fixed cost of a single produce request",
+    )
+    parser.add_argument(
+        "--bandwidth-mib",
+        type=float,
+        default=50,
+        help="Simulated bandwidth to the broker in MiB/s",
+    )
+    args = parser.parse_args()
+
+    confluent_kafka = types.ModuleType("confluent_kafka")
+    confluent_kafka.Producer = StandInProducer
+    sys.modules["confluent_kafka"] = confluent_kafka
+
+    rows = make_rows(args.rows)
+    settings = [
+        ("default", None),
+        ("linger 5ms, poll every 100", BatchingOptions(5, poll_every=100)),
+        ("linger 50ms, poll every 1000", BatchingOptions(50, poll_every=1000)),
+        (
+            "linger 50ms, gzip",
+            BatchingOptions(50, compression="gzip", poll_every=1000),
+        ),
+        (
+            "linger 50ms, 64 KiB batches",
+            BatchingOptions(50, batch_size=65536, poll_every=1000),
+        ),
+    ]
+    for name, batching in settings:
+        run(
+            name,
+            batching,
+            rows,
+            args.request_overhead_ms / 1000,
+            args.bandwidth_mib * 2 ** 20,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares decoding an online feature response into columns against turning
+it into a list of dicts with a dict comprehension.
+
+Usage:
+    python benchmarks/online_response.py --rows 10000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from feast.online_response import to_dataframe, to_numpy
+from feast.serving.ServingService_pb2 import GetOnlineFeaturesResponse
+from feast.types import Value_pb2 as ValueProto
+
+
+def make_response(rows: int, list_length: int) -> GetOnlineFeaturesResponse:
+    rng = np.random.default_rng(0)
+    cities = ["jakarta", "singapore", "bangkok"]
+    response = GetOnlineFeaturesResponse()
+    for row_idx in range(rows):
+        response.field_values.add(
+            fields={
+                "driver_id": ValueProto.Value(int64_val=row_idx),
+                "benchmark/trips": ValueProto.Value(int32_val=int(rng.integers(1000))),
+                "benchmark/rating": ValueProto.Value(float_val=rng.random()),
+                "benchmark/earnings": ValueProto.Value(double_val=rng.random()),
+                "benchmark/city": ValueProto.Value(
+                    string_val=cities[row_idx % len(cities)]
+                ),
+                "benchmark/active": ValueProto.Value(bool_val=row_idx % 2 == 0),
+                "benchmark/embedding": ValueProto.Value(
+                    float_list_val=ValueProto.FloatList(
+                        val=rng.random(list_length).tolist()
+                    )
+                ),
+                # Missing or stale feature values are empty
+                "benchmark/stale": ValueProto.Value(),
+            }
+        )
+    return response
+
+
+def naive_dicts(response):
+    """
+    Converts the response into a dict per row with a dict comprehension
+    """
+    rows = []
+    for field_values in response.field_values:
+        row = {}
+        for name, value in field_values.fields.items():
+            value_field = value.WhichOneof("val")
+            if value_field is None:
+                row[name] = None
+            elif value_field.endswith("_list_val"):
+                row[name] = list(getattr(value, value_field).val)
+            else:
+                row[name] = getattr(value, value_field)
+        rows.append(row)
+    return rows
+
+
+def naive_numpy(response):
+    rows = naive_dicts(response)
+    return {name: np.array([row[name] for row in rows]) for name in rows[0]}
+
+
+def naive_dataframe(response):
+    return pd.DataFrame(naive_dicts(response))
+
+
+def run(name, func, data):
+    # Parse a fresh response every run, as protobuf creates the Python objects
+    # of messages lazily and caches them
+    response = GetOnlineFeaturesResponse.FromString(data)
+    start = time.perf_counter()
+    result = func(response)
+    elapsed = time.perf_counter() - start
+    rows = len(response.field_values)
+    print(f"{name:<18} {elapsed:8.3f}s {rows / elapsed:12,.0f} rows/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--list-length", type=int, default=16)
+    args = parser.parse_args()
+
+    data = make_response(args.rows, args.list_length).SerializeToString()
+
+    expected = run("naive numpy", naive_numpy, data)
+    actual = run("to_numpy", to_numpy, data)
+    for name in ["driver_id", "benchmark/trips", "benchmark/rating", "benchmark/city"]:
+        assert (actual[name].values == expected[name]).all()
+    embedding = actual["benchmark/embedding"]
+    assert (embedding.values == np.concatenate(expected["benchmark/embedding"])).all()
+
+    expected = run("naive dataframe", naive_dataframe, data)
+    actual = run("to_dataframe", to_dataframe, data)
+    assert (actual["benchmark/earnings"] == expected["benchmark/earnings"]).all()
+
+
+if __name__ == "__main__":
+    main()
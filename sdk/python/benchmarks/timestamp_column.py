@@ -0,0 +1,90 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares converting a PyArrow timestamp column into the seconds and
+nanoseconds of FeatureRow event timestamps in a single cast against
+converting every value through a Python datetime.
+
+The row by row conversion only runs on the first --naive-rows rows, as it
+takes minutes for the full column.
+
+Usage:
+    python benchmarks/timestamp_column.py --rows 10000000 --unit ns
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pyarrow as pa
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from feast.loaders.encoder import pa_column_to_timestamp_buffers
+
+
+def make_column(rows: int, unit: str, tz: str) -> pa.ChunkedArray:
+    rng = np.random.default_rng(0)
+    start = np.datetime64("2020-01-01", unit).astype(np.int64)
+    span = np.timedelta64(365, "D").astype(f"timedelta64[{unit}]").astype(np.int64)
+    values = np.sort(start + rng.integers(span, size=rows))
+    # Columns of tables read from files or converted from pandas are chunked
+    chunks = np.array_split(values, max(1, rows // 1_000_000))
+    return pa.chunked_array(
+        [pa.array(chunk, type=pa.timestamp(unit, tz=tz)) for chunk in chunks]
+    )
+
+
+def row_by_row(column):
+    """
+    The conversion previously used by feast.loaders.encoder
+    """
+    timestamps = []
+    for val in column:
+        timestamp = Timestamp()
+        timestamp.FromMicroseconds(micros=int(val.as_py().timestamp() * 1_000_000))
+        timestamps.append(timestamp)
+    seconds = np.fromiter((ts.seconds for ts in timestamps), np.int64, len(timestamps))
+    nanos = np.fromiter((ts.nanos for ts in timestamps), np.int64, len(timestamps))
+    return seconds, nanos
+
+
+def run(name, func, column):
+    start = time.perf_counter()
+    result = func(column)
+    elapsed = time.perf_counter() - start
+    rows = len(column)
+    print(f"{name:<12} {rows:>12,} rows {elapsed:8.3f}s {rows / elapsed:14,.0f} rows/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--naive-rows", type=int, default=200_000)
+    parser.add_argument("--unit", choices=["s", "ms", "us", "ns"], default="ns")
+    parser.add_argument("--tz", default="UTC")
+    args = parser.parse_args()
+
+    column = make_column(args.rows, args.unit, args.tz)
+
+    sample = column.slice(0, args.naive_rows)
+    expected_seconds, expected_nanos = run("row by row", row_by_row, sample)
+    seconds, nanos = run("vectorized", pa_column_to_timestamp_buffers, column)
+    assert (seconds[: len(sample)] == expected_seconds).all()
+    # Python floats lose precision below a microsecond for current dates
+    assert (np.abs(nanos[: len(sample)] - expected_nanos) <= 1000).all()
+
+
+if __name__ == "__main__":
+    main()
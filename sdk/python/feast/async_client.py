@@ -0,0 +1,241 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import grpc
+from grpc import aio
+
+from feast.client import _build_feature_references_cached
+from feast.config import Config
+from feast.constants import (
+    CONFIG_PROJECT_KEY,
+    CONFIG_SERVING_SECURE_KEY,
+    CONFIG_SERVING_URL_KEY,
+)
+from feast.serving.ServingService_pb2 import (
+    GetOnlineFeaturesRequest,
+    GetOnlineFeaturesResponse,
+)
+from feast.serving.ServingService_pb2_grpc import ServingServiceStub
+
+# A single online retrieval: feature references and entity rows
+OnlineFeaturesQuery = Tuple[List[str], List[GetOnlineFeaturesRequest.EntityRow]]
+
+
+class AsyncClient:
+    """
+    Feast asyncio client: Used for retrieving online features from Feast
+    Serving without blocking the event loop.
+
+    Requests are spread round-robin over a pool of gRPC channels, each of
+    which holds its own HTTP/2 connection. Channels are bound to the event
+    loop they are first used in, so a client should only be used from a
+    single event loop.
+    """
+
+    def __init__(
+        self,
+        options: Optional[Dict[str, str]] = None,
+        channel_pool_size: int = 4,
+        **kwargs,
+    ):
+        """
+        Args:
+            serving_url: Feast Serving URL. Used to retrieve features
+            project: Sets the active project. This field is optional.
+            serving_secure: Use client-side SSL/TLS for Serving gRPC API
+            options: Configuration options to initialize client with
+            channel_pool_size: Number of gRPC channels to spread requests over
+            **kwargs: Additional keyword arguments that will be used as
+                configuration options along with "options"
+        """
+        if channel_pool_size < 1:
+            raise ValueError("channel_pool_size must be at least 1")
+
+        if options is None:
+            options = dict()
+        self._config = Config(options={**options, **kwargs})
+
+        self._channel_pool_size = channel_pool_size
+        self._channels: List[aio.Channel] = []
+        self._stubs: List[ServingServiceStub] = []
+        self._next_stub = 0
+
+    @property
+    def serving_url(self) -> str:
+        """
+        Retrieve Serving URL
+
+        Returns:
+            Serving URL string
+        """
+        return self._config.get(CONFIG_SERVING_URL_KEY)
+
+    @property
+    def serving_secure(self) -> bool:
+        """
+        Retrieve Feast Serving client-side SSL/TLS setting
+
+        Returns:
+            Whether client-side SSL/TLS is enabled
+        """
+        return self._config.getboolean(CONFIG_SERVING_SECURE_KEY)
+
+    @property
+    def channel_pool_size(self) -> int:
+        """
+        Retrieve the number of gRPC channels requests are spread over
+
+        Returns:
+            Number of channels
+        """
+        return self._channel_pool_size
+
+    @property
+    def project(self) -> Union[str, None]:
+        """
+        Retrieve currently active project
+
+        Returns:
+            Project name
+        """
+        return self._config.get(CONFIG_PROJECT_KEY)
+
+    def set_project(self, project: str):
+        """
+        Set currently active Feast project
+
+        Args:
+            project: Project to set as active
+        """
+        self._config.set(CONFIG_PROJECT_KEY, project)
+
+    def _get_serving_stub(self) -> ServingServiceStub:
+        """
+        Returns the stub of the next channel in the pool, opening the
+        channels on first use.
+        """
+        if not self._stubs:
+            if not self.serving_url:
+                raise ValueError("Please set Feast Serving URL.")
+
+            for _ in range(self._channel_pool_size):
+                if self.serving_secure or self.serving_url.endswith(":443"):
+                    channel = aio.secure_channel(
+                        self.serving_url, grpc.ssl_channel_credentials()
+                    )
+                else:
+                    channel = aio.insecure_channel(self.serving_url)
+                self._channels.append(channel)
+                self._stubs.append(ServingServiceStub(channel))
+
+        stub = self._stubs[self._next_stub]
+        self._next_stub = (self._next_stub + 1) % len(self._stubs)
+        return stub
+
+    async def get_online_features(
+        self,
+        feature_refs: List[str],
+        entity_rows: List[GetOnlineFeaturesRequest.EntityRow],
+        default_project: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> GetOnlineFeaturesResponse:
+        """
+        Retrieves the latest online feature data from Feast Serving
+
+        Args:
+            feature_refs: List of feature references in the following format
+                [project]/[feature_name]:[version]. Only the feature name
+                is a required component in the reference.
+                example:
+                    ["my_project/my_feature_1:3",
+                    "my_project3/my_feature_4:1",]
+            entity_rows: List of GetFeaturesRequest.EntityRow where each row
+                contains entities. Timestamp should not be set for online
+                retrieval. All entity types within a feature
+            default_project: This project will be used if the project name is
+                not provided in the feature reference
+            timeout: Deadline of the call in seconds. No deadline is set if
+                not provided.
+
+        Returns:
+            Returns a list of maps where each item in the list contains the
+            latest feature values for the provided entities
+        """
+        request = GetOnlineFeaturesRequest(
+            features=_build_feature_references_cached(
+                tuple(feature_refs),
+                default_project if not self.project else self.project,
+            ),
+            entity_rows=entity_rows,
+        )
+
+        try:
+            return await self._get_serving_stub().GetOnlineFeatures(
+                request, timeout=timeout
+            )
+        except grpc.RpcError as e:
+            raise grpc.RpcError(e.details())
+
+    async def get_online_features_many(
+        self,
+        queries: Iterable[OnlineFeaturesQuery],
+        default_project: Optional[str] = None,
+        timeout: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[GetOnlineFeaturesResponse, BaseException]]:
+        """
+        Retrieves the latest online feature data for several independent
+        queries concurrently. Queries are spread over the channel pool.
+
+        Args:
+            queries: Iterable of (feature_refs, entity_rows) tuples, each of
+                which is retrieved as in get_online_features()
+            default_project: This project will be used if the project name is
+                not provided in a feature reference
+            timeout: Deadline of every single call in seconds. No deadline is
+                set if not provided.
+            return_exceptions: Return the errors of failed queries in place
+                of their responses, instead of raising the first error
+
+        Returns:
+            List of responses, in the order of the queries
+        """
+        return await asyncio.gather(
+            *(
+                self.get_online_features(
+                    feature_refs, entity_rows, default_project, timeout
+                )
+                for feature_refs, entity_rows in queries
+            ),
+            return_exceptions=return_exceptions,
+        )
+
+    async def close(self):
+        """
+        Closes all gRPC channels of the pool. They are opened again by the
+        next request.
+        """
+        channels, self._channels, self._stubs = self._channels, [], []
+        self._next_stub = 0
+        for channel in channels:
+            await channel.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -17,10 +17,11 @@ import logging
 import sys
 
 import click
+import grpc
 import pkg_resources
 import yaml
 
-from feast.client import Client
+from feast.client import ApplyStatus, Client
 from feast.config import Config
 from feast.core.IngestionJob_pb2 import IngestionJobStatus
 from feast.feature_set import FeatureSet, FeatureSetRef
@@ -150,7 +151,32 @@ def feature_set_create(filename):
 
     feature_sets = [FeatureSet.from_dict(fs_dict) for fs_dict in yaml_loader(filename)]
     feast_client = Client()  # type: Client
-    feast_client.apply(feature_sets)
+    results = feast_client.apply_all(feature_sets)
+
+    from tabulate import tabulate
+
+    table = [
+        [result.feature_set.name, result.feature_set.version, result.status.value]
+        + ([_format_apply_error(result.error)] if result.error else [])
+        for result in results
+    ]
+    print(
+        tabulate(
+            table, headers=["NAME", "VERSION", "STATUS", "ERROR"], tablefmt="plain"
+        )
+    )
+    if any(result.status == ApplyStatus.ERROR for result in results):
+        sys.exit(1)
+
+
+def _format_apply_error(error: Exception) -> str:
+    """
+    Formats the error of a feature set which could not be applied, with the
+    status code of errors returned by Feast Core
+    """
+    if isinstance(error, grpc.Call):
+        return f"{error.code().name}: {error.details()}"
+    return str(error)
 
 
 @feature_set.command("describe")
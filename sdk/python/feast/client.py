@@ -13,6 +13,7 @@
 # limitations under the License.
 
 
+import enum
 import logging
 import os
 import shutil
@@ -20,8 +21,10 @@ import tempfile
 import time
 import uuid
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from math import ceil
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 import grpc
 import pandas as pd
@@ -33,6 +36,7 @@ from feast.constants import (
     CONFIG_CORE_SECURE_KEY,
     CONFIG_CORE_URL_KEY,
     CONFIG_GRPC_CONNECTION_TIMEOUT_DEFAULT_KEY,
+    CONFIG_INGESTION_STAGING_DIR_KEY,
     CONFIG_PROJECT_KEY,
     CONFIG_SERVING_SECURE_KEY,
     CONFIG_SERVING_URL_KEY,
@@ -56,12 +60,23 @@ from feast.core.CoreService_pb2 import (
     StopIngestionJobRequest,
 )
 from feast.core.CoreService_pb2_grpc import CoreServiceStub
+from feast.core.FeatureSet_pb2 import FeatureSet as FeatureSetProto
 from feast.core.FeatureSet_pb2 import FeatureSetStatus
 from feast.feature_set import Entity, FeatureSet, FeatureSetRef
+from feast.feature_set_cache import FeatureSetCache, ListingFilter
 from feast.job import IngestJob, RetrievalJob
-from feast.loaders.abstract_producer import get_producer
+from feast.loaders.abstract_producer import BatchingOptions, get_producer
 from feast.loaders.file import export_source_to_staging_location
-from feast.loaders.ingest import KAFKA_CHUNK_PRODUCTION_TIMEOUT, get_feature_row_chunks
+from feast.loaders.ingest import (
+    KAFKA_CHUNK_PRODUCTION_TIMEOUT,
+    get_feature_row_chunks_from_tables,
+    read_source_batches,
+)
+from feast.loaders.pipeline import IngestionPipeline
+from feast.loaders.pool import EncodingPool
+from feast.loaders.staging_cache import DEFAULT_MAX_MANIFEST_ENTRIES, StagingCache
+from feast.online_batcher import OnlineRequestBatcher
+from feast.online_cache import OnlineFeatureCache, entity_key, feature_ref_string
 from feast.serving.ServingService_pb2 import (
     DataFormat,
     DatasetSource,
@@ -74,11 +89,35 @@ from feast.serving.ServingService_pb2 import (
     GetOnlineFeaturesResponse,
 )
 from feast.serving.ServingService_pb2_grpc import ServingServiceStub
+from feast.types.Value_pb2 import Value as ValueProto
 
 _logger = logging.getLogger(__name__)
 
 CPU_COUNT = os.cpu_count()  # type: int
 
+# Maximum number of feature sets apply_all() registers concurrently by default
+DEFAULT_APPLY_WORKERS: int = 16
+
+
+class ApplyStatus(enum.Enum):
+    """
+    Outcome of registering a feature set with Feast Core
+    """
+
+    CREATED = "CREATED"
+    NO_CHANGE = "NO_CHANGE"
+    ERROR = "ERROR"
+
+
+class ApplyResult(NamedTuple):
+    """
+    Result of registering a single feature set with Client.apply_all()
+    """
+
+    feature_set: FeatureSet
+    status: ApplyStatus
+    error: Optional[Exception] = None
+
 
 class Client:
     """
@@ -108,6 +147,31 @@ class Client:
         self.__serving_channel: grpc.Channel = None
         self._core_service_stub: CoreServiceStub = None
         self._serving_service_stub: ServingServiceStub = None
+        self._encoding_pool: Optional[EncodingPool] = None
+        self._online_cache: Optional[OnlineFeatureCache] = None
+        self._online_batcher: Optional[OnlineRequestBatcher] = None
+        self._staging_cache: Optional[StagingCache] = None
+        self._feature_set_cache: Optional[FeatureSetCache] = None
+        self._feature_set_refresh_interval: Optional[float] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Stops the worker processes used to encode ingested data, if they were
+        started, and the background refresher of the feature set cache, if it
+        is enabled. The workers are started again by the next call to
+        ingest(), and the refresher by the next feature set lookup.
+        """
+        if self._encoding_pool is not None:
+            self._encoding_pool.close()
+            self._encoding_pool = None
+        if self._feature_set_cache is not None:
+            self._feature_set_cache.stop_refresher()
 
     @property
     def core_url(self) -> str:
@@ -280,6 +344,211 @@ class Client:
         else:
             self._serving_service_stub = ServingServiceStub(self.__serving_channel)
 
+    def _get_encoding_pool(self, max_workers: int) -> EncodingPool:
+        """
+        Returns the pool of worker processes used to encode ingested data,
+        replacing it if it has a different number of workers or staging
+        directory. Ingested data is staged in the directory configured with
+        the ingestion_staging_dir option.
+
+        Args:
+            max_workers: Number of worker processes
+        """
+        staging_dir = self._config.get(CONFIG_INGESTION_STAGING_DIR_KEY) or None
+        if self._encoding_pool is not None and (
+            self._encoding_pool.max_workers != max_workers
+            or staging_dir is not None
+            and self._encoding_pool.staging_dir != staging_dir
+        ):
+            self._encoding_pool.close()
+            self._encoding_pool = None
+        if self._encoding_pool is None:
+            self._encoding_pool = EncodingPool(max_workers, staging_dir)
+        return self._encoding_pool
+
+    @property
+    def online_cache(self) -> Optional[OnlineFeatureCache]:
+        """
+        Retrieve the cache of online feature values, if it is enabled
+
+        Returns:
+            Online feature cache or None
+        """
+        return self._online_cache
+
+    def enable_online_cache(
+        self,
+        max_entries: int = 10000,
+        default_ttl: float = 60.0,
+        ttls: Optional[Dict[str, float]] = None,
+    ) -> OnlineFeatureCache:
+        """
+        Caches the feature values retrieved by get_online_features(), so that
+        only values which are not cached are retrieved from Feast Serving.
+
+        Values expire after the max age of their feature set, which is looked
+        up from Feast Core once per feature.
+
+        Args:
+            max_entries: Maximum number of cached feature values. The least
+                recently used values are evicted beyond it.
+            default_ttl: TTL in seconds of features whose feature set has no
+                max age or could not be looked up
+            ttls: TTLs in seconds by feature set reference
+                ("project/feature_set") which take precedence over the max
+                age of the feature set. A TTL of 0 disables caching.
+
+        Returns:
+            The online feature cache, which exposes hit, miss and eviction
+            counters in its stats attribute
+        """
+        self._online_cache = OnlineFeatureCache(max_entries, default_ttl, ttls)
+        return self._online_cache
+
+    def disable_online_cache(self):
+        """
+        Stops caching online feature values and drops the cached values
+        """
+        self._online_cache = None
+
+    @property
+    def online_batcher(self) -> Optional[OnlineRequestBatcher]:
+        """
+        Retrieve the batcher of concurrent online feature requests, if
+        batching is enabled
+
+        Returns:
+            Online request batcher or None
+        """
+        return self._online_batcher
+
+    def enable_online_batching(
+        self, max_wait_seconds: float = 0.002, max_batch_size: int = 256
+    ) -> OnlineRequestBatcher:
+        """
+        Coalesces concurrent get_online_features() calls from different
+        threads for the same features into a single request to Feast Serving.
+
+        Args:
+            max_wait_seconds: Maximum time in seconds a call waits for
+                concurrent calls to join its request
+            max_batch_size: Number of entity rows after which a request is
+                sent without waiting any longer
+
+        Returns:
+            The online request batcher, which counts requests and batches
+        """
+        self._online_batcher = OnlineRequestBatcher(
+            self._send_online_request, max_wait_seconds, max_batch_size
+        )
+        return self._online_batcher
+
+    def disable_online_batching(self):
+        """
+        Sends every get_online_features() call as its own request
+        """
+        self._online_batcher = None
+
+    @property
+    def staging_cache(self) -> Optional[StagingCache]:
+        """
+        Retrieve the cache of staged entity DataFrames, if it is enabled
+
+        Returns:
+            Staging cache or None
+        """
+        return self._staging_cache
+
+    def enable_staging_cache(
+        self,
+        manifest_path: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_MANIFEST_ENTRIES,
+    ) -> StagingCache:
+        """
+        Stages the entity DataFrames of get_batch_features() under the hash
+        of their contents, so that calls with the same entity rows reuse the
+        files already uploaded to the staging location instead of exporting
+        and uploading them again.
+
+        Args:
+            manifest_path: Path of the local manifest of staged files.
+                Defaults to staging_manifest.json in the Feast configuration
+                directory.
+            max_entries: Maximum number of staged DataFrames kept track of
+
+        Returns:
+            The staging cache, which counts hits and misses
+        """
+        self._staging_cache = StagingCache(manifest_path, max_entries)
+        return self._staging_cache
+
+    def disable_staging_cache(self):
+        """
+        Exports and uploads the entity rows of every get_batch_features() call
+        """
+        self._staging_cache = None
+
+    @property
+    def feature_set_cache(self) -> Optional[FeatureSetCache]:
+        """
+        Retrieve the cache of feature sets, if it is enabled
+
+        Returns:
+            Feature set cache or None
+        """
+        return self._feature_set_cache
+
+    def enable_feature_set_cache(
+        self, ttl: float = 60.0, refresh_interval: Optional[float] = None
+    ) -> FeatureSetCache:
+        """
+        Caches the feature sets retrieved from Feast Core, so that
+        get_feature_set(), list_feature_sets() and list_entities() are served
+        locally until the feature sets expire. Feature sets are dropped from
+        the cache when they are applied.
+
+        Args:
+            ttl: Time in seconds after which feature sets are retrieved from
+                Feast Core again
+            refresh_interval: If set, the feature sets of the cached projects
+                are listed from Feast Core every refresh_interval seconds on
+                a background thread, keeping them from expiring if it is
+                shorter than the TTL
+
+        Returns:
+            The feature set cache, which exposes hit and miss counters in
+            its stats attribute
+        """
+        self.disable_feature_set_cache()
+        self._feature_set_cache = FeatureSetCache(ttl)
+        self._feature_set_refresh_interval = refresh_interval
+        return self._get_feature_set_cache()
+
+    def disable_feature_set_cache(self):
+        """
+        Retrieves feature sets from Feast Core on every lookup
+        """
+        if self._feature_set_cache is not None:
+            self._feature_set_cache.stop_refresher()
+        self._feature_set_cache = None
+        self._feature_set_refresh_interval = None
+
+    def _get_feature_set_cache(self) -> Optional[FeatureSetCache]:
+        """
+        Returns the feature set cache, if it is enabled, starting its
+        background refresher if it should run but was stopped by close()
+        """
+        cache = self._feature_set_cache
+        if (
+            cache is not None
+            and self._feature_set_refresh_interval is not None
+            and not cache.refreshing
+        ):
+            cache.start_refresher(
+                self._list_feature_set_protos, self._feature_set_refresh_interval
+            )
+        return cache
+
     @property
     def project(self) -> Union[str, None]:
         """
@@ -365,6 +634,58 @@ class Client:
                 f"Could not determine feature set type to apply {feature_set}"
             )
 
+    def apply_all(
+        self,
+        feature_sets: Sequence[FeatureSet],
+        max_workers: int = DEFAULT_APPLY_WORKERS,
+    ) -> List[ApplyResult]:
+        """
+        Idempotently registers many feature sets with Feast Core, sending up
+        to max_workers requests concurrently.
+
+        All feature sets are validated before any of them is registered.
+        Failing requests do not stop the others, and are reported in the
+        results instead.
+
+        Args:
+            feature_sets: Feature sets that will be registered. They are
+                updated with the registered version, like with apply().
+            max_workers: Maximum number of concurrent requests to Feast Core
+
+        Returns:
+            Result of every feature set, in the order of feature_sets, with
+            its status and the error if it could not be registered. Errors
+            of Feast Core are the grpc.RpcError of the request, whose code()
+            tells whether it is worth retrying
+
+        Raises:
+            ValueError: If any feature set is invalid, naming all of them
+        """
+        protos = []
+        errors = []
+        for feature_set in feature_sets:
+            try:
+                protos.append(self._feature_set_proto_to_apply(feature_set))
+            except ValueError as e:
+                errors.append(str(e))
+        if errors:
+            raise ValueError("Invalid feature sets:\n" + "\n".join(errors))
+        if not protos:
+            return []
+
+        self._connect_core()
+
+        def apply_feature_set(feature_set, feature_set_proto):
+            try:
+                response = self._send_apply_feature_set(feature_set_proto)
+                status = self._update_applied_feature_set(feature_set, response)
+            except Exception as e:
+                return ApplyResult(feature_set, ApplyStatus.ERROR, e)
+            return ApplyResult(feature_set, status)
+
+        with ThreadPoolExecutor(min(max_workers, len(protos))) as executor:
+            return list(executor.map(apply_feature_set, feature_sets, protos))
+
     def _apply_feature_set(self, feature_set: FeatureSet):
         """
         Registers a single feature set with Feast
@@ -374,6 +695,32 @@ class Client:
         """
         self._connect_core()
 
+        feature_set_proto = self._feature_set_proto_to_apply(feature_set)
+        try:
+            apply_fs_response = self._send_apply_feature_set(feature_set_proto)
+        except grpc.RpcError as e:
+            raise grpc.RpcError(e.details())
+        status = self._update_applied_feature_set(feature_set, apply_fs_response)
+
+        # If the feature set has changed, update the local copy
+        if status == ApplyStatus.CREATED:
+            print(
+                f'Feature set updated/created: "{feature_set.name}:{feature_set.version}"'
+            )
+
+        # If no change has been applied, do nothing
+        if status == ApplyStatus.NO_CHANGE:
+            print(f"No change detected or applied: {feature_set.name}")
+
+    def _feature_set_proto_to_apply(self, feature_set: FeatureSet) -> FeatureSetProto:
+        """
+        Validates a feature set locally and returns its proto, in the project
+        of the client unless it has one
+        """
+        if not isinstance(feature_set, FeatureSet):
+            raise ValueError(
+                f"Could not determine feature set type to apply {feature_set}"
+            )
         feature_set.is_valid()
         feature_set_proto = feature_set.to_proto()
         if len(feature_set_proto.spec.project) == 0:
@@ -385,32 +732,45 @@ class Client:
                 )
             else:
                 feature_set_proto.spec.project = self.project
+        return feature_set_proto
 
+    def _send_apply_feature_set(
+        self, feature_set_proto: FeatureSetProto
+    ) -> ApplyFeatureSetResponse:
+        """
+        Sends a feature set to Feast Core and returns its response
+        """
         # Convert the feature set to a request and send to Feast Core
         try:
             apply_fs_response = self._core_service_stub.ApplyFeatureSet(
                 ApplyFeatureSetRequest(feature_set=feature_set_proto),
                 timeout=self._config.getint(CONFIG_GRPC_CONNECTION_TIMEOUT_DEFAULT_KEY),
             )  # type: ApplyFeatureSetResponse
-        except grpc.RpcError as e:
-            raise grpc.RpcError(e.details())
+        finally:
+            # Cached versions of the feature set are out of date
+            if self._feature_set_cache is not None:
+                self._feature_set_cache.invalidate(
+                    feature_set_proto.spec.project, feature_set_proto.spec.name
+                )
+        return apply_fs_response
 
+    def _update_applied_feature_set(
+        self, feature_set: FeatureSet, apply_fs_response: ApplyFeatureSetResponse
+    ) -> ApplyStatus:
+        """
+        Updates a local feature set from the feature set registered by Feast
+        Core, and returns whether it was created or updated
+        """
         # Extract the returned feature set
         applied_fs = FeatureSet.from_proto(apply_fs_response.feature_set)
 
-        # If the feature set has changed, update the local copy
-        if apply_fs_response.status == ApplyFeatureSetResponse.Status.CREATED:
-            print(
-                f'Feature set updated/created: "{applied_fs.name}:{applied_fs.version}"'
-            )
-
-        # If no change has been applied, do nothing
-        if apply_fs_response.status == ApplyFeatureSetResponse.Status.NO_CHANGE:
-            print(f"No change detected or applied: {feature_set.name}")
-
         # Deep copy from the returned feature set to the local feature set
         feature_set._update_from_feature_set(applied_fs)
 
+        if apply_fs_response.status == ApplyFeatureSetResponse.Status.NO_CHANGE:
+            return ApplyStatus.NO_CHANGE
+        return ApplyStatus.CREATED
+
     def list_feature_sets(
         self, project: str = None, name: str = None, version: str = None
     ) -> List[FeatureSet]:
@@ -439,22 +799,42 @@ class Client:
         if version is None:
             version = "*"
 
+        listing_filter = (project, name, str(version))
+        cache = self._get_feature_set_cache()
+        feature_sets = None if cache is None else cache.get_listing(listing_filter)
+
+        if feature_sets is None:
+            # Get latest feature sets from Feast Core
+            feature_set_protos = self._list_feature_set_protos(listing_filter)
+
+            # Extract feature sets and return
+            if cache is not None:
+                feature_sets = cache.put_listing(listing_filter, feature_set_protos)
+            else:
+                feature_sets = [
+                    FeatureSet.from_proto(feature_set_proto)
+                    for feature_set_proto in feature_set_protos
+                ]
+        for feature_set in feature_sets:
+            feature_set._client = self
+        return feature_sets
+
+    def _list_feature_set_protos(
+        self, listing_filter: ListingFilter
+    ) -> List[FeatureSetProto]:
+        """
+        Lists the feature sets matching a project, name and version filter
+        from Feast Core
+        """
+        self._connect_core()
+        project, name, version = listing_filter
         filter = ListFeatureSetsRequest.Filter(
             project=project, feature_set_name=name, feature_set_version=version
         )
-
-        # Get latest feature sets from Feast Core
         feature_set_protos = self._core_service_stub.ListFeatureSets(
             ListFeatureSetsRequest(filter=filter)
         )  # type: ListFeatureSetsResponse
-
-        # Extract feature sets and return
-        feature_sets = []
-        for feature_set_proto in feature_set_protos.feature_sets:
-            feature_set = FeatureSet.from_proto(feature_set_proto)
-            feature_set._client = self
-            feature_sets.append(feature_set)
-        return feature_sets
+        return list(feature_set_protos.feature_sets)
 
     def get_feature_set(
         self, name: str, version: int = None, project: str = None
@@ -483,6 +863,12 @@ class Client:
         if version is None:
             version = 0
 
+        cache = self._get_feature_set_cache()
+        if cache is not None:
+            feature_set = cache.get(FeatureSetRef(project, name.strip(), int(version)))
+            if feature_set is not None:
+                return feature_set
+
         try:
             get_feature_set_response = self._core_service_stub.GetFeatureSet(
                 GetFeatureSetRequest(
@@ -491,6 +877,10 @@ class Client:
             )  # type: GetFeatureSetResponse
         except grpc.RpcError as e:
             raise grpc.RpcError(e.details())
+        if cache is not None:
+            return cache.put(
+                get_feature_set_response.feature_set, latest=not int(version)
+            )
         return FeatureSet.from_proto(get_feature_set_response.feature_set)
 
     def list_entities(self) -> Dict[str, Entity]:
@@ -595,9 +985,15 @@ class Client:
 
         # Export and upload entity row DataFrame to staging location
         # provided by Feast
-        staged_files = export_source_to_staging_location(
-            entity_rows, serving_info.job_staging_location
-        )  # type: List[str]
+        staged_files: List[str]
+        if self._staging_cache is not None and isinstance(entity_rows, pd.DataFrame):
+            staged_files = self._staging_cache.stage(
+                entity_rows, serving_info.job_staging_location
+            )
+        else:
+            staged_files = export_source_to_staging_location(
+                entity_rows, serving_info.job_staging_location
+            )
         request = GetBatchFeaturesRequest(
             features=feature_references,
             dataset_source=DatasetSource(
@@ -643,22 +1039,157 @@ class Client:
         """
         self._connect_serving()
 
+        features = _build_feature_references_cached(
+            tuple(feature_refs), default_project if not self.project else self.project,
+        )
+        if self._online_cache is not None:
+            return self._get_online_features_cached(features, entity_rows)
+        return self._get_online_features_from_serving(features, entity_rows)
+
+    def _get_online_features_from_serving(
+        self,
+        features: Sequence[FeatureReference],
+        entity_rows: List[GetOnlineFeaturesRequest.EntityRow],
+    ) -> GetOnlineFeaturesResponse:
+        """
+        Retrieves online features from Feast Serving, as part of a batch of
+        concurrent requests if batching is enabled.
+        """
+        if self._online_batcher is not None:
+            return self._online_batcher.get_online_features(features, entity_rows)
+        return self._send_online_request(features, entity_rows)
+
+    def _send_online_request(
+        self,
+        features: Sequence[FeatureReference],
+        entity_rows: List[GetOnlineFeaturesRequest.EntityRow],
+    ) -> GetOnlineFeaturesResponse:
+        """
+        Sends a single online feature request to Feast Serving.
+        """
         try:
-            response = self._serving_service_stub.GetOnlineFeatures(
-                GetOnlineFeaturesRequest(
-                    features=_build_feature_references(
-                        feature_refs=feature_refs,
-                        default_project=(
-                            default_project if not self.project else self.project
-                        ),
-                    ),
-                    entity_rows=entity_rows,
-                )
+            return self._serving_service_stub.GetOnlineFeatures(
+                GetOnlineFeaturesRequest(features=features, entity_rows=entity_rows)
             )
         except grpc.RpcError as e:
             raise grpc.RpcError(e.details())
 
-        return response
+    def _get_online_features_cached(
+        self,
+        features: Tuple[FeatureReference, ...],
+        entity_rows: List[GetOnlineFeaturesRequest.EntityRow],
+    ) -> GetOnlineFeaturesResponse:
+        """
+        Retrieves online feature values from the online cache, and only the
+        values missing from it from Feast Serving. Response rows are in the
+        order of the entity rows.
+        """
+        cache = self._online_cache
+        self._resolve_online_cache_ttls(features)
+        refs = [feature_ref_string(feature) for feature in features]
+
+        # Look up the cached values of every entity row
+        entity_keys = [entity_key(entity_row.fields) for entity_row in entity_rows]
+        row_values = []  # type: List[Dict[str, ValueProto]]
+        missing_rows = OrderedDict()  # type: OrderedDict
+        missing_refs = set()
+        for entity_row, key in zip(entity_rows, entity_keys):
+            values = dict()
+            for ref in refs:
+                value = cache.get((ref, key))
+                if value is None:
+                    missing_rows.setdefault(key, entity_row)
+                    missing_refs.add(ref)
+                else:
+                    values[ref] = value
+            row_values.append(values)
+
+        # Retrieve the missing values of entity rows with cache misses only
+        if missing_rows:
+            response = self._get_online_features_from_serving(
+                [
+                    feature
+                    for feature, ref in zip(features, refs)
+                    if ref in missing_refs
+                ],
+                list(missing_rows.values()),
+            )
+
+            entity_names = {
+                name
+                for entity_row in missing_rows.values()
+                for name in entity_row.fields
+            }
+            retrieved = dict()
+            for field_values in response.field_values:
+                key = entity_key(field_values.fields, entity_names)
+                retrieved[key] = field_values.fields
+                for ref in missing_refs:
+                    # Values of missing or stale features are empty
+                    if ref in field_values.fields and field_values.fields[
+                        ref
+                    ].WhichOneof("val"):
+                        value = ValueProto()
+                        value.CopyFrom(field_values.fields[ref])
+                        cache.put((ref, key), value)
+
+            for values, key in zip(row_values, entity_keys):
+                fields = retrieved.get(key)
+                if fields is None:
+                    continue
+                for ref in missing_refs:
+                    if ref not in values and ref in fields:
+                        values[ref] = fields[ref]
+
+        return GetOnlineFeaturesResponse(
+            field_values=[
+                GetOnlineFeaturesResponse.FieldValues(
+                    fields={**entity_row.fields, **values}
+                )
+                for entity_row, values in zip(entity_rows, row_values)
+            ]
+        )
+
+    def _resolve_online_cache_ttls(self, features: Tuple[FeatureReference, ...]):
+        """
+        Sets the TTLs of features in the online cache which do not have one
+        yet, from the max age of their feature sets in Feast Core. Features
+        whose feature set cannot be looked up use the default TTL.
+        """
+        cache = self._online_cache
+        unresolved = [
+            feature
+            for feature in features
+            if cache.feature_ttl(feature_ref_string(feature)) is None
+        ]
+        projects = {feature.project for feature in unresolved}
+        for project in projects:
+            try:
+                feature_sets = self.list_feature_sets(project=project)
+            except (ConnectionError, grpc.RpcError) as e:
+                _logger.warning(
+                    f"Could not look up the max age of feature sets in project "
+                    f"{project}, using the default TTL: {e}"
+                )
+                feature_sets = []
+
+            for feature in unresolved:
+                if feature.project != project:
+                    continue
+                candidates = [
+                    feature_set
+                    for feature_set in feature_sets
+                    if feature.name in {f.name for f in feature_set.features}
+                    and feature.version in (0, feature_set.version)
+                ]
+                if candidates:
+                    feature_set = max(candidates, key=lambda fs: fs.version or 0)
+                    ttl = cache.feature_set_ttl(
+                        project, feature_set.name, feature_set.max_age
+                    )
+                else:
+                    ttl = cache.default_ttl
+                cache.set_feature_ttl(feature_ref_string(feature), ttl)
 
     def list_ingest_jobs(
         self,
@@ -736,6 +1267,10 @@ class Client:
         max_workers: int = max(CPU_COUNT - 1, 1),
         disable_progress_bar: bool = False,
         timeout: int = KAFKA_CHUNK_PRODUCTION_TIMEOUT,
+        stream: bool = False,
+        max_in_flight_chunks: Optional[int] = None,
+        checkpoint_rows: Optional[int] = None,
+        batching: Optional[BatchingOptions] = None,
     ) -> None:
         """
         Loads feature data into Feast for a specific feature set.
@@ -763,7 +1298,9 @@ class Client:
                 ingesting. This will also register changes to Feast.
 
             max_workers (int):
-                Number of worker processes to use to encode values.
+                Number of worker processes to use to encode values. The
+                worker processes are kept running for subsequent ingestions
+                until close() is called.
 
             disable_progress_bar (bool):
                 Disable printing of progress statistics.
@@ -771,6 +1308,27 @@ class Client:
             timeout (int):
                 Timeout in seconds to wait for completion.
 
+            stream (bool):
+                Read, encode and produce the source in chunks of chunk_size
+                rows instead of first rewriting it to a temporary parquet
+                file. This keeps memory usage bounded for large files.
+
+            max_in_flight_chunks (Optional[int]):
+                Maximum number of chunks waiting between the read, encode and
+                produce stages. A stage which runs ahead blocks until the
+                next stage catches up. Defaults to max_workers.
+
+            checkpoint_rows (Optional[int]):
+                Flush the Kafka producer each time at least this many rows
+                were produced. By default the producer is only flushed once
+                all rows are produced.
+
+            batching (Optional[feast.loaders.abstract_producer.BatchingOptions]):
+                Pack FeatureRows into larger Kafka produce requests, tuning
+                linger time, batch size, compression and how often delivery
+                callbacks are polled. Each FeatureRow is sent as soon as
+                possible by default.
+
         Returns:
             None:
                 None
@@ -785,17 +1343,26 @@ class Client:
         else:
             raise Exception(f"Feature set name must be provided")
 
-        # Read table and get row count
-        dir_path, dest_path = _read_table_from_source(source, chunk_size, max_workers)
+        if stream:
+            # Read source lazily and get row count if known up front
+            dir_path = None
+            tables, row_count, schema = read_source_batches(source, chunk_size)
+        else:
+            # Read table and get row count
+            dir_path, dest_path = _read_table_from_source(
+                source, chunk_size, max_workers
+            )
 
-        pq_file = pq.ParquetFile(dest_path)
+            pq_file = pq.ParquetFile(dest_path)
 
-        row_count = pq_file.metadata.num_rows
+            row_count = pq_file.metadata.num_rows
+            schema = pq_file.schema_arrow
 
-        # Update the feature set based on PyArrow table of first row group
+        # Update the feature set based on the schema of the source, which for
+        # parquet files is read from the file footer without reading any data
         if force_update:
-            feature_set.infer_fields_from_pa(
-                table=pq_file.read_row_group(0),
+            feature_set.infer_fields_from_pa_schema(
+                schema=schema,
                 discard_unused_fields=True,
                 replace_existing_features=True,
             )
@@ -821,32 +1388,42 @@ class Client:
             # Kafka configs
             brokers = feature_set.get_kafka_source_brokers()
             topic = feature_set.get_kafka_source_topic()
-            producer = get_producer(brokers, row_count, disable_progress_bar)
+            producer = get_producer(brokers, row_count, disable_progress_bar, batching)
 
-            # Loop optimization declarations
-            produce = producer.produce
-            flush = producer.flush
             ingestion_id = _generate_ingestion_id(feature_set)
 
             # Transform and push data to Kafka
             if feature_set.source.source_type == "Kafka":
-                for chunk in get_feature_row_chunks(
-                    file=dest_path,
-                    row_groups=list(range(pq_file.num_row_groups)),
-                    fs=feature_set,
-                    ingestion_id=ingestion_id,
-                    max_workers=max_workers,
-                ):
-
-                    # Push FeatureRow one chunk at a time to kafka
-                    for serialized_row in chunk:
-                        produce(topic=topic, value=serialized_row)
-
-                    # Force a flush after each chunk
-                    flush(timeout=timeout)
+                if not stream:
+                    tables = (
+                        pq_file.read_row_group(row_group_idx)
+                        for row_group_idx in range(pq_file.num_row_groups)
+                    )
+
+                # Start the workers before the pipeline starts its threads
+                pool = self._get_encoding_pool(max_workers)
+                pool.start()
+
+                # Read, encode and produce chunks concurrently
+                pipeline = IngestionPipeline(
+                    tables=tables,
+                    encode=partial(
+                        get_feature_row_chunks_from_tables,
+                        fs=feature_set,
+                        ingestion_id=ingestion_id,
+                        max_workers=max_workers,
+                        pool=pool,
+                    ),
+                    produce=partial(producer.produce, topic),
+                    flush=partial(producer.flush, timeout=timeout),
+                    max_in_flight_chunks=max_in_flight_chunks or max_workers,
+                    checkpoint_rows=checkpoint_rows,
+                )
+                ingested_rows = pipeline.run()
 
-                    # Remove chunk from memory
-                    del chunk
+                # Row count of streamed CSV files is only known at the end
+                if row_count is None:
+                    producer.row_count = ingested_rows
 
             else:
                 raise Exception(
@@ -857,10 +1434,15 @@ class Client:
 
             # Print ingestion statistics
             producer.print_results()
+            _logger.debug(
+                "Stage timings:\n"
+                + "\n".join(str(timing) for timing in pipeline.timings.values())
+            )
         finally:
             # Remove parquet file(s) that were created earlier
-            print("Removing temporary file(s)...")
-            shutil.rmtree(dir_path)
+            if dir_path is not None:
+                print("Removing temporary file(s)...")
+                shutil.rmtree(dir_path)
 
         return None
 
@@ -919,6 +1501,25 @@ def _build_feature_references(
     return features
 
 
+@lru_cache(maxsize=1024)
+def _build_feature_references_cached(
+    feature_refs: Tuple[str, ...], default_project: str = None
+) -> Tuple[FeatureReference, ...]:
+    """
+    Memoized version of _build_feature_references for online retrieval,
+    where the same feature references are parsed on every request. The
+    returned FeatureReferences are shared between calls and must not be
+    modified.
+
+    Args:
+        feature_refs: Tuple of feature reference strings
+            ("project/feature:version")
+        default_project: This project will be used if the project name is
+            not provided in the feature reference
+    """
+    return tuple(_build_feature_references(list(feature_refs), default_project))
+
+
 def _generate_ingestion_id(feature_set: FeatureSet) -> str:
     """
     Generates a UUID from the feature set name, version, and the current time.
@@ -34,6 +34,7 @@ CONFIG_GRPC_CONNECTION_TIMEOUT_APPLY_KEY = "grpc_connection_timeout_apply_key"
 CONFIG_BATCH_FEATURE_REQUEST_WAIT_TIME_SECONDS_KEY = (
     "batch_feature_request_wait_time_seconds"
 )
+CONFIG_INGESTION_STAGING_DIR_KEY = "ingestion_staging_dir"
 
 # Configuration option default values
 FEAST_DEFAULT_OPTIONS = {
@@ -45,4 +46,6 @@ FEAST_DEFAULT_OPTIONS = {
     CONFIG_GRPC_CONNECTION_TIMEOUT_DEFAULT_KEY: "3",
     CONFIG_GRPC_CONNECTION_TIMEOUT_APPLY_KEY: "600",
     CONFIG_BATCH_FEATURE_REQUEST_WAIT_TIME_SECONDS_KEY: "600",
+    # Shared memory in /dev/shm if it exists, else the temporary directory
+    CONFIG_INGESTION_STAGING_DIR_KEY: "",
 }
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: feast/core/CoreService.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'feast/core/CoreService.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from feast.core import FeatureSet_pb2 as feast_dot_core_dot_FeatureSet__pb2
+from feast.core import Store_pb2 as feast_dot_core_dot_Store__pb2
+from feast.core import FeatureSetReference_pb2 as feast_dot_core_dot_FeatureSetReference__pb2
+from feast.core import IngestionJob_pb2 as feast_dot_core_dot_IngestionJob__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1c\x66\x65\x61st/core/CoreService.proto\x12\nfeast.core\x1a\x1b\x66\x65\x61st/core/FeatureSet.proto\x1a\x16\x66\x65\x61st/core/Store.proto\x1a$feast/core/FeatureSetReference.proto\x1a\x1d\x66\x65\x61st/core/IngestionJob.proto\"F\n\x14GetFeatureSetRequest\x12\x0f\n\x07project\x18\x03 \x01(\t\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\x05\"D\n\x15GetFeatureSetResponse\x12+\n\x0b\x66\x65\x61ture_set\x18\x01 \x01(\x0b\x32\x16.feast.core.FeatureSet\"\xa5\x01\n\x16ListFeatureSetsRequest\x12\x39\n\x06\x66ilter\x18\x01 \x01(\x0b\x32).feast.core.ListFeatureSetsRequest.Filter\x1aP\n\x06\x46ilter\x12\x0f\n\x07project\x18\x03 \x01(\t\x12\x18\n\x10\x66\x65\x61ture_set_name\x18\x01 \x01(\t\x12\x1b\n\x13\x66\x65\x61ture_set_version\x18\x02 \x01(\t\"G\n\x17ListFeatureSetsResponse\x12,\n\x0c\x66\x65\x61ture_sets\x18\x01 \x03(\x0b\x32\x16.feast.core.FeatureSet\"a\n\x11ListStoresRequest\x12\x34\n\x06\x66ilter\x18\x01 \x01(\x0b\x32$.feast.core.ListStoresRequest.Filter\x1a\x16\n\x06\x46ilter\x12\x0c\n\x04name\x18\x01 \x01(\t\"6\n\x12ListStoresResponse\x12 \n\x05store\x18\x01 \x03(\x0b\x32\x11.feast.core.Store\"E\n\x16\x41pplyFeatureSetRequest\x12+\n\x0b\x66\x65\x61ture_set\x18\x01 \x01(\x0b\x32\x16.feast.core.FeatureSet\"\xb3\x01\n\x17\x41pplyFeatureSetResponse\x12+\n\x0b\x66\x65\x61ture_set\x18\x01 \x01(\x0b\x32\x16.feast.core.FeatureSet\x12:\n\x06status\x18\x02 \x01(\x0e\x32*.feast.core.ApplyFeatureSetResponse.Status\"/\n\x06Status\x12\r\n\tNO_CHANGE\x10\x00\x12\x0b\n\x07\x43REATED\x10\x01\x12\t\n\x05\x45RROR\x10\x02\"\x1c\n\x1aGetFeastCoreVersionRequest\".\n\x1bGetFeastCoreVersionResponse\x12\x0f\n\x07version\x18\x01 \x01(\t\"6\n\x12UpdateStoreRequest\x12 \n\x05store\x18\x01 \x01(\x0b\x32\x11.feast.core.Store\"\x95\x01\n\x13UpdateStoreResponse\x12 \n\x05store\x18\x01 \x01(\x0b\x32\x11.feast.core.Store\x12\x36\n\x06status\x18\x02 \x01(\x0e\x32&.feast.core.UpdateStoreResponse.Status\"$\n\x06Status\x12\r\n\tNO_CHANGE\x10\x00\x12\x0b\n\x07UPDATED\x10\x01\"$\n\x14\x43reateProjectRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x17\n\x15\x43reateProjectResponse\"%\n\x15\x41rchiveProjectRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x18\n\x16\x41rchiveProjectResponse\"\x15\n\x13ListProjectsRequest\"(\n\x14ListProjectsResponse\x12\x10\n\x08projects\x18\x01 \x03(\t\"\xc1\x01\n\x18ListIngestionJobsRequest\x12;\n\x06\x66ilter\x18\x01 \x01(\x0b\x32+.feast.core.ListIngestionJobsRequest.Filter\x1ah\n\x06\x46ilter\x12\n\n\x02id\x18\x01 \x01(\t\x12>\n\x15\x66\x65\x61ture_set_reference\x18\x02 \x01(\x0b\x32\x1f.feast.core.FeatureSetReference\x12\x12\n\nstore_name\x18\x03 \x01(\t\"C\n\x19ListIngestionJobsResponse\x12&\n\x04jobs\x18\x01 \x03(\x0b\x32\x18.feast.core.IngestionJob\"(\n\x1aRestartIngestionJobRequest\x12\n\n\x02id\x18\x01 \x01(\t\"\x1d\n\x1bRestartIngestionJobResponse\"%\n\x17StopIngestionJobRequest\x12\n\n\x02id\x18\x01 \x01(\t\"\x1a\n\x18StopIngestionJobResponse2\xcb\x08\n\x0b\x43oreService\x12\x66\n\x13GetFeastCoreVersion\x12&.feast.core.GetFeastCoreVersionRequest\x1a\'.feast.core.GetFeastCoreVersionResponse\x12T\n\rGetFeatureSet\x12 .feast.core.GetFeatureSetRequest\x1a!.feast.core.GetFeatureSetResponse\x12Z\n\x0fListFeatureSets\x12\".feast.core.ListFeatureSetsRequest\x1a#.feast.core.ListFeatureSetsResponse\x12K\n\nListStores\x12\x1d.feast.core.ListStoresRequest\x1a\x1e.feast.core.ListStoresResponse\x12Z\n\x0f\x41pplyFeatureSet\x12\".feast.core.ApplyFeatureSetRequest\x1a#.feast.core.ApplyFeatureSetResponse\x12N\n\x0bUpdateStore\x12\x1e.feast.core.UpdateStoreRequest\x1a\x1f.feast.core.UpdateStoreResponse\x12T\n\rCreateProject\x12 .feast.core.CreateProjectRequest\x1a!.feast.core.CreateProjectResponse\x12W\n\x0e\x41rchiveProject\x12!.feast.core.ArchiveProjectRequest\x1a\".feast.core.ArchiveProjectResponse\x12Q\n\x0cListProjects\x12\x1f.feast.core.ListProjectsRequest\x1a .feast.core.ListProjectsResponse\x12`\n\x11ListIngestionJobs\x12$.feast.core.ListIngestionJobsRequest\x1a%.feast.core.ListIngestionJobsResponse\x12\x66\n\x13RestartIngestionJob\x12&.feast.core.RestartIngestionJobRequest\x1a\'.feast.core.RestartIngestionJobResponse\x12]\n\x10StopIngestionJob\x12#.feast.core.StopIngestionJobRequest\x1a$.feast.core.StopIngestionJobResponseBO\n\nfeast.coreB\x10\x43oreServiceProtoZ/github.com/gojek/feast/sdk/go/protos/feast/coreb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'feast.core.CoreService_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\nfeast.coreB\020CoreServiceProtoZ/github.com/gojek/feast/sdk/go/protos/feast/core'
+  _globals['_GETFEATURESETREQUEST']._serialized_start=166
+  _globals['_GETFEATURESETREQUEST']._serialized_end=236
+  _globals['_GETFEATURESETRESPONSE']._serialized_start=238
+  _globals['_GETFEATURESETRESPONSE']._serialized_end=306
+  _globals['_LISTFEATURESETSREQUEST']._serialized_start=309
+  _globals['_LISTFEATURESETSREQUEST']._serialized_end=474
+  _globals['_LISTFEATURESETSREQUEST_FILTER']._serialized_start=394
+  _globals['_LISTFEATURESETSREQUEST_FILTER']._serialized_end=474
+  _globals['_LISTFEATURESETSRESPONSE']._serialized_start=476
+  _globals['_LISTFEATURESETSRESPONSE']._serialized_end=547
+  _globals['_LISTSTORESREQUEST']._serialized_start=549
+  _globals['_LISTSTORESREQUEST']._serialized_end=646
+  _globals['_LISTSTORESREQUEST_FILTER']._serialized_start=624
+  _globals['_LISTSTORESREQUEST_FILTER']._serialized_end=646
+  _globals['_LISTSTORESRESPONSE']._serialized_start=648
+  _globals['_LISTSTORESRESPONSE']._serialized_end=702
+  _globals['_APPLYFEATURESETREQUEST']._serialized_start=704
+  _globals['_APPLYFEATURESETREQUEST']._serialized_end=773
+  _globals['_APPLYFEATURESETRESPONSE']._serialized_start=776
+  _globals['_APPLYFEATURESETRESPONSE']._serialized_end=955
+  _globals['_APPLYFEATURESETRESPONSE_STATUS']._serialized_start=908
+  _globals['_APPLYFEATURESETRESPONSE_STATUS']._serialized_end=955
+  _globals['_GETFEASTCOREVERSIONREQUEST']._serialized_start=957
+  _globals['_GETFEASTCOREVERSIONREQUEST']._serialized_end=985
+  _globals['_GETFEASTCOREVERSIONRESPONSE']._serialized_start=987
+  _globals['_GETFEASTCOREVERSIONRESPONSE']._serialized_end=1033
+  _globals['_UPDATESTOREREQUEST']._serialized_start=1035
+  _globals['_UPDATESTOREREQUEST']._serialized_end=1089
+  _globals['_UPDATESTORERESPONSE']._serialized_start=1092
+  _globals['_UPDATESTORERESPONSE']._serialized_end=1241
+  _globals['_UPDATESTORERESPONSE_STATUS']._serialized_start=1205
+  _globals['_UPDATESTORERESPONSE_STATUS']._serialized_end=1241
+  _globals['_CREATEPROJECTREQUEST']._serialized_start=1243
+  _globals['_CREATEPROJECTREQUEST']._serialized_end=1279
+  _globals['_CREATEPROJECTRESPONSE']._serialized_start=1281
+  _globals['_CREATEPROJECTRESPONSE']._serialized_end=1304
+  _globals['_ARCHIVEPROJECTREQUEST']._serialized_start=1306
+  _globals['_ARCHIVEPROJECTREQUEST']._serialized_end=1343
+  _globals['_ARCHIVEPROJECTRESPONSE']._serialized_start=1345
+  _globals['_ARCHIVEPROJECTRESPONSE']._serialized_end=1369
+  _globals['_LISTPROJECTSREQUEST']._serialized_start=1371
+  _globals['_LISTPROJECTSREQUEST']._serialized_end=1392
+  _globals['_LISTPROJECTSRESPONSE']._serialized_start=1394
+  _globals['_LISTPROJECTSRESPONSE']._serialized_end=1434
+  _globals['_LISTINGESTIONJOBSREQUEST']._serialized_start=1437
+  _globals['_LISTINGESTIONJOBSREQUEST']._serialized_end=1630
+  _globals['_LISTINGESTIONJOBSREQUEST_FILTER']._serialized_start=1526
+  _globals['_LISTINGESTIONJOBSREQUEST_FILTER']._serialized_end=1630
+  _globals['_LISTINGESTIONJOBSRESPONSE']._serialized_start=1632
+  _globals['_LISTINGESTIONJOBSRESPONSE']._serialized_end=1699
+  _globals['_RESTARTINGESTIONJOBREQUEST']._serialized_start=1701
+  _globals['_RESTARTINGESTIONJOBREQUEST']._serialized_end=1741
+  _globals['_RESTARTINGESTIONJOBRESPONSE']._serialized_start=1743
+  _globals['_RESTARTINGESTIONJOBRESPONSE']._serialized_end=1772
+  _globals['_STOPINGESTIONJOBREQUEST']._serialized_start=1774
+  _globals['_STOPINGESTIONJOBREQUEST']._serialized_end=1811
+  _globals['_STOPINGESTIONJOBRESPONSE']._serialized_start=1813
+  _globals['_STOPINGESTIONJOBRESPONSE']._serialized_end=1839
+  _globals['_CORESERVICE']._serialized_start=1842
+  _globals['_CORESERVICE']._serialized_end=2941
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: feast/core/IngestionJob.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'feast/core/IngestionJob.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from feast.core import FeatureSet_pb2 as feast_dot_core_dot_FeatureSet__pb2
+from feast.core import Store_pb2 as feast_dot_core_dot_Store__pb2
+from feast.core import Source_pb2 as feast_dot_core_dot_Source__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1d\x66\x65\x61st/core/IngestionJob.proto\x12\nfeast.core\x1a\x1b\x66\x65\x61st/core/FeatureSet.proto\x1a\x16\x66\x65\x61st/core/Store.proto\x1a\x17\x66\x65\x61st/core/Source.proto\"\xd3\x01\n\x0cIngestionJob\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0b\x65xternal_id\x18\x02 \x01(\t\x12.\n\x06status\x18\x03 \x01(\x0e\x32\x1e.feast.core.IngestionJobStatus\x12,\n\x0c\x66\x65\x61ture_sets\x18\x04 \x03(\x0b\x32\x16.feast.core.FeatureSet\x12\"\n\x06source\x18\x05 \x01(\x0b\x32\x12.feast.core.Source\x12 \n\x05store\x18\x06 \x01(\x0b\x32\x11.feast.core.Store*\x8f\x01\n\x12IngestionJobStatus\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\x0b\n\x07RUNNING\x10\x02\x12\r\n\tCOMPLETED\x10\x03\x12\x0c\n\x08\x41\x42ORTING\x10\x04\x12\x0b\n\x07\x41\x42ORTED\x10\x05\x12\t\n\x05\x45RROR\x10\x06\x12\x0e\n\nSUSPENDING\x10\x07\x12\r\n\tSUSPENDED\x10\x08\x42P\n\nfeast.coreB\x11IngestionJobProtoZ/github.com/gojek/feast/sdk/go/protos/feast/coreb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'feast.core.IngestionJob_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\nfeast.coreB\021IngestionJobProtoZ/github.com/gojek/feast/sdk/go/protos/feast/core'
+  _globals['_INGESTIONJOBSTATUS']._serialized_start=338
+  _globals['_INGESTIONJOBSTATUS']._serialized_end=481
+  _globals['_INGESTIONJOB']._serialized_start=124
+  _globals['_INGESTIONJOB']._serialized_end=335
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: feast/core/Runner.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'feast/core/Runner.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x17\x66\x65\x61st/core/Runner.proto\x12\nfeast.core\"S\n\x19\x44irectRunnerConfigOptions\x12\x19\n\x11targetParallelism\x18\x01 \x01(\x05\x12\x1b\n\x13\x64\x65\x61\x64LetterTableSpec\x18\x02 \x01(\t\"\xa2\x02\n\x1b\x44\x61taflowRunnerConfigOptions\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0e\n\x06region\x18\x02 \x01(\t\x12\x0c\n\x04zone\x18\x03 \x01(\t\x12\x16\n\x0eserviceAccount\x18\x04 \x01(\t\x12\x0f\n\x07network\x18\x05 \x01(\t\x12\x12\n\nsubnetwork\x18\x06 \x01(\t\x12\x19\n\x11workerMachineType\x18\x07 \x01(\t\x12\x1c\n\x14\x61utoscalingAlgorithm\x18\x08 \x01(\t\x12\x14\n\x0cusePublicIps\x18\t \x01(\x08\x12\x14\n\x0ctempLocation\x18\n \x01(\t\x12\x15\n\rmaxNumWorkers\x18\x0b \x01(\x05\x12\x1b\n\x13\x64\x65\x61\x64LetterTableSpec\x18\x0c \x01(\tBJ\n\nfeast.coreB\x0bRunnerProtoZ/github.com/gojek/feast/sdk/go/protos/feast/coreb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'feast.core.Runner_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\nfeast.coreB\013RunnerProtoZ/github.com/gojek/feast/sdk/go/protos/feast/core'
+  _globals['_DIRECTRUNNERCONFIGOPTIONS']._serialized_start=39
+  _globals['_DIRECTRUNNERCONFIGOPTIONS']._serialized_end=122
+  _globals['_DATAFLOWRUNNERCONFIGOPTIONS']._serialized_start=125
+  _globals['_DATAFLOWRUNNERCONFIGOPTIONS']._serialized_end=415
+# @@protoc_insertion_point(module_scope)
@@ -21,6 +21,8 @@ from feast.value_type import ValueType
 class Entity(Field):
     """Entity field type"""
 
+    __slots__ = ()
+
     def to_proto(self) -> EntityProto:
         """
         Converts Entity to its Protocol Buffer representation
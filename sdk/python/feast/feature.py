@@ -21,6 +21,8 @@ from feast.value_type import ValueType
 class Feature(Field):
     """Feature field type"""
 
+    __slots__ = ()
+
     def to_proto(self) -> FeatureProto:
         """Converts Feature object to its Protocol Buffer representation"""
         value_type = ValueTypeProto.ValueType.Enum.Value(self.dtype.name)
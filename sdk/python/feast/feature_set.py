@@ -11,12 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
 import warnings
 from collections import OrderedDict
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from google.protobuf import json_format
 from google.protobuf.duration_pb2 import Duration
 from google.protobuf.json_format import MessageToJson
@@ -36,7 +39,8 @@ from feast.loaders import yaml as feast_yaml
 from feast.source import Source
 from feast.type_map import (
     DATETIME_COLUMN,
-    pa_to_feast_value_type,
+    pa_type_to_feast_value_type,
+    pd_dtype_to_feast_value_type,
     python_type_to_feast_value_type,
 )
 from tensorflow_metadata.proto.v0 import schema_pb2
@@ -101,6 +105,25 @@ class FeatureSet:
         """
         return self._fields
 
+    @property
+    def _fields(self) -> Dict[str, Field]:
+        # Fields of a feature set created from a proto are only built once
+        # they are accessed
+        if self._field_specs is not None:
+            fields = OrderedDict()  # type: Dict[str, Field]
+            for feature in self._field_specs.features:
+                fields[feature.name] = Feature.from_proto(feature)
+            for entity in self._field_specs.entities:
+                fields[entity.name] = Entity.from_proto(entity)
+            self._field_dict = fields
+            self._field_specs = None
+        return self._field_dict
+
+    @_fields.setter
+    def _fields(self, fields: Dict[str, Field]):
+        self._field_dict = fields
+        self._field_specs = None
+
     @property
     def features(self) -> List[Feature]:
         """
@@ -476,6 +499,125 @@ class FeatureSet:
                 fields that are not found in the dataset or provided by the
                 user.
 
+        Returns:
+            None:
+                None
+        """
+        # Validates the columns to ensure that value types are consistent
+        table.validate()
+        self.infer_fields_from_pa_schema(
+            schema=table.schema,
+            entities=entities,
+            features=features,
+            replace_existing_features=replace_existing_features,
+            replace_existing_entities=replace_existing_entities,
+            discard_unused_fields=discard_unused_fields,
+        )
+
+    def infer_fields_from_parquet(
+        self,
+        path: Union[str, List[str]],
+        entities: Optional[List[Entity]] = None,
+        features: Optional[List[Feature]] = None,
+        replace_existing_features: bool = False,
+        replace_existing_entities: bool = False,
+        discard_unused_fields: bool = False,
+    ) -> None:
+        """
+        Adds fields (Features or Entities) to a feature set based on the schema
+        of one or more Parquet files. Only the file footers are read, so the
+        time taken does not depend on the amount of data in the files. The
+        schemas of multiple files are unified, which fails if a column has
+        different types in different files. All columns are detected as
+        features, so setting at least one entity manually is advised.
+
+        Args:
+            path (Union[str, List[str]]):
+                Path of a Parquet file, of a directory of Parquet files, or a
+                list of paths of Parquet files.
+
+            entities (Optional[List[Entity]]):
+                List of entities that will be set manually and not inferred.
+                These will take precedence over any existing entities or
+                entities found in the Parquet files.
+
+            features (Optional[List[Feature]]):
+                List of features that will be set manually and not inferred.
+                These will take precedence over any existing feature or features
+                found in the Parquet files.
+
+            replace_existing_features (bool):
+                Boolean flag. If true, will replace existing features in this
+                feature set with features found in the Parquet files. If false,
+                will skip conflicting features.
+
+            replace_existing_entities (bool):
+                Boolean flag. If true, will replace existing entities in this
+                feature set with features found in the Parquet files. If false,
+                will skip conflicting entities.
+
+            discard_unused_fields (bool):
+                Boolean flag. Setting this to True will discard any existing
+                fields that are not found in the dataset or provided by the
+                user.
+
+        Returns:
+            None:
+                None
+        """
+        self.infer_fields_from_pa_schema(
+            schema=_read_parquet_schema(path),
+            entities=entities,
+            features=features,
+            replace_existing_features=replace_existing_features,
+            replace_existing_entities=replace_existing_entities,
+            discard_unused_fields=discard_unused_fields,
+        )
+
+    def infer_fields_from_pa_schema(
+        self,
+        schema: pa.Schema,
+        entities: Optional[List[Entity]] = None,
+        features: Optional[List[Feature]] = None,
+        replace_existing_features: bool = False,
+        replace_existing_entities: bool = False,
+        discard_unused_fields: bool = False,
+    ) -> None:
+        """
+        Adds fields (Features or Entities) to a feature set based on a PyArrow
+        schema, such as the schema of a PyArrow table or of a Parquet file. All
+        columns are detected as features, so setting at least one entity
+        manually is advised.
+
+        Args:
+            schema (pyarrow.Schema):
+                PyArrow schema to infer fields from.
+
+            entities (Optional[List[Entity]]):
+                List of entities that will be set manually and not inferred.
+                These will take precedence over any existing entities or
+                entities found in the schema.
+
+            features (Optional[List[Feature]]):
+                List of features that will be set manually and not inferred.
+                These will take precedence over any existing feature or features
+                found in the schema.
+
+            replace_existing_features (bool):
+                Boolean flag. If true, will replace existing features in this
+                feature set with features found in the schema. If false, will
+                skip conflicting features.
+
+            replace_existing_entities (bool):
+                Boolean flag. If true, will replace existing entities in this
+                feature set with features found in the schema. If false, will
+                skip conflicting entities.
+
+            discard_unused_fields (bool):
+                Boolean flag. Setting this to True will discard any existing
+                fields that are not found in the dataset or provided by the
+                user.
+
         Returns:
             None:
                 None
@@ -486,11 +628,11 @@ class FeatureSet:
             features = list()
 
         # Validate whether the datetime column exists with the right name
-        if DATETIME_COLUMN not in table.column_names:
+        if DATETIME_COLUMN not in schema.names:
             raise Exception("No column 'datetime'")
 
         # Validate the date type for the datetime column
-        if not isinstance(table.column(DATETIME_COLUMN).type, TimestampType):
+        if not isinstance(schema.field(DATETIME_COLUMN).type, TimestampType):
             raise Exception(
                 "Column 'datetime' does not have the correct type: datetime64[ms]"
             )
@@ -523,7 +665,7 @@ class FeatureSet:
             new_fields[name] = field
 
         # Iterate over all of the column names and create features
-        for column in table.column_names:
+        for column in schema.names:
             column = column.strip()
 
             # Skip datetime column
@@ -551,16 +693,17 @@ class FeatureSet:
             # Store this fields as a feature
             # TODO: (Minor) Change the parameter name from dtype to patype
             new_fields[column] = Feature(
-                name=column, dtype=self._infer_pa_column_type(table.column(column))
+                name=column,
+                dtype=pa_type_to_feast_value_type(schema.field(column).type),
             )
 
-            output_log += f"{type(new_fields[column]).__name__} {new_fields[column].name} ({new_fields[column].dtype}) added from PyArrow Table.\n"
+            output_log += f"{type(new_fields[column]).__name__} {new_fields[column].name} ({new_fields[column].dtype}) added from PyArrow schema.\n"
 
         # Discard unused fields from feature set
         if discard_unused_fields:
             keys_to_remove = []
             for key in new_fields.keys():
-                if not (key in table.column_names or key in provided_fields.keys()):
+                if not (key in schema.names or key in provided_fields.keys()):
                     output_log += f"{type(new_fields[key]).__name__} {new_fields[key].name} ({new_fields[key].dtype}) removed because it is unused.\n"
                     keys_to_remove.append(key)
             for key in keys_to_remove:
@@ -571,45 +714,7 @@ class FeatureSet:
         print(output_log)
 
     def _infer_pd_column_type(self, column, series, rows_to_sample):
-        dtype = None
-        sample_count = 0
-
-        # Loop over all rows for this column to infer types
-        for key, value in series.iteritems():
-            sample_count += 1
-            # Stop sampling at the row limit
-            if sample_count > rows_to_sample:
-                continue
-
-            # Infer the specific type for this row
-            current_dtype = python_type_to_feast_value_type(name=column, value=value)
-
-            # Make sure the type is consistent for column
-            if dtype:
-                if dtype != current_dtype:
-                    raise ValueError(
-                        f"Type mismatch detected in column {column}. Both "
-                        f"the types {current_dtype} and {dtype} "
-                        f"have been found."
-                    )
-            else:
-                # Store dtype in field to type map if it isnt already
-                dtype = current_dtype
-
-        return dtype
-
-    def _infer_pa_column_type(self, column: pa.lib.ChunkedArray):
-        """
-        Infers the PyArrow column type.
-
-        :param column: Column from a PyArrow table
-        :type column: pa.lib.ChunkedArray
-        :return:
-        :rtype:
-        """
-        # Validates the column to ensure that value types are consistent
-        column.validate()
-        return pa_to_feast_value_type(column)
+        return _infer_pd_column_type(column, series, rows_to_sample)
 
     def _update_from_feature_set(self, feature_set):
         """
@@ -624,8 +729,13 @@ class FeatureSet:
         self.version = feature_set.version
         self.source = feature_set.source
         self.max_age = feature_set.max_age
-        self.features = feature_set.features
-        self.entities = feature_set.entities
+        if feature_set._field_specs is not None:
+            # Keep the fields of the other feature set unbuilt
+            self._fields = OrderedDict()
+            self._field_specs = feature_set._field_specs
+        else:
+            self.features = feature_set.features
+            self.entities = feature_set.entities
         self.source = feature_set.source
         self.status = feature_set.status
         self.created_timestamp = feature_set.created_timestamp
@@ -779,7 +889,9 @@ class FeatureSet:
     @classmethod
     def from_proto(cls, feature_set_proto: FeatureSetProto):
         """
-        Creates a feature set from a protobuf representation of a feature set
+        Creates a feature set from a protobuf representation of a feature set.
+        Its features and entities are only built when they are first accessed,
+        and are copied as is by to_proto() until then.
 
         Args:
             feature_set_proto: A protobuf representation of a feature set
@@ -790,13 +902,6 @@ class FeatureSet:
 
         feature_set = cls(
             name=feature_set_proto.spec.name,
-            features=[
-                Feature.from_proto(feature)
-                for feature in feature_set_proto.spec.features
-            ],
-            entities=[
-                Entity.from_proto(entity) for entity in feature_set_proto.spec.entities
-            ],
             max_age=feature_set_proto.spec.max_age,
             source=(
                 None
@@ -807,6 +912,10 @@ class FeatureSet:
             if len(feature_set_proto.spec.project) == 0
             else feature_set_proto.spec.project,
         )
+        feature_set._field_specs = FeatureSetSpecProto(
+            features=feature_set_proto.spec.features,
+            entities=feature_set_proto.spec.entities,
+        )
         feature_set._version = feature_set_proto.spec.version
         feature_set._status = feature_set_proto.meta.status
         feature_set._created_timestamp = feature_set_proto.meta.created_timestamp
@@ -830,17 +939,21 @@ class FeatureSet:
             project=self.project,
             max_age=self.max_age,
             source=self.source.to_proto() if self.source is not None else None,
-            features=[
+        )
+        if self._field_specs is not None:
+            spec.features.extend(self._field_specs.features)
+            spec.entities.extend(self._field_specs.entities)
+        else:
+            spec.features.extend(
                 field.to_proto()
                 for field in self._fields.values()
                 if type(field) == Feature
-            ],
-            entities=[
+            )
+            spec.entities.extend(
                 field.to_proto()
                 for field in self._fields.values()
                 if type(field) == Entity
-            ],
-        )
+            )
 
         return FeatureSetProto(spec=spec, meta=meta)
 
@@ -978,16 +1091,13 @@ def _make_tfx_schema_domain_info_inline(schema: schema_pb2.Schema) -> None:
 
 
 def _infer_pd_column_type(column, series, rows_to_sample):
-    dtype = None
-    sample_count = 0
-
-    # Loop over all rows for this column to infer types
-    for key, value in series.iteritems():
-        sample_count += 1
-        # Stop sampling at the row limit
-        if sample_count > rows_to_sample:
-            continue
+    # All values of columns of most NumPy dtypes have the same type
+    dtype = pd_dtype_to_feast_value_type(series.dtype)
+    if dtype is not None:
+        return dtype
 
+    # Loop over the sampled rows for this column to infer types
+    for value in series.iloc[:rows_to_sample]:
         # Infer the specific type for this row
         current_dtype = python_type_to_feast_value_type(name=column, value=value)
 
@@ -1004,3 +1114,21 @@ def _infer_pd_column_type(column, series, rows_to_sample):
             dtype = current_dtype
 
     return dtype
+
+
+def _read_parquet_schema(path: Union[str, List[str]]) -> pa.Schema:
+    """
+    Reads the PyArrow schema of one or more Parquet files from their footers,
+    unifying the schemas of multiple files.
+    """
+    if isinstance(path, str) and not os.path.isdir(path):
+        return pq.read_schema(path)
+
+    if isinstance(path, str):
+        # Only lists the files of the directory
+        paths = ds.dataset(path, format="parquet").files
+    else:
+        paths = path
+    if not paths:
+        raise ValueError(f"No Parquet files found in {path}")
+    return pa.unify_schemas([pq.read_schema(file_path) for file_path in paths])
@@ -0,0 +1,370 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+import time
+from fnmatch import fnmatchcase
+from typing import Callable, Dict, List, Optional, Tuple
+
+from feast.core.FeatureSet_pb2 import FeatureSet as FeatureSetProto
+from feast.core.FeatureSet_pb2 import FeatureSetStatus
+from feast.feature_set import FeatureSet, FeatureSetRef
+from feast.online_cache import CacheStats
+
+_logger = logging.getLogger(__name__)
+
+# Filter of a feature set listing: project, name and version, each of which
+# may be a "*" wildcard
+ListingFilter = Tuple[str, str, str]
+
+
+class _Entry:
+    """
+    A cached feature set, stored as its serialized proto.
+    """
+
+    __slots__ = ("serialized", "version", "fetched_at")
+
+    def __init__(self, serialized: bytes, version: int, fetched_at: float):
+        self.serialized = serialized
+        self.version = version
+        self.fetched_at = fetched_at
+
+    def feature_set(self) -> FeatureSet:
+        """
+        Builds a new feature set from the cached proto
+        """
+        return FeatureSet.from_proto(FeatureSetProto.FromString(self.serialized))
+
+
+class FeatureSetCache:
+    """
+    In-process registry of the feature sets retrieved from Feast Core,
+    keyed by feature set reference. A reference without a version refers to
+    the latest version of a feature set.
+
+    Feature sets and listings expire after a TTL. A background refresher can
+    keep them up to date by listing the feature sets of every cached project
+    more often than the TTL.
+
+    Only feature sets which are ready are cached, as the status of the
+    others is expected to change. Feature sets are cached as protos, and
+    every lookup returns new feature sets which can be modified without
+    affecting the cache. The cache is safe to share between threads.
+    """
+
+    def __init__(self, ttl: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            ttl (float):
+                Time in seconds after which a feature set is retrieved from
+                Feast Core again.
+
+            clock (Callable[[], float]):
+                Function returning the current time in seconds.
+        """
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: Dict[FeatureSetRef, _Entry] = dict()
+        self._listings: Dict[ListingFilter, Tuple[List[FeatureSetRef], float]] = dict()
+        self._lock = threading.Lock()
+        self._refresher: Optional[threading.Thread] = None
+        self._stop_refresher = threading.Event()
+        self.stats = CacheStats()
+
+    @property
+    def ttl(self) -> float:
+        """
+        Returns the time in seconds after which feature sets expire
+        """
+        return self._ttl
+
+    @property
+    def refreshing(self) -> bool:
+        """
+        Returns True if the background refresher is running
+        """
+        return self._refresher is not None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, ref: FeatureSetRef) -> Optional[FeatureSet]:
+        """
+        Returns a cached feature set, or None if it is missing or expired.
+
+        Args:
+            ref (FeatureSetRef):
+                Reference of the feature set, without a version for the
+                latest version.
+        """
+        with self._lock:
+            entry = self._entries.get(ref)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if self._expired(entry.fetched_at):
+                del self._entries[ref]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+        return entry.feature_set()
+
+    def put(self, proto: FeatureSetProto, latest: bool = False) -> FeatureSet:
+        """
+        Caches a feature set retrieved from Feast Core, if it is ready.
+
+        Args:
+            proto (FeatureSetProto):
+                Feature set retrieved from Feast Core.
+
+            latest (bool):
+                Whether the feature set is the latest version, which is also
+                cached under the reference without a version.
+
+        Returns:
+            FeatureSet:
+                The feature set built from its proto.
+        """
+        if proto.meta.status == FeatureSetStatus.STATUS_READY:
+            entry = _build_entry(proto, self._clock())
+            with self._lock:
+                self._entries[_ref(proto)] = entry
+                if latest:
+                    self._entries[_latest_ref(proto)] = entry
+        return FeatureSet.from_proto(proto)
+
+    def get_listing(self, listing_filter: ListingFilter) -> Optional[List[FeatureSet]]:
+        """
+        Returns the cached feature sets of a listing, or None if the listing
+        is missing or expired.
+
+        Args:
+            listing_filter (ListingFilter):
+                Project, name and version filters of the listing.
+        """
+        with self._lock:
+            listing = self._listings.get(listing_filter)
+            if listing is None:
+                self.stats.misses += 1
+                return None
+            refs, fetched_at = listing
+            entries = [self._entries.get(ref) for ref in refs]
+            if self._expired(fetched_at) or None in entries:
+                del self._listings[listing_filter]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+        return [entry.feature_set() for entry in entries]
+
+    def put_listing(
+        self, listing_filter: ListingFilter, protos: List[FeatureSetProto]
+    ) -> List[FeatureSet]:
+        """
+        Caches the feature sets of a listing, if all of them are ready.
+
+        Args:
+            listing_filter (ListingFilter):
+                Project, name and version filters of the listing.
+
+            protos (List[FeatureSetProto]):
+                Feature sets retrieved from Feast Core.
+
+        Returns:
+            List[FeatureSet]:
+                The feature sets built from their protos.
+        """
+        feature_sets = [self.put(proto) for proto in protos]
+        if all(proto.meta.status == FeatureSetStatus.STATUS_READY for proto in protos):
+            with self._lock:
+                self._listings[listing_filter] = (
+                    [_ref(proto) for proto in protos],
+                    self._clock(),
+                )
+        return feature_sets
+
+    def invalidate(self, project: Optional[str] = None, name: Optional[str] = None):
+        """
+        Drops the cached versions of a feature set, and the listings of its
+        project. Drops everything if no project is given.
+
+        Args:
+            project (Optional[str]):
+                Project of the feature set.
+
+            name (Optional[str]):
+                Name of the feature set. All feature sets of the project are
+                dropped if no name is given.
+        """
+        with self._lock:
+            if project is None:
+                self._entries.clear()
+                self._listings.clear()
+                return
+            self._entries = {
+                ref: entry
+                for ref, entry in self._entries.items()
+                if ref.project != project or name is not None and ref.name != name
+            }
+            self._listings = {
+                listing_filter: listing
+                for listing_filter, listing in self._listings.items()
+                if not fnmatchcase(project, listing_filter[0])
+            }
+
+    def refresh(
+        self, list_feature_sets: Callable[[ListingFilter], List[FeatureSetProto]]
+    ) -> int:
+        """
+        Lists the feature sets of every cached project from Feast Core, and
+        updates the cache with them.
+
+        Args:
+            list_feature_sets (Callable[[ListingFilter], List[FeatureSetProto]]):
+                Function returning the feature set protos matching a filter.
+
+        Returns:
+            int:
+                Number of feature sets which changed or were removed.
+        """
+        with self._lock:
+            projects = {ref.project for ref in self._entries}
+            projects.update(
+                listing_filter[0]
+                for listing_filter in self._listings
+                if "*" not in listing_filter[0]
+            )
+
+        changes = 0
+        for project in sorted(projects):
+            protos = list_feature_sets((project, "*", "*"))
+            changes += self._update_project(project, protos)
+        return changes
+
+    def _update_project(self, project: str, protos: List[FeatureSetProto]) -> int:
+        now = self._clock()
+        entries: Dict[FeatureSetRef, _Entry] = dict()
+        not_ready = []
+        for proto in protos:
+            if proto.meta.status != FeatureSetStatus.STATUS_READY:
+                not_ready.append(_ref(proto))
+                continue
+            entry = _build_entry(proto, now)
+            entries[_ref(proto)] = entry
+            latest_ref = _latest_ref(proto)
+            latest = entries.get(latest_ref)
+            if latest is None or entry.version > latest.version:
+                entries[latest_ref] = entry
+
+        with self._lock:
+            old_entries = {
+                ref: entry
+                for ref, entry in self._entries.items()
+                if ref.project == project
+            }
+            for ref in old_entries:
+                del self._entries[ref]
+            self._entries.update(entries)
+            for listing_filter in list(self._listings):
+                if not fnmatchcase(project, listing_filter[0]):
+                    continue
+                # Listings spanning projects cannot be rebuilt from one project
+                if listing_filter[0] != project or any(
+                    _matches(ref, listing_filter) for ref in not_ready
+                ):
+                    del self._listings[listing_filter]
+                    continue
+                refs = [
+                    ref
+                    for ref in entries
+                    if ref.version and _matches(ref, listing_filter)
+                ]
+                self._listings[listing_filter] = (refs, now)
+
+        return sum(
+            entries.get(ref) is None or entries[ref].serialized != entry.serialized
+            for ref, entry in old_entries.items()
+            if ref.version
+        )
+
+    def start_refresher(
+        self,
+        list_feature_sets: Callable[[ListingFilter], List[FeatureSetProto]],
+        interval: float,
+    ):
+        """
+        Refreshes the cache on a background thread every interval seconds.
+
+        Args:
+            list_feature_sets (Callable[[ListingFilter], List[FeatureSetProto]]):
+                Function returning the feature set protos matching a filter.
+
+            interval (float):
+                Time in seconds between refreshes.
+        """
+        self.stop_refresher()
+        self._stop_refresher.clear()
+
+        def refresh_periodically():
+            while not self._stop_refresher.wait(interval):
+                try:
+                    changes = self.refresh(list_feature_sets)
+                except Exception as e:
+                    _logger.warning(f"Could not refresh cached feature sets: {e}")
+                    continue
+                if changes:
+                    _logger.info(f"{changes} cached feature sets changed")
+
+        self._refresher = threading.Thread(
+            target=refresh_periodically, name="feature-set-refresher", daemon=True
+        )
+        self._refresher.start()
+
+    def stop_refresher(self):
+        """
+        Stops the background refresher, if it was started.
+        """
+        if self._refresher is not None:
+            self._stop_refresher.set()
+            self._refresher.join()
+            self._refresher = None
+
+    def _expired(self, fetched_at: float) -> bool:
+        return fetched_at + self._ttl <= self._clock()
+
+
+def _build_entry(proto: FeatureSetProto, fetched_at: float) -> _Entry:
+    return _Entry(
+        proto.SerializeToString(deterministic=True), proto.spec.version, fetched_at
+    )
+
+
+def _ref(proto: FeatureSetProto) -> FeatureSetRef:
+    return FeatureSetRef(proto.spec.project, proto.spec.name, proto.spec.version)
+
+
+def _latest_ref(proto: FeatureSetProto) -> FeatureSetRef:
+    return FeatureSetRef(proto.spec.project, proto.spec.name)
+
+
+def _matches(ref: FeatureSetRef, listing_filter: ListingFilter) -> bool:
+    project, name, version = listing_filter
+    return (
+        fnmatchcase(ref.project, project)
+        and fnmatchcase(ref.name, name)
+        and fnmatchcase(str(ref.version), version)
+    )
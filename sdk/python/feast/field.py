@@ -24,6 +24,28 @@ class Field:
     features.
     """
 
+    # Feature sets may hold thousands of fields, which do without a __dict__
+    __slots__ = (
+        "_name",
+        "_dtype",
+        "_presence",
+        "_group_presence",
+        "_shape",
+        "_value_count",
+        "_domain",
+        "_int_domain",
+        "_float_domain",
+        "_string_domain",
+        "_bool_domain",
+        "_struct_domain",
+        "_natural_language_domain",
+        "_image_domain",
+        "_mid_domain",
+        "_url_domain",
+        "_time_domain",
+        "_time_of_day_domain",
+    )
+
     def __init__(self, name: str, dtype: ValueType):
         self._name = name
         if not isinstance(dtype, ValueType):
@@ -305,7 +327,7 @@ class Field:
         if not isinstance(url_domain, schema_pb2.URLDomain):
             raise TypeError("url_domain must be of URLDomain type")
         self._clear_domain_info()
-        self.url_domain = url_domain
+        self._url_domain = url_domain
 
     @property
     def time_domain(self) -> schema_pb2.TimeDomain:
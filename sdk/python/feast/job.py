@@ -1,11 +1,13 @@
-import tempfile
+import asyncio
+import random
+import sys
 import time
-from datetime import datetime, timedelta
-from typing import List
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
 from urllib.parse import urlparse
 
-import fastavro
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from google.cloud import storage
 from google.protobuf.json_format import MessageToJson
 
@@ -15,6 +17,12 @@ from feast.core.IngestionJob_pb2 import IngestionJob as IngestJobProto
 from feast.core.IngestionJob_pb2 import IngestionJobStatus
 from feast.core.Store_pb2 import Store
 from feast.feature_set import FeatureSet
+from feast.loaders.retrieval import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_WORKERS,
+    RetrievalReader,
+    prefetch,
+)
 from feast.serving.ServingService_pb2 import (
     DATA_FORMAT_AVRO,
     JOB_STATUS_DONE,
@@ -31,21 +39,80 @@ DEFAULT_TIMEOUT_SEC: int = 21600
 # Maximum no of seconds to wait before reloading the job status in Feast
 MAX_WAIT_INTERVAL_SEC: int = 60
 
+# Minimum no of seconds to wait before reloading the job status in Feast
+MIN_WAIT_INTERVAL_SEC: float = 0.5
+
+# Fraction of the time already spent waiting for a job that is waited before
+# reloading its status, which bounds the latency added by polling relative
+# to the duration of the job
+ADAPTIVE_WAIT_FRACTION: float = 0.1
+
+# Maximum relative deviation of wait intervals, which spreads the reloads of
+# jobs waited for at the same time
+WAIT_INTERVAL_JITTER: float = 0.2
+
+
+class _PollSchedule:
+    """
+    Intervals between reloads of the status of jobs, which grow with the
+    time spent waiting from min_interval_sec up to max_interval_sec.
+    """
+
+    def __init__(
+        self,
+        min_interval_sec: Optional[float] = None,
+        max_interval_sec: Optional[float] = None,
+    ):
+        self._min_interval_sec = (
+            MIN_WAIT_INTERVAL_SEC if min_interval_sec is None else min_interval_sec
+        )
+        self._max_interval_sec = (
+            MAX_WAIT_INTERVAL_SEC if max_interval_sec is None else max_interval_sec
+        )
+        self._start = time.monotonic()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self._start
+
+    def next_interval(self) -> float:
+        interval = min(
+            max(self.elapsed() * ADAPTIVE_WAIT_FRACTION, self._min_interval_sec),
+            self._max_interval_sec,
+        )
+        return interval * random.uniform(
+            1 - WAIT_INTERVAL_JITTER, 1 + WAIT_INTERVAL_JITTER
+        )
+
 
 class RetrievalJob:
     """
     A class representing a job for feature retrieval in Feast.
     """
 
-    def __init__(self, job_proto: JobProto, serving_stub: ServingServiceStub):
+    def __init__(
+        self,
+        job_proto: JobProto,
+        serving_stub: ServingServiceStub,
+        storage_client: Any = None,
+        max_download_workers: int = DEFAULT_MAX_WORKERS,
+    ):
         """
         Args:
             job_proto: Job proto object (wrapped by this job object)
             serving_stub: Stub for Feast serving service
+            storage_client: Client used to download result files from Google
+                Cloud Storage, google.cloud.storage.Client if not provided
+            max_download_workers: Maximum number of result files downloaded
+                concurrently
         """
         self.job_proto = job_proto
         self.serving_stub = serving_stub
-        self.storage_client = storage.Client(project=None)
+        self.storage_client = (
+            storage_client
+            if storage_client is not None
+            else storage.Client(project=None)
+        )
+        self.max_download_workers = max_download_workers
 
     @property
     def id(self):
@@ -68,6 +135,33 @@ class RetrievalJob:
         """
         self.job_proto = self.serving_stub.GetJob(GetJobRequest(job=self.job_proto)).job
 
+    def wait(self, timeout_sec: int = DEFAULT_TIMEOUT_SEC):
+        """
+        Wait until job is done. The job status is reloaded at intervals which
+        grow with the time spent waiting, up to MAX_WAIT_INTERVAL_SEC.
+        Raises TimeoutError if the job is not done after timeout_sec.
+
+        Args:
+            timeout_sec (int):
+                Max no of seconds to wait until job is done.
+        """
+        wait_all([self], timeout_sec=timeout_sec)
+
+    async def wait_async(self, timeout_sec: int = DEFAULT_TIMEOUT_SEC):
+        """
+        Wait until job is done without blocking the event loop. Raises
+        TimeoutError if the job is not done after timeout_sec.
+
+        Args:
+            timeout_sec (int):
+                Max no of seconds to wait until job is done.
+
+        Returns:
+            RetrievalJob:
+                This job.
+        """
+        return await _wait_async(self, None, timeout_sec)
+
     def get_avro_files(self, timeout_sec: int = DEFAULT_TIMEOUT_SEC):
         """
         Wait until job is done to get the file uri to Avro result files on
@@ -81,21 +175,13 @@ class RetrievalJob:
         Returns:
             str: Google Cloud Storage file uris of the returned Avro files.
         """
-        max_wait_datetime = datetime.now() + timedelta(seconds=timeout_sec)
-        wait_duration_sec = 2
-
-        while self.status != JOB_STATUS_DONE:
-            if datetime.now() > max_wait_datetime:
-                raise Exception(
-                    "Timeout exceeded while waiting for result. Please retry "
-                    "this method or use a longer timeout value."
-                )
-
-            self.reload()
-            time.sleep(wait_duration_sec)
-
-            # Backoff the wait duration exponentially up till MAX_WAIT_INTERVAL_SEC
-            wait_duration_sec = min(wait_duration_sec * 2, MAX_WAIT_INTERVAL_SEC)
+        try:
+            self.wait(timeout_sec)
+        except TimeoutError:
+            raise Exception(
+                "Timeout exceeded while waiting for result. Please retry "
+                "this method or use a longer timeout value."
+            )
 
         if self.job_proto.error:
             raise Exception(self.job_proto.error)
@@ -111,7 +197,8 @@ class RetrievalJob:
     def result(self, timeout_sec: int = DEFAULT_TIMEOUT_SEC):
         """
         Wait until job is done to get an iterable rows of result. The row can
-        only represent an Avro row in Feast 0.3.
+        only represent an Avro row in Feast 0.3. Result files are downloaded
+        concurrently and parsed while they download.
 
         Args:
             timeout_sec (int):
@@ -121,77 +208,166 @@ class RetrievalJob:
         Returns:
             Iterable of Avro rows.
         """
-        uris = self.get_avro_files(timeout_sec)
-        for file_uri in uris:
-            if file_uri.scheme == "gs":
-                file_obj = tempfile.TemporaryFile()
-                self.storage_client.download_blob_to_file(file_uri.geturl(), file_obj)
-            elif file_uri.scheme == "file":
-                file_obj = open(file_uri.path, "rb")
-            else:
-                raise Exception(
-                    f"Could not identify file URI {file_uri}. Only gs:// and file:// supported"
-                )
+        yield from self._reader(timeout_sec)
 
-            file_obj.seek(0)
-            avro_reader = fastavro.reader(file_obj)
+    def to_arrow(self, timeout_sec: int = DEFAULT_TIMEOUT_SEC) -> pa.Table:
+        """
+        Wait until a job is done to get the result as a PyArrow table. Avro
+        blocks are decoded straight into Arrow columns, without collecting
+        the rows of the result as Python objects.
 
-            for record in avro_reader:
-                yield record
+        Args:
+            timeout_sec (int):
+                Max no of seconds to wait until job is done. If "timeout_sec"
+                is exceeded, an exception will be raised.
 
-    def to_dataframe(self, timeout_sec: int = DEFAULT_TIMEOUT_SEC) -> pd.DataFrame:
+        Returns:
+            pyarrow.Table:
+                PyArrow table of the feature values.
+        """
+        return self._reader(timeout_sec).to_arrow()
+
+    def to_parquet(
+        self,
+        path: str,
+        timeout_sec: int = DEFAULT_TIMEOUT_SEC,
+        row_group_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
         """
-        Wait until a job is done to get an iterable rows of result. This method
-        will split the response into chunked DataFrame of a specified size to
-        to be yielded to the instance calling it.
+        Wait until a job is done to write the result into a Parquet file.
+        The result is written one row group at a time, so it does not have
+        to fit into memory.
 
         Args:
-            max_chunk_size (int):
-                Maximum number of rows that the DataFrame should contain.
+            path (str):
+                Path of the Parquet file to write.
 
             timeout_sec (int):
                 Max no of seconds to wait until job is done. If "timeout_sec"
                 is exceeded, an exception will be raised.
 
+            row_group_size (int):
+                Number of rows of every row group of the Parquet file.
+
+        Returns:
+            None:
+                None
+        """
+        writer = None
+        try:
+            for batch in self._reader(timeout_sec).record_batches(row_group_size):
+                if writer is None:
+                    writer = pq.ParquetWriter(path, batch.schema)
+                writer.write_table(pa.Table.from_batches([batch]))
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:
+            # The result has no files
+            pq.write_table(pa.table({}), path)
+
+    def to_dataframe(self, timeout_sec: int = DEFAULT_TIMEOUT_SEC) -> pd.DataFrame:
+        """
+        Wait until a job is done to get the result as a Pandas DataFrame.
+
+        Args:
+            timeout_sec (int):
+                Max no of seconds to wait until job is done. If "timeout_sec"
+                is exceeded, an exception will be raised.
+
         Returns:
             pd.DataFrame:
                 Pandas DataFrame of the feature values.
         """
-        records = [r for r in self.result(timeout_sec=timeout_sec)]
-        return pd.DataFrame.from_records(records)
+        return self.to_arrow(timeout_sec=timeout_sec).to_pandas()
+
+    def _reader(self, timeout_sec: int) -> RetrievalReader:
+        """
+        Wait until a job is done to get a reader of its result files.
+        """
+        return RetrievalReader(
+            self.get_avro_files(timeout_sec),
+            self.storage_client,
+            max_workers=self.max_download_workers,
+        )
+
+    def to_chunked_arrow(
+        self,
+        max_chunk_size: int = -1,
+        timeout_sec: int = DEFAULT_TIMEOUT_SEC,
+        prefetch_chunks: int = 0,
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Wait until a job is done to get the result as PyArrow record batches
+        of a fixed number of rows. Only the chunks which are not consumed yet
+        are held in memory, so results larger than memory can be streamed.
+
+        Args:
+            max_chunk_size (int):
+                Number of rows of every chunk, except for the last one which
+                holds the remaining rows. The whole result is a single chunk
+                if smaller than 1.
+
+            timeout_sec (int):
+                Max no of seconds to wait until job is done. If "timeout_sec"
+                is exceeded, an exception will be raised.
+
+            prefetch_chunks (int):
+                Number of chunks decoded ahead on a background thread while
+                the current chunk is consumed. Chunks are only decoded when
+                requested if 0.
+
+        Returns:
+            Iterator[pyarrow.RecordBatch]:
+                Record batches of the feature values.
+        """
+        yield from prefetch(self._chunks(max_chunk_size, timeout_sec), prefetch_chunks)
 
     def to_chunked_dataframe(
-        self, max_chunk_size: int = -1, timeout_sec: int = DEFAULT_TIMEOUT_SEC
-    ) -> pd.DataFrame:
+        self,
+        max_chunk_size: int = -1,
+        timeout_sec: int = DEFAULT_TIMEOUT_SEC,
+        prefetch_chunks: int = 0,
+    ) -> Iterator[pd.DataFrame]:
         """
-        Wait until a job is done to get an iterable rows of result. This method
-        will split the response into chunked DataFrame of a specified size to
-        to be yielded to the instance calling it.
+        Wait until a job is done to get the result as Pandas DataFrames of a
+        fixed number of rows. Only the chunks which are not consumed yet are
+        held in memory, so results larger than memory can be streamed.
 
         Args:
             max_chunk_size (int):
-                Maximum number of rows that the DataFrame should contain.
+                Number of rows of every chunk, except for the last one which
+                holds the remaining rows. The whole result is a single chunk
+                if smaller than 1.
 
             timeout_sec (int):
                 Max no of seconds to wait until job is done. If "timeout_sec"
                 is exceeded, an exception will be raised.
 
+            prefetch_chunks (int):
+                Number of chunks decoded and converted ahead on a background
+                thread while the current chunk is consumed. Chunks are only
+                decoded when requested if 0.
+
         Returns:
-            pd.DataFrame:
-                Pandas DataFrame of the feature values.
+            Iterator[pd.DataFrame]:
+                Pandas DataFrames of the feature values.
         """
-        # Max chunk size defined by user
-        records = []
-        for result in self.result(timeout_sec=timeout_sec):
-            result.append(records)
-            if len(records) == max_chunk_size:
-                df = pd.DataFrame.from_records(records)
-                records.clear()  # Empty records array
-                yield df
+        chunks = (
+            chunk.to_pandas() for chunk in self._chunks(max_chunk_size, timeout_sec)
+        )
+        yield from prefetch(chunks, prefetch_chunks)
 
-        # Handle for last chunk that is < max_chunk_size
-        if not records:
-            yield pd.DataFrame.from_records(records)
+    def _chunks(
+        self, max_chunk_size: int, timeout_sec: int
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Wait until a job is done to get the non-empty chunks of its result.
+        """
+        chunk_size = max_chunk_size if max_chunk_size > 0 else sys.maxsize
+        for chunk in self._reader(timeout_sec).record_batches(chunk_size):
+            if chunk.num_rows:
+                yield chunk
 
     def __iter__(self):
         return iter(self.result())
@@ -277,20 +453,27 @@ class IngestJob:
             status: The IngestionJobStatus to wait for.
             timeout_secs: Maximum seconds to wait before timing out.
         """
-        # poll & wait for job status to transition
-        wait_begin = time.time()
-        wait_secs = 2
-        elapsed_secs = 0
-        while self.status != status and elapsed_secs <= timeout_secs:
-            time.sleep(wait_secs)
-            # back off wait duration exponentially, capped at MAX_WAIT_INTERVAL_SEC
-            wait_secs = min(wait_secs * 2, MAX_WAIT_INTERVAL_SEC)
-            elapsed_secs = time.time() - wait_begin
-
-        # raise error if timeout
-        if elapsed_secs > timeout_secs:
+        try:
+            wait_all([self], timeout_sec=timeout_secs, ingest_job_status=status)
+        except TimeoutError:
             raise TimeoutError("Wait for IngestJob's status to transition timed out")
 
+    async def wait_async(self, status: IngestionJobStatus, timeout_secs: float = 300):
+        """
+        Wait for this IngestJob to transtion to the given status without
+        blocking the event loop. Raises TimeoutError if the wait operation
+        times out.
+
+        Args:
+            status: The IngestionJobStatus to wait for.
+            timeout_secs: Maximum seconds to wait before timing out.
+
+        Returns:
+            IngestJob:
+                This job.
+        """
+        return await _wait_async(self, status, timeout_secs)
+
     def __str__(self):
         # render the contents of ingest job as human readable string
         self.reload()
@@ -299,3 +482,145 @@ class IngestJob:
     def __repr__(self):
         # render the ingest job as human readable string
         return f"IngestJob<{self.id}>"
+
+
+Job = Union[RetrievalJob, IngestJob]
+
+
+def as_completed(
+    jobs: Iterable[Job],
+    timeout_sec: float = DEFAULT_TIMEOUT_SEC,
+    ingest_job_status: IngestionJobStatus = IngestionJobStatus.RUNNING,
+    min_interval_sec: Optional[float] = None,
+    max_interval_sec: Optional[float] = None,
+) -> Iterator[Job]:
+    """
+    Waits for many jobs in a single loop, yielding every job as soon as it
+    is found done. Retrieval jobs are done once their status is DONE, and
+    ingestion jobs once they transitioned to ingest_job_status.
+
+    The status of every job is reloaded at intervals which grow with the
+    time spent waiting, from min_interval_sec up to max_interval_sec. The
+    intervals are jittered, so the reloads of many jobs are spread out.
+
+    Args:
+        jobs (Iterable[Union[RetrievalJob, IngestJob]]):
+            Jobs to wait for.
+
+        timeout_sec (float):
+            Max no of seconds to wait until all jobs are done. A TimeoutError
+            is raised if it is exceeded.
+
+        ingest_job_status (IngestionJobStatus):
+            Status of ingestion jobs to wait for.
+
+        min_interval_sec (Optional[float]):
+            Min no of seconds to wait before reloading the status of a job,
+            MIN_WAIT_INTERVAL_SEC if not provided.
+
+        max_interval_sec (Optional[float]):
+            Max no of seconds to wait before reloading the status of a job,
+            MAX_WAIT_INTERVAL_SEC if not provided.
+
+    Returns:
+        Iterator[Union[RetrievalJob, IngestJob]]:
+            Jobs in the order they were found done.
+    """
+    schedule = _PollSchedule(min_interval_sec, max_interval_sec)
+    pending = {idx: job for idx, job in enumerate(jobs)}
+    next_polls = {idx: 0.0 for idx in pending}
+    while pending:
+        for idx in sorted(pending, key=next_polls.get):
+            if next_polls[idx] > schedule.elapsed():
+                continue
+            if _is_done(pending[idx], ingest_job_status):
+                yield pending.pop(idx)
+            else:
+                next_polls[idx] = schedule.elapsed() + schedule.next_interval()
+        if not pending:
+            break
+
+        remaining_sec = timeout_sec - schedule.elapsed()
+        if remaining_sec <= 0:
+            raise TimeoutError(
+                f"Timeout exceeded while waiting for jobs "
+                f"{', '.join(str(job.id) for job in pending.values())}"
+            )
+        next_poll = min(next_polls[idx] for idx in pending)
+        time.sleep(min(max(next_poll - schedule.elapsed(), 0), remaining_sec))
+
+
+def wait_all(
+    jobs: Iterable[Job],
+    timeout_sec: float = DEFAULT_TIMEOUT_SEC,
+    callback: Optional[Callable[[Job], Any]] = None,
+    ingest_job_status: IngestionJobStatus = IngestionJobStatus.RUNNING,
+    min_interval_sec: Optional[float] = None,
+    max_interval_sec: Optional[float] = None,
+) -> List[Job]:
+    """
+    Waits until all jobs are done, polling them in a single loop.
+
+    Args:
+        jobs (Iterable[Union[RetrievalJob, IngestJob]]):
+            Jobs to wait for.
+
+        timeout_sec (float):
+            Max no of seconds to wait until all jobs are done. A TimeoutError
+            is raised if it is exceeded.
+
+        callback (Optional[Callable[[Union[RetrievalJob, IngestJob]], Any]]):
+            Function called with every job as soon as it is found done, on
+            the calling thread.
+
+        ingest_job_status (IngestionJobStatus):
+            Status of ingestion jobs to wait for.
+
+        min_interval_sec (Optional[float]):
+            Min no of seconds to wait before reloading the status of a job,
+            MIN_WAIT_INTERVAL_SEC if not provided.
+
+        max_interval_sec (Optional[float]):
+            Max no of seconds to wait before reloading the status of a job,
+            MAX_WAIT_INTERVAL_SEC if not provided.
+
+    Returns:
+        List[Union[RetrievalJob, IngestJob]]:
+            The jobs, in the order they were given.
+    """
+    jobs = list(jobs)
+    for job in as_completed(
+        jobs, timeout_sec, ingest_job_status, min_interval_sec, max_interval_sec
+    ):
+        if callback is not None:
+            callback(job)
+    return jobs
+
+
+async def _wait_async(
+    job: Job, ingest_job_status: Optional[IngestionJobStatus], timeout_sec: float
+) -> Job:
+    """
+    Waits until a job is done, reloading its status on the default executor.
+    """
+    loop = asyncio.get_event_loop()
+    schedule = _PollSchedule()
+    while not await loop.run_in_executor(None, _is_done, job, ingest_job_status):
+        remaining_sec = timeout_sec - schedule.elapsed()
+        if remaining_sec <= 0:
+            raise TimeoutError(f"Timeout exceeded while waiting for job {job.id}")
+        await asyncio.sleep(min(schedule.next_interval(), remaining_sec))
+    return job
+
+
+def _is_done(job: Job, ingest_job_status: Optional[IngestionJobStatus]) -> bool:
+    """
+    Returns whether a job is done, reloading its status if it is not known
+    to be done yet.
+    """
+    if isinstance(job, IngestJob):
+        # The status of ingestion jobs is reloaded on access
+        return job.status == ingest_job_status
+    if job.status != JOB_STATUS_DONE:
+        job.reload()
+    return job.status == JOB_STATUS_DONE
@@ -12,10 +12,84 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 
 from tqdm import tqdm
 
+COMPRESSION_CODECS = ("none", "gzip", "snappy", "lz4", "zstd")
+
+
+class BatchingOptions:
+    """
+    Kafka producer settings that trade delivery latency for throughput by
+    packing many FeatureRows into each produce request.
+    """
+
+    def __init__(
+        self,
+        linger_ms: int = 50,
+        batch_size: int = 1048576,
+        compression: str = "none",
+        poll_every: int = 1000,
+    ):
+        """
+        Args:
+            linger_ms (int):
+                Time in milliseconds to wait for more messages before a
+                partially filled batch is sent.
+
+            batch_size (int):
+                Maximum size in bytes of a batch of messages.
+
+            compression (str):
+                Compression codec of batches, one of "none", "gzip",
+                "snappy", "lz4" or "zstd".
+
+            poll_every (int):
+                Number of produced messages after which delivery callbacks
+                are served, instead of after every message.
+        """
+        if compression not in COMPRESSION_CODECS:
+            raise ValueError(
+                f"Unknown compression codec {compression}, expected one of "
+                f"{COMPRESSION_CODECS}"
+            )
+        if poll_every < 1:
+            raise ValueError("poll_every must be at least 1")
+        self.linger_ms = linger_ms
+        self.batch_size = batch_size
+        self.compression = compression
+        self.poll_every = poll_every
+
+    def to_confluent_config(self) -> Dict[str, Any]:
+        """
+        Returns the options as confluent-kafka (librdkafka) configuration
+        """
+        return {
+            "linger.ms": self.linger_ms,
+            "batch.size": self.batch_size,
+            "compression.codec": self.compression,
+        }
+
+    def to_kafka_python_config(self) -> Dict[str, Any]:
+        """
+        Returns the options as kafka-python KafkaProducer arguments
+        """
+        return {
+            "linger_ms": self.linger_ms,
+            "batch_size": self.batch_size,
+            "compression_type": None
+            if self.compression == "none"
+            else self.compression,
+        }
+
+    def __repr__(self):
+        return (
+            f"BatchingOptions(linger_ms={self.linger_ms}, "
+            f"batch_size={self.batch_size}, compression={self.compression!r}, "
+            f"poll_every={self.poll_every})"
+        )
+
 
 class AbstractProducer:
     """
@@ -88,10 +162,23 @@ class ConfluentProducer(AbstractProducer):
     Concrete implementation of Confluent Kafka producer (confluent-kafka)
     """
 
-    def __init__(self, brokers: str, row_count: int, disable_progress_bar: bool):
+    def __init__(
+        self,
+        brokers: str,
+        row_count: int,
+        disable_progress_bar: bool,
+        batching: Optional[BatchingOptions] = None,
+    ):
         from confluent_kafka import Producer
 
-        self.producer = Producer({"bootstrap.servers": brokers})
+        config = {"bootstrap.servers": brokers}
+        self.poll_every = 1
+        if batching is not None:
+            config.update(batching.to_confluent_config())
+            self.poll_every = batching.poll_every
+        self._unpolled = 0
+
+        self.producer = Producer(config)
         super().__init__(brokers, row_count, disable_progress_bar)
 
     def produce(self, topic: str, value: bytes) -> None:
@@ -108,12 +195,26 @@ class ConfluentProducer(AbstractProducer):
         """
 
         try:
-            self.producer.produce(topic, value=value, callback=self._delivery_callback)
-            # Serve delivery callback queue.
+            try:
+                self.producer.produce(
+                    topic, value=value, callback=self._delivery_callback
+                )
+            except BufferError:
+                # Local queue is full, wait for some deliveries and retry
+                self.producer.poll(1)
+                self._unpolled = 0
+                self.producer.produce(
+                    topic, value=value, callback=self._delivery_callback
+                )
+
+            # Serve delivery callback queue once every poll_every messages.
             # NOTE: Since produce() is an asynchronous API this poll() call
             #       will most likely not serve the delivery callback for the
             #       last produce()d message.
-            self.producer.poll(0)
+            self._unpolled += 1
+            if self._unpolled >= self.poll_every:
+                self.producer.poll(0)
+                self._unpolled = 0
         except Exception as ex:
             self._set_error(str(ex))
 
@@ -158,10 +259,17 @@ class KafkaPythonProducer(AbstractProducer):
     Concrete implementation of Python Kafka producer (kafka-python)
     """
 
-    def __init__(self, brokers: str, row_count: int, disable_progress_bar: bool):
+    def __init__(
+        self,
+        brokers: str,
+        row_count: int,
+        disable_progress_bar: bool,
+        batching: Optional[BatchingOptions] = None,
+    ):
         from kafka import KafkaProducer
 
-        self.producer = KafkaProducer(bootstrap_servers=[brokers])
+        config = batching.to_kafka_python_config() if batching is not None else {}
+        self.producer = KafkaProducer(bootstrap_servers=[brokers], **config)
         super().__init__(brokers, row_count, disable_progress_bar)
 
     def produce(self, topic: str, value: bytes):
@@ -204,7 +312,10 @@ class KafkaPythonProducer(AbstractProducer):
 
 
 def get_producer(
-    brokers: str, row_count: int, disable_progress_bar: bool
+    brokers: str,
+    row_count: int,
+    disable_progress_bar: bool,
+    batching: Optional[BatchingOptions] = None,
 ) -> Union[ConfluentProducer, KafkaPythonProducer]:
     """
     Simple context helper function that returns a AbstractProducer object when
@@ -218,6 +329,8 @@ def get_producer(
     Args:
         brokers (str): Kafka broker information with hostname and port.
         row_count (int): Number of rows in table
+        batching (Optional[BatchingOptions]): Batch messages into larger
+            produce requests using these options.
 
     Returns:
         Union[ConfluentProducer, KafkaPythonProducer]:
@@ -226,7 +339,7 @@ def get_producer(
                 * kafka-python producer
     """
     try:
-        return ConfluentProducer(brokers, row_count, disable_progress_bar)
+        return ConfluentProducer(brokers, row_count, disable_progress_bar, batching)
     except ImportError:
         print("Unable to import confluent-kafka, falling back to kafka-python")
-        return KafkaPythonProducer(brokers, row_count, disable_progress_bar)
+        return KafkaPythonProducer(brokers, row_count, disable_progress_bar, batching)
@@ -0,0 +1,328 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import bz2
+import json
+import lzma
+import os
+import zlib
+from typing import IO, Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from feast.constants import DATETIME_COLUMN
+from feast.loaders.encoder import (
+    pa_array_binary_data,
+    pa_array_offsets,
+    pa_array_validity,
+)
+from feast.loaders.serializer import (
+    FIXED32,
+    FIXED64,
+    Constant,
+    Ragged,
+    Segment,
+    encode_fixed_width,
+    encode_varints,
+    mask_rows,
+    write_segments,
+)
+
+# Name of the Avro field of the datetime column of entity DataFrames
+EVENT_TIMESTAMP_FIELD = "event_timestamp"
+
+# Number of rows of every Avro block by default
+DEFAULT_BLOCK_ROWS: int = 16384
+
+_MAGIC = b"Obj\x01"
+_SYNC_SIZE = 16
+
+# Union branches of nullable fields, encoded as Avro longs
+_NULL_BRANCH = b"\x00"
+_VALUE_BRANCH = b"\x02"
+
+_TIMESTAMP_MICROS = {"type": "long", "logicalType": "timestamp-micros"}
+
+# Avro types of the values of nullable fields the writer can encode
+_SUPPORTED_TYPES = [
+    "boolean",
+    "int",
+    "long",
+    "float",
+    "double",
+    "string",
+    "bytes",
+    _TIMESTAMP_MICROS,
+]
+
+# Avro types of the values of object columns, by the type of their first value
+_OBJECT_AVRO_TYPES = {
+    str: "string",
+    bytes: "bytes",
+    bool: "boolean",
+    int: "long",
+    float: "double",
+}
+
+
+def _compress_snappy(data: bytes) -> bytes:
+    import snappy
+
+    return snappy.compress(data) + zlib.crc32(data).to_bytes(4, "big")
+
+
+def _compress_deflate(data: bytes) -> bytes:
+    compressor = zlib.compressobj(wbits=-15)
+    return compressor.compress(data) + compressor.flush()
+
+
+# Compression of the data of every block, by Avro codec name
+_CODECS: Dict[str, Callable[[Any], Any]] = {
+    "null": lambda data: data,
+    "deflate": _compress_deflate,
+    "bzip2": bz2.compress,
+    "xz": lzma.compress,
+    "snappy": _compress_snappy,
+}
+
+
+def entity_rows_avro_schema(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Returns the Avro schema of an entity DataFrame, which has a nullable
+    field for every column. The datetime column becomes the event_timestamp
+    field, of type timestamp-micros.
+
+    Args:
+        df (pd.DataFrame):
+            Pandas DataFrame of entity rows.
+
+    Returns:
+        Dict[str, Any]:
+            Avro record schema. Types are inferred from the dtypes of the
+            columns, and from their first value for object columns.
+    """
+    fields = []
+    for column in df.columns:
+        name = EVENT_TIMESTAMP_FIELD if column == DATETIME_COLUMN else column
+        fields.append({"name": name, "type": ["null", _avro_type(df[column])]})
+    return {"type": "record", "name": "Root", "fields": fields}
+
+
+def _avro_type(column: pd.Series) -> Union[str, Dict[str, str]]:
+    """
+    Returns the Avro type of the values of a column. Raises a ValueError if
+    the column cannot be written by write_entity_rows_avro.
+    """
+    dtype = column.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return "boolean"
+    if pd.api.types.is_integer_dtype(dtype):
+        fits_int = dtype.itemsize < 4 or dtype.kind == "i" and dtype.itemsize == 4
+        return "int" if fits_int else "long"
+    if pd.api.types.is_float_dtype(dtype):
+        return "float" if dtype.itemsize <= 4 else "double"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return _TIMESTAMP_MICROS
+    if pd.api.types.is_string_dtype(dtype):
+        first_idx = column.first_valid_index()
+        if first_idx is None:
+            return "string"
+        avro_type = _OBJECT_AVRO_TYPES.get(type(column[first_idx]))
+        if avro_type is not None:
+            return avro_type
+    raise ValueError(
+        f'Column "{column.name}" of type {dtype} cannot be written as Avro'
+    )
+
+
+def write_entity_rows_avro(
+    df: pd.DataFrame,
+    file_path_or_buffer: Union[str, IO[bytes]],
+    schema: Optional[Dict[str, Any]] = None,
+    codec: str = "null",
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+) -> None:
+    """
+    Writes an entity DataFrame as an Avro file.
+
+    Every block of rows is encoded from the NumPy arrays of the columns at
+    once, instead of converting every row into a record first. The
+    DataFrame is not modified.
+
+    Args:
+        df (pd.DataFrame):
+            Pandas DataFrame of entity rows, with a datetime column.
+
+        file_path_or_buffer (Union[str, IO[bytes]]):
+            Path of the file to write, or a binary file-like object.
+
+        schema (Optional[Dict[str, Any]]):
+            Avro schema as returned by entity_rows_avro_schema, which is
+            inferred from the DataFrame if not provided. Shards of a
+            DataFrame should share the schema of the whole DataFrame.
+
+        codec (str):
+            Avro codec compressing every block: "null", "deflate", "bzip2",
+            "xz" or "snappy", which requires python-snappy.
+
+        block_rows (int):
+            Number of rows of every block.
+
+    Raises:
+        ValueError:
+            If a field of the schema has a type which cannot be written,
+            which is checked before anything is written, or if the values
+            of a column cannot be encoded. In that case the header and the
+            blocks before the failing one have already been written.
+    """
+    if codec not in _CODECS:
+        raise ValueError(f"Unsupported Avro codec {codec}")
+    if block_rows < 1:
+        raise ValueError("block_rows must be at least 1")
+    if schema is None:
+        schema = entity_rows_avro_schema(df)
+    for field in schema["fields"]:
+        field_type = field["type"]
+        if (
+            not isinstance(field_type, list)
+            or len(field_type) != 2
+            or field_type[0] != "null"
+            or field_type[1] not in _SUPPORTED_TYPES
+        ):
+            raise ValueError(
+                f'Field "{field["name"]}" of type {field_type} cannot be written'
+            )
+
+    if isinstance(file_path_or_buffer, str):
+        with open(file_path_or_buffer, "wb") as file:
+            _write_file(df, file, schema, codec, block_rows)
+    else:
+        _write_file(df, file_path_or_buffer, schema, codec, block_rows)
+
+
+def _write_file(
+    df: pd.DataFrame,
+    file: IO[bytes],
+    schema: Dict[str, Any],
+    codec: str,
+    block_rows: int,
+):
+    sync_marker = os.urandom(_SYNC_SIZE)
+    metadata = {
+        "avro.schema": json.dumps(schema).encode("utf-8"),
+        "avro.codec": codec.encode("utf-8"),
+    }
+    header = [_MAGIC, _long(len(metadata))]
+    for key, value in metadata.items():
+        header.extend([_bytes(key.encode("utf-8")), _bytes(value)])
+    header.extend([_long(0), sync_marker])
+    file.write(b"".join(header))
+
+    columns = [
+        (field["type"][1], df[_column_name(df, field["name"])])
+        for field in schema["fields"]
+    ]
+    compress = _CODECS[codec]
+    for start in range(0, len(df), block_rows):
+        num_rows = min(block_rows, len(df) - start)
+        segments: List[Segment] = []
+        for avro_type, column in columns:
+            segments.extend(
+                _encode_column(avro_type, column.iloc[start : start + num_rows])
+            )
+        data, _ = write_segments(segments, num_rows)
+        block = compress(data)
+        file.write(_long(num_rows) + _long(len(block)))
+        file.write(block)
+        file.write(sync_marker)
+
+
+def _column_name(df: pd.DataFrame, field_name: str) -> str:
+    if field_name == EVENT_TIMESTAMP_FIELD and field_name not in df.columns:
+        return DATETIME_COLUMN
+    return field_name
+
+
+def _encode_column(
+    avro_type: Union[str, Dict[str, str]], column: pd.Series
+) -> List[Segment]:
+    """
+    Encodes the values of a column as a nullable Avro field, which is the
+    branch of the union followed by the value unless it is null.
+    """
+    if avro_type in ("string", "bytes"):
+        arrow_type = pa.string() if avro_type == "string" else pa.binary()
+        array = pa.array(column, type=arrow_type, from_pandas=True)
+        offsets = pa_array_offsets(array)
+        lengths = np.diff(offsets)
+        data = pa_array_binary_data(array)[offsets[0] : offsets[-1]]
+        return _nullable(
+            [_encode_longs(lengths), (data, lengths)], pa_array_validity(array)
+        )
+
+    validity = None
+    if not pd.api.types.is_float_dtype(column.dtype):
+        # NaN values of float columns are written as NaN, not as nulls
+        valid = column.notna().to_numpy()
+        validity = None if valid.all() else valid
+    if validity is not None and avro_type != _TIMESTAMP_MICROS:
+        # Null values are replaced by zeros, which are encoded and dropped
+        column = column.where(validity, 0)
+
+    if avro_type == _TIMESTAMP_MICROS:
+        if getattr(column.dtype, "tz", None) is not None:
+            column = column.dt.tz_convert("UTC").dt.tz_localize(None)
+        micros = column.to_numpy(dtype="datetime64[us]").view(np.int64)
+        encoded = [_encode_longs(micros)]
+    elif avro_type in ("int", "long"):
+        encoded = [_encode_longs(column.to_numpy(dtype=np.int64))]
+    elif avro_type == "boolean":
+        values = column.to_numpy(dtype=np.bool_).astype(np.uint8)
+        encoded = [(values, np.ones(len(values), dtype=np.int64))]
+    elif avro_type == "float":
+        encoded = [encode_fixed_width(column.to_numpy(dtype=np.float32), FIXED32)]
+    elif avro_type == "double":
+        encoded = [encode_fixed_width(column.to_numpy(dtype=np.float64), FIXED64)]
+    else:
+        raise ValueError(f"Unsupported Avro type {avro_type}")
+    return _nullable(encoded, validity)
+
+
+def _nullable(encoded: List[Ragged], validity: Optional[np.ndarray]) -> List[Segment]:
+    if validity is None:
+        return [Constant(_VALUE_BRANCH), *encoded]
+    return [
+        Constant(_VALUE_BRANCH, validity),
+        Constant(_NULL_BRANCH, ~validity),
+        *[mask_rows(part, validity) for part in encoded],
+    ]
+
+
+def _encode_longs(values: np.ndarray) -> Ragged:
+    """
+    Encodes integers as Avro longs, which are zigzag encoded varints.
+    """
+    values = values.astype(np.int64, copy=False)
+    return encode_varints((values << 1) ^ (values >> 63))
+
+
+def _long(value: int) -> bytes:
+    data, _ = _encode_longs(np.array([value], dtype=np.int64))
+    return data.tobytes()
+
+
+def _bytes(value: bytes) -> bytes:
+    return _long(len(value)) + value
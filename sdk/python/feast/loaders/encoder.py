@@ -0,0 +1,265 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+
+from feast.constants import DATETIME_COLUMN
+from feast.loaders.serializer import (
+    VALUE_ENCODINGS,
+    ColumnBuffer,
+    FeatureRowSerializer,
+    split_rows,
+)
+from feast.type_map import pa_column_to_epoch_micros
+from feast.value_type import ValueType
+
+# Mapping of Feast value types to the PyArrow type of a single element
+_ARROW_ELEMENT_TYPES = {
+    ValueType.BYTES: pa.binary(),
+    ValueType.STRING: pa.string(),
+    ValueType.INT32: pa.int32(),
+    ValueType.INT64: pa.int64(),
+    ValueType.DOUBLE: pa.float64(),
+    ValueType.FLOAT: pa.float32(),
+    ValueType.BOOL: pa.bool_(),
+    ValueType.BYTES_LIST: pa.binary(),
+    ValueType.STRING_LIST: pa.string(),
+    ValueType.INT32_LIST: pa.int32(),
+    ValueType.INT64_LIST: pa.int64(),
+    ValueType.DOUBLE_LIST: pa.float64(),
+    ValueType.FLOAT_LIST: pa.float32(),
+    ValueType.BOOL_LIST: pa.bool_(),
+}
+
+
+def encode_pa_table(
+    table: pa.lib.Table, feature_set: str, fields: dict, ingestion_id: str
+) -> List[bytes]:
+    """
+    Encodes a PyArrow table into serialized FeatureRows one column at a time.
+
+    The output is byte for byte identical to building a FeatureRow protobuf
+    message for every row and calling SerializeToString() on it, but no
+    intermediate protobuf objects are created.
+
+    Args:
+        table (pyarrow.lib.Table):
+            PyArrow table containing the datetime column and all fields.
+
+        feature_set (str):
+            Feature set reference in the format f"{project}/{name}:{version}".
+
+        fields (dict[str, enum.Enum.ValueType]):
+            A mapping of field names to their value types.
+
+        ingestion_id (str):
+            UUID unique to this ingestion job.
+
+    Returns:
+        List[bytes]:
+            List of byte encoded FeatureRows, one for each row in the table.
+    """
+    return split_rows(
+        encode_pa_table_to_buffer(table, feature_set, fields, ingestion_id)
+    )
+
+
+def encode_pa_table_to_buffer(
+    table: pa.lib.Table, feature_set: str, fields: dict, ingestion_id: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encodes a PyArrow table into serialized FeatureRows which are stored one
+    after the other in a single buffer.
+
+    Args:
+        table (pyarrow.lib.Table):
+            PyArrow table containing the datetime column and all fields.
+
+        feature_set (str):
+            Feature set reference in the format f"{project}/{name}:{version}".
+
+        fields (dict[str, enum.Enum.ValueType]):
+            A mapping of field names to their value types.
+
+        ingestion_id (str):
+            UUID unique to this ingestion job.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]:
+            Buffer holding the concatenation of all byte encoded FeatureRows,
+            and the length of every FeatureRow.
+    """
+    serializer = FeatureRowSerializer(feature_set, fields, ingestion_id)
+    columns = {
+        name: pa_column_to_column_buffer(dtype, table.column(name))
+        for name, dtype in fields.items()
+    }
+    seconds, nanos = pa_column_to_timestamp_buffers(table.column(DATETIME_COLUMN))
+    return serializer.serialize_to_buffer(columns, seconds, nanos)
+
+
+def pa_column_to_column_buffer(
+    feast_value_type: ValueType, column: pa.lib.ChunkedArray
+) -> ColumnBuffer:
+    """
+    Returns zero copy views of the buffers of a PyArrow column where possible,
+    after casting it to the type of the Feast field.
+
+    Args:
+        feast_value_type (ValueType):
+            Value type of the Feast field.
+
+        column (pyarrow.lib.ChunkedArray):
+            PyArrow column holding the values of the field.
+
+    Returns:
+        ColumnBuffer:
+            Typed buffers of the column.
+    """
+    if feast_value_type not in VALUE_ENCODINGS:
+        raise ValueError(f"Unsupported value type {feast_value_type}")
+    element_type = _ARROW_ELEMENT_TYPES[feast_value_type]
+    is_list = feast_value_type.name.endswith("_LIST")
+
+    array = _combine_chunks(column)
+    target_type = pa.list_(element_type) if is_list else element_type
+    if not array.type.equals(target_type):
+        array = array.cast(target_type)
+
+    validity = pa_array_validity(array)
+    list_offsets = None
+    if is_list:
+        list_offsets = pa_array_offsets(array)
+        array = array.values.slice(list_offsets[0], list_offsets[-1] - list_offsets[0])
+        list_offsets = list_offsets - list_offsets[0]
+        if array.null_count > 0:
+            raise ValueError("List values cannot contain null elements")
+
+    if pa.types.is_string(element_type) or pa.types.is_binary(element_type):
+        return ColumnBuffer(
+            values=pa_array_binary_data(array),
+            value_offsets=pa_array_offsets(array),
+            list_offsets=list_offsets,
+            validity=validity,
+        )
+    return ColumnBuffer(
+        values=_primitive_values(array), list_offsets=list_offsets, validity=validity
+    )
+
+
+def pa_column_to_timestamp_buffers(column: pa.lib.ChunkedArray):
+    """
+    Returns the seconds and nanoseconds of every timestamp in a PyArrow
+    column, with the precision of a microsecond.
+
+    Args:
+        column (pyarrow.lib.ChunkedArray):
+            PyArrow column of timestamps of any time unit and time zone.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]:
+            Seconds and nanoseconds of every timestamp.
+    """
+    seconds, micros = np.divmod(pa_column_to_epoch_micros(column), 1_000_000)
+    return seconds, micros * 1000
+
+
+def _combine_chunks(column: pa.lib.ChunkedArray) -> pa.Array:
+    """
+    Returns the contents of a chunked array as a single contiguous array.
+    """
+    if isinstance(column, pa.Array):
+        return column
+    if column.num_chunks == 1:
+        return column.chunk(0)
+    if column.num_chunks == 0:
+        return pa.array([], type=column.type)
+    return pa.concat_arrays(column.chunks)
+
+
+def pa_array_validity(array: pa.Array) -> Optional[np.ndarray]:
+    """
+    Returns a boolean mask of the non-null values of an array, or None if the
+    array does not contain any nulls.
+
+    Args:
+        array (pyarrow.Array):
+            PyArrow array of any type.
+
+    Returns:
+        Optional[np.ndarray]:
+            Boolean mask of the non-null values.
+    """
+    if array.null_count == 0:
+        return None
+    bitmap = np.frombuffer(array.buffers()[0], dtype=np.uint8)
+    bits = np.unpackbits(bitmap, bitorder="little")
+    return bits[array.offset : array.offset + len(array)].astype(bool)
+
+
+def _primitive_values(array: pa.Array) -> np.ndarray:
+    """
+    Returns a zero copy NumPy view of the values of a primitive array. Slots
+    of null values contain undefined data.
+    """
+    if len(array) == 0:
+        return np.array([], dtype=array.type.to_pandas_dtype())
+    buffer = array.buffers()[1]
+    if pa.types.is_boolean(array.type):
+        bits = np.unpackbits(np.frombuffer(buffer, dtype=np.uint8), bitorder="little")
+        return bits[array.offset : array.offset + len(array)]
+    values = np.frombuffer(buffer, dtype=array.type.to_pandas_dtype())
+    return values[array.offset : array.offset + len(array)]
+
+
+def pa_array_offsets(array: pa.Array) -> np.ndarray:
+    """
+    Returns the offsets of a string, binary or list array as an int64 array.
+
+    Args:
+        array (pyarrow.Array):
+            PyArrow string, binary or list array.
+
+    Returns:
+        np.ndarray:
+            Offsets of every value into the data of the array, starting at
+            the offset of the first value.
+    """
+    if len(array) == 0:
+        return np.zeros(1, dtype=np.int64)
+    offsets = np.frombuffer(array.buffers()[1], dtype=np.int32)
+    return offsets[array.offset : array.offset + len(array) + 1].astype(np.int64)
+
+
+def pa_array_binary_data(array: pa.Array) -> np.ndarray:
+    """
+    Returns a zero copy NumPy view of the data buffer of a string or binary
+    array.
+
+    Args:
+        array (pyarrow.Array):
+            PyArrow string or binary array.
+
+    Returns:
+        np.ndarray:
+            Raw bytes of the values of the array as uint8, indexed by the
+            offsets returned by pa_array_offsets.
+    """
+    buffer = array.buffers()[2] if len(array) else None
+    if buffer is None:
+        return np.empty(0, dtype=np.uint8)
+    return np.frombuffer(buffer, dtype=np.uint8)
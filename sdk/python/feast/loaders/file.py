@@ -12,25 +12,48 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 import os
 import re
 import shutil
 import tempfile
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Tuple, Union
+from multiprocessing import Pool
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import ParseResult, urlparse
 
+import numpy as np
 import pandas as pd
 from google.cloud import storage
-from pandavro import to_avro
+from pandavro import schema_infer, to_avro
+
+from feast.loaders.avro import entity_rows_avro_schema, write_entity_rows_avro
+
+# Minimum number of rows of every Avro file a DataFrame is staged as, unless
+# the number of files is given. Smaller DataFrames are staged as one file.
+MIN_ROWS_PER_SHARD: int = 100000
+
+# Maximum number of files uploaded to Google Cloud Storage concurrently
+MAX_UPLOAD_WORKERS: int = 8
 
 
 def export_source_to_staging_location(
-    source: Union[pd.DataFrame, str], staging_location_uri: str
+    source: Union[pd.DataFrame, str],
+    staging_location_uri: str,
+    num_shards: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    codec: str = "null",
+    file_prefix: Optional[str] = None,
 ) -> List[str]:
     """
-    Uploads a DataFrame as an Avro file to a remote staging location.
+    Uploads a DataFrame as Avro files to a remote staging location.
+
+    Large DataFrames are split into shards, which are encoded as Avro files
+    by parallel processes and uploaded concurrently while the remaining
+    shards are encoded.
 
     The local staging location specified in this function is used for E2E
     tests, please do not use it.
@@ -52,6 +75,22 @@ def export_source_to_staging_location(
                 * gs://bucket/path/
                 * file:///data/subfolder/
 
+        num_shards (Optional[int]):
+            Number of Avro files a DataFrame is staged as. Defaults to the
+            number of CPUs, but with at least MIN_ROWS_PER_SHARD rows per
+            file.
+
+        max_workers (Optional[int]):
+            Number of processes encoding the shards of a DataFrame. Defaults
+            to the number of CPUs.
+
+        codec (str):
+            Avro codec compressing the files a DataFrame is staged as.
+
+        file_prefix (Optional[str]):
+            Name of the files a DataFrame is staged as, without the shard
+            number and extension. Defaults to a random name.
+
     Returns:
         List[str]:
             Returns a list containing the full path to the file(s) in the
@@ -62,6 +101,18 @@ def export_source_to_staging_location(
 
     # Prepare Avro file to be exported to staging location
     if isinstance(source, pd.DataFrame):
+        num_shards = _get_num_shards(len(source), num_shards)
+        if num_shards > 1:
+            # Large DataFrame provided as a source, staged as many files
+            return export_dataframe_shards_to_staging_location(
+                source,
+                staging_location_uri,
+                num_shards,
+                max_workers,
+                codec,
+                file_prefix,
+            )
+
         # DataFrame provided as a source
         uri_path = None  # type: Optional[str]
         if uri.scheme == "file":
@@ -69,7 +120,7 @@ def export_source_to_staging_location(
 
         # Remote gs staging location provided by serving
         dir_path, file_name, source_path = export_dataframe_to_local(
-            df=source, dir_path=uri_path
+            df=source, dir_path=uri_path, codec=codec, file_prefix=file_prefix
         )
     elif urlparse(source).scheme in ["", "file"]:
         # Local file provided as a source
@@ -108,26 +159,42 @@ def export_source_to_staging_location(
             f"valid URI. Only gs:// and file:// uri scheme are supported."
         )
 
-    # Clean up, remove local staging file
-    if dir_path and isinstance(source, pd.DataFrame) and len(str(dir_path)) > 4:
+    # Clean up, remove local staging file unless it is the staging location
+    if (
+        dir_path
+        and isinstance(source, pd.DataFrame)
+        and uri.scheme == "gs"
+        and len(str(dir_path)) > 4
+    ):
         shutil.rmtree(dir_path)
 
     return [staging_location_uri.rstrip("/") + "/" + file_name]
 
 
 def export_dataframe_to_local(
-    df: pd.DataFrame, dir_path: Optional[str] = None
+    df: pd.DataFrame,
+    dir_path: Optional[str] = None,
+    codec: str = "null",
+    file_prefix: Optional[str] = None,
 ) -> Tuple[str, str, str]:
     """
-    Exports a pandas DataFrame to the local filesystem.
+    Exports a pandas DataFrame to the local filesystem as an Avro file. The
+    datetime column is written as the event_timestamp field.
 
     Args:
         df (pd.DataFrame):
-            Pandas DataFrame to save.
+            Pandas DataFrame to save. It is not modified.
 
         dir_path (Optional[str]):
             Absolute directory path '/data/project/subfolder/'.
 
+        codec (str):
+            Avro codec compressing the file: "null", "deflate", "bzip2",
+            "xz" or "snappy", which requires python-snappy.
+
+        file_prefix (Optional[str]):
+            Name of the file without extension. Defaults to a random name.
+
     Returns:
         Tuple[str, str, str]:
             Tuple of directory path, file name and destination path. The
@@ -139,25 +206,165 @@ def export_dataframe_to_local(
     if dir_path is None:
         dir_path = tempfile.mkdtemp()
 
-    file_name = _get_file_name()
+    file_name = f"{file_prefix}.avro" if file_prefix else _get_file_name()
     dest_path = f"{dir_path}/{file_name}"
 
-    # Temporarily rename datetime column to event_timestamp. Ideally we would
-    # force the schema with our avro writer instead.
-    df.columns = ["event_timestamp" if col == "datetime" else col for col in df.columns]
+    _write_avro(df, dest_path, _infer_schema(df), codec)
+
+    return dir_path, file_name, dest_path
+
+
+def export_dataframe_shards_to_staging_location(
+    df: pd.DataFrame,
+    staging_location_uri: str,
+    num_shards: int,
+    max_workers: Optional[int] = None,
+    codec: str = "null",
+    file_prefix: Optional[str] = None,
+) -> List[str]:
+    """
+    Exports a pandas DataFrame as many Avro files to a staging location.
+
+    The DataFrame is split into shards of consecutive rows, which are
+    encoded by a pool of processes. Shards are uploaded concurrently as
+    soon as they are encoded, while the remaining shards are still being
+    encoded. All shards share the Avro schema of the whole DataFrame.
+
+    Args:
+        df (pd.DataFrame):
+            Pandas DataFrame to stage.
+
+        staging_location_uri (str):
+            Remote staging location where the files should be written.
+            Examples:
+                * gs://bucket/path/
+                * file:///data/subfolder/
+
+        num_shards (int):
+            Number of Avro files to split the DataFrame into.
+
+        max_workers (Optional[int]):
+            Number of processes encoding the shards. Defaults to the number
+            of CPUs.
+
+        codec (str):
+            Avro codec compressing the files.
+
+        file_prefix (Optional[str]):
+            Name of the files without the shard number and extension.
+            Defaults to a random name.
+
+    Returns:
+        List[str]:
+            Full paths of the files in the staging location, in the order of
+            the rows of the DataFrame.
+    """
+    uri = urlparse(staging_location_uri)
+    if uri.scheme not in ("gs", "file"):
+        raise Exception(
+            f"Staging location {staging_location_uri} does not have a "
+            f"valid URI. Only gs:// and file:// uri scheme are supported."
+        )
 
+    # Local staging location is used for end-to-end tests
+    dir_path = uri.path if uri.scheme == "file" else tempfile.mkdtemp()
+    file_prefix = file_prefix or _get_file_name()[: -len(".avro")]
+    file_names = [f"{file_prefix}_{idx:05d}.avro" for idx in range(num_shards)]
+    bounds = np.linspace(0, len(df), num_shards + 1).astype(int)
+
+    # Infer the schema once, so empty values of a shard do not change it
+    schema = _infer_schema(df)
+
+    num_workers = min(max_workers or os.cpu_count() or 1, num_shards)
+    in_flight = deque()  # type: deque
+    uploads = []
     try:
-        # Export dataset to file in local path
-        to_avro(df=df, file_path_or_buffer=dest_path)
-    except Exception:
-        raise
+        # Start worker processes before the upload threads
+        with Pool(num_workers) as pool, ThreadPoolExecutor(
+            MAX_UPLOAD_WORKERS
+        ) as upload_executor:
+
+            def upload_next_shard():
+                # Wait for the oldest shard to be encoded and upload it
+                result, file_name = in_flight.popleft()
+                local_path = result.get()
+                if uri.scheme == "gs":
+                    remote_path = str(uri.path).strip("/") + "/" + file_name
+                    uploads.append(
+                        upload_executor.submit(
+                            upload_file_to_gcs, local_path, uri.hostname, remote_path
+                        )
+                    )
+
+            for idx, file_name in enumerate(file_names):
+                shard = df.iloc[bounds[idx] : bounds[idx + 1]]
+                result = pool.apply_async(
+                    _export_shard,
+                    (shard, os.path.join(dir_path, file_name), schema, codec),
+                )
+                in_flight.append((result, file_name))
+                # Hand out at most two shards per worker at a time
+                if len(in_flight) >= 2 * num_workers:
+                    upload_next_shard()
+            while in_flight:
+                upload_next_shard()
+            for upload in uploads:
+                upload.result()
     finally:
-        # Revert event_timestamp column to datetime
-        df.columns = [
-            "datetime" if col == "event_timestamp" else col for col in df.columns
-        ]
+        # Clean up, remove local staging files
+        if uri.scheme == "gs":
+            shutil.rmtree(dir_path, ignore_errors=True)
 
-    return dir_path, file_name, dest_path
+    return [staging_location_uri.rstrip("/") + "/" + name for name in file_names]
+
+
+def _export_shard(
+    df: pd.DataFrame, dest_path: str, schema: Dict[str, Any], codec: str
+) -> str:
+    """
+    Worker function that exports a shard of a DataFrame as an Avro file.
+    """
+    _write_avro(df, dest_path, schema, codec)
+    return dest_path
+
+
+def _infer_schema(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Returns the Avro schema of the entity rows of a DataFrame.
+    """
+    try:
+        return entity_rows_avro_schema(df)
+    except ValueError:
+        # Column types without a vectorized encoding are inferred by pandavro
+        return schema_infer(df.rename(columns={"datetime": "event_timestamp"}))
+
+
+def _write_avro(
+    df: pd.DataFrame, dest_path: str, schema: Dict[str, Any], codec: str
+) -> None:
+    """
+    Writes the entity rows of a DataFrame as an Avro file, with pandavro if
+    the schema has fields the vectorized writer cannot encode.
+    """
+    try:
+        write_entity_rows_avro(df, dest_path, schema=schema, codec=codec)
+    except ValueError:
+        to_avro(
+            file_path_or_buffer=dest_path,
+            df=df.rename(columns={"datetime": "event_timestamp"}),
+            schema=schema,
+            codec=codec,
+        )
+
+
+def _get_num_shards(num_rows: int, num_shards: Optional[int]) -> int:
+    """
+    Returns the number of Avro files a DataFrame with num_rows rows is
+    staged as.
+    """
+    if num_shards is None:
+        num_shards = min(os.cpu_count() or 1, math.ceil(num_rows / MIN_ROWS_PER_SHARD))
+    return max(1, min(num_shards, num_rows))
 
 
 def upload_file_to_gcs(local_path: str, bucket: str, remote_path: str) -> None:
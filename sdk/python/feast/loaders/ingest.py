@@ -1,19 +1,13 @@
 import logging
-from functools import partial
-from multiprocessing import Pool
-from typing import Iterable, List
+import os
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
+import pyarrow as pa
 import pyarrow.parquet as pq
 
-from feast.constants import DATETIME_COLUMN
 from feast.feature_set import FeatureSet
-from feast.type_map import (
-    pa_column_to_proto_column,
-    pa_column_to_timestamp_proto_column,
-)
-from feast.types import Field_pb2 as FieldProto
-from feast.types.FeatureRow_pb2 import FeatureRow
+from feast.loaders.pool import EncodingPool
 
 _logger = logging.getLogger(__name__)
 
@@ -25,104 +19,139 @@ BATCH_FEATURE_REQUEST_WAIT_TIME_SECONDS = 300
 KAFKA_CHUNK_PRODUCTION_TIMEOUT = 120  # type: int
 
 
-def _encode_pa_tables(
-    file: str, feature_set: str, fields: dict, ingestion_id: str, row_group_idx: int
-) -> List[bytes]:
+def get_feature_row_chunks(
+    file: str,
+    row_groups: List[int],
+    fs: FeatureSet,
+    ingestion_id: str,
+    max_workers: int,
+    pool: Optional[EncodingPool] = None,
+) -> Iterable[List[bytes]]:
     """
-    Helper function to encode a PyArrow table(s) read from parquet file(s) into
-    FeatureRows.
-
-    This function accepts a list of file directory pointing to many parquet
-    files. All parquet files must have the same schema.
-
-    Each parquet file will be read into as a table and encoded into FeatureRows
-    using a pool of max_workers workers.
+    Iterator function to encode a PyArrow table read from a parquet file to
+    FeatureRow(s).
 
     Args:
         file (str):
-            File directory of all the parquet file to encode.
-            Parquet file must have more than one row group.
+            File directory of the parquet file. The parquet file must have more
+            than one row group.
 
-        feature_set (str):
-            Feature set reference in the format f"{project}/{name}:{version}".
+        row_groups (List[int]):
+            Specific row group indexes to be read and transformed in the parquet
+            file.
 
-        fields (dict[str, enum.Enum.ValueType]):
-            A mapping of field names to their value types.
+        fs (feast.feature_set.FeatureSet):
+            FeatureSet describing parquet files.
 
         ingestion_id (str):
             UUID unique to this ingestion job.
 
-        row_group_idx(int):
-            Row group index to read and encode into byte like FeatureRow
-            protobuf objects.
+        max_workers (int):
+            Maximum number of workers to spawn.
+
+        pool (Optional[feast.loaders.pool.EncodingPool]):
+            Pool of workers to encode with. If not provided, a pool with
+            max_workers workers is started for this call only.
 
     Returns:
-        List[bytes]:
-            List of byte encoded FeatureRows from the parquet file.
+        Iterable[List[bytes]]:
+            Iterable list of byte encoded FeatureRow(s).
     """
     pq_file = pq.ParquetFile(file)
-    # Read parquet file as a PyArrow table
-    table = pq_file.read_row_group(row_group_idx)
-
-    # Add datetime column
-    datetime_col = pa_column_to_timestamp_proto_column(table.column(DATETIME_COLUMN))
-
-    # Preprocess the columns by converting all its values to Proto values
-    proto_columns = {
-        field_name: pa_column_to_proto_column(dtype, table.column(field_name))
-        for field_name, dtype in fields.items()
-    }
-
-    # List to store result
-    feature_rows = []
-
-    # Loop optimization declaration(s)
-    field = FieldProto.Field
-    proto_items = proto_columns.items()
-    append = feature_rows.append
-
-    # Iterate through the rows
-    for row_idx in range(table.num_rows):
-        feature_row = FeatureRow(
-            event_timestamp=datetime_col[row_idx],
-            feature_set=feature_set,
-            ingestion_id=ingestion_id,
-        )
-        # Loop optimization declaration
-        ext = feature_row.fields.extend
+    tables = (pq_file.read_row_group(row_group_idx) for row_group_idx in row_groups)
+    return get_feature_row_chunks_from_tables(
+        tables, fs, ingestion_id, max_workers, pool
+    )
 
-        # Insert field from each column
-        for k, v in proto_items:
-            ext([field(name=k, value=v[row_idx])])
 
-        # Append FeatureRow in byte string form
-        append(feature_row.SerializeToString())
+def read_source_batches(
+    source: Union[pd.DataFrame, str], chunk_size: int
+) -> Tuple[Iterator[pa.lib.Table], Optional[int], pa.Schema]:
+    """
+    Reads a data source (path or Pandas DataFrame) lazily as PyArrow tables
+    of at most chunk_size rows each, without materializing the whole source.
 
-    return feature_rows
+    Parquet files are read one row group at a time and CSV files one block
+    at a time. JSON files cannot be read incrementally by PyArrow and are
+    loaded in full before being split.
 
+    Args:
+        source (Union[pd.DataFrame, str]):
+            Either a string path or Pandas DataFrame.
 
-def get_feature_row_chunks(
-    file: str,
-    row_groups: List[int],
+        chunk_size (int):
+            Maximum number of rows in a single table.
+
+    Returns:
+        Tuple[Iterator[pyarrow.lib.Table], Optional[int], pyarrow.Schema]:
+            Tuple containing an iterator over the tables read from the source,
+            the total number of rows, if it is known up front, and the schema
+            of the source, which is known even if the source has no rows.
+    """
+    if isinstance(source, pd.DataFrame):
+        table = pa.Table.from_pandas(df=source)
+        return _split_tables([table], chunk_size), table.num_rows, table.schema
+
+    if not isinstance(source, str):
+        raise ValueError(f"Unknown data source provided for ingestion: {source}")
+
+    file_ext = os.path.splitext(source)[1]
+    if ".csv" in file_ext:
+        from pyarrow import csv
+
+        reader = csv.open_csv(source)
+        batches = (pa.Table.from_batches([batch]) for batch in reader)
+        return _split_tables(batches, chunk_size), None, reader.schema
+
+    if ".json" in file_ext:
+        from pyarrow import json
+
+        table = json.read_json(source)
+        return _split_tables([table], chunk_size), table.num_rows, table.schema
+
+    pq_file = pq.ParquetFile(source)
+    row_groups = (
+        pq_file.read_row_group(row_group_idx)
+        for row_group_idx in range(pq_file.num_row_groups)
+    )
+    return (
+        _split_tables(row_groups, chunk_size),
+        pq_file.metadata.num_rows,
+        pq_file.schema_arrow,
+    )
+
+
+def _split_tables(
+    tables: Iterable[pa.lib.Table], chunk_size: int
+) -> Iterator[pa.lib.Table]:
+    """
+    Splits tables which are larger than chunk_size rows into zero copy slices.
+    """
+    for table in tables:
+        for offset in range(0, table.num_rows, chunk_size):
+            yield table.slice(offset, chunk_size)
+
+
+def get_feature_row_chunks_from_tables(
+    tables: Iterable[pa.lib.Table],
     fs: FeatureSet,
     ingestion_id: str,
     max_workers: int,
+    pool: Optional[EncodingPool] = None,
 ) -> Iterable[List[bytes]]:
     """
-    Iterator function to encode a PyArrow table read from a parquet file to
-    FeatureRow(s).
+    Iterator function to encode PyArrow tables read from a streaming source
+    to FeatureRow(s).
 
-    Args:
-        file (str):
-            File directory of the parquet file. The parquet file must have more
-            than one row group.
+    Tables are only read from the source as workers become free, so at most
+    2 * max_workers tables are held in memory at a time.
 
-        row_groups (List[int]):
-            Specific row group indexes to be read and transformed in the parquet
-            file.
+    Args:
+        tables (Iterable[pyarrow.lib.Table]):
+            Tables holding the rows of the source.
 
         fs (feast.feature_set.FeatureSet):
-            FeatureSet describing parquet files.
+            FeatureSet describing the tables.
 
         ingestion_id (str):
             UUID unique to this ingestion job.
@@ -130,6 +159,10 @@ def get_feature_row_chunks(
         max_workers (int):
             Maximum number of workers to spawn.
 
+        pool (Optional[feast.loaders.pool.EncodingPool]):
+            Pool of workers to encode with. If not provided, a pool with
+            max_workers workers is started for this call only.
+
     Returns:
         Iterable[List[bytes]]:
             Iterable list of byte encoded FeatureRow(s).
@@ -139,11 +172,12 @@ def get_feature_row_chunks(
 
     field_map = {field.name: field.dtype for field in fs.fields.values()}
 
-    pool = Pool(max_workers)
-    func = partial(_encode_pa_tables, file, feature_set, field_map, ingestion_id)
-    for chunk in pool.imap(func, row_groups):
-        yield chunk
-    return
+    if pool is not None:
+        yield from pool.imap(tables, feature_set, field_map, ingestion_id)
+        return
+
+    with EncodingPool(max_workers) as pool:
+        yield from pool.imap(tables, feature_set, field_map, ingestion_id)
 
 
 def validate_dataframe(dataframe: pd.DataFrame, feature_set: FeatureSet):
@@ -0,0 +1,267 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import pyarrow as pa
+
+# Marks the end of the items of a queue
+_END = object()
+
+# Interval in seconds at which blocked stages check whether the pipeline
+# was stopped
+_POLL_INTERVAL = 0.1
+
+
+class StageTiming:
+    """
+    Time spent by a single stage of the ingestion pipeline.
+
+    Attributes:
+        name (str):
+            Name of the stage.
+
+        busy_seconds (float):
+            Time spent doing work.
+
+        input_wait_seconds (float):
+            Time spent waiting for the previous stage to provide work.
+
+        output_wait_seconds (float):
+            Time spent waiting for the next stage to accept work, i.e. under
+            backpressure.
+
+        chunks (int):
+            Number of chunks processed.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.busy_seconds = 0.0
+        self.input_wait_seconds = 0.0
+        self.output_wait_seconds = 0.0
+        self.chunks = 0
+
+    def __repr__(self):
+        return (
+            f"{self.name}: busy {self.busy_seconds:.3f}s, "
+            f"waiting for input {self.input_wait_seconds:.3f}s, "
+            f"waiting for output {self.output_wait_seconds:.3f}s, "
+            f"{self.chunks} chunks"
+        )
+
+
+class IngestionPipeline:
+    """
+    Ingestion engine that runs the read, encode and produce stages of an
+    ingestion concurrently.
+
+    Tables are read on a background thread and encoded on another one, while
+    the calling thread produces the encoded rows. The stages are connected by
+    bounded queues, so a stage which runs ahead of the next one blocks until
+    it catches up. The producer is only flushed at checkpoints and at the end
+    of the ingestion, not after every chunk.
+    """
+
+    def __init__(
+        self,
+        tables: Iterable[pa.lib.Table],
+        encode: Callable[[Iterable[pa.lib.Table]], Iterable[List[bytes]]],
+        produce: Callable[[bytes], Any],
+        flush: Callable[[], Any],
+        max_in_flight_chunks: int = 2,
+        checkpoint_rows: Optional[int] = None,
+    ):
+        """
+        Args:
+            tables (Iterable[pyarrow.lib.Table]):
+                Tables holding the rows to ingest.
+
+            encode (Callable[[Iterable[pyarrow.lib.Table]], Iterable[List[bytes]]]):
+                Function that lazily encodes tables into chunks of byte
+                encoded FeatureRows, one chunk per table.
+
+            produce (Callable[[bytes], Any]):
+                Function that sends a single byte encoded FeatureRow.
+
+            flush (Callable[[], Any]):
+                Function that waits until all sent FeatureRows are delivered.
+
+            max_in_flight_chunks (int):
+                Maximum number of read tables and encoded chunks waiting for
+                the next stage.
+
+            checkpoint_rows (Optional[int]):
+                Flush after at least this many rows were produced since the
+                last flush. If not set, flush only at the end.
+        """
+        if max_in_flight_chunks < 1:
+            raise ValueError("max_in_flight_chunks must be at least 1")
+        self._tables = tables
+        self._encode = encode
+        self._produce = produce
+        self._flush = flush
+        self._checkpoint_rows = checkpoint_rows
+        self._read_queue: queue.Queue = queue.Queue(max_in_flight_chunks)
+        self._encoded_queue: queue.Queue = queue.Queue(max_in_flight_chunks)
+        self._stopped = threading.Event()
+        self._errors: List[BaseException] = []
+        self.timings: Dict[str, StageTiming] = {
+            name: StageTiming(name) for name in ("read", "encode", "produce", "flush")
+        }
+
+    def run(self) -> int:
+        """
+        Runs the ingestion until all tables are produced and flushed.
+
+        Returns:
+            int:
+                Number of produced rows.
+        """
+        threads = [
+            threading.Thread(target=self._read, name="feast-ingest-read"),
+            threading.Thread(target=self._encode_tables, name="feast-ingest-encode"),
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        try:
+            rows = self._produce_chunks()
+        finally:
+            self._stopped.set()
+            for thread in threads:
+                thread.join()
+
+        if self._errors:
+            raise self._errors[0]
+        return rows
+
+    def _read(self):
+        """
+        Read stage, which reads tables into the read queue.
+        """
+        timing = self.timings["read"]
+        try:
+            tables = iter(self._tables)
+            while True:
+                start = time.perf_counter()
+                table = next(tables, _END)
+                timing.busy_seconds += time.perf_counter() - start
+                if table is _END or not self._put(self._read_queue, table, timing):
+                    break
+                timing.chunks += 1
+        except BaseException as e:
+            self._errors.append(e)
+        finally:
+            self._put(self._read_queue, _END, timing)
+
+    def _encode_tables(self):
+        """
+        Encode stage, which encodes tables from the read queue into the
+        encoded queue.
+        """
+        timing = self.timings["encode"]
+        chunks = None
+        try:
+            chunks = iter(self._encode(self._get_all(self._read_queue, timing)))
+            while True:
+                start = time.perf_counter()
+                input_wait = timing.input_wait_seconds
+                chunk = next(chunks, _END)
+                timing.busy_seconds += (
+                    time.perf_counter() - start - timing.input_wait_seconds + input_wait
+                )
+                if chunk is _END or not self._put(self._encoded_queue, chunk, timing):
+                    break
+                timing.chunks += 1
+        except BaseException as e:
+            self._errors.append(e)
+        finally:
+            # Stop encoding abandoned tables
+            if hasattr(chunks, "close"):
+                chunks.close()
+            self._put(self._encoded_queue, _END, timing)
+
+    def _produce_chunks(self) -> int:
+        """
+        Produce stage, which produces the chunks from the encoded queue and
+        flushes at checkpoints and at the end.
+        """
+        timing = self.timings["produce"]
+        rows = 0
+        unflushed_rows = 0
+        for chunk in self._get_all(self._encoded_queue, timing):
+            start = time.perf_counter()
+            produce = self._produce
+            for serialized_row in chunk:
+                produce(serialized_row)
+            timing.busy_seconds += time.perf_counter() - start
+            timing.chunks += 1
+
+            rows += len(chunk)
+            unflushed_rows += len(chunk)
+            if self._checkpoint_rows and unflushed_rows >= self._checkpoint_rows:
+                self._flush_produced()
+                unflushed_rows = 0
+
+        if not self._errors:
+            self._flush_produced()
+        return rows
+
+    def _flush_produced(self):
+        timing = self.timings["flush"]
+        start = time.perf_counter()
+        self._flush()
+        timing.busy_seconds += time.perf_counter() - start
+        timing.chunks += 1
+
+    def _put(self, items: queue.Queue, item, timing: StageTiming) -> bool:
+        """
+        Puts an item into a queue, waiting for a free slot unless the
+        pipeline is stopped. Returns False if the pipeline was stopped.
+        """
+        start = time.perf_counter()
+        try:
+            while not self._stopped.is_set():
+                try:
+                    items.put(item, timeout=_POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        finally:
+            timing.output_wait_seconds += time.perf_counter() - start
+
+    def _get_all(self, items: queue.Queue, timing: StageTiming) -> Iterator:
+        """
+        Yields the items of a queue until its end is reached or the pipeline
+        is stopped.
+        """
+        while True:
+            start = time.perf_counter()
+            item = _END
+            while not self._stopped.is_set():
+                try:
+                    item = items.get(timeout=_POLL_INTERVAL)
+                    break
+                except queue.Empty:
+                    pass
+            timing.input_wait_seconds += time.perf_counter() - start
+            if item is _END:
+                return
+            yield item
@@ -0,0 +1,291 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import uuid
+from collections import deque
+from multiprocessing import Pool
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+
+from feast.loaders.encoder import encode_pa_table_to_buffer
+from feast.loaders.serializer import split_rows
+
+# Memory backed file system used to hand tables to and from workers. Falls
+# back to the default temporary directory where it does not exist.
+_SHARED_MEMORY_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Tables are staged in the default temporary directory instead once the
+# staging directory has less free space than this many times their size
+_FREE_SPACE_FACTOR = 4
+
+
+class EncodingPool:
+    """
+    Pool of worker processes that encode PyArrow tables into FeatureRows.
+
+    Worker processes are started on first use and reused by every ingestion
+    until the pool is closed. Tables are handed to the workers, and encoded
+    FeatureRows handed back, as memory mapped Arrow IPC files in a staging
+    directory instead of being pickled. Files which do not fit into the
+    staging directory are written to the default temporary directory.
+    """
+
+    def __init__(self, max_workers: int, staging_dir: Optional[str] = None):
+        """
+        Args:
+            max_workers (int):
+                Number of worker processes.
+
+            staging_dir (Optional[str]):
+                Directory in which tables and encoded FeatureRows are staged.
+                Defaults to shared memory in /dev/shm where it exists, and to
+                the default temporary directory otherwise.
+        """
+        self._max_workers = max_workers
+        self._staging_dir = staging_dir or _SHARED_MEMORY_DIR
+        self._pool = None
+        self._dir_path = None  # type: Optional[str]
+        self._fallback_dir_path = None  # type: Optional[str]
+
+    @property
+    def max_workers(self) -> int:
+        """
+        Returns the number of worker processes of the pool
+        """
+        return self._max_workers
+
+    @property
+    def staging_dir(self) -> Optional[str]:
+        """
+        Returns the directory in which tables are staged, or None for the
+        default temporary directory
+        """
+        return self._staging_dir
+
+    @property
+    def closed(self) -> bool:
+        """
+        Returns True if the worker processes are not running
+        """
+        return self._pool is None
+
+    def start(self):
+        """
+        Starts the worker processes if they are not running yet. Workers are
+        forked from the calling process, so this should be called before the
+        calling process starts any threads.
+        """
+        if self._pool is None:
+            self._dir_path = tempfile.mkdtemp(prefix="feast-", dir=self._staging_dir)
+            self._fallback_dir_path = tempfile.mkdtemp(prefix="feast-")
+            self._pool = Pool(self._max_workers)
+
+    def imap(
+        self,
+        tables: Iterable[pa.lib.Table],
+        feature_set: str,
+        fields: dict,
+        ingestion_id: str,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[List[bytes]]:
+        """
+        Encodes PyArrow tables into FeatureRows using the worker processes.
+
+        Tables are only taken from the iterable as workers become free, so at
+        most max_in_flight tables are held in memory at a time.
+
+        Args:
+            tables (Iterable[pyarrow.lib.Table]):
+                Tables holding the datetime column and all fields.
+
+            feature_set (str):
+                Feature set reference in the format
+                f"{project}/{name}:{version}".
+
+            fields (dict[str, enum.Enum.ValueType]):
+                A mapping of field names to their value types.
+
+            ingestion_id (str):
+                UUID unique to this ingestion job.
+
+            max_in_flight (Optional[int]):
+                Maximum number of tables being encoded at a time. Defaults to
+                twice the number of workers.
+
+        Returns:
+            Iterator[List[bytes]]:
+                Iterator over the byte encoded FeatureRows of every table, in
+                the order of the tables.
+        """
+        self.start()
+        if max_in_flight is None:
+            max_in_flight = 2 * self._max_workers
+
+        in_flight = deque()  # type: deque
+        try:
+            for table in tables:
+                in_flight.append(self._submit(table, feature_set, fields, ingestion_id))
+                if len(in_flight) >= max_in_flight:
+                    yield self._collect(*in_flight.popleft())
+            while in_flight:
+                yield self._collect(*in_flight.popleft())
+        finally:
+            # Wait for abandoned tasks so their files can be removed
+            for result, input_path, output_paths in in_flight:
+                result.wait()
+                _remove(input_path, *output_paths)
+
+    def _submit(self, table, feature_set, fields, ingestion_id):
+        """
+        Writes a table to the staging directory and hands it to a worker.
+        """
+        name = uuid.uuid4().hex
+        staged_path = os.path.join(self._dir_path, name)
+        fallback_path = os.path.join(self._fallback_dir_path, name)
+        output_paths = [f"{staged_path}.rows", f"{fallback_path}.rows"]
+
+        input_path = f"{staged_path}.arrow"
+        free_bytes = shutil.disk_usage(self._dir_path).free
+        fits = free_bytes >= _FREE_SPACE_FACTOR * table.nbytes
+        if not (fits and _try_write_table(table, input_path)):
+            input_path = f"{fallback_path}.arrow"
+            _write_table(table, input_path)
+
+        result = self._pool.apply_async(
+            _encode_shared,
+            (input_path, output_paths, feature_set, fields, ingestion_id),
+        )
+        return result, input_path, output_paths
+
+    @staticmethod
+    def _collect(result, input_path: str, output_paths: List[str]) -> List[bytes]:
+        """
+        Waits for a worker to encode a table and reads the encoded rows back
+        from the file it wrote.
+        """
+        try:
+            num_rows, output_path = result.get()
+            with pa.memory_map(output_path) as source:
+                buffer = source.read_buffer()
+                lengths = np.frombuffer(buffer, dtype=np.int64, count=num_rows)
+                data = np.frombuffer(buffer, dtype=np.uint8, offset=8 * num_rows)
+                return split_rows((data, lengths))
+        finally:
+            _remove(input_path, *output_paths)
+
+    def close(self):
+        """
+        Stops the worker processes once all submitted tables are encoded and
+        removes the staged files. The pool is started again when it is used
+        next.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._remove_staging_dirs()
+
+    def terminate(self):
+        """
+        Stops the worker processes immediately and removes the staged files.
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+            self._remove_staging_dirs()
+
+    def _remove_staging_dirs(self):
+        for dir_path in (self._dir_path, self._fallback_dir_path):
+            shutil.rmtree(dir_path, ignore_errors=True)
+        self._dir_path = None
+        self._fallback_dir_path = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+
+def _encode_shared(
+    input_path: str,
+    output_paths: List[str],
+    feature_set: str,
+    fields: dict,
+    ingestion_id: str,
+) -> Tuple[int, str]:
+    """
+    Worker function that encodes a table read from a staged file into
+    FeatureRows, and writes their lengths followed by their bytes to the
+    first of the output paths with enough free space.
+
+    Returns:
+        Tuple[int, str]:
+            Number of encoded rows and the path they were written to.
+    """
+    with pa.memory_map(input_path) as source:
+        table = pa.ipc.open_stream(source).read_all()
+        data, lengths = encode_pa_table_to_buffer(
+            table, feature_set, fields, ingestion_id
+        )
+
+    for output_path in output_paths[:-1]:
+        try:
+            _write_rows(output_path, data, lengths)
+            return len(lengths), output_path
+        except OSError:
+            _remove(output_path)
+    _write_rows(output_paths[-1], data, lengths)
+    return len(lengths), output_paths[-1]
+
+
+def _write_table(table: pa.lib.Table, path: str):
+    with pa.OSFile(path, "wb") as sink:
+        writer = pa.RecordBatchStreamWriter(sink, table.schema)
+        writer.write_table(table)
+        writer.close()
+
+
+def _try_write_table(table: pa.lib.Table, path: str) -> bool:
+    """
+    Writes a table to a file, and returns False instead of raising if there
+    is not enough space for it.
+    """
+    try:
+        _write_table(table, path)
+        return True
+    except OSError:
+        _remove(path)
+        return False
+
+
+def _write_rows(path: str, data: np.ndarray, lengths: np.ndarray):
+    with open(path, "wb") as sink:
+        sink.write(np.ascontiguousarray(lengths, dtype=np.int64))
+        sink.write(np.ascontiguousarray(data))
+
+
+def _remove(*paths: str):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
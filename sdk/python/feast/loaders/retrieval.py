@@ -0,0 +1,533 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    IO,
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+from urllib.parse import ParseResult, urlparse
+
+import fastavro
+import pyarrow as pa
+
+# Number of files downloaded concurrently by default
+DEFAULT_MAX_WORKERS: int = 4
+
+# Bytes of every file which are buffered ahead of the reader by default
+DEFAULT_MAX_BUFFERED_BYTES: int = 8 * 1024 * 1024
+
+# Number of rows of the record batches decoded from Avro files by default
+DEFAULT_BATCH_SIZE: int = 65536
+
+# Size of the chunks written by the local storage client
+_LOCAL_CHUNK_SIZE = 1024 * 1024
+
+# Interval in seconds at which a blocked prefetch thread checks whether it
+# was stopped
+_POLL_INTERVAL = 0.1
+
+# Marks the end of the items of a prefetch queue
+_END = object()
+
+T = TypeVar("T")
+
+# PyArrow types of Avro primitive and logical types
+_AVRO_PRIMITIVE_TYPES = {
+    "null": pa.null(),
+    "boolean": pa.bool_(),
+    "int": pa.int32(),
+    "long": pa.int64(),
+    "float": pa.float32(),
+    "double": pa.float64(),
+    "bytes": pa.binary(),
+    "string": pa.string(),
+}
+_AVRO_LOGICAL_TYPES = {
+    "date": pa.date32(),
+    "time-millis": pa.time32("ms"),
+    "time-micros": pa.time64("us"),
+    "timestamp-millis": pa.timestamp("ms", tz="UTC"),
+    "timestamp-micros": pa.timestamp("us", tz="UTC"),
+}
+
+
+class DownloadStopped(Exception):
+    """
+    Raised in a download when the reader of the downloaded file was closed.
+    """
+
+
+class BlobStream(io.RawIOBase):
+    """
+    File-like object connecting the download of a file to its reader.
+
+    The download writes chunks of the file while the reader reads them,
+    which blocks until the bytes it asks for arrived. Writes block while
+    max_buffered_bytes are waiting to be read, so the memory used by a file
+    is bounded no matter how far its download runs ahead of the reader.
+    """
+
+    def __init__(self, max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES):
+        self._max_buffered_bytes = max_buffered_bytes
+        self._chunks: Deque[memoryview] = deque()
+        self._buffered_bytes = 0
+        self._written_bytes = 0
+        self._finished = False
+        self._error: Optional[BaseException] = None
+        self._condition = threading.Condition()
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        """
+        Appends a chunk of the file, waiting until the reader caught up if
+        the buffer is full.
+        """
+        chunk = memoryview(bytes(data))
+        with self._condition:
+            while (
+                self._buffered_bytes
+                and self._buffered_bytes + len(chunk) > self._max_buffered_bytes
+                and not self.closed
+            ):
+                self._condition.wait()
+            if self.closed:
+                raise DownloadStopped("The reader of the file was closed")
+            self._chunks.append(chunk)
+            self._buffered_bytes += len(chunk)
+            self._written_bytes += len(chunk)
+            self._condition.notify_all()
+        return len(chunk)
+
+    def tell(self) -> int:
+        """
+        Returns the number of bytes written, which lets downloads resume
+        after a failure.
+        """
+        return self._written_bytes
+
+    def finish(self, error: Optional[BaseException] = None):
+        """
+        Marks the end of the file. The error of a failed download is raised
+        to the reader once it read all chunks before it.
+        """
+        with self._condition:
+            self._finished = True
+            self._error = error
+            self._condition.notify_all()
+
+    def readinto(self, buffer) -> int:
+        """
+        Reads the next bytes of the file into a buffer, waiting until they
+        arrived. Returns 0 at the end of the file.
+        """
+        with self._condition:
+            while not self._chunks and not self._finished and not self.closed:
+                self._condition.wait()
+            if self._chunks:
+                chunk = self._chunks[0]
+                size = min(len(buffer), len(chunk))
+                buffer[:size] = chunk[:size]
+                if size == len(chunk):
+                    self._chunks.popleft()
+                else:
+                    self._chunks[0] = chunk[size:]
+                self._buffered_bytes -= size
+                self._condition.notify_all()
+                return size
+            if self._error is not None:
+                raise self._error
+            return 0
+
+    def close(self):
+        """
+        Closes the reader, which makes a running download stop.
+        """
+        with self._condition:
+            super().close()
+            self._chunks.clear()
+            self._buffered_bytes = 0
+            self._condition.notify_all()
+
+
+class LocalStorageClient:
+    """
+    Stand-in for google.cloud.storage.Client which serves gs:// URIs from a
+    local directory, with a subdirectory per bucket. Useful to read the
+    results of retrieval jobs offline.
+    """
+
+    def __init__(self, root: str, chunk_size: int = _LOCAL_CHUNK_SIZE):
+        """
+        Args:
+            root (str):
+                Directory holding a subdirectory for every bucket.
+
+            chunk_size (int):
+                Size in bytes of the chunks in which files are written.
+        """
+        self._root = root
+        self._chunk_size = chunk_size
+
+    def download_blob_to_file(self, blob_or_uri: str, file_obj: IO[bytes]):
+        """
+        Writes the file of a gs:// URI into a file-like object.
+        """
+        uri = urlparse(blob_or_uri)
+        path = os.path.join(self._root, uri.netloc, uri.path.lstrip("/"))
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(self._chunk_size), b""):
+                file_obj.write(chunk)
+
+
+class RetrievalReader:
+    """
+    Reads the Avro files of a retrieval job result in order.
+
+    Up to max_workers gs:// files are downloaded concurrently, ahead of the
+    file which is being read. Every file is parsed while it downloads rather
+    than after, and at most max_buffered_bytes of every downloading file are
+    held in memory.
+    """
+
+    def __init__(
+        self,
+        uris: List[Union[str, ParseResult]],
+        storage_client: Any,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+    ):
+        """
+        Args:
+            uris (List[Union[str, ParseResult]]):
+                gs:// and file:// URIs of the Avro files.
+
+            storage_client (Any):
+                Client with a download_blob_to_file(uri, file_obj) method,
+                like google.cloud.storage.Client or LocalStorageClient.
+
+            max_workers (int):
+                Maximum number of files downloaded concurrently.
+
+            max_buffered_bytes (int):
+                Maximum number of bytes of every file waiting to be read.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._uris = [urlparse(uri) if isinstance(uri, str) else uri for uri in uris]
+        for uri in self._uris:
+            if uri.scheme not in ("gs", "file"):
+                raise Exception(
+                    f"Could not identify file URI {uri.geturl()}. Only gs:// and "
+                    f"file:// supported"
+                )
+        self._storage_client = storage_client
+        self._max_workers = max_workers
+        self._max_buffered_bytes = max_buffered_bytes
+
+    def files(self) -> Iterator[IO[bytes]]:
+        """
+        Yields a binary file-like object for every file, in order. Every
+        file is closed once the next one is requested.
+        """
+        executor = ThreadPoolExecutor(
+            self._max_workers, thread_name_prefix="feast-retrieval-download"
+        )
+        opened: Dict[int, IO[bytes]] = dict()
+        try:
+            for file_idx in range(len(self._uris)):
+                # Start the downloads of the following files
+                for idx in range(file_idx, file_idx + self._max_workers):
+                    if idx < len(self._uris) and idx not in opened:
+                        opened[idx] = self._open(self._uris[idx], executor)
+                file_obj = opened.pop(file_idx)
+                try:
+                    yield file_obj
+                finally:
+                    file_obj.close()
+        finally:
+            for file_obj in opened.values():
+                file_obj.close()
+            executor.shutdown(wait=True)
+
+    def _open(self, uri: ParseResult, executor: ThreadPoolExecutor) -> IO[bytes]:
+        if uri.scheme == "file":
+            return open(uri.path, "rb")
+
+        stream = BlobStream(self._max_buffered_bytes)
+        executor.submit(self._download, uri, stream)
+        return io.BufferedReader(stream)
+
+    def _download(self, uri: ParseResult, stream: BlobStream):
+        if stream.closed:
+            # The reader stopped before the download started
+            return
+        try:
+            self._storage_client.download_blob_to_file(uri.geturl(), stream)
+        except BaseException as e:
+            stream.finish(e)
+        else:
+            stream.finish()
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the records of all files.
+        """
+        for file_obj in self.files():
+            yield from fastavro.reader(file_obj)
+
+    def record_batches(
+        self, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Yields the records of all files as PyArrow record batches.
+
+        Every Avro block is converted into Arrow columns as soon as it is
+        decoded, so only the records of a single block exist as Python
+        objects at any time.
+
+        Args:
+            batch_size (int):
+                Number of rows of every record batch, except for the last one
+                which holds the remaining rows.
+
+        Returns:
+            Iterator[pyarrow.RecordBatch]:
+                Record batches with the schema of the Avro files. A single
+                empty record batch is yielded if the files hold no records.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        schema = None
+        pending: List[pa.RecordBatch] = []
+        pending_rows = 0
+        yielded = False
+        for file_obj in self.files():
+            reader = fastavro.block_reader(file_obj)
+            if schema is None:
+                schema = avro_to_arrow_schema(reader.writer_schema)
+            for block in reader:
+                batch = _records_to_batch(list(block), schema)
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                while pending_rows >= batch_size:
+                    table = pa.Table.from_batches(pending, schema)
+                    yield _combine_batches(table.slice(0, batch_size))
+                    yielded = True
+                    remainder = table.slice(batch_size)
+                    pending = remainder.to_batches()
+                    pending_rows = remainder.num_rows
+
+        if schema is not None and (pending_rows or not yielded):
+            yield _combine_batches(pa.Table.from_batches(pending, schema))
+
+    def to_arrow(self) -> pa.Table:
+        """
+        Reads the records of all files into a PyArrow table.
+        """
+        batches = list(self.record_batches())
+        if not batches:
+            return pa.table({})
+        return pa.Table.from_batches(batches)
+
+
+class _PrefetchError:
+    """
+    Error raised while prefetching, to be raised to the consumer.
+    """
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def prefetch(items: Iterable[T], max_prefetched: int) -> Iterator[T]:
+    """
+    Iterates over items on a background thread, which stays up to
+    max_prefetched items ahead of the consumer.
+
+    Args:
+        items (Iterable[T]):
+            Items to iterate over.
+
+        max_prefetched (int):
+            Maximum number of items produced ahead of the consumer. Items
+            are produced on the calling thread if smaller than 1.
+
+    Returns:
+        Iterator[T]:
+            Iterator over the items, in order. Errors raised while producing
+            an item are raised to the consumer in its place.
+    """
+    if max_prefetched < 1:
+        yield from items
+        return
+
+    prefetched: queue.Queue = queue.Queue(max_prefetched)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                prefetched.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+            put(_END)
+        except BaseException as e:
+            put(_PrefetchError(e))
+        finally:
+            # Stop producing abandoned items
+            if hasattr(iterator, "close"):
+                iterator.close()
+
+    thread = threading.Thread(target=produce, name="feast-retrieval-prefetch")
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            item = prefetched.get()
+            if item is _END:
+                break
+            if isinstance(item, _PrefetchError):
+                raise item.error
+            yield item
+    finally:
+        stopped.set()
+        thread.join()
+
+
+def _records_to_batch(
+    records: List[Dict[str, Any]], schema: pa.Schema
+) -> pa.RecordBatch:
+    """
+    Converts records to a record batch column by column, as
+    pa.RecordBatch.from_pylist is only available from PyArrow 7.0.
+    """
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array([record.get(field.name) for record in records], type=field.type)
+            for field in schema
+        ],
+        schema=schema,
+    )
+
+
+def _combine_batches(table: pa.Table) -> pa.RecordBatch:
+    """
+    Returns the rows of a table as a single record batch.
+    """
+    if table.num_rows == 0:
+        return _records_to_batch([], table.schema)
+    return table.combine_chunks().to_batches()[0]
+
+
+def avro_to_arrow_schema(avro_schema: Dict[str, Any]) -> pa.Schema:
+    """
+    Converts the schema of Avro records into a PyArrow schema. Fields whose
+    type is a union with null are nullable.
+
+    Args:
+        avro_schema (Dict[str, Any]):
+            Avro record schema, as returned by fastavro.
+
+    Returns:
+        pyarrow.Schema:
+            Schema with a field for every field of the records.
+    """
+    return pa.schema(_arrow_struct(avro_schema, dict()))
+
+
+def _arrow_struct(avro_schema: Dict[str, Any], named: Dict[str, pa.DataType]):
+    return [
+        pa.field(
+            field["name"],
+            _arrow_type(field["type"], named),
+            nullable=_is_nullable(field["type"]),
+        )
+        for field in avro_schema["fields"]
+    ]
+
+
+def _is_nullable(avro_type) -> bool:
+    return avro_type == "null" or (isinstance(avro_type, list) and "null" in avro_type)
+
+
+def _arrow_type(avro_type, named: Dict[str, pa.DataType]) -> pa.DataType:
+    """
+    Converts an Avro type into a PyArrow type. Named types are registered in
+    named, so later references to them can be resolved.
+    """
+    if isinstance(avro_type, str):
+        if avro_type in _AVRO_PRIMITIVE_TYPES:
+            return _AVRO_PRIMITIVE_TYPES[avro_type]
+        if avro_type in named:
+            return named[avro_type]
+        raise ValueError(f"Unknown Avro type {avro_type}")
+
+    if isinstance(avro_type, list):
+        types = [branch for branch in avro_type if branch != "null"]
+        if not types:
+            return pa.null()
+        if len(types) > 1:
+            raise ValueError(f"Avro union {avro_type} is not supported")
+        return _arrow_type(types[0], named)
+
+    type_name = avro_type["type"]
+    logical_type = avro_type.get("logicalType")
+    if logical_type == "decimal":
+        arrow_type = pa.decimal128(avro_type["precision"], avro_type.get("scale", 0))
+    elif logical_type in _AVRO_LOGICAL_TYPES:
+        arrow_type = _AVRO_LOGICAL_TYPES[logical_type]
+    elif type_name == "record":
+        arrow_type = pa.struct(_arrow_struct(avro_type, named))
+    elif type_name == "enum":
+        arrow_type = pa.string()
+    elif type_name == "fixed":
+        arrow_type = pa.binary(avro_type["size"])
+    elif type_name == "array":
+        arrow_type = pa.list_(_arrow_type(avro_type["items"], named))
+    elif type_name == "map":
+        arrow_type = pa.map_(pa.string(), _arrow_type(avro_type["values"], named))
+    else:
+        arrow_type = _arrow_type(type_name, named)
+
+    if "name" in avro_type:
+        named[avro_type["name"]] = arrow_type
+    return arrow_type
@@ -0,0 +1,524 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from feast.value_type import ValueType
+
+# A column of variable length byte strings, one per row, stored as the
+# concatenation of all rows and the length of each row.
+Ragged = Tuple[np.ndarray, np.ndarray]
+
+# Protobuf wire types
+VARINT = 0
+FIXED64 = 1
+LENGTH_DELIMITED = 2
+FIXED32 = 5
+
+# Field numbers of feast.types.FeatureRow
+_FEATURE_ROW_FIELDS = 2
+_FEATURE_ROW_EVENT_TIMESTAMP = 3
+_FEATURE_ROW_FEATURE_SET = 6
+_FEATURE_ROW_INGESTION_ID = 7
+
+# Field numbers of feast.types.Field
+_FIELD_NAME = 1
+_FIELD_VALUE = 2
+
+# Field numbers of google.protobuf.Timestamp
+_TIMESTAMP_SECONDS = 1
+_TIMESTAMP_NANOS = 2
+
+# Field number of the repeated "val" field in all feast.types.*List messages
+_LIST_VAL = 1
+
+# Mapping of Feast value types to the field number of the value in the
+# feast.types.Value oneof and the wire type of a single element
+VALUE_ENCODINGS = {
+    ValueType.BYTES: (1, LENGTH_DELIMITED),
+    ValueType.STRING: (2, LENGTH_DELIMITED),
+    ValueType.INT32: (3, VARINT),
+    ValueType.INT64: (4, VARINT),
+    ValueType.DOUBLE: (5, FIXED64),
+    ValueType.FLOAT: (6, FIXED32),
+    ValueType.BOOL: (7, VARINT),
+    ValueType.BYTES_LIST: (11, LENGTH_DELIMITED),
+    ValueType.STRING_LIST: (12, LENGTH_DELIMITED),
+    ValueType.INT32_LIST: (13, VARINT),
+    ValueType.INT64_LIST: (14, VARINT),
+    ValueType.DOUBLE_LIST: (15, FIXED64),
+    ValueType.FLOAT_LIST: (16, FIXED32),
+    ValueType.BOOL_LIST: (17, VARINT),
+}
+
+_FIXED_WIDTH_DTYPES = {
+    FIXED32: np.dtype("<f4"),
+    FIXED64: np.dtype("<f8"),
+}
+
+
+class ColumnBuffer(NamedTuple):
+    """
+    Typed buffers holding the values of a single column, laid out in the same
+    way as an Arrow array.
+
+    Attributes:
+        values (np.ndarray):
+            Values of every row, or of every list element for list columns.
+            String and bytes values are stored as the concatenation of their
+            raw bytes with dtype uint8.
+
+        value_offsets (Optional[np.ndarray]):
+            Offsets of every string or bytes value into values.
+
+        list_offsets (Optional[np.ndarray]):
+            Offsets of the elements of every row for list columns.
+
+        validity (Optional[np.ndarray]):
+            Boolean mask of the non-null rows, or None if there are no nulls.
+    """
+
+    values: np.ndarray
+    value_offsets: Optional[np.ndarray] = None
+    list_offsets: Optional[np.ndarray] = None
+    validity: Optional[np.ndarray] = None
+
+
+class Constant(NamedTuple):
+    """
+    The same bytes in every row, or only in the rows selected by the mask.
+
+    Attributes:
+        value (bytes):
+            Bytes written in every selected row.
+
+        mask (Optional[np.ndarray]):
+            Boolean mask of the rows holding the value, or None for all rows.
+    """
+
+    value: bytes
+    mask: Optional[np.ndarray] = None
+
+
+# Part of every row of an encoded column, written by write_segments
+Segment = Union[Constant, Ragged]
+
+
+class FeatureRowSerializer:
+    """
+    Serializes columns of feature values into the FeatureRow protobuf wire
+    format without creating any protobuf messages.
+
+    The output is byte for byte identical to building a FeatureRow message
+    for every row and calling SerializeToString() on it. The tags, field
+    names, feature set reference and ingestion id are encoded once when the
+    serializer is created, and all rows of a batch are written into a single
+    preallocated buffer.
+    """
+
+    def __init__(
+        self, feature_set: str, fields: Dict[str, ValueType], ingestion_id: str
+    ):
+        """
+        Args:
+            feature_set (str):
+                Feature set reference in the format
+                f"{project}/{name}:{version}".
+
+            fields (Dict[str, ValueType]):
+                A mapping of field names to their value types, in the order
+                in which the fields are serialized.
+
+            ingestion_id (str):
+                UUID unique to this ingestion job.
+        """
+        self._fields = []
+        for name, dtype in fields.items():
+            if dtype not in VALUE_ENCODINGS:
+                raise ValueError(f"Unsupported value type {dtype} for field {name}")
+            value_field, encoding = VALUE_ENCODINGS[dtype]
+            self._fields.append(
+                (
+                    name,
+                    # Field name followed by the tag of the Field value
+                    _string_field(_FIELD_NAME, name)
+                    + _tag(_FIELD_VALUE, LENGTH_DELIMITED),
+                    _tag(value_field, LENGTH_DELIMITED),
+                    _tag(value_field, encoding),
+                    encoding,
+                    dtype.name.endswith("_LIST"),
+                )
+            )
+        self._suffix = _string_field(
+            _FEATURE_ROW_FEATURE_SET, feature_set
+        ) + _string_field(_FEATURE_ROW_INGESTION_ID, ingestion_id)
+
+    def serialize(
+        self, columns: Dict[str, ColumnBuffer], seconds: np.ndarray, nanos: np.ndarray,
+    ) -> List[bytes]:
+        """
+        Serializes a batch of rows into FeatureRows.
+
+        Args:
+            columns (Dict[str, ColumnBuffer]):
+                Typed buffers of every field of the serializer.
+
+            seconds (np.ndarray):
+                Seconds of the event timestamp of every row.
+
+            nanos (np.ndarray):
+                Nanoseconds of the event timestamp of every row.
+
+        Returns:
+            List[bytes]:
+                List of byte encoded FeatureRows, one for each row.
+        """
+        return split_rows(self.serialize_to_buffer(columns, seconds, nanos))
+
+    def serialize_to_buffer(
+        self, columns: Dict[str, ColumnBuffer], seconds: np.ndarray, nanos: np.ndarray,
+    ) -> Ragged:
+        """
+        Serializes a batch of rows into FeatureRows which are stored one after
+        the other in a single buffer.
+
+        Args:
+            columns (Dict[str, ColumnBuffer]):
+                Typed buffers of every field of the serializer.
+
+            seconds (np.ndarray):
+                Seconds of the event timestamp of every row.
+
+            nanos (np.ndarray):
+                Nanoseconds of the event timestamp of every row.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]:
+                Buffer holding the concatenation of all byte encoded
+                FeatureRows, and the length of every FeatureRow.
+        """
+        num_rows = len(seconds)
+        segments: List[Segment] = []
+        for name, header, list_tag, scalar_tag, encoding, is_list in self._fields:
+            column = columns[name]
+            if is_list:
+                value = self._list_value(column, list_tag, encoding, num_rows)
+            else:
+                value = self._scalar_value(column, scalar_tag, encoding)
+
+            value_lengths = _total_lengths(value, num_rows)
+            value_length_varints = encode_varints(value_lengths)
+            field_lengths = len(header) + value_length_varints[1] + value_lengths
+            segments += [
+                Constant(_tag(_FEATURE_ROW_FIELDS, LENGTH_DELIMITED)),
+                encode_varints(field_lengths),
+                Constant(header),
+                value_length_varints,
+                *value,
+            ]
+
+        segments += self._timestamp(seconds, nanos, num_rows)
+        segments.append(Constant(self._suffix))
+        return write_segments(segments, num_rows)
+
+    @staticmethod
+    def _scalar_value(column: ColumnBuffer, tag: bytes, encoding: int) -> List[Segment]:
+        """
+        Returns the contents of the feast.types.Value of every row of a scalar
+        column. Null values are encoded as empty Value messages.
+        """
+        if encoding == LENGTH_DELIMITED:
+            payload = _length_prefixed(_binary_elements(column))
+        elif encoding == VARINT:
+            payload = [encode_varints(column.values)]
+        else:
+            payload = [encode_fixed_width(column.values, encoding)]
+        return [
+            Constant(tag, column.validity),
+            *[mask_rows(part, column.validity) for part in payload],
+        ]
+
+    @staticmethod
+    def _list_value(
+        column: ColumnBuffer, tag: bytes, encoding: int, num_rows: int
+    ) -> List[Segment]:
+        """
+        Returns the contents of the feast.types.Value of every row of a list
+        column. Null lists are encoded as empty lists.
+        """
+        offsets = column.list_offsets
+        if encoding == LENGTH_DELIMITED:
+            # Strings and bytes are never packed, every element carries a tag
+            num_elements = len(column.value_offsets) - 1
+            elements = write_segments(
+                [
+                    Constant(_tag(_LIST_VAL, LENGTH_DELIMITED)),
+                    *_length_prefixed(_binary_elements(column)),
+                ],
+                num_elements,
+            )
+            body = [mask_rows(_group_rows(elements, offsets), column.validity)]
+        else:
+            if encoding == VARINT:
+                elements = encode_varints(column.values)
+            else:
+                elements = encode_fixed_width(column.values, encoding)
+            # Empty packed fields are omitted entirely
+            present = np.diff(offsets) > 0
+            if column.validity is not None:
+                present &= column.validity
+            packed = [mask_rows(_group_rows(elements, offsets), present)]
+            body = _length_delimited(
+                _tag(_LIST_VAL, LENGTH_DELIMITED), packed, num_rows, present
+            )
+        return _length_delimited(tag, body, num_rows)
+
+    @staticmethod
+    def _timestamp(
+        seconds: np.ndarray, nanos: np.ndarray, num_rows: int
+    ) -> List[Segment]:
+        """
+        Returns the FeatureRow.event_timestamp of every row.
+        """
+        # Zero values are not serialized in proto3
+        seconds_set = seconds != 0
+        nanos_set = nanos != 0
+        body = [
+            Constant(_tag(_TIMESTAMP_SECONDS, VARINT), seconds_set),
+            mask_rows(encode_varints(seconds), seconds_set),
+            Constant(_tag(_TIMESTAMP_NANOS, VARINT), nanos_set),
+            mask_rows(encode_varints(nanos), nanos_set),
+        ]
+        return _length_delimited(
+            _tag(_FEATURE_ROW_EVENT_TIMESTAMP, LENGTH_DELIMITED), body, num_rows
+        )
+
+
+def _segment_lengths(segment: Segment, num_rows: int) -> np.ndarray:
+    """
+    Returns the number of bytes of a segment in every row.
+    """
+    if isinstance(segment, Constant):
+        if segment.mask is None:
+            return np.full(num_rows, len(segment.value), dtype=np.int64)
+        return np.where(segment.mask, len(segment.value), 0)
+    return segment[1]
+
+
+def _total_lengths(segments: List[Segment], num_rows: int) -> np.ndarray:
+    """
+    Returns the number of bytes of all segments together in every row.
+    """
+    lengths = np.zeros(num_rows, dtype=np.int64)
+    for segment in segments:
+        lengths += _segment_lengths(segment, num_rows)
+    return lengths
+
+
+def write_segments(segments: List[Segment], num_rows: int) -> Ragged:
+    """
+    Writes the segments of every row one after the other into a single
+    preallocated buffer.
+
+    Args:
+        segments (List[Segment]):
+            Segments making up every row, in order.
+
+        num_rows (int):
+            Number of rows.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]:
+            Buffer holding the concatenation of all rows, and the length of
+            every row.
+    """
+    segment_lengths = [_segment_lengths(segment, num_rows) for segment in segments]
+    lengths = np.sum(segment_lengths, axis=0, dtype=np.int64).reshape(num_rows)
+    data = np.frombuffer(bytearray(int(lengths.sum())), dtype=np.uint8)
+    cursor = np.cumsum(lengths) - lengths
+
+    for segment, part_lengths in zip(segments, segment_lengths):
+        if isinstance(segment, Constant):
+            rows = cursor if segment.mask is None else cursor[segment.mask]
+            value = np.frombuffer(segment.value, dtype=np.uint8)
+            data[rows[:, None] + np.arange(len(value))] = value
+        elif len(segment[0]):
+            # Shift every byte from its position in the segment to its
+            # position in the output row
+            part_starts = np.cumsum(part_lengths) - part_lengths
+            shift = np.repeat(cursor - part_starts, part_lengths)
+            data[np.arange(len(segment[0])) + shift] = segment[0]
+        cursor += part_lengths
+
+    return data, lengths
+
+
+def _length_delimited(
+    tag: bytes,
+    segments: List[Segment],
+    num_rows: int,
+    mask: Optional[np.ndarray] = None,
+) -> List[Segment]:
+    """
+    Encodes the segments of every row as a length delimited protobuf field.
+    Rows for which the mask is False are left out and must be empty.
+    """
+    lengths = encode_varints(_total_lengths(segments, num_rows))
+    return [Constant(tag, mask), mask_rows(lengths, mask), *segments]
+
+
+def _binary_elements(column: ColumnBuffer) -> Ragged:
+    """
+    Returns the raw bytes of every string or bytes value of a column.
+    """
+    offsets = column.value_offsets
+    return column.values[offsets[0] : offsets[-1]], np.diff(offsets)
+
+
+def encode_fixed_width(values: np.ndarray, encoding: int) -> Ragged:
+    """
+    Encodes floating point values as little endian fixed width bytes.
+
+    Args:
+        values (np.ndarray):
+            Floating point values.
+
+        encoding (int):
+            FIXED32 for 4 byte floats or FIXED64 for 8 byte doubles.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]:
+            Encoded bytes of all values, and the length of every value.
+    """
+    dtype = _FIXED_WIDTH_DTYPES[encoding]
+    data = np.ascontiguousarray(values, dtype=dtype).view(np.uint8)
+    return data, np.full(len(values), dtype.itemsize, dtype=np.int64)
+
+
+def encode_varints(values: np.ndarray) -> Ragged:
+    """
+    Encodes integers as protobuf base 128 varints. Negative values are sign
+    extended to 64 bits, which makes them 10 bytes long.
+
+    Args:
+        values (np.ndarray):
+            Integer values.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]:
+            Encoded bytes of all values, and the length of every value.
+    """
+    values = values.astype(np.int64, copy=False).view(np.uint64)
+    lengths = np.ones(len(values), dtype=np.int64)
+    remainder = values >> np.uint64(7)
+    while remainder.any():
+        lengths += remainder != 0
+        remainder = remainder >> np.uint64(7)
+
+    width = int(lengths.max()) if len(values) else 0
+    positions = np.arange(width)
+    shifts = (positions * 7).astype(np.uint64)
+    groups = ((values[:, None] >> shifts) & np.uint64(0x7F)).astype(np.uint8)
+    groups[positions < lengths[:, None] - 1] |= 0x80
+    return groups[positions < lengths[:, None]], lengths
+
+
+def _length_prefixed(column: Ragged) -> List[Segment]:
+    """
+    Prefixes every row with its length encoded as a varint.
+    """
+    return [encode_varints(column[1]), column]
+
+
+def mask_rows(column: Ragged, mask: Optional[np.ndarray]) -> Ragged:
+    """
+    Empties all rows for which the mask is False.
+
+    Args:
+        column (Tuple[np.ndarray, np.ndarray]):
+            Buffer holding the concatenation of all rows, and the length of
+            every row.
+
+        mask (Optional[np.ndarray]):
+            Boolean mask of the rows to keep, or None to keep all rows.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]:
+            Column in which the rows that are not kept are empty.
+    """
+    if mask is None:
+        return column
+    data, lengths = column
+    return data[np.repeat(mask, lengths)], np.where(mask, lengths, 0)
+
+
+def _group_rows(elements: Ragged, offsets: np.ndarray) -> Ragged:
+    """
+    Groups encoded list elements into rows using the list offsets.
+    """
+    data, lengths = elements
+    ends = np.concatenate([[0], np.cumsum(lengths)])
+    return data, np.diff(ends[offsets])
+
+
+def split_rows(column: Ragged) -> List[bytes]:
+    """
+    Returns every row of a column as a separate bytes object.
+
+    Args:
+        column (Tuple[np.ndarray, np.ndarray]):
+            Buffer holding the concatenation of all rows, and the length of
+            every row.
+
+    Returns:
+        List[bytes]:
+            List of rows.
+    """
+    data, lengths = column
+    buffer = data.tobytes()
+    ends = np.cumsum(lengths).tolist()
+    starts = [0] + ends[:-1]
+    return [buffer[start:end] for start, end in zip(starts, ends)]
+
+
+def _varint(value: int) -> bytes:
+    """
+    Encodes a single integer as a varint.
+    """
+    value &= 0xFFFFFFFFFFFFFFFF
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _tag(field_number: int, wire_type: int) -> bytes:
+    """
+    Encodes the key of a protobuf field.
+    """
+    return _varint(field_number << 3 | wire_type)
+
+
+def _string_field(field_number: int, value: str) -> bytes:
+    """
+    Encodes a string field. Empty strings are not serialized in proto3.
+    """
+    if not value:
+        return b""
+    encoded = value.encode("utf-8")
+    return _tag(field_number, LENGTH_DELIMITED) + _varint(len(encoded)) + encoded
@@ -0,0 +1,237 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from os.path import expanduser, join
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import pandas as pd
+from google.cloud import storage
+
+from feast.constants import CONFIG_FILE_DEFAULT_DIRECTORY, FEAST_CONFIG_FILE_ENV_KEY
+from feast.loaders.file import export_source_to_staging_location
+
+# Name of the manifest file in the Feast configuration directory
+STAGING_MANIFEST_FILE_NAME = "staging_manifest.json"
+
+# Maximum number of staged DataFrames the manifest keeps track of by default
+DEFAULT_MAX_MANIFEST_ENTRIES: int = 1000
+
+# Prefix of the names of the files a DataFrame is staged as, followed by the
+# hash of its contents
+STAGED_FILE_PREFIX = "entities_"
+
+
+def hash_entity_rows(df: pd.DataFrame) -> Optional[str]:
+    """
+    Returns a hash of the column names, types and values of a DataFrame.
+
+    Args:
+        df (pd.DataFrame):
+            Pandas DataFrame of entity rows.
+
+    Returns:
+        Optional[str]:
+            Hexadecimal SHA-256 digest, or None if the DataFrame has values
+            which cannot be hashed, such as lists.
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    except TypeError:
+        return None
+    digest = hashlib.sha256()
+    for column, dtype in df.dtypes.items():
+        digest.update(f"{column}:{dtype}\n".encode("utf-8"))
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
+
+
+def default_manifest_path() -> str:
+    """
+    Returns the path of the staging manifest in the Feast configuration
+    directory, next to the configuration file.
+    """
+    return join(
+        expanduser("~"),
+        os.environ.get(FEAST_CONFIG_FILE_ENV_KEY, CONFIG_FILE_DEFAULT_DIRECTORY),
+        STAGING_MANIFEST_FILE_NAME,
+    )
+
+
+class StagingCache:
+    """
+    Stages entity DataFrames as files named after the hash of their
+    contents, and skips exporting and uploading a DataFrame again while its
+    files still exist in the staging location.
+
+    Staged files are tracked in a local JSON manifest, which lists the files
+    of every DataFrame once all of them were uploaded. Files missing from
+    the staging location, for example because of its retention policy, are
+    staged again.
+
+    Attributes:
+        hits (int):
+            Number of DataFrames whose staged files were reused.
+
+        misses (int):
+            Number of DataFrames exported and uploaded to the staging
+            location.
+    """
+
+    def __init__(
+        self,
+        manifest_path: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_MANIFEST_ENTRIES,
+    ):
+        """
+        Args:
+            manifest_path: Path of the manifest file. Defaults to
+                staging_manifest.json in the Feast configuration directory.
+            max_entries: Maximum number of staged DataFrames in the
+                manifest. The oldest ones are forgotten beyond it.
+        """
+        self.manifest_path = manifest_path or default_manifest_path()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def stage(self, df: pd.DataFrame, staging_location_uri: str, **kwargs) -> List[str]:
+        """
+        Stages a DataFrame, unless the same rows were staged to the same
+        location before.
+
+        Args:
+            df (pd.DataFrame):
+                Pandas DataFrame of entity rows.
+
+            staging_location_uri (str):
+                Remote staging location, such as gs://bucket/path/.
+
+            **kwargs:
+                Additional keyword arguments of
+                export_source_to_staging_location.
+
+        Returns:
+            List[str]:
+                Full paths of the files in the staging location.
+        """
+        digest = hash_entity_rows(df)
+        if digest is not None:
+            staged_files = self.lookup(staging_location_uri, digest)
+            if staged_files is not None and _files_exist(staged_files):
+                self.hits += 1
+                return staged_files
+
+        self.misses += 1
+        if digest is None:
+            return export_source_to_staging_location(df, staging_location_uri, **kwargs)
+        staged_files = export_source_to_staging_location(
+            df,
+            staging_location_uri,
+            file_prefix=f"{STAGED_FILE_PREFIX}{digest}",
+            **kwargs,
+        )
+        self.record(staging_location_uri, digest, staged_files)
+        return staged_files
+
+    def lookup(self, staging_location_uri: str, digest: str) -> Optional[List[str]]:
+        """
+        Returns the files a DataFrame was staged as according to the
+        manifest, or None if it was not staged to that location.
+        """
+        with self._lock:
+            entries = self._load()
+        entry = entries.get(_entry_key(staging_location_uri, digest))
+        return None if entry is None else entry["files"]
+
+    def record(self, staging_location_uri: str, digest: str, files: List[str]):
+        """
+        Adds the files a DataFrame was staged as to the manifest.
+        """
+        with self._lock:
+            # Reload the manifest to keep entries recorded by other processes
+            entries = self._load()
+            entries[_entry_key(staging_location_uri, digest)] = {
+                "files": files,
+                "staged_at": time.time(),
+            }
+            if len(entries) > self.max_entries:
+                oldest = sorted(entries, key=lambda key: entries[key]["staged_at"])
+                for key in oldest[: len(entries) - self.max_entries]:
+                    del entries[key]
+            self._save(entries)
+
+    def clear(self):
+        """
+        Forgets all staged DataFrames. Staged files are left in place.
+        """
+        with self._lock:
+            self._save({})
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.manifest_path) as file:
+                return json.load(file)["entries"]
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]):
+        directory = os.path.dirname(os.path.abspath(self.manifest_path))
+        os.makedirs(directory, exist_ok=True)
+        # Replace the manifest at once, so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump({"entries": entries}, file)
+            os.replace(tmp_path, self.manifest_path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+
+def _entry_key(staging_location_uri: str, digest: str) -> str:
+    return f"{staging_location_uri.rstrip('/')}/{digest}"
+
+
+def _files_exist(uris: List[str]) -> bool:
+    """
+    Returns whether all files exist in their staging location.
+    """
+    gcs_paths: Dict[str, List[str]] = {}
+    for uri in uris:
+        parsed = urlparse(uri)
+        if parsed.scheme == "gs":
+            gcs_paths.setdefault(parsed.netloc, []).append(parsed.path.lstrip("/"))
+        elif parsed.scheme == "file":
+            if not os.path.exists(parsed.path):
+                return False
+        else:
+            return False
+
+    if gcs_paths:
+        storage_client = storage.Client(project=None)
+        for bucket, paths in gcs_paths.items():
+            # List the files of a DataFrame with a single request
+            prefix = os.path.commonprefix(paths)
+            blobs = storage_client.list_blobs(bucket, prefix=prefix)
+            if not set(paths) <= {blob.name for blob in blobs}:
+                return False
+    return True
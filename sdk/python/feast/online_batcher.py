@@ -0,0 +1,174 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from feast.online_cache import entity_key, feature_ref_string
+from feast.serving.ServingService_pb2 import (
+    FeatureReference,
+    GetOnlineFeaturesRequest,
+    GetOnlineFeaturesResponse,
+)
+
+EntityRow = GetOnlineFeaturesRequest.EntityRow
+
+
+class _Batch:
+    """
+    Entity rows of concurrent requests for the same features, which are
+    retrieved in a single request.
+    """
+
+    def __init__(self):
+        self.rows = OrderedDict()  # type: OrderedDict
+        self.entity_names = set()
+        self.num_rows = 0
+        self.closed = threading.Event()
+        self.done = threading.Event()
+        self.response: Optional[Dict[tuple, Any]] = None
+        self.error: Optional[BaseException] = None
+
+    def add(self, entity_rows: Sequence[EntityRow]):
+        for entity_row in entity_rows:
+            self.rows.setdefault(entity_key(entity_row.fields), entity_row)
+            self.entity_names.update(entity_row.fields)
+        self.num_rows += len(entity_rows)
+
+
+class OnlineRequestBatcher:
+    """
+    Coalesces concurrent online feature requests for the same features into
+    a single request to Feast Serving.
+
+    The first caller of a batch waits up to max_wait_seconds for other
+    callers to add their entity rows, or until the batch holds
+    max_batch_size entity rows, and then sends the request on behalf of all
+    of them. Every caller receives the rows of its own entity rows only, in
+    their order.
+    """
+
+    def __init__(
+        self,
+        send: Callable[
+            [Sequence[FeatureReference], List[EntityRow]], GetOnlineFeaturesResponse
+        ],
+        max_wait_seconds: float = 0.002,
+        max_batch_size: int = 256,
+    ):
+        """
+        Args:
+            send (Callable[[Sequence[FeatureReference], List[EntityRow]], GetOnlineFeaturesResponse]):
+                Function that retrieves features for entity rows from Feast
+                Serving.
+
+            max_wait_seconds (float):
+                Maximum time in seconds a request waits for concurrent
+                requests to join its batch.
+
+            max_batch_size (int):
+                Number of entity rows after which a batch is sent without
+                waiting any longer.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._send = send
+        self._max_wait_seconds = max_wait_seconds
+        self._max_batch_size = max_batch_size
+        self._pending: Dict[Tuple[str, ...], _Batch] = dict()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.batches = 0
+
+    @property
+    def max_wait_seconds(self) -> float:
+        """
+        Returns the time in seconds a request waits for concurrent requests
+        """
+        return self._max_wait_seconds
+
+    @property
+    def max_batch_size(self) -> int:
+        """
+        Returns the number of entity rows after which a batch is sent
+        """
+        return self._max_batch_size
+
+    def get_online_features(
+        self, features: Sequence[FeatureReference], entity_rows: Sequence[EntityRow]
+    ) -> GetOnlineFeaturesResponse:
+        """
+        Retrieves features for entity rows as part of a batch of concurrent
+        requests for the same features.
+
+        Args:
+            features (Sequence[FeatureReference]):
+                References of the features to retrieve.
+
+            entity_rows (Sequence[EntityRow]):
+                Entity rows to retrieve the features for.
+
+        Returns:
+            GetOnlineFeaturesResponse:
+                Response holding a row for every entity row, in their order.
+        """
+        key = tuple(feature_ref_string(feature) for feature in features)
+        with self._lock:
+            self.requests += 1
+            batch = self._pending.get(key)
+            leader = batch is None
+            if leader:
+                batch = _Batch()
+                self._pending[key] = batch
+            batch.add(entity_rows)
+            if batch.num_rows >= self._max_batch_size:
+                del self._pending[key]
+                batch.closed.set()
+
+        if leader:
+            batch.closed.wait(self._max_wait_seconds)
+            with self._lock:
+                if self._pending.get(key) is batch:
+                    del self._pending[key]
+                self.batches += 1
+            self._run(batch, features)
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+        field_values = []
+        for entity_row in entity_rows:
+            row = batch.response.get(entity_key(entity_row.fields))
+            if row is None:
+                row = GetOnlineFeaturesResponse.FieldValues(fields=entity_row.fields)
+            field_values.append(row)
+        return GetOnlineFeaturesResponse(field_values=field_values)
+
+    def _run(self, batch: _Batch, features: Sequence[FeatureReference]):
+        """
+        Sends the request of a batch and indexes the response rows by their
+        entity key.
+        """
+        try:
+            response = self._send(features, list(batch.rows.values()))
+            batch.response = {
+                entity_key(field_values.fields, batch.entity_names): field_values
+                for field_values in response.field_values
+            }
+        except BaseException as e:
+            batch.error = e
+        finally:
+            batch.done.set()
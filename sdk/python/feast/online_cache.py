@@ -0,0 +1,259 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from google.protobuf.duration_pb2 import Duration
+
+from feast.serving.ServingService_pb2 import FeatureReference
+from feast.types.Value_pb2 import Value
+
+# Key of a single cached feature value: the feature reference string and the
+# serialized entity key
+CacheKey = Tuple[str, Tuple[Tuple[str, bytes], ...]]
+
+
+class CacheStats:
+    """
+    Counters of an online feature cache.
+
+    Attributes:
+        hits (int):
+            Number of feature values served from the cache.
+
+        misses (int):
+            Number of feature values not found in the cache, including
+            expired ones.
+
+        evictions (int):
+            Number of feature values evicted to stay within the maximum
+            number of entries.
+
+        expirations (int):
+            Number of feature values dropped because their TTL passed.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Returns the share of lookups served from the cache
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __repr__(self):
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, expirations={self.expirations})"
+        )
+
+
+class OnlineFeatureCache:
+    """
+    In-process cache of online feature values, keyed by feature reference
+    and entity key.
+
+    Every value expires after the TTL of its feature set, which defaults to
+    the max age of the feature set. Once the cache holds max_entries values,
+    the least recently used ones are evicted. The cache is safe to share
+    between threads.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        default_ttl: float = 60.0,
+        ttls: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_entries (int):
+                Maximum number of feature values held.
+
+            default_ttl (float):
+                TTL in seconds of features whose feature set has no max age
+                or could not be looked up.
+
+            ttls (Optional[Dict[str, float]]):
+                TTLs in seconds by feature set reference
+                ("project/feature_set"), which take precedence over the max
+                age of the feature set. A TTL of 0 disables caching of the
+                feature set.
+
+            clock (Callable[[], float]):
+                Function returning the current time in seconds.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._default_ttl = default_ttl
+        self._ttls = dict(ttls or {})
+        self._clock = clock
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._feature_ttls = dict()  # type: Dict[str, float]
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    @property
+    def max_entries(self) -> int:
+        """
+        Returns the maximum number of feature values held
+        """
+        return self._max_entries
+
+    @property
+    def default_ttl(self) -> float:
+        """
+        Returns the TTL in seconds of features without a max age
+        """
+        return self._default_ttl
+
+    def __len__(self):
+        return len(self._entries)
+
+    def feature_set_ttl(
+        self, project: str, name: str, max_age: Optional[Duration] = None
+    ) -> float:
+        """
+        Returns the TTL of the values of a feature set.
+
+        Args:
+            project (str):
+                Project of the feature set.
+
+            name (str):
+                Name of the feature set.
+
+            max_age (Optional[Duration]):
+                Max age of the feature set, if known.
+
+        Returns:
+            float:
+                The configured TTL of the feature set if there is one, else
+                its max age if it is set, else the default TTL.
+        """
+        ttl = self._ttls.get(f"{project}/{name}")
+        if ttl is not None:
+            return ttl
+        if max_age is not None and (max_age.seconds or max_age.nanos):
+            return max_age.seconds + max_age.nanos / 1e9
+        return self._default_ttl
+
+    def feature_ttl(self, feature_ref: str) -> Optional[float]:
+        """
+        Returns the TTL of a feature, or None if it was not set yet.
+        """
+        return self._feature_ttls.get(feature_ref)
+
+    def set_feature_ttl(self, feature_ref: str, ttl: float):
+        """
+        Sets the TTL in seconds of the values of a feature.
+        """
+        self._feature_ttls[feature_ref] = ttl
+
+    def get(self, key: CacheKey) -> Optional[Value]:
+        """
+        Returns a cached feature value, or None if it is missing or expired.
+
+        Args:
+            key (CacheKey):
+                Tuple of the feature reference string and the entity key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def put(self, key: CacheKey, value: Value):
+        """
+        Caches a feature value for the TTL of its feature, evicting the least
+        recently used values if the cache is full.
+
+        Args:
+            key (CacheKey):
+                Tuple of the feature reference string and the entity key.
+
+            value (Value):
+                Feature value. It must not be modified afterwards.
+        """
+        ttl = self._feature_ttls.get(key[0], self._default_ttl)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self):
+        """
+        Removes all cached feature values.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+def feature_ref_string(ref: FeatureReference) -> str:
+    """
+    Returns the string a feature reference is keyed by in the responses of
+    Feast Serving: "project/name", followed by ":version" if the version is
+    set.
+    """
+    if ref.version:
+        return f"{ref.project}/{ref.name}:{ref.version}"
+    return f"{ref.project}/{ref.name}"
+
+
+def entity_key(
+    fields: Dict[str, Value], entity_names=None
+) -> Tuple[Tuple[str, bytes], ...]:
+    """
+    Returns a hashable key of the entity values of an entity row.
+
+    Args:
+        fields (Dict[str, Value]):
+            Fields of an entity row or of a row of a response.
+
+        entity_names (Optional[Container[str]]):
+            Names of the entities among the fields. All fields are entities
+            if not provided.
+    """
+    return tuple(
+        sorted(
+            (name, value.SerializeToString(deterministic=True))
+            for name, value in fields.items()
+            if entity_names is None or name in entity_names
+        )
+    )
@@ -0,0 +1,603 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+from feast.loaders.serializer import VALUE_ENCODINGS
+from feast.serving.ServingService_pb2 import GetOnlineFeaturesResponse
+from feast.types.Value_pb2 import Value
+
+# Protobuf wire types
+_VARINT = 0
+_FIXED64 = 1
+_LENGTH_DELIMITED = 2
+_FIXED32 = 5
+
+# Tag of the repeated "val" field in all feast.types.*List messages
+_LIST_VAL_TAG = 1 << 3 | _LENGTH_DELIMITED
+
+# NumPy dtypes of the values of every Value oneof field
+_SCALAR_DTYPES = {
+    "int32_val": np.int32,
+    "int64_val": np.int64,
+    "float_val": np.float32,
+    "double_val": np.float64,
+    "bool_val": np.bool_,
+    "string_val": object,
+    "bytes_val": object,
+}
+_LIST_DTYPES = {
+    "int32_list_val": np.int32,
+    "int64_list_val": np.int64,
+    "float_list_val": np.float32,
+    "double_list_val": np.float64,
+    "bool_list_val": np.bool_,
+    "string_list_val": object,
+    "bytes_list_val": object,
+}
+
+# PyArrow types of the values of Value oneof fields holding Python objects
+_OBJECT_ARROW_TYPES = {
+    "string_val": pa.string(),
+    "bytes_val": pa.binary(),
+    "string_list_val": pa.string(),
+    "bytes_list_val": pa.binary(),
+}
+
+# Name and element wire type of every Value oneof field by field number
+_VALUE_FIELDS = {
+    field_number: (Value.DESCRIPTOR.fields_by_number[field_number].name, wire_type)
+    for field_number, wire_type in VALUE_ENCODINGS.values()
+}
+
+_FIXED_WIDTH_DTYPES = {_FIXED32: np.dtype("<f4"), _FIXED64: np.dtype("<f8")}
+
+
+def _raw_fields_class():
+    """
+    Returns a message class with two repeated bytes fields, numbered 1 and 2.
+
+    Length delimited fields of any message can be parsed as bytes. Parsing a
+    serialized GetOnlineFeaturesResponse with it yields the bytes of every
+    row, parsing rows yields the bytes of every map entry and parsing map
+    entries yields the bytes of every key and value, without creating a
+    Python object for every message.
+    """
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name="feast/online_response_raw.proto", package="feast.raw", syntax="proto3"
+    )
+    message_proto = file_proto.message_type.add(name="RawFields")
+    for number in (1, 2):
+        message_proto.field.add(
+            name=f"field_{number}",
+            number=number,
+            type=descriptor_pb2.FieldDescriptorProto.TYPE_BYTES,
+            label=descriptor_pb2.FieldDescriptorProto.LABEL_REPEATED,
+        )
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    descriptor = pool.FindMessageTypeByName("feast.raw.RawFields")
+    if hasattr(message_factory, "GetMessageClass"):
+        return message_factory.GetMessageClass(descriptor)
+    return message_factory.MessageFactory(pool).GetPrototype(descriptor)
+
+
+_RawFields = _raw_fields_class()
+
+
+class OnlineColumn(NamedTuple):
+    """
+    Feature or entity values of all rows of an online feature response.
+
+    Attributes:
+        values (np.ndarray):
+            Value of every row for scalar types, which is zero or None for
+            rows without a value. Concatenated values of all rows for list
+            types. Strings and bytes are held in object arrays.
+
+        offsets (Optional[np.ndarray]):
+            For list types, offsets of the values of every row into values,
+            followed by the total number of values. None for scalar types.
+
+        validity (np.ndarray):
+            Boolean mask of the rows which have a value.
+
+        value_field (Optional[str]):
+            Name of the Value field holding the values, for example
+            "int64_val". None if no row has a value.
+    """
+
+    values: np.ndarray
+    offsets: Optional[np.ndarray]
+    validity: np.ndarray
+    value_field: Optional[str]
+
+    def to_arrow(self) -> pa.Array:
+        """
+        Returns the column as a PyArrow array, which is a list array for
+        list types.
+        """
+        if self.value_field is None:
+            return pa.nulls(len(self.validity))
+
+        value_type = _OBJECT_ARROW_TYPES.get(self.value_field)
+        if self.offsets is None:
+            return pa.array(self.values, type=value_type, mask=~self.validity)
+
+        values = pa.array(self.values, type=value_type)
+        offsets = pa.array(
+            self.offsets.astype(np.int32), mask=np.append(~self.validity, False)
+        )
+        return pa.ListArray.from_arrays(offsets, values)
+
+
+class _ColumnDecoder:
+    """
+    Decodes the values of a single field of all response rows from Value
+    messages into preallocated arrays.
+    """
+
+    __slots__ = ["num_rows", "value_field", "values", "lengths", "validity"]
+
+    def __init__(self, num_rows: int):
+        self.num_rows = num_rows
+        self.value_field = None
+        self.values = None
+        self.lengths = None
+        self.validity = np.zeros(num_rows, dtype=np.bool_)
+
+    def add(self, name: str, row_idx: int, value: Value):
+        value_field = value.WhichOneof("val")
+        if value_field is None:
+            return
+        if value_field != self.value_field:
+            if self.value_field is not None:
+                raise ValueError(f'Field "{name}" holds values of more than one type')
+            self._start(value_field)
+
+        if self.lengths is None:
+            self.values[row_idx] = getattr(value, value_field)
+        else:
+            items = getattr(value, value_field).val
+            self.values.extend(items)
+            self.lengths[row_idx] = len(items)
+        self.validity[row_idx] = True
+
+    def _start(self, value_field: str):
+        """
+        Allocates the arrays for the type of the first value of the column.
+        """
+        self.value_field = value_field
+        if value_field in _SCALAR_DTYPES:
+            self.values = _empty(self.num_rows, _SCALAR_DTYPES[value_field])
+        else:
+            self.values = []
+            self.lengths = np.zeros(self.num_rows, dtype=np.int64)
+
+    def finish(self) -> OnlineColumn:
+        if self.value_field is None:
+            return _null_column(self.num_rows)
+        if self.lengths is None:
+            return OnlineColumn(self.values, None, self.validity, self.value_field)
+        values = np.array(self.values, dtype=_LIST_DTYPES[self.value_field])
+        return OnlineColumn(
+            values, _offsets(self.lengths), self.validity, self.value_field
+        )
+
+
+def to_numpy(
+    response: Union[GetOnlineFeaturesResponse, bytes],
+    fields: Optional[Iterable[str]] = None,
+) -> Dict[str, OnlineColumn]:
+    """
+    Decodes an online feature response into typed NumPy columns.
+
+    The response is decoded from its wire format in a single pass, without
+    creating a Python object for every feature value. The type of every
+    column is taken from its values. List values are held as the
+    concatenated values of all rows and offsets into them.
+
+    Args:
+        response (Union[GetOnlineFeaturesResponse, bytes]):
+            Response of Feast Serving, or its serialized bytes.
+
+        fields (Optional[Iterable[str]]):
+            Names of the entities and feature references to decode. All
+            fields of the response are decoded if not provided.
+
+    Returns:
+        Dict[str, OnlineColumn]:
+            Columns by entity name or feature reference, ordered like the
+            fields argument if it is provided, else by name.
+    """
+    data = response if isinstance(response, bytes) else response.SerializeToString()
+    rows = list(_RawFields.FromString(data).field_1)
+    num_rows = len(rows)
+    entries = list(_RawFields.FromString(b"".join(rows)).field_1)
+    map_entries = _RawFields.FromString(b"".join(entries))
+    keys, values = list(map_entries.field_1), list(map_entries.field_2)
+    if not len(keys) == len(values) == len(entries):
+        # Some map entries leave out their key or value
+        if isinstance(response, bytes):
+            response = GetOnlineFeaturesResponse.FromString(response)
+        return _decode_messages(response, fields)
+
+    # Row of every map entry, from the sizes of rows and map entries
+    row_ends = np.cumsum(_lengths(rows))
+    entry_sizes = _lengths(entries)
+    entry_rows = np.searchsorted(
+        row_ends, np.cumsum(1 + _varint_sizes(entry_sizes) + entry_sizes)
+    )
+
+    # Field of every map entry, or -1 if it is not decoded
+    key_codes, unique_keys = pd.factorize(np.array(keys, dtype=object))
+    if fields is not None:
+        names = [name.encode("utf-8") for name in dict.fromkeys(fields)]
+    else:
+        names = sorted(unique_keys)
+    field_indices = {name: i for i, name in enumerate(names)}
+    entry_fields = np.array(
+        [field_indices.get(key, -1) for key in unique_keys], dtype=np.int64
+    )[key_codes]
+
+    value_sizes = _lengths(values)
+    value_data = np.frombuffer(b"".join(values), dtype=np.uint8)
+    value_starts = np.cumsum(value_sizes) - value_sizes
+
+    columns = dict()
+    for field_idx, name in enumerate(names):
+        selected = np.flatnonzero(entry_fields == field_idx)
+        columns[name.decode("utf-8")] = _decode_column(
+            name.decode("utf-8"),
+            num_rows,
+            entry_rows[selected],
+            value_data,
+            value_starts[selected],
+            value_sizes[selected],
+        )
+    return columns
+
+
+def _decode_messages(
+    response: GetOnlineFeaturesResponse, fields: Optional[Iterable[str]]
+) -> Dict[str, OnlineColumn]:
+    """
+    Decodes an online feature response from its Value messages.
+    """
+    rows = response.field_values
+    num_rows = len(rows)
+    decoders = dict()  # type: Dict[str, _ColumnDecoder]
+    if fields is not None:
+        decoders = {name: _ColumnDecoder(num_rows) for name in fields}
+
+    for row_idx, field_values in enumerate(rows):
+        for name, value in field_values.fields.items():
+            decoder = decoders.get(name)
+            if decoder is None:
+                if fields is not None:
+                    continue
+                decoder = decoders[name] = _ColumnDecoder(num_rows)
+            decoder.add(name, row_idx, value)
+
+    names = decoders if fields is not None else sorted(decoders)
+    return {name: decoders[name].finish() for name in names}
+
+
+def _decode_column(
+    name: str,
+    num_rows: int,
+    rows: np.ndarray,
+    data: np.ndarray,
+    starts: np.ndarray,
+    sizes: np.ndarray,
+) -> OnlineColumn:
+    """
+    Decodes the serialized Value messages of a single field into a column.
+    Encodings which protobuf allows but serializers do not produce, like
+    unpacked lists, are decoded by parsing the Value messages instead.
+
+    Args:
+        name: Name of the field
+        num_rows: Number of rows of the response
+        rows: Row of every value, in ascending order
+        data: Buffer holding the serialized values
+        starts: Offset of every value into data
+        sizes: Size in bytes of every value
+    """
+    # Empty Value messages have no value set
+    present = sizes > 0
+    rows, starts, sizes = rows[present], starts[present], sizes[present]
+    if not len(rows):
+        return _null_column(num_rows)
+
+    # All values must set the same Value field, whose tag is one or two
+    # bytes long
+    tags = data[starts].astype(np.int64)
+    tag_size = 1 if tags[0] < 0x80 else 2
+    if tag_size == 2:
+        tags = tags & 0x7F | data[starts + 1].astype(np.int64) << 7
+    field_number, tag_wire_type = int(tags[0]) >> 3, int(tags[0]) & 0x7
+    if (tags >> 3 != field_number).any():
+        raise ValueError(f'Field "{name}" holds values of more than one type')
+    if field_number not in _VALUE_FIELDS or (tags != tags[0]).any():
+        return _decode_values(name, num_rows, rows, data, starts, sizes)
+
+    value_field, wire_type = _VALUE_FIELDS[field_number]
+    is_list = value_field in _LIST_DTYPES
+    if tag_wire_type != (_LENGTH_DELIMITED if is_list else wire_type):
+        return _decode_values(name, num_rows, rows, data, starts, sizes)
+    payload_starts, payload_sizes = starts + tag_size, sizes - tag_size
+
+    if is_list:
+        column = _decode_packed_lists(
+            data, payload_starts, payload_sizes, wire_type, num_rows, rows
+        )
+    else:
+        column = _decode_scalars(data, payload_starts, payload_sizes, wire_type)
+    if column is None:
+        return _decode_values(name, num_rows, rows, data, starts, sizes)
+
+    validity = np.zeros(num_rows, dtype=np.bool_)
+    validity[rows] = True
+    if is_list:
+        elements, offsets = column
+        values = elements.astype(_LIST_DTYPES[value_field], copy=False)
+        return OnlineColumn(values, offsets, validity, value_field)
+
+    if wire_type == _LENGTH_DELIMITED:
+        column = _binary_array(column, _OBJECT_ARROW_TYPES[value_field])
+    values = _empty(num_rows, _SCALAR_DTYPES[value_field])
+    values[rows] = column
+    return OnlineColumn(values, None, validity, value_field)
+
+
+def _decode_scalars(
+    data: np.ndarray, starts: np.ndarray, sizes: np.ndarray, wire_type: int
+):
+    """
+    Decodes the payloads of scalar Value fields. Returns None if they are
+    not encoded as expected.
+    """
+    if wire_type == _VARINT:
+        values = _decode_varints(_gather(data, starts, sizes))
+        return values if len(values) == len(sizes) else None
+    if wire_type == _LENGTH_DELIMITED:
+        return _length_delimited(data, starts, sizes)
+    dtype = _FIXED_WIDTH_DTYPES[wire_type]
+    if (sizes != dtype.itemsize).any():
+        return None
+    return _gather(data, starts, sizes).view(dtype)
+
+
+def _decode_packed_lists(
+    data: np.ndarray,
+    starts: np.ndarray,
+    sizes: np.ndarray,
+    wire_type: int,
+    num_rows: int,
+    rows: np.ndarray,
+):
+    """
+    Decodes the payloads of list Value fields, which are *List messages
+    holding the packed elements in a single field unless they are empty.
+    Returns the elements and the offsets of every row into them, or None if
+    the lists are not encoded as expected.
+    """
+    if wire_type == _LENGTH_DELIMITED:
+        # Strings and bytes are never packed
+        return None
+    lists = _length_delimited(data, starts, sizes)
+    if lists is None:
+        return None
+    list_data, list_sizes = lists
+    list_starts = np.cumsum(list_sizes) - list_sizes
+    nonempty = list_sizes > 0
+    if (list_data[list_starts[nonempty]] != _LIST_VAL_TAG).any():
+        return None
+    packed = _length_delimited(
+        list_data, list_starts[nonempty] + 1, list_sizes[nonempty] - 1
+    )
+    if packed is None:
+        return None
+    elements, packed_sizes = packed
+
+    counts = np.zeros(len(sizes), dtype=np.int64)
+    if wire_type == _VARINT:
+        counts[nonempty] = _count_varints(elements, packed_sizes)
+        elements = _decode_varints(elements)
+    else:
+        dtype = _FIXED_WIDTH_DTYPES[wire_type]
+        if (packed_sizes % dtype.itemsize).any():
+            return None
+        counts[nonempty] = packed_sizes // dtype.itemsize
+        elements = elements.view(dtype)
+
+    lengths = np.zeros(num_rows, dtype=np.int64)
+    lengths[rows] = counts
+    return elements, _offsets(lengths)
+
+
+def _decode_values(
+    name: str,
+    num_rows: int,
+    rows: np.ndarray,
+    data: np.ndarray,
+    starts: np.ndarray,
+    sizes: np.ndarray,
+) -> OnlineColumn:
+    """
+    Decodes the serialized Value messages of a single field by parsing them.
+    """
+    decoder = _ColumnDecoder(num_rows)
+    buffer = data.tobytes()
+    for row_idx, start, size in zip(rows.tolist(), starts.tolist(), sizes.tolist()):
+        decoder.add(name, row_idx, Value.FromString(buffer[start : start + size]))
+    return decoder.finish()
+
+
+def _length_delimited(data: np.ndarray, starts: np.ndarray, sizes: np.ndarray):
+    """
+    Strips the varint length prefix off every length delimited payload.
+    Returns the concatenated payloads and their sizes, or None if a prefix
+    does not match the size of its payload.
+    """
+    payload_sizes = sizes - 1
+    for prefix_size in range(2, 6):
+        payload_sizes = np.where(
+            payload_sizes >= 1 << 7 * (prefix_size - 1),
+            sizes - prefix_size,
+            payload_sizes,
+        )
+    prefix_sizes = sizes - payload_sizes
+    prefixes = _decode_varints(_gather(data, starts, prefix_sizes))
+    if len(prefixes) != len(sizes) or (prefixes != payload_sizes).any():
+        return None
+    return _gather(data, starts + prefix_sizes, payload_sizes), payload_sizes
+
+
+def _binary_array(payloads, arrow_type: pa.DataType) -> np.ndarray:
+    """
+    Returns concatenated string or bytes payloads as an object array.
+    """
+    data, sizes = payloads
+    array = pa.Array.from_buffers(
+        arrow_type,
+        len(sizes),
+        [None, pa.py_buffer(_offsets(sizes).astype(np.int32)), pa.py_buffer(data)],
+    )
+    return array.to_numpy(zero_copy_only=False)
+
+
+def _gather(data: np.ndarray, starts: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """
+    Concatenates the segments of a buffer with the given offsets and sizes.
+    """
+    total = int(sizes.sum())
+    if total == 0:
+        return data[:0]
+    output_starts = np.cumsum(sizes) - sizes
+    return data[np.arange(total) + np.repeat(starts - output_starts, sizes)]
+
+
+def _decode_varints(data: np.ndarray) -> np.ndarray:
+    """
+    Decodes a buffer of concatenated base 128 varints into int64 values.
+    """
+    ends = np.flatnonzero(data < 0x80)
+    if not len(ends) or ends[-1] != len(data) - 1:
+        return np.zeros(0, dtype=np.int64)
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    positions = np.arange(len(data)) - np.repeat(starts, ends - starts + 1)
+    groups = (data & 0x7F).astype(np.uint64) << (positions * 7).astype(np.uint64)
+    return np.add.reduceat(groups, starts).view(np.int64)
+
+
+def _count_varints(data: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """
+    Counts the varints in every non-empty segment of a buffer of
+    concatenated varints.
+    """
+    if not len(sizes):
+        return np.zeros(0, dtype=np.int64)
+    ends = (data < 0x80).astype(np.int64)
+    return np.add.reduceat(ends, np.cumsum(sizes) - sizes)
+
+
+def _varint_sizes(values: np.ndarray) -> np.ndarray:
+    """
+    Returns the number of bytes of non-negative values encoded as varints.
+    """
+    sizes = np.ones(len(values), dtype=np.int64)
+    for prefix_size in range(1, 9):
+        sizes += values >= 1 << 7 * prefix_size
+    return sizes
+
+
+def _lengths(items: List[bytes]) -> np.ndarray:
+    return np.fromiter(map(len, items), dtype=np.int64, count=len(items))
+
+
+def _offsets(lengths: np.ndarray) -> np.ndarray:
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _empty(num_rows: int, dtype) -> np.ndarray:
+    """
+    Returns an array of zeros, or of None for object arrays.
+    """
+    if dtype is object:
+        return np.full(num_rows, None, dtype=object)
+    return np.zeros(num_rows, dtype=dtype)
+
+
+def _null_column(num_rows: int) -> OnlineColumn:
+    return OnlineColumn(
+        _empty(num_rows, object), None, np.zeros(num_rows, dtype=np.bool_), None
+    )
+
+
+def to_arrow(
+    response: Union[GetOnlineFeaturesResponse, bytes],
+    fields: Optional[Iterable[str]] = None,
+) -> pa.Table:
+    """
+    Decodes an online feature response into a PyArrow table.
+
+    Args:
+        response (Union[GetOnlineFeaturesResponse, bytes]):
+            Response of Feast Serving, or its serialized bytes.
+
+        fields (Optional[Iterable[str]]):
+            Names of the entities and feature references to decode. All
+            fields of the response are decoded if not provided.
+
+    Returns:
+        pyarrow.Table:
+            Table with a column per entity and feature reference, where list
+            types are list columns.
+    """
+    columns = to_numpy(response, fields)
+    return pa.Table.from_arrays(
+        [column.to_arrow() for column in columns.values()], names=list(columns)
+    )
+
+
+def to_dataframe(
+    response: Union[GetOnlineFeaturesResponse, bytes],
+    fields: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    """
+    Decodes an online feature response into a Pandas DataFrame.
+
+    Args:
+        response (Union[GetOnlineFeaturesResponse, bytes]):
+            Response of Feast Serving, or its serialized bytes.
+
+        fields (Optional[Iterable[str]]):
+            Names of the entities and feature references to decode. All
+            fields of the response are decoded if not provided.
+
+    Returns:
+        pd.DataFrame:
+            DataFrame with a column per entity and feature reference. Null
+            values are converted like PyArrow converts them to Pandas.
+    """
+    return to_arrow(response, fields).to_pandas()
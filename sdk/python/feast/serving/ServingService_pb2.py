@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: feast/serving/ServingService.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'feast/serving/ServingService.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from feast.types import Value_pb2 as feast_dot_types_dot_Value__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\"feast/serving/ServingService.proto\x12\rfeast.serving\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/duration.proto\x1a\x17\x66\x65\x61st/types/Value.proto\"\x1c\n\x1aGetFeastServingInfoRequest\"{\n\x1bGetFeastServingInfoResponse\x12\x0f\n\x07version\x18\x01 \x01(\t\x12-\n\x04type\x18\x02 \x01(\x0e\x32\x1f.feast.serving.FeastServingType\x12\x1c\n\x14job_staging_location\x18\n \x01(\t\"n\n\x10\x46\x65\x61tureReference\x12\x0f\n\x07project\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\x05\x12*\n\x07max_age\x18\x04 \x01(\x0b\x32\x19.google.protobuf.Duration\"\x8e\x03\n\x18GetOnlineFeaturesRequest\x12\x31\n\x08\x66\x65\x61tures\x18\x04 \x03(\x0b\x32\x1f.feast.serving.FeatureReference\x12\x46\n\x0b\x65ntity_rows\x18\x02 \x03(\x0b\x32\x31.feast.serving.GetOnlineFeaturesRequest.EntityRow\x12!\n\x19omit_entities_in_response\x18\x03 \x01(\x08\x1a\xd3\x01\n\tEntityRow\x12\x34\n\x10\x65ntity_timestamp\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12M\n\x06\x66ields\x18\x02 \x03(\x0b\x32=.feast.serving.GetOnlineFeaturesRequest.EntityRow.FieldsEntry\x1a\x41\n\x0b\x46ieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.feast.types.Value:\x02\x38\x01\"\x82\x01\n\x17GetBatchFeaturesRequest\x12\x31\n\x08\x66\x65\x61tures\x18\x03 \x03(\x0b\x32\x1f.feast.serving.FeatureReference\x12\x34\n\x0e\x64\x61taset_source\x18\x02 \x01(\x0b\x32\x1c.feast.serving.DatasetSource\"\x8c\x02\n\x19GetOnlineFeaturesResponse\x12J\n\x0c\x66ield_values\x18\x01 \x03(\x0b\x32\x34.feast.serving.GetOnlineFeaturesResponse.FieldValues\x1a\xa2\x01\n\x0b\x46ieldValues\x12P\n\x06\x66ields\x18\x01 \x03(\x0b\x32@.feast.serving.GetOnlineFeaturesResponse.FieldValues.FieldsEntry\x1a\x41\n\x0b\x46ieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.feast.types.Value:\x02\x38\x01\";\n\x18GetBatchFeaturesResponse\x12\x1f\n\x03job\x18\x01 \x01(\x0b\x32\x12.feast.serving.Job\"0\n\rGetJobRequest\x12\x1f\n\x03job\x18\x01 \x01(\x0b\x32\x12.feast.serving.Job\"1\n\x0eGetJobResponse\x12\x1f\n\x03job\x18\x01 \x01(\x0b\x32\x12.feast.serving.Job\"\xb3\x01\n\x03Job\x12\n\n\x02id\x18\x01 \x01(\t\x12$\n\x04type\x18\x02 \x01(\x0e\x32\x16.feast.serving.JobType\x12(\n\x06status\x18\x03 \x01(\x0e\x32\x18.feast.serving.JobStatus\x12\r\n\x05\x65rror\x18\x04 \x01(\t\x12\x11\n\tfile_uris\x18\x05 \x03(\t\x12.\n\x0b\x64\x61ta_format\x18\x06 \x01(\x0e\x32\x19.feast.serving.DataFormat\"\xb2\x01\n\rDatasetSource\x12>\n\x0b\x66ile_source\x18\x01 \x01(\x0b\x32\'.feast.serving.DatasetSource.FileSourceH\x00\x1aO\n\nFileSource\x12\x11\n\tfile_uris\x18\x01 \x03(\t\x12.\n\x0b\x64\x61ta_format\x18\x02 \x01(\x0e\x32\x19.feast.serving.DataFormatB\x10\n\x0e\x64\x61taset_source*o\n\x10\x46\x65\x61stServingType\x12\x1e\n\x1a\x46\x45\x41ST_SERVING_TYPE_INVALID\x10\x00\x12\x1d\n\x19\x46\x45\x41ST_SERVING_TYPE_ONLINE\x10\x01\x12\x1c\n\x18\x46\x45\x41ST_SERVING_TYPE_BATCH\x10\x02*6\n\x07JobType\x12\x14\n\x10JOB_TYPE_INVALID\x10\x00\x12\x15\n\x11JOB_TYPE_DOWNLOAD\x10\x01*h\n\tJobStatus\x12\x16\n\x12JOB_STATUS_INVALID\x10\x00\x12\x16\n\x12JOB_STATUS_PENDING\x10\x01\x12\x16\n\x12JOB_STATUS_RUNNING\x10\x02\x12\x13\n\x0fJOB_STATUS_DONE\x10\x03*;\n\nDataFormat\x12\x17\n\x13\x44\x41TA_FORMAT_INVALID\x10\x00\x12\x14\n\x10\x44\x41TA_FORMAT_AVRO\x10\x01\x32\x92\x03\n\x0eServingService\x12l\n\x13GetFeastServingInfo\x12).feast.serving.GetFeastServingInfoRequest\x1a*.feast.serving.GetFeastServingInfoResponse\x12\x66\n\x11GetOnlineFeatures\x12\'.feast.serving.GetOnlineFeaturesRequest\x1a(.feast.serving.GetOnlineFeaturesResponse\x12\x63\n\x10GetBatchFeatures\x12&.feast.serving.GetBatchFeaturesRequest\x1a\'.feast.serving.GetBatchFeaturesResponse\x12\x45\n\x06GetJob\x12\x1c.feast.serving.GetJobRequest\x1a\x1d.feast.serving.GetJobResponseBT\n\rfeast.servingB\x0fServingAPIProtoZ2github.com/gojek/feast/sdk/go/protos/feast/servingb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'feast.serving.ServingService_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\rfeast.servingB\017ServingAPIProtoZ2github.com/gojek/feast/sdk/go/protos/feast/serving'
+  _globals['_GETONLINEFEATURESREQUEST_ENTITYROW_FIELDSENTRY']._loaded_options = None
+  _globals['_GETONLINEFEATURESREQUEST_ENTITYROW_FIELDSENTRY']._serialized_options = b'8\001'
+  _globals['_GETONLINEFEATURESRESPONSE_FIELDVALUES_FIELDSENTRY']._loaded_options = None
+  _globals['_GETONLINEFEATURESRESPONSE_FIELDVALUES_FIELDSENTRY']._serialized_options = b'8\001'
+  _globals['_FEASTSERVINGTYPE']._serialized_start=1740
+  _globals['_FEASTSERVINGTYPE']._serialized_end=1851
+  _globals['_JOBTYPE']._serialized_start=1853
+  _globals['_JOBTYPE']._serialized_end=1907
+  _globals['_JOBSTATUS']._serialized_start=1909
+  _globals['_JOBSTATUS']._serialized_end=2013
+  _globals['_DATAFORMAT']._serialized_start=2015
+  _globals['_DATAFORMAT']._serialized_end=2074
+  _globals['_GETFEASTSERVINGINFOREQUEST']._serialized_start=143
+  _globals['_GETFEASTSERVINGINFOREQUEST']._serialized_end=171
+  _globals['_GETFEASTSERVINGINFORESPONSE']._serialized_start=173
+  _globals['_GETFEASTSERVINGINFORESPONSE']._serialized_end=296
+  _globals['_FEATUREREFERENCE']._serialized_start=298
+  _globals['_FEATUREREFERENCE']._serialized_end=408
+  _globals['_GETONLINEFEATURESREQUEST']._serialized_start=411
+  _globals['_GETONLINEFEATURESREQUEST']._serialized_end=809
+  _globals['_GETONLINEFEATURESREQUEST_ENTITYROW']._serialized_start=598
+  _globals['_GETONLINEFEATURESREQUEST_ENTITYROW']._serialized_end=809
+  _globals['_GETONLINEFEATURESREQUEST_ENTITYROW_FIELDSENTRY']._serialized_start=744
+  _globals['_GETONLINEFEATURESREQUEST_ENTITYROW_FIELDSENTRY']._serialized_end=809
+  _globals['_GETBATCHFEATURESREQUEST']._serialized_start=812
+  _globals['_GETBATCHFEATURESREQUEST']._serialized_end=942
+  _globals['_GETONLINEFEATURESRESPONSE']._serialized_start=945
+  _globals['_GETONLINEFEATURESRESPONSE']._serialized_end=1213
+  _globals['_GETONLINEFEATURESRESPONSE_FIELDVALUES']._serialized_start=1051
+  _globals['_GETONLINEFEATURESRESPONSE_FIELDVALUES']._serialized_end=1213
+  _globals['_GETONLINEFEATURESRESPONSE_FIELDVALUES_FIELDSENTRY']._serialized_start=744
+  _globals['_GETONLINEFEATURESRESPONSE_FIELDVALUES_FIELDSENTRY']._serialized_end=809
+  _globals['_GETBATCHFEATURESRESPONSE']._serialized_start=1215
+  _globals['_GETBATCHFEATURESRESPONSE']._serialized_end=1274
+  _globals['_GETJOBREQUEST']._serialized_start=1276
+  _globals['_GETJOBREQUEST']._serialized_end=1324
+  _globals['_GETJOBRESPONSE']._serialized_start=1326
+  _globals['_GETJOBRESPONSE']._serialized_end=1375
+  _globals['_JOB']._serialized_start=1378
+  _globals['_JOB']._serialized_end=1557
+  _globals['_DATASETSOURCE']._serialized_start=1560
+  _globals['_DATASETSOURCE']._serialized_end=1738
+  _globals['_DATASETSOURCE_FILESOURCE']._serialized_start=1641
+  _globals['_DATASETSOURCE_FILESOURCE']._serialized_end=1720
+  _globals['_SERVINGSERVICE']._serialized_start=2077
+  _globals['_SERVINGSERVICE']._serialized_end=2479
+# @@protoc_insertion_point(module_scope)
@@ -12,8 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from datetime import datetime, timezone
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -37,6 +37,55 @@ from feast.types.Value_pb2 import Value as ProtoValue
 from feast.types.Value_pb2 import ValueType as ProtoValueType
 from feast.value_type import ValueType
 
+# Feast value types of the names of Python and NumPy types
+_PYTHON_TYPE_VALUE_TYPES = {
+    "int": ValueType.INT64,
+    "str": ValueType.STRING,
+    "float": ValueType.DOUBLE,
+    "bytes": ValueType.BYTES,
+    "float64": ValueType.DOUBLE,
+    "float32": ValueType.FLOAT,
+    "int64": ValueType.INT64,
+    "uint64": ValueType.INT64,
+    "int32": ValueType.INT32,
+    "uint32": ValueType.INT32,
+    "uint8": ValueType.INT32,
+    "int8": ValueType.INT32,
+    "bool": ValueType.BOOL,
+    "timedelta": ValueType.INT64,
+    "datetime64[ns]": ValueType.INT64,
+    "datetime64[ns, tz]": ValueType.INT64,
+    "category": ValueType.STRING,
+}
+
+# Feast value types of the kinds of NumPy dtypes whose values Pandas
+# iterates over as Python ints, floats and bools
+_NUMPY_KIND_VALUE_TYPES = {
+    "i": ValueType.INT64,
+    "u": ValueType.INT64,
+    "f": ValueType.DOUBLE,
+    "b": ValueType.BOOL,
+}
+
+
+def pd_dtype_to_feast_value_type(dtype) -> Optional[ValueType]:
+    """
+    Finds the Feast Value Type of every value of a Pandas column or NumPy
+    array from its dtype, without inspecting its values. This is the type
+    python_type_to_feast_value_type finds for each of the values Pandas
+    iterates over.
+
+    Args:
+        dtype: Pandas or NumPy dtype
+
+    Returns:
+        Feast Value Type, or None if the values of this dtype have to be
+        inspected
+    """
+    if not isinstance(dtype, np.dtype):
+        return None
+    return _NUMPY_KIND_VALUE_TYPES.get(dtype.kind)
+
 
 def python_type_to_feast_value_type(
     name: str, value, recurse: bool = True
@@ -56,32 +105,17 @@ def python_type_to_feast_value_type(
     """
 
     type_name = type(value).__name__
-
-    type_map = {
-        "int": ValueType.INT64,
-        "str": ValueType.STRING,
-        "float": ValueType.DOUBLE,
-        "bytes": ValueType.BYTES,
-        "float64": ValueType.DOUBLE,
-        "float32": ValueType.FLOAT,
-        "int64": ValueType.INT64,
-        "uint64": ValueType.INT64,
-        "int32": ValueType.INT32,
-        "uint32": ValueType.INT32,
-        "uint8": ValueType.INT32,
-        "int8": ValueType.INT32,
-        "bool": ValueType.BOOL,
-        "timedelta": ValueType.INT64,
-        "datetime64[ns]": ValueType.INT64,
-        "datetime64[ns, tz]": ValueType.INT64,
-        "category": ValueType.STRING,
-    }
+    type_map = _PYTHON_TYPE_VALUE_TYPES
 
     if type_name in type_map:
         return type_map[type_name]
 
     if type_name == "ndarray":
         if recurse:
+            # All items of numeric arrays have the same type
+            item_value_type = pd_dtype_to_feast_value_type(value.dtype)
+            if item_value_type is not None and value.ndim == 1 and value.size:
+                return ValueType[item_value_type.name + "_LIST"]
 
             # Convert to list type
             list_items = pd.core.series.Series(value)
@@ -132,6 +166,8 @@ def convert_df_to_feature_rows(dataframe: pd.DataFrame, feature_set):
         Function that will do conversion
     """
 
+    datetime_dtype = dataframe[DATETIME_COLUMN].dtype
+
     def convert_series_to_proto_values(row: pd.Series):
         """
         Converts a Pandas Series to a Feast FeatureRow
@@ -145,7 +181,7 @@ def convert_df_to_feature_rows(dataframe: pd.DataFrame, feature_set):
 
         feature_row = FeatureRowProto.FeatureRow(
             event_timestamp=_pd_datetime_to_timestamp_proto(
-                dataframe[DATETIME_COLUMN].dtype, row[DATETIME_COLUMN]
+                datetime_dtype, row[DATETIME_COLUMN]
             ),
             feature_set=feature_set.name + ":" + str(feature_set.version),
         )
@@ -204,6 +240,107 @@ def convert_dict_to_proto_values(
     return feature_row
 
 
+def convert_df_to_feature_row_protos(
+    dataframe: pd.DataFrame, feature_set
+) -> List[FeatureRowProto.FeatureRow]:
+    """
+    Converts every row of a Pandas DataFrame to a Feast FeatureRow.
+
+    Produces the same FeatureRows as convert_dict_to_proto_values does for
+    each row, but converts the datetime column to epoch seconds at once and
+    scalar field columns to values without inspecting the type of every
+    value.
+
+    Args:
+        dataframe: Dataframe that will be converted
+        feature_set: Feature set used as schema for conversion
+
+    Returns:
+        List of FeatureRows, one for each row in the dataframe
+    """
+    feature_set_ref = f"{feature_set.project}/{feature_set.name}:{feature_set.version}"
+    seconds = _pd_datetime_column_to_seconds(dataframe[DATETIME_COLUMN]).tolist()
+    names = [field.name for field in feature_set.fields.values()]
+    columns = [
+        _pd_column_to_proto_values(field.dtype, dataframe[field.name])
+        for field in feature_set.fields.values()
+    ]
+
+    # Messages are built from dicts of their fields, which is faster than
+    # building and copying intermediate messages
+    feature_rows = []
+    for row_idx, row_seconds in enumerate(seconds):
+        feature_rows.append(
+            FeatureRowProto.FeatureRow(
+                event_timestamp={"seconds": row_seconds},
+                feature_set=feature_set_ref,
+                fields=[
+                    {"name": name, "value": column[row_idx]}
+                    for name, column in zip(names, columns)
+                ],
+            )
+        )
+    return feature_rows
+
+
+def _pd_datetime_column_to_seconds(column: pd.Series) -> np.ndarray:
+    """
+    Converts a Pandas column of datetimes to seconds since the epoch, like
+    _pd_datetime_to_timestamp_proto does for every value of the column.
+    """
+    dtype = column.dtype
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        if column.isna().any():
+            raise ValueError(f"Column '{column.name}' cannot contain null values")
+        if getattr(dtype, "tz", None) is None:
+            # If timestamps do not contain a timezone, we assume they are of
+            # the local timezone and adjust them to UTC
+            local_timezone = datetime.now(timezone.utc).astimezone().tzinfo
+            column = column.dt.tz_localize(local_timezone)
+        nanos = column.array.asi8
+        # Truncate towards zero like int() does
+        return np.where(nanos < 0, -(-nanos // 1_000_000_000), nanos // 1_000_000_000)
+    if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+        return column.to_numpy().astype(np.int64)
+    return np.array(
+        [_pd_datetime_to_timestamp_proto(dtype, value).seconds for value in column],
+        dtype=np.int64,
+    )
+
+
+# Feast value types whose values can be built from a whole column, with
+# their Value field, Python type and the kinds of NumPy dtypes of columns
+# whose Python values convert the same way as their NumPy values
+_COLUMN_VALUE_FIELDS = {
+    ValueType.INT32: ("int32_val", int, "biuf"),
+    ValueType.INT64: ("int64_val", int, "biuf"),
+    ValueType.FLOAT: ("float_val", float, "biuf"),
+    ValueType.DOUBLE: ("double_val", float, "biuf"),
+    ValueType.BOOL: ("bool_val", bool, "b"),
+    ValueType.STRING: ("string_val", str, "O"),
+}
+
+
+def _pd_column_to_proto_values(
+    feast_value_type, column: pd.Series
+) -> List[Union[ProtoValue, dict]]:
+    """
+    Converts a Pandas column to Feast Proto Values, like
+    _python_value_to_proto_value does for every value of the column. Values
+    of scalar columns are returned as dicts of their fields.
+    """
+    value_field, value_type, kinds = _COLUMN_VALUE_FIELDS.get(
+        feast_value_type, (None, None, "")
+    )
+    if column.dtype.kind in kinds:
+        nulls = column.isna().to_numpy()
+        return [
+            {} if null else {value_field: value_type(value)}
+            for value, null in zip(column.tolist(), nulls.tolist())
+        ]
+    return [_python_value_to_proto_value(feast_value_type, value) for value in column]
+
+
 def _pd_datetime_to_timestamp_proto(dtype, value) -> Timestamp:
     """
     Converts a Pandas datetime to a Timestamp Proto
@@ -234,6 +371,44 @@ def _type_err(item, dtype):
     raise ValueError(f'Value "{item}" is of type {type(item)} not of type {dtype}')
 
 
+# Value field and accepted element types of every list type
+_LIST_VALUE_TYPES = {
+    ValueType.FLOAT_LIST: ("float_list_val", (np.float32, np.float64)),
+    ValueType.DOUBLE_LIST: ("double_list_val", (np.float64, np.float32)),
+    ValueType.INT32_LIST: ("int32_list_val", (np.int32,)),
+    ValueType.INT64_LIST: ("int64_list_val", (np.int64, np.int32)),
+    ValueType.STRING_LIST: ("string_list_val", (np.str_, str)),
+    ValueType.BOOL_LIST: ("bool_list_val", (np.bool_, bool)),
+    ValueType.BYTES_LIST: ("bytes_list_val", (np.bytes_, bytes)),
+}
+
+
+def _python_list_to_proto_value(feast_value_type, value) -> ProtoValue:
+    """
+    Converts a NumPy array or Python list to a Feast Proto Value of a list
+    type, validating the type of every element.
+
+    The elements of one dimensional NumPy arrays all have the type of the
+    array, which is validated once.
+    """
+    value_field, item_types = _LIST_VALUE_TYPES[feast_value_type]
+    if (
+        isinstance(value, np.ndarray)
+        and value.ndim == 1
+        and value.dtype.type in item_types
+    ):
+        items = value.tolist()
+    else:
+        for item in value:
+            if type(item) not in item_types:
+                _type_err(item, item_types[0])
+        items = value
+
+    proto_value = ProtoValue()
+    getattr(proto_value, value_field).val.extend(items)
+    return proto_value
+
+
 def _python_value_to_proto_value(feast_value_type, value) -> ProtoValue:
     """
     Converts a Python (native, pandas) value to a Feast Proto Value based
@@ -248,89 +423,8 @@ def _python_value_to_proto_value(feast_value_type, value) -> ProtoValue:
     """
 
     # Detect list type and handle separately
-    if "list" in feast_value_type.name.lower():
-
-        if feast_value_type == ValueType.FLOAT_LIST:
-            return ProtoValue(
-                float_list_val=FloatList(
-                    val=[
-                        item
-                        if type(item) in [np.float32, np.float64]
-                        else _type_err(item, np.float32)
-                        for item in value
-                    ]
-                )
-            )
-
-        if feast_value_type == ValueType.DOUBLE_LIST:
-            return ProtoValue(
-                double_list_val=DoubleList(
-                    val=[
-                        item
-                        if type(item) in [np.float64, np.float32]
-                        else _type_err(item, np.float64)
-                        for item in value
-                    ]
-                )
-            )
-
-        if feast_value_type == ValueType.INT32_LIST:
-            return ProtoValue(
-                int32_list_val=Int32List(
-                    val=[
-                        item if type(item) is np.int32 else _type_err(item, np.int32)
-                        for item in value
-                    ]
-                )
-            )
-
-        if feast_value_type == ValueType.INT64_LIST:
-            return ProtoValue(
-                int64_list_val=Int64List(
-                    val=[
-                        item
-                        if type(item) in [np.int64, np.int32]
-                        else _type_err(item, np.int64)
-                        for item in value
-                    ]
-                )
-            )
-
-        if feast_value_type == ValueType.STRING_LIST:
-            return ProtoValue(
-                string_list_val=StringList(
-                    val=[
-                        item
-                        if type(item) in [np.str_, str]
-                        else _type_err(item, np.str_)
-                        for item in value
-                    ]
-                )
-            )
-
-        if feast_value_type == ValueType.BOOL_LIST:
-            return ProtoValue(
-                bool_list_val=BoolList(
-                    val=[
-                        item
-                        if type(item) in [np.bool_, bool]
-                        else _type_err(item, np.bool_)
-                        for item in value
-                    ]
-                )
-            )
-
-        if feast_value_type == ValueType.BYTES_LIST:
-            return ProtoValue(
-                bytes_list_val=BytesList(
-                    val=[
-                        item
-                        if type(item) in [np.bytes_, bytes]
-                        else _type_err(item, np.bytes_)
-                        for item in value
-                    ]
-                )
-            )
+    if feast_value_type in _LIST_VALUE_TYPES:
+        return _python_list_to_proto_value(feast_value_type, value)
 
     # Handle scalar types below
     else:
@@ -427,6 +521,25 @@ def pa_to_value_type(pa_type: object):
 
 
 def pa_to_feast_value_type(value: object) -> ValueType:
+    return pa_type_to_feast_value_type(value.type)
+
+
+def pa_type_to_feast_value_type(pa_type: pa.DataType) -> ValueType:
+    """
+    Converts a PyArrow type, such as the type of a field of a PyArrow schema,
+    to a Feast value type.
+
+    Args:
+        pa_type (pyarrow.DataType):
+            PyArrow type to convert.
+
+    Returns:
+        ValueType:
+            Feast value type of the PyArrow type.
+    """
+    if isinstance(pa_type, pa.ListType):
+        # The name of list items depends on how a Parquet file was written
+        pa_type = pa.list_(pa_type.value_type)
     type_map = {
         "timestamp[ms]": ValueType.INT64,
         "int32": ValueType.INT32,
@@ -444,19 +557,92 @@ def pa_to_feast_value_type(value: object) -> ValueType:
         "list<item: binary>": ValueType.BYTES_LIST,
         "list<item: bool>": ValueType.BOOL_LIST,
     }
-    return type_map[value.type.__str__()]
+    return type_map[pa_type.__str__()]
+
+
+def pa_column_to_epoch_micros(column: pa.lib.ChunkedArray) -> np.ndarray:
+    """
+    Converts a PyArrow timestamp column of any time unit to microseconds
+    since the epoch without going through Python objects. Timestamps with a
+    time zone are stored in UTC by PyArrow. Timestamps without one are taken
+    to be in the local time zone, like datetime.timestamp() does for naive
+    datetimes. Nanoseconds are rounded to the nearest microsecond, like
+    pandas does.
 
+    Args:
+        column (pyarrow.lib.ChunkedArray):
+            PyArrow column of timestamps.
 
-def pa_column_to_timestamp_proto_column(column: pa.lib.ChunkedArray) -> Timestamp:
+    Returns:
+        np.ndarray:
+            Microseconds since the epoch of every timestamp, as int64.
+    """
     if not isinstance(column.type, TimestampType):
         raise Exception("Only TimestampType columns are allowed")
+    if column.null_count > 0:
+        raise ValueError("Timestamp columns cannot contain null values")
+
+    if column.type.unit == "ns":
+        micros = (_pa_int64_values(column) + 500) // 1000
+    else:
+        # Casting to a finer unit checks for overflows
+        micros = _pa_int64_values(column.cast(pa.timestamp("us", tz=column.type.tz)))
+    if column.type.tz is None:
+        return _local_to_epoch_micros(micros)
+    return micros
+
+
+# Time zones only change their UTC offset on quarter hours of local time
+_QUARTER_HOUR_MICROS = 15 * 60 * 1_000_000
 
-    proto_column = []
-    for val in column:
-        timestamp = Timestamp()
-        timestamp.FromMicroseconds(micros=int(val.as_py().timestamp() * 1_000_000))
-        proto_column.append(timestamp)
-    return proto_column
+
+def _local_to_epoch_micros(micros: np.ndarray) -> np.ndarray:
+    """
+    Converts microseconds of naive timestamps in the local time zone to
+    microseconds since the epoch, like datetime.timestamp() does. The UTC
+    offset of the local time zone only changes on quarter hours, so it is
+    looked up once for every quarter hour holding timestamps.
+    """
+    quarter_hours, inverse = np.unique(
+        micros // _QUARTER_HOUR_MICROS, return_inverse=True
+    )
+    offsets = np.array(
+        [_local_utc_offset_micros(int(quarter_hour)) for quarter_hour in quarter_hours],
+        dtype=np.int64,
+    )
+    return micros - offsets[inverse]
+
+
+def _local_utc_offset_micros(quarter_hour: int) -> int:
+    """
+    Returns the UTC offset of the local time zone in microseconds at the
+    start of a quarter hour of naive local time since the epoch.
+    """
+    seconds = quarter_hour * _QUARTER_HOUR_MICROS // 1_000_000
+    local = datetime(1970, 1, 1) + timedelta(seconds=seconds)
+    return (seconds - int(local.timestamp())) * 1_000_000
+
+
+def _pa_int64_values(column: pa.lib.ChunkedArray) -> np.ndarray:
+    """
+    Returns the values of a PyArrow column of 64 bit values as int64.
+    """
+    chunks = column.chunks if isinstance(column, pa.ChunkedArray) else [column]
+    values = [chunk.view(pa.int64()).to_numpy() for chunk in chunks]
+    if len(values) == 1:
+        return values[0]
+    return np.concatenate(values) if values else np.empty(0, dtype=np.int64)
+
+
+def pa_column_to_timestamp_proto_column(
+    column: pa.lib.ChunkedArray,
+) -> List[Timestamp]:
+    micros = pa_column_to_epoch_micros(column)
+    seconds, micros = np.divmod(micros, 1_000_000)
+    return [
+        Timestamp(seconds=second, nanos=micro * 1000)
+        for second, micro in zip(seconds.tolist(), micros.tolist())
+    ]
 
 
 def pa_column_to_proto_column(
@@ -484,8 +670,38 @@ def pa_column_to_proto_column(
     if type(value) == dict:
         list_param_name = list(value.keys())[0]
         return [
-            ProtoValue(**{list_param_name: value[list_param_name](val=x.as_py())})
-            for x in column
+            ProtoValue(**{list_param_name: value[list_param_name](val=x)})
+            for x in _pa_list_column_to_python_lists(column)
         ]
     else:
         return [ProtoValue(**{value: x.as_py()}) for x in column]
+
+
+def _pa_list_column_to_python_lists(
+    column: pa.lib.ChunkedArray,
+) -> List[Optional[list]]:
+    """
+    Splits a PyArrow list column into a Python list per row through the
+    offsets and values buffers of its arrays, instead of converting every
+    row on its own. Null rows are returned as None.
+    """
+    chunks = column.chunks if isinstance(column, pa.ChunkedArray) else [column]
+    lists: List[Optional[list]] = []
+    for chunk in chunks:
+        if len(chunk) == 0:
+            continue
+        offsets = chunk.offsets.to_numpy()
+        start = int(offsets[0])
+        values = chunk.values.slice(start, int(offsets[-1]) - start)
+        if values.null_count == 0:
+            items = values.to_numpy(zero_copy_only=False).tolist()
+        else:
+            items = values.to_pylist()
+        bounds = (offsets - start).tolist()
+        chunk_lists = [items[begin:end] for begin, end in zip(bounds[:-1], bounds[1:])]
+        if chunk.null_count > 0:
+            nulls = chunk.is_null().to_numpy(zero_copy_only=False)
+            for row_idx in np.flatnonzero(nulls):
+                chunk_lists[row_idx] = None
+        lists.extend(chunk_lists)
+    return lists
@@ -32,7 +32,7 @@ REQUIRED = [
     "google-cloud-core==1.0.*",
     "googleapis-common-protos==1.*",
     "google-cloud-bigquery-storage==0.7.*",
-    "grpcio==1.*",
+    "grpcio>=1.32.0,<2",
     "pandas==0.*",
     "pandavro==1.5.*",
     "protobuf>=3.10",
@@ -42,7 +42,7 @@ REQUIRED = [
     "tabulate==0.8.*",
     "toml==0.10.*",
     "tqdm==4.*",
-    "pyarrow>=0.15.1",
+    "pyarrow>=0.17.0",
     "numpy",
     "google",
     "confluent_kafka",
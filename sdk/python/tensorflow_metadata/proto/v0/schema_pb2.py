@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: tensorflow_metadata/proto/v0/schema.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'tensorflow_metadata/proto/v0/schema.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from tensorflow_metadata.proto.v0 import path_pb2 as tensorflow__metadata_dot_proto_dot_v0_dot_path__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n)tensorflow_metadata/proto/v0/schema.proto\x12\x16tensorflow.metadata.v0\x1a\x19google/protobuf/any.proto\x1a\'tensorflow_metadata/proto/v0/path.proto\"\xe2\x05\n\x06Schema\x12\x30\n\x07\x66\x65\x61ture\x18\x01 \x03(\x0b\x32\x1f.tensorflow.metadata.v0.Feature\x12=\n\x0esparse_feature\x18\x06 \x03(\x0b\x32%.tensorflow.metadata.v0.SparseFeature\x12\x41\n\x10weighted_feature\x18\x0c \x03(\x0b\x32\'.tensorflow.metadata.v0.WeightedFeature\x12;\n\rstring_domain\x18\x04 \x03(\x0b\x32$.tensorflow.metadata.v0.StringDomain\x12\x39\n\x0c\x66loat_domain\x18\t \x03(\x0b\x32#.tensorflow.metadata.v0.FloatDomain\x12\x35\n\nint_domain\x18\n \x03(\x0b\x32!.tensorflow.metadata.v0.IntDomain\x12\x1b\n\x13\x64\x65\x66\x61ult_environment\x18\x05 \x03(\t\x12\x36\n\nannotation\x18\x08 \x01(\x0b\x32\".tensorflow.metadata.v0.Annotation\x12G\n\x13\x64\x61taset_constraints\x18\x0b \x01(\x0b\x32*.tensorflow.metadata.v0.DatasetConstraints\x12\x62\n\x1btensor_representation_group\x18\r \x03(\x0b\x32=.tensorflow.metadata.v0.Schema.TensorRepresentationGroupEntry\x1as\n\x1eTensorRepresentationGroupEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12@\n\x05value\x18\x02 \x01(\x0b\x32\x31.tensorflow.metadata.v0.TensorRepresentationGroup:\x02\x38\x01\"\xdf\x0b\n\x07\x46\x65\x61ture\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x16\n\ndeprecated\x18\x02 \x01(\x08\x42\x02\x18\x01\x12;\n\x08presence\x18\x0e \x01(\x0b\x32\'.tensorflow.metadata.v0.FeaturePresenceH\x00\x12L\n\x0egroup_presence\x18\x11 \x01(\x0b\x32\x32.tensorflow.metadata.v0.FeaturePresenceWithinGroupH\x00\x12\x33\n\x05shape\x18\x17 \x01(\x0b\x32\".tensorflow.metadata.v0.FixedShapeH\x01\x12\x39\n\x0bvalue_count\x18\x05 \x01(\x0b\x32\".tensorflow.metadata.v0.ValueCountH\x01\x12\x31\n\x04type\x18\x06 \x01(\x0e\x32#.tensorflow.metadata.v0.FeatureType\x12\x10\n\x06\x64omain\x18\x07 \x01(\tH\x02\x12\x37\n\nint_domain\x18\t \x01(\x0b\x32!.tensorflow.metadata.v0.IntDomainH\x02\x12;\n\x0c\x66loat_domain\x18\n \x01(\x0b\x32#.tensorflow.metadata.v0.FloatDomainH\x02\x12=\n\rstring_domain\x18\x0b \x01(\x0b\x32$.tensorflow.metadata.v0.StringDomainH\x02\x12\x39\n\x0b\x62ool_domain\x18\r \x01(\x0b\x32\".tensorflow.metadata.v0.BoolDomainH\x02\x12=\n\rstruct_domain\x18\x1d \x01(\x0b\x32$.tensorflow.metadata.v0.StructDomainH\x02\x12P\n\x17natural_language_domain\x18\x18 \x01(\x0b\x32-.tensorflow.metadata.v0.NaturalLanguageDomainH\x02\x12;\n\x0cimage_domain\x18\x19 \x01(\x0b\x32#.tensorflow.metadata.v0.ImageDomainH\x02\x12\x37\n\nmid_domain\x18\x1a \x01(\x0b\x32!.tensorflow.metadata.v0.MIDDomainH\x02\x12\x37\n\nurl_domain\x18\x1b \x01(\x0b\x32!.tensorflow.metadata.v0.URLDomainH\x02\x12\x39\n\x0btime_domain\x18\x1c \x01(\x0b\x32\".tensorflow.metadata.v0.TimeDomainH\x02\x12\x45\n\x12time_of_day_domain\x18\x1e \x01(\x0b\x32\'.tensorflow.metadata.v0.TimeOfDayDomainH\x02\x12Q\n\x18\x64istribution_constraints\x18\x0f \x01(\x0b\x32/.tensorflow.metadata.v0.DistributionConstraints\x12\x36\n\nannotation\x18\x10 \x01(\x0b\x32\".tensorflow.metadata.v0.Annotation\x12\x42\n\x0fskew_comparator\x18\x12 \x01(\x0b\x32).tensorflow.metadata.v0.FeatureComparator\x12\x43\n\x10\x64rift_comparator\x18\x15 \x01(\x0b\x32).tensorflow.metadata.v0.FeatureComparator\x12\x16\n\x0ein_environment\x18\x14 \x03(\t\x12\x1a\n\x12not_in_environment\x18\x13 \x03(\t\x12?\n\x0flifecycle_stage\x18\x16 \x01(\x0e\x32&.tensorflow.metadata.v0.LifecycleStageB\x16\n\x14presence_constraintsB\x0c\n\nshape_typeB\r\n\x0b\x64omain_info\"X\n\nAnnotation\x12\x0b\n\x03tag\x18\x01 \x03(\t\x12\x0f\n\x07\x63omment\x18\x02 \x03(\t\x12,\n\x0e\x65xtra_metadata\x18\x03 \x03(\x0b\x32\x14.google.protobuf.Any\"X\n\x16NumericValueComparator\x12\x1e\n\x16min_fraction_threshold\x18\x01 \x01(\x01\x12\x1e\n\x16max_fraction_threshold\x18\x02 \x01(\x01\"\xe0\x01\n\x12\x44\x61tasetConstraints\x12U\n\x1dnum_examples_drift_comparator\x18\x01 \x01(\x0b\x32..tensorflow.metadata.v0.NumericValueComparator\x12W\n\x1fnum_examples_version_comparator\x18\x02 \x01(\x0b\x32..tensorflow.metadata.v0.NumericValueComparator\x12\x1a\n\x12min_examples_count\x18\x03 \x01(\x03\"d\n\nFixedShape\x12\x33\n\x03\x64im\x18\x02 \x03(\x0b\x32&.tensorflow.metadata.v0.FixedShape.Dim\x1a!\n\x03\x44im\x12\x0c\n\x04size\x18\x01 \x01(\x03\x12\x0c\n\x04name\x18\x02 \x01(\t\"&\n\nValueCount\x12\x0b\n\x03min\x18\x01 \x01(\x03\x12\x0b\n\x03max\x18\x02 \x01(\x03\"\xc5\x01\n\x0fWeightedFeature\x12\x0c\n\x04name\x18\x01 \x01(\t\x12-\n\x07\x66\x65\x61ture\x18\x02 \x01(\x0b\x32\x1c.tensorflow.metadata.v0.Path\x12\x34\n\x0eweight_feature\x18\x03 \x01(\x0b\x32\x1c.tensorflow.metadata.v0.Path\x12?\n\x0flifecycle_stage\x18\x04 \x01(\x0e\x32&.tensorflow.metadata.v0.LifecycleStage\"\x90\x04\n\rSparseFeature\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x16\n\ndeprecated\x18\x02 \x01(\x08\x42\x02\x18\x01\x12?\n\x0flifecycle_stage\x18\x07 \x01(\x0e\x32&.tensorflow.metadata.v0.LifecycleStage\x12=\n\x08presence\x18\x04 \x01(\x0b\x32\'.tensorflow.metadata.v0.FeaturePresenceB\x02\x18\x01\x12\x37\n\x0b\x64\x65nse_shape\x18\x05 \x01(\x0b\x32\".tensorflow.metadata.v0.FixedShape\x12I\n\rindex_feature\x18\x06 \x03(\x0b\x32\x32.tensorflow.metadata.v0.SparseFeature.IndexFeature\x12\x11\n\tis_sorted\x18\x08 \x01(\x08\x12I\n\rvalue_feature\x18\t \x01(\x0b\x32\x32.tensorflow.metadata.v0.SparseFeature.ValueFeature\x12\x35\n\x04type\x18\n \x01(\x0e\x32#.tensorflow.metadata.v0.FeatureTypeB\x02\x18\x01\x1a\x1c\n\x0cIndexFeature\x12\x0c\n\x04name\x18\x01 \x01(\t\x1a\x1c\n\x0cValueFeature\x12\x0c\n\x04name\x18\x01 \x01(\tJ\x04\x08\x0b\x10\x0c\"5\n\x17\x44istributionConstraints\x12\x1a\n\x0fmin_domain_mass\x18\x01 \x01(\x01:\x01\x31\"K\n\tIntDomain\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03min\x18\x03 \x01(\x03\x12\x0b\n\x03max\x18\x04 \x01(\x03\x12\x16\n\x0eis_categorical\x18\x05 \x01(\x08\"5\n\x0b\x46loatDomain\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03min\x18\x03 \x01(\x02\x12\x0b\n\x03max\x18\x04 \x01(\x02\"\x7f\n\x0cStructDomain\x12\x30\n\x07\x66\x65\x61ture\x18\x01 \x03(\x0b\x32\x1f.tensorflow.metadata.v0.Feature\x12=\n\x0esparse_feature\x18\x02 \x03(\x0b\x32%.tensorflow.metadata.v0.SparseFeature\"+\n\x0cStringDomain\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x03(\t\"C\n\nBoolDomain\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\ntrue_value\x18\x02 \x01(\t\x12\x13\n\x0b\x66\x61lse_value\x18\x03 \x01(\t\"\x17\n\x15NaturalLanguageDomain\"\r\n\x0bImageDomain\"\x0b\n\tMIDDomain\"\x0b\n\tURLDomain\"\x8e\x02\n\nTimeDomain\x12\x17\n\rstring_format\x18\x01 \x01(\tH\x00\x12N\n\x0einteger_format\x18\x02 \x01(\x0e\x32\x34.tensorflow.metadata.v0.TimeDomain.IntegerTimeFormatH\x00\"\x8c\x01\n\x11IntegerTimeFormat\x12\x12\n\x0e\x46ORMAT_UNKNOWN\x10\x00\x12\r\n\tUNIX_DAYS\x10\x05\x12\x10\n\x0cUNIX_SECONDS\x10\x01\x12\x15\n\x11UNIX_MILLISECONDS\x10\x02\x12\x15\n\x11UNIX_MICROSECONDS\x10\x03\x12\x14\n\x10UNIX_NANOSECONDS\x10\x04\x42\x08\n\x06\x66ormat\"\xd1\x01\n\x0fTimeOfDayDomain\x12\x17\n\rstring_format\x18\x01 \x01(\tH\x00\x12X\n\x0einteger_format\x18\x02 \x01(\x0e\x32>.tensorflow.metadata.v0.TimeOfDayDomain.IntegerTimeOfDayFormatH\x00\"A\n\x16IntegerTimeOfDayFormat\x12\x12\n\x0e\x46ORMAT_UNKNOWN\x10\x00\x12\x13\n\x0fPACKED_64_NANOS\x10\x01\x42\x08\n\x06\x66ormat\":\n\x0f\x46\x65\x61turePresence\x12\x14\n\x0cmin_fraction\x18\x01 \x01(\x01\x12\x11\n\tmin_count\x18\x02 \x01(\x03\".\n\x1a\x46\x65\x61turePresenceWithinGroup\x12\x10\n\x08required\x18\x01 \x01(\x08\"!\n\x0cInfinityNorm\x12\x11\n\tthreshold\x18\x01 \x01(\x01\"P\n\x11\x46\x65\x61tureComparator\x12;\n\rinfinity_norm\x18\x01 \x01(\x0b\x32$.tensorflow.metadata.v0.InfinityNorm\"\xeb\x05\n\x14TensorRepresentation\x12P\n\x0c\x64\x65nse_tensor\x18\x01 \x01(\x0b\x32\x38.tensorflow.metadata.v0.TensorRepresentation.DenseTensorH\x00\x12_\n\x14varlen_sparse_tensor\x18\x02 \x01(\x0b\x32?.tensorflow.metadata.v0.TensorRepresentation.VarLenSparseTensorH\x00\x12R\n\rsparse_tensor\x18\x03 \x01(\x0b\x32\x39.tensorflow.metadata.v0.TensorRepresentation.SparseTensorH\x00\x1ao\n\x0c\x44\x65\x66\x61ultValue\x12\x15\n\x0b\x66loat_value\x18\x01 \x01(\x01H\x00\x12\x13\n\tint_value\x18\x02 \x01(\x03H\x00\x12\x15\n\x0b\x62ytes_value\x18\x03 \x01(\x0cH\x00\x12\x14\n\nuint_value\x18\x04 \x01(\x04H\x00\x42\x06\n\x04kind\x1a\xa7\x01\n\x0b\x44\x65nseTensor\x12\x13\n\x0b\x63olumn_name\x18\x01 \x01(\t\x12\x31\n\x05shape\x18\x02 \x01(\x0b\x32\".tensorflow.metadata.v0.FixedShape\x12P\n\rdefault_value\x18\x03 \x01(\x0b\x32\x39.tensorflow.metadata.v0.TensorRepresentation.DefaultValue\x1a)\n\x12VarLenSparseTensor\x12\x13\n\x0b\x63olumn_name\x18\x01 \x01(\t\x1a~\n\x0cSparseTensor\x12\x37\n\x0b\x64\x65nse_shape\x18\x01 \x01(\x0b\x32\".tensorflow.metadata.v0.FixedShape\x12\x1a\n\x12index_column_names\x18\x02 \x03(\t\x12\x19\n\x11value_column_name\x18\x03 \x01(\tB\x06\n\x04kind\"\xf2\x01\n\x19TensorRepresentationGroup\x12j\n\x15tensor_representation\x18\x01 \x03(\x0b\x32K.tensorflow.metadata.v0.TensorRepresentationGroup.TensorRepresentationEntry\x1ai\n\x19TensorRepresentationEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.tensorflow.metadata.v0.TensorRepresentation:\x02\x38\x01*u\n\x0eLifecycleStage\x12\x11\n\rUNKNOWN_STAGE\x10\x00\x12\x0b\n\x07PLANNED\x10\x01\x12\t\n\x05\x41LPHA\x10\x02\x12\x08\n\x04\x42\x45TA\x10\x03\x12\x0e\n\nPRODUCTION\x10\x04\x12\x0e\n\nDEPRECATED\x10\x05\x12\x0e\n\nDEBUG_ONLY\x10\x06*J\n\x0b\x46\x65\x61tureType\x12\x10\n\x0cTYPE_UNKNOWN\x10\x00\x12\t\n\x05\x42YTES\x10\x01\x12\x07\n\x03INT\x10\x02\x12\t\n\x05\x46LOAT\x10\x03\x12\n\n\x06STRUCT\x10\x04\x42\x64\n\x1aorg.tensorflow.metadata.v0P\x01ZAgithub.com/gojek/feast/sdk/go/protos/tensorflow_metadata/proto/v0\xf8\x01\x01')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'tensorflow_metadata.proto.v0.schema_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\032org.tensorflow.metadata.v0P\001ZAgithub.com/gojek/feast/sdk/go/protos/tensorflow_metadata/proto/v0\370\001\001'
+  _globals['_SCHEMA_TENSORREPRESENTATIONGROUPENTRY']._loaded_options = None
+  _globals['_SCHEMA_TENSORREPRESENTATIONGROUPENTRY']._serialized_options = b'8\001'
+  _globals['_FEATURE'].fields_by_name['deprecated']._loaded_options = None
+  _globals['_FEATURE'].fields_by_name['deprecated']._serialized_options = b'\030\001'
+  _globals['_SPARSEFEATURE'].fields_by_name['deprecated']._loaded_options = None
+  _globals['_SPARSEFEATURE'].fields_by_name['deprecated']._serialized_options = b'\030\001'
+  _globals['_SPARSEFEATURE'].fields_by_name['presence']._loaded_options = None
+  _globals['_SPARSEFEATURE'].fields_by_name['presence']._serialized_options = b'\030\001'
+  _globals['_SPARSEFEATURE'].fields_by_name['type']._loaded_options = None
+  _globals['_SPARSEFEATURE'].fields_by_name['type']._serialized_options = b'\030\001'
+  _globals['_TENSORREPRESENTATIONGROUP_TENSORREPRESENTATIONENTRY']._loaded_options = None
+  _globals['_TENSORREPRESENTATIONGROUP_TENSORREPRESENTATIONENTRY']._serialized_options = b'8\001'
+  _globals['_LIFECYCLESTAGE']._serialized_start=5865
+  _globals['_LIFECYCLESTAGE']._serialized_end=5982
+  _globals['_FEATURETYPE']._serialized_start=5984
+  _globals['_FEATURETYPE']._serialized_end=6058
+  _globals['_SCHEMA']._serialized_start=138
+  _globals['_SCHEMA']._serialized_end=876
+  _globals['_SCHEMA_TENSORREPRESENTATIONGROUPENTRY']._serialized_start=761
+  _globals['_SCHEMA_TENSORREPRESENTATIONGROUPENTRY']._serialized_end=876
+  _globals['_FEATURE']._serialized_start=879
+  _globals['_FEATURE']._serialized_end=2382
+  _globals['_ANNOTATION']._serialized_start=2384
+  _globals['_ANNOTATION']._serialized_end=2472
+  _globals['_NUMERICVALUECOMPARATOR']._serialized_start=2474
+  _globals['_NUMERICVALUECOMPARATOR']._serialized_end=2562
+  _globals['_DATASETCONSTRAINTS']._serialized_start=2565
+  _globals['_DATASETCONSTRAINTS']._serialized_end=2789
+  _globals['_FIXEDSHAPE']._serialized_start=2791
+  _globals['_FIXEDSHAPE']._serialized_end=2891
+  _globals['_FIXEDSHAPE_DIM']._serialized_start=2858
+  _globals['_FIXEDSHAPE_DIM']._serialized_end=2891
+  _globals['_VALUECOUNT']._serialized_start=2893
+  _globals['_VALUECOUNT']._serialized_end=2931
+  _globals['_WEIGHTEDFEATURE']._serialized_start=2934
+  _globals['_WEIGHTEDFEATURE']._serialized_end=3131
+  _globals['_SPARSEFEATURE']._serialized_start=3134
+  _globals['_SPARSEFEATURE']._serialized_end=3662
+  _globals['_SPARSEFEATURE_INDEXFEATURE']._serialized_start=3598
+  _globals['_SPARSEFEATURE_INDEXFEATURE']._serialized_end=3626
+  _globals['_SPARSEFEATURE_VALUEFEATURE']._serialized_start=3628
+  _globals['_SPARSEFEATURE_VALUEFEATURE']._serialized_end=3656
+  _globals['_DISTRIBUTIONCONSTRAINTS']._serialized_start=3664
+  _globals['_DISTRIBUTIONCONSTRAINTS']._serialized_end=3717
+  _globals['_INTDOMAIN']._serialized_start=3719
+  _globals['_INTDOMAIN']._serialized_end=3794
+  _globals['_FLOATDOMAIN']._serialized_start=3796
+  _globals['_FLOATDOMAIN']._serialized_end=3849
+  _globals['_STRUCTDOMAIN']._serialized_start=3851
+  _globals['_STRUCTDOMAIN']._serialized_end=3978
+  _globals['_STRINGDOMAIN']._serialized_start=3980
+  _globals['_STRINGDOMAIN']._serialized_end=4023
+  _globals['_BOOLDOMAIN']._serialized_start=4025
+  _globals['_BOOLDOMAIN']._serialized_end=4092
+  _globals['_NATURALLANGUAGEDOMAIN']._serialized_start=4094
+  _globals['_NATURALLANGUAGEDOMAIN']._serialized_end=4117
+  _globals['_IMAGEDOMAIN']._serialized_start=4119
+  _globals['_IMAGEDOMAIN']._serialized_end=4132
+  _globals['_MIDDOMAIN']._serialized_start=4134
+  _globals['_MIDDOMAIN']._serialized_end=4145
+  _globals['_URLDOMAIN']._serialized_start=4147
+  _globals['_URLDOMAIN']._serialized_end=4158
+  _globals['_TIMEDOMAIN']._serialized_start=4161
+  _globals['_TIMEDOMAIN']._serialized_end=4431
+  _globals['_TIMEDOMAIN_INTEGERTIMEFORMAT']._serialized_start=4281
+  _globals['_TIMEDOMAIN_INTEGERTIMEFORMAT']._serialized_end=4421
+  _globals['_TIMEOFDAYDOMAIN']._serialized_start=4434
+  _globals['_TIMEOFDAYDOMAIN']._serialized_end=4643
+  _globals['_TIMEOFDAYDOMAIN_INTEGERTIMEOFDAYFORMAT']._serialized_start=4568
+  _globals['_TIMEOFDAYDOMAIN_INTEGERTIMEOFDAYFORMAT']._serialized_end=4633
+  _globals['_FEATUREPRESENCE']._serialized_start=4645
+  _globals['_FEATUREPRESENCE']._serialized_end=4703
+  _globals['_FEATUREPRESENCEWITHINGROUP']._serialized_start=4705
+  _globals['_FEATUREPRESENCEWITHINGROUP']._serialized_end=4751
+  _globals['_INFINITYNORM']._serialized_start=4753
+  _globals['_INFINITYNORM']._serialized_end=4786
+  _globals['_FEATURECOMPARATOR']._serialized_start=4788
+  _globals['_FEATURECOMPARATOR']._serialized_end=4868
+  _globals['_TENSORREPRESENTATION']._serialized_start=4871
+  _globals['_TENSORREPRESENTATION']._serialized_end=5618
+  _globals['_TENSORREPRESENTATION_DEFAULTVALUE']._serialized_start=5158
+  _globals['_TENSORREPRESENTATION_DEFAULTVALUE']._serialized_end=5269
+  _globals['_TENSORREPRESENTATION_DENSETENSOR']._serialized_start=5272
+  _globals['_TENSORREPRESENTATION_DENSETENSOR']._serialized_end=5439
+  _globals['_TENSORREPRESENTATION_VARLENSPARSETENSOR']._serialized_start=5441
+  _globals['_TENSORREPRESENTATION_VARLENSPARSETENSOR']._serialized_end=5482
+  _globals['_TENSORREPRESENTATION_SPARSETENSOR']._serialized_start=5484
+  _globals['_TENSORREPRESENTATION_SPARSETENSOR']._serialized_end=5610
+  _globals['_TENSORREPRESENTATIONGROUP']._serialized_start=5621
+  _globals['_TENSORREPRESENTATIONGROUP']._serialized_end=5863
+  _globals['_TENSORREPRESENTATIONGROUP_TENSORREPRESENTATIONENTRY']._serialized_start=5758
+  _globals['_TENSORREPRESENTATIONGROUP_TENSORREPRESENTATIONENTRY']._serialized_end=5863
+# @@protoc_insertion_point(module_scope)
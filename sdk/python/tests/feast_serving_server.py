@@ -4,7 +4,6 @@ from concurrent import futures
 from typing import Dict
 
 import grpc
-from google.protobuf.timestamp_pb2 import Timestamp
 
 import feast.serving.ServingService_pb2_grpc as Serving
 from feast.core import FeatureSet_pb2 as FeatureSetProto
@@ -15,8 +14,6 @@ from feast.serving.ServingService_pb2 import (
     GetOnlineFeaturesRequest,
     GetOnlineFeaturesResponse,
 )
-from feast.types import FeatureRow_pb2 as FeatureRowProto
-from feast.types import Field_pb2 as FieldProto
 from feast.types import Value_pb2 as ValueProto
 
 _ONE_DAY_IN_SECONDS = 60 * 60 * 24
@@ -62,73 +59,20 @@ class ServingServicer(Serving.ServingServiceServicer):
         return GetFeastServingInfoResponse(version="0.3.2")
 
     def GetOnlineFeatures(self, request: GetOnlineFeaturesRequest, context):
-
-        response = GetOnlineFeaturesResponse(
-            feature_data_sets=[
-                GetOnlineFeaturesResponse.FeatureDataSet(
-                    name="feature_set_1",
-                    version="1",
-                    feature_rows=[
-                        FeatureRowProto.FeatureRow(
-                            feature_set="feature_set_1",
-                            event_timestamp=Timestamp(),
-                            fields=[
-                                FieldProto.Field(
-                                    name="feature_1",
-                                    value=ValueProto.Value(float_val=1.2),
-                                ),
-                                FieldProto.Field(
-                                    name="feature_2",
-                                    value=ValueProto.Value(float_val=1.2),
-                                ),
-                                FieldProto.Field(
-                                    name="feature_3",
-                                    value=ValueProto.Value(float_val=1.2),
-                                ),
-                            ],
-                        ),
-                        FeatureRowProto.FeatureRow(
-                            feature_set="feature_set_1",
-                            event_timestamp=Timestamp(),
-                            fields=[
-                                FieldProto.Field(
-                                    name="feature_1",
-                                    value=ValueProto.Value(float_val=1.2),
-                                ),
-                                FieldProto.Field(
-                                    name="feature_2",
-                                    value=ValueProto.Value(float_val=1.2),
-                                ),
-                                FieldProto.Field(
-                                    name="feature_3",
-                                    value=ValueProto.Value(float_val=1.2),
-                                ),
-                            ],
-                        ),
-                        FeatureRowProto.FeatureRow(
-                            feature_set="feature_set_1",
-                            event_timestamp=Timestamp(),
-                            fields=[
-                                FieldProto.Field(
-                                    name="feature_1",
-                                    value=ValueProto.Value(float_val=1.2),
-                                ),
-                                FieldProto.Field(
-                                    name="feature_2",
-                                    value=ValueProto.Value(float_val=1.2),
-                                ),
-                                FieldProto.Field(
-                                    name="feature_3",
-                                    value=ValueProto.Value(float_val=1.2),
-                                ),
-                            ],
-                        ),
-                    ],
-                )
-            ]
-        )
-
-        return response
+        # Returns the entities of every entity row together with a value for
+        # every requested feature, keyed like Feast Serving keys them
+        feature_refs = [
+            f"{ref.project}/{ref.name}" + (f":{ref.version}" if ref.version else "")
+            for ref in request.features
+        ]
+        field_values = []
+        for entity_row in request.entity_rows:
+            fields = dict(entity_row.fields)
+            for feature_ref in feature_refs:
+                fields[feature_ref] = ValueProto.Value(float_val=1.2)
+            field_values.append(GetOnlineFeaturesResponse.FieldValues(fields=fields))
+
+        return GetOnlineFeaturesResponse(field_values=field_values)
 
 
 def serve():
@@ -0,0 +1,156 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import time
+from concurrent import futures
+
+import grpc
+import pytest
+
+import feast.serving.ServingService_pb2_grpc as Serving
+from feast.async_client import AsyncClient
+from feast.client import _build_feature_references_cached
+from feast.serving.ServingService_pb2 import GetOnlineFeaturesRequest
+from feast.types import Value_pb2 as ValueProto
+from feast_serving_server import ServingServicer
+
+
+class SlowServingServicer(ServingServicer):
+    def GetOnlineFeatures(self, request, context):
+        time.sleep(0.5)
+        return super().GetOnlineFeatures(request, context)
+
+
+def _entity_rows(*customer_ids):
+    return [
+        GetOnlineFeaturesRequest.EntityRow(
+            fields={"customer_id": ValueProto.Value(int64_val=customer_id)}
+        )
+        for customer_id in customer_ids
+    ]
+
+
+def _serve(servicer):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    Serving.add_ServingServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    return server, f"localhost:{port}"
+
+
+class TestAsyncClient:
+    @pytest.fixture
+    def serving_url(self):
+        server, url = _serve(ServingServicer())
+        yield url
+        server.stop(0)
+
+    @pytest.fixture
+    def slow_serving_url(self):
+        server, url = _serve(SlowServingServicer())
+        yield url
+        server.stop(0)
+
+    def test_get_online_features(self, serving_url):
+        async def get_online_features():
+            async with AsyncClient(serving_url=serving_url) as client:
+                client.set_project("my_project")
+                return await client.get_online_features(
+                    feature_refs=["feature_1", "other_project/feature_2:2"],
+                    entity_rows=_entity_rows(1, 2),
+                )
+
+        response = asyncio.run(get_online_features())
+
+        assert [
+            field_values.fields["customer_id"].int64_val
+            for field_values in response.field_values
+        ] == [1, 2]
+        for field_values in response.field_values:
+            assert field_values.fields[
+                "my_project/feature_1"
+            ].float_val == pytest.approx(1.2)
+            assert field_values.fields[
+                "other_project/feature_2:2"
+            ].float_val == pytest.approx(1.2)
+
+    def test_feature_references_are_cached(self, serving_url):
+        feature_refs = ["cached_project/cached_feature:1"]
+
+        async def get_online_features():
+            async with AsyncClient(serving_url=serving_url) as client:
+                for customer_id in range(3):
+                    await client.get_online_features(
+                        feature_refs, _entity_rows(customer_id)
+                    )
+
+        hits = _build_feature_references_cached.cache_info().hits
+        asyncio.run(get_online_features())
+
+        assert _build_feature_references_cached.cache_info().hits - hits == 2
+
+    def test_channels_are_used_round_robin(self, serving_url):
+        async def get_stubs():
+            client = AsyncClient(serving_url=serving_url, channel_pool_size=3)
+            stubs = [client._get_serving_stub() for _ in range(6)]
+            await client.close()
+            return stubs
+
+        stubs = asyncio.run(get_stubs())
+
+        assert len(set(stubs[:3])) == 3
+        assert stubs[:3] == stubs[3:]
+
+    @pytest.mark.parametrize(
+        "url",
+        [pytest.lazy_fixture("serving_url"), pytest.lazy_fixture("slow_serving_url")],
+    )
+    def test_get_online_features_many(self, url):
+        async def get_online_features_many():
+            async with AsyncClient(serving_url=url) as client:
+                start = time.perf_counter()
+                responses = await client.get_online_features_many(
+                    [
+                        (["my_project/feature_1"], _entity_rows(customer_id))
+                        for customer_id in range(8)
+                    ]
+                )
+                return responses, time.perf_counter() - start
+
+        responses, elapsed = asyncio.run(get_online_features_many())
+
+        assert [
+            response.field_values[0].fields["customer_id"].int64_val
+            for response in responses
+        ] == list(range(8))
+        # Queries against the slow server run concurrently
+        assert elapsed < 8 * 0.5
+
+    def test_deadline_exceeded(self, slow_serving_url):
+        async def get_online_features_many():
+            async with AsyncClient(serving_url=slow_serving_url) as client:
+                return await client.get_online_features_many(
+                    [(["my_project/feature_1"], _entity_rows(1))] * 2,
+                    timeout=0.1,
+                    return_exceptions=True,
+                )
+
+        responses = asyncio.run(get_online_features_many())
+
+        assert len(responses) == 2
+        assert all(isinstance(response, grpc.RpcError) for response in responses)
+
+    def test_invalid_channel_pool_size(self):
+        with pytest.raises(ValueError):
+            AsyncClient(serving_url="localhost:6566", channel_pool_size=0)
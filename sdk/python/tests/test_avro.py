@@ -0,0 +1,145 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import io
+from datetime import datetime
+
+import fastavro
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+from pandavro import to_avro
+
+from feast.loaders.avro import entity_rows_avro_schema, write_entity_rows_avro
+from feast.loaders.file import export_dataframe_to_local
+
+
+@pytest.fixture
+def entity_rows():
+    rows = 100
+    return pd.DataFrame(
+        {
+            "datetime": [
+                datetime(2020, 1, 1, tzinfo=pytz.utc) + pd.Timedelta(seconds=i)
+                for i in range(rows)
+            ],
+            "driver_id": np.arange(rows, dtype=np.int64) - 50,
+            "customer_id": np.arange(rows, dtype=np.int32) * -70000,
+            "rating": np.linspace(-1, 1, rows, dtype=np.float32),
+            "earnings": np.linspace(-1000, 1000, rows),
+            "city": [None if i % 3 == 0 else "jakartá"[: i % 8] for i in range(rows)],
+            "key": [bytes([i]) for i in range(rows)],
+            "active": np.arange(rows) % 2 == 0,
+            "trips": pd.Series(
+                [None if i % 4 == 0 else i for i in range(rows)], dtype="Int64"
+            ),
+        }
+    )
+
+
+def _read(data):
+    return list(fastavro.reader(io.BytesIO(data)))
+
+
+def _pandavro_records(df):
+    buffer = io.BytesIO()
+    to_avro(buffer, df.rename(columns={"datetime": "event_timestamp"}))
+    return _read(buffer.getvalue())
+
+
+class TestWriteEntityRowsAvro:
+    @pytest.mark.parametrize("codec", ["null", "deflate", "bzip2", "xz"])
+    def test_same_records_as_pandavro(self, entity_rows, codec):
+        buffer = io.BytesIO()
+
+        write_entity_rows_avro(entity_rows, buffer, codec=codec, block_rows=30)
+
+        reader = fastavro.reader(io.BytesIO(buffer.getvalue()))
+        assert reader.metadata["avro.codec"] == codec
+        assert list(reader) == _pandavro_records(entity_rows)
+
+    def test_schema(self, entity_rows):
+        schema = entity_rows_avro_schema(entity_rows)
+
+        assert schema["name"] == "Root"
+        assert schema["fields"][:3] == [
+            {
+                "name": "event_timestamp",
+                "type": ["null", {"type": "long", "logicalType": "timestamp-micros"}],
+            },
+            {"name": "driver_id", "type": ["null", "long"]},
+            {"name": "customer_id", "type": ["null", "int"]},
+        ]
+
+    def test_does_not_modify_dataframe(self, entity_rows):
+        expected = entity_rows.copy()
+
+        write_entity_rows_avro(entity_rows, io.BytesIO())
+
+        pd.testing.assert_frame_equal(entity_rows, expected)
+
+    def test_naive_timestamps_and_nan(self):
+        df = pd.DataFrame(
+            {"datetime": [datetime(2020, 1, 1), pd.NaT], "rating": [np.nan, 1.5]}
+        )
+        buffer = io.BytesIO()
+
+        write_entity_rows_avro(df, buffer)
+
+        records = _read(buffer.getvalue())
+        assert [r["event_timestamp"] for r in records] == [
+            datetime(2020, 1, 1, tzinfo=pytz.utc),
+            None,
+        ]
+        # NaN is a value, as written by pandavro
+        assert np.isnan(records[0]["rating"]) and records[1]["rating"] == 1.5
+
+    def test_empty_dataframe(self, entity_rows):
+        buffer = io.BytesIO()
+
+        write_entity_rows_avro(entity_rows.head(0), buffer)
+
+        assert _read(buffer.getvalue()) == []
+
+    def test_unsupported_column(self):
+        df = pd.DataFrame({"datetime": [datetime(2020, 1, 1)], "ids": [[1, 2]]})
+
+        with pytest.raises(ValueError, match='"ids"'):
+            write_entity_rows_avro(df, io.BytesIO())
+
+    def test_unsupported_codec(self, entity_rows):
+        with pytest.raises(ValueError, match="codec"):
+            write_entity_rows_avro(entity_rows, io.BytesIO(), codec="lz4")
+
+
+class TestExportDataframeToLocal:
+    def test_does_not_modify_dataframe(self, entity_rows, tmp_path):
+        expected = entity_rows.copy()
+
+        _, _, dest_path = export_dataframe_to_local(
+            entity_rows, str(tmp_path), codec="deflate"
+        )
+
+        pd.testing.assert_frame_equal(entity_rows, expected)
+        with open(dest_path, "rb") as file:
+            assert _read(file.read()) == _pandavro_records(entity_rows)
+
+    def test_unsupported_columns_fall_back_to_pandavro(self, tmp_path):
+        df = pd.DataFrame({"datetime": [datetime(2020, 1, 1)], "ids": [[1, 2]]})
+
+        _, _, dest_path = export_dataframe_to_local(df, str(tmp_path))
+
+        with open(dest_path, "rb") as file:
+            assert _read(file.read()) == _pandavro_records(df)
+        assert list(df.columns) == ["datetime", "ids"]
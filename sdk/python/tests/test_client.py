@@ -13,11 +13,15 @@
 # limitations under the License.
 
 
+import datetime
+import logging
 import pkgutil
+import threading
 from concurrent import futures
 from unittest import mock
 
 import grpc
+import pandas as pd
 import pytest
 from google.protobuf.duration_pb2 import Duration
 from mock import MagicMock, patch
@@ -25,7 +29,7 @@ from mock import MagicMock, patch
 import dataframes
 import feast.core.CoreService_pb2_grpc as Core
 import feast.serving.ServingService_pb2_grpc as Serving
-from feast.client import Client
+from feast.client import ApplyStatus, Client
 from feast.core.CoreService_pb2 import (
     GetFeastCoreVersionResponse,
     GetFeatureSetResponse,
@@ -45,11 +49,15 @@ from feast.entity import Entity
 from feast.feature_set import Feature, FeatureSet, FeatureSetRef
 from feast.job import IngestJob
 from feast.serving.ServingService_pb2 import (
+    FeastServingType,
+    GetBatchFeaturesResponse,
     GetFeastServingInfoResponse,
     GetOnlineFeaturesRequest,
     GetOnlineFeaturesResponse,
 )
+from feast.serving.ServingService_pb2 import Job as ServingJob
 from feast.source import KafkaSource
+from feast.types.FeatureRow_pb2 import FeatureRow
 from feast.types import Value_pb2 as ValueProto
 from feast.value_type import ValueType
 from feast_core_server import CoreServicer
@@ -62,6 +70,18 @@ _CERTIFICATE_CHAIN_RESOURCE_PATH = "data/localhost.pem"
 _ROOT_CERTIFICATE_RESOURCE_PATH = "data/localhost.crt"
 
 
+class _UnavailableError(grpc.RpcError):
+    """
+    Error of a gRPC call which could not reach the server
+    """
+
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+    def details(self):
+        return "Connection refused"
+
+
 class TestClient:
     @pytest.fixture
     def secure_mock_client(self, mocker):
@@ -239,6 +259,134 @@ class TestClient:
             and response.field_values[0].fields["my_project/feature_9:1"].int64_val == 9
         )
 
+    def test_get_online_features_cached(self, mock_client, mocker):
+        mock_client._serving_service_stub = Serving.ServingServiceStub(
+            grpc.insecure_channel("")
+        )
+        serving = mocker.patch.object(
+            mock_client._serving_service_stub,
+            "GetOnlineFeatures",
+            side_effect=lambda request: ServingServicer().GetOnlineFeatures(
+                request, None
+            ),
+        )
+        mocker.patch.object(
+            mock_client,
+            "list_feature_sets",
+            return_value=[
+                FeatureSet(
+                    "driver",
+                    project="my_project",
+                    features=[Feature("feature_1", ValueType.FLOAT)],
+                    max_age=Duration(seconds=600),
+                )
+            ],
+        )
+        cache = mock_client.enable_online_cache(default_ttl=60)
+
+        def get_online_features(*customer_ids):
+            response = mock_client.get_online_features(
+                feature_refs=["my_project/feature_1", "my_project/feature_2"],
+                entity_rows=[
+                    GetOnlineFeaturesRequest.EntityRow(
+                        fields={"customer_id": ValueProto.Value(int64_val=customer_id)}
+                    )
+                    for customer_id in customer_ids
+                ],
+            )
+            for field_values in response.field_values:
+                assert field_values.fields["my_project/feature_1"].float_val
+                assert field_values.fields["my_project/feature_2"].float_val
+            return [
+                field_values.fields["customer_id"].int64_val
+                for field_values in response.field_values
+            ]
+
+        assert get_online_features(1, 2) == [1, 2]
+        assert get_online_features(3, 2, 1) == [3, 2, 1]
+        assert get_online_features(2, 1) == [2, 1]
+
+        # Only the entity row with cache misses is retrieved the second time
+        assert serving.call_count == 2
+        assert [
+            row.fields["customer_id"].int64_val
+            for row in serving.call_args.args[0].entity_rows
+        ] == [3]
+        assert (cache.stats.hits, cache.stats.misses) == (8, 6)
+        assert cache.feature_ttl("my_project/feature_1") == 600
+        assert cache.feature_ttl("my_project/feature_2") == 60
+        mock_client.list_feature_sets.assert_called_once_with(project="my_project")
+
+    def test_get_online_features_batched(self, mock_client, mocker):
+        mock_client._serving_service_stub = Serving.ServingServiceStub(
+            grpc.insecure_channel("")
+        )
+        serving = mocker.patch.object(
+            mock_client._serving_service_stub,
+            "GetOnlineFeatures",
+            side_effect=lambda request: ServingServicer().GetOnlineFeatures(
+                request, None
+            ),
+        )
+        mock_client.enable_online_batching(max_wait_seconds=5, max_batch_size=4)
+        barrier = threading.Barrier(4)
+
+        def get_online_features(customer_id):
+            barrier.wait()
+            response = mock_client.get_online_features(
+                feature_refs=["my_project/feature_1"],
+                entity_rows=[
+                    GetOnlineFeaturesRequest.EntityRow(
+                        fields={"customer_id": ValueProto.Value(int64_val=customer_id)}
+                    )
+                ],
+            )
+            return response.field_values[0].fields["customer_id"].int64_val
+
+        with futures.ThreadPoolExecutor(4) as executor:
+            customer_ids = list(executor.map(get_online_features, range(4)))
+
+        assert customer_ids == list(range(4))
+        assert serving.call_count == 1
+        assert len(serving.call_args.args[0].entity_rows) == 4
+
+    def test_get_batch_features_staging_cache(self, mock_client, mocker, tmp_path):
+        mock_client._serving_service_stub = Serving.ServingServiceStub(
+            grpc.insecure_channel("")
+        )
+        mocker.patch.object(
+            mock_client._serving_service_stub,
+            "GetFeastServingInfo",
+            return_value=GetFeastServingInfoResponse(
+                type=FeastServingType.FEAST_SERVING_TYPE_BATCH,
+                job_staging_location=f"file://{tmp_path}/",
+            ),
+        )
+        serving = mocker.patch.object(
+            mock_client._serving_service_stub,
+            "GetBatchFeatures",
+            return_value=GetBatchFeaturesResponse(job=ServingJob(id="job")),
+        )
+        # Retrieval jobs create a storage client to download their results
+        mocker.patch("feast.job.storage.Client")
+        cache = mock_client.enable_staging_cache(str(tmp_path / "manifest.json"))
+        entity_rows = pd.DataFrame(
+            {
+                "datetime": [datetime.datetime(2020, 1, 1)] * 3,
+                "customer": [1001, 1002, 1003],
+            }
+        )
+
+        for feature in ["feature_1", "feature_2"]:
+            mock_client.get_batch_features([feature], entity_rows, "my_project")
+
+        (first, second) = [
+            call.args[0].dataset_source.file_source.file_uris
+            for call in serving.call_args_list
+        ]
+        assert first == second
+        assert (cache.hits, cache.misses) == (1, 1)
+
     @pytest.mark.parametrize(
         "mocked_client",
         [pytest.lazy_fixture("mock_client"), pytest.lazy_fixture("secure_mock_client")],
@@ -571,6 +719,113 @@ class TestClient:
             and feature_sets[1].entities[0].dtype == ValueType.INT64
         )
 
+    def test_apply_all(self, client, mocker):
+        client.set_project("project1")
+        feature_sets = []
+        for i in range(5):
+            fs = FeatureSet(f"my-feature-set-{i}")
+            fs.add(Feature(name=f"fs{i}-my-feature-1", dtype=ValueType.INT64))
+            fs.add(Entity(name=f"fs{i}-my-entity-1", dtype=ValueType.INT64))
+            feature_sets.append(fs)
+
+        results = client.apply_all(feature_sets, max_workers=3)
+
+        assert [result.feature_set for result in results] == feature_sets
+        assert all(result.status == ApplyStatus.CREATED for result in results)
+        assert all(result.error is None for result in results)
+        assert all(fs.version == 1 for fs in feature_sets)
+        assert len(client.list_feature_sets()) == 5
+
+        # Failing requests are reported without stopping the others
+        apply_feature_set = client._core_service_stub.ApplyFeatureSet
+        error = _UnavailableError()
+
+        def apply_or_fail(request, timeout):
+            if request.feature_set.spec.name == "my-feature-set-2":
+                raise error
+            return apply_feature_set(request, timeout=timeout)
+
+        mocker.patch.object(
+            client._core_service_stub, "ApplyFeatureSet", side_effect=apply_or_fail
+        )
+        update = client._update_applied_feature_set
+
+        def update_or_fail(feature_set, response):
+            if feature_set.name == "my-feature-set-4":
+                raise ValueError("invalid response")
+            return update(feature_set, response)
+
+        mocker.patch.object(
+            client, "_update_applied_feature_set", side_effect=update_or_fail
+        )
+        results = client.apply_all(feature_sets)
+
+        assert [result.status for result in results] == [
+            ApplyStatus.CREATED,
+            ApplyStatus.CREATED,
+            ApplyStatus.ERROR,
+            ApplyStatus.CREATED,
+            ApplyStatus.ERROR,
+        ]
+        # The errors of Feast Core keep their status code
+        assert results[2].error is error
+        assert results[2].error.code() == grpc.StatusCode.UNAVAILABLE
+        assert isinstance(results[4].error, ValueError)
+        assert [fs.version for fs in feature_sets] == [2, 2, 1, 2, 1]
+
+    def test_apply_all_validates_before_applying(self, client, mocker):
+        client.set_project("project1")
+        send = mocker.spy(client, "_send_apply_feature_set")
+        valid = FeatureSet("valid")
+        valid.add(Feature(name="feature", dtype=ValueType.INT64))
+        valid.add(Entity(name="entity", dtype=ValueType.INT64))
+
+        with pytest.raises(ValueError, match="no-entities"):
+            client.apply_all([valid, FeatureSet("no-entities")])
+
+        assert send.call_count == 0
+
+    def test_feature_set_cache(self, client, mocker):
+        client.set_project("project1")
+        list_feature_sets = mocker.spy(client, "_list_feature_set_protos")
+        cache = client.enable_feature_set_cache(ttl=600)
+        fs1 = FeatureSet("my-feature-set-1")
+        fs1.add(Feature(name="fs1-my-feature-1", dtype=ValueType.INT64))
+        fs1.add(Entity(name="fs1-my-entity-1", dtype=ValueType.INT64))
+        client.apply(fs1)
+
+        for _ in range(3):
+            assert list(client.list_entities()) == ["fs1-my-entity-1"]
+            assert client.get_feature_set("my-feature-set-1", version=1) is not None
+
+        assert list_feature_sets.call_count == 1
+        assert cache.stats.hits == 5
+
+        # Lookups return copies of the cached feature sets
+        client.get_feature_set("my-feature-set-1", version=1).drop("fs1-my-feature-1")
+        feature_set = client.get_feature_set("my-feature-set-1", version=1)
+        assert "fs1-my-feature-1" in feature_set.fields
+
+        # Applying a feature set drops its cached versions
+        fs1.add(Entity(name="fs1-my-entity-2", dtype=ValueType.INT64))
+        client.apply(fs1)
+        assert list(client.list_entities()) == ["fs1-my-entity-1", "fs1-my-entity-2"]
+        assert list_feature_sets.call_count == 2
+
+    def test_feature_set_cache_refresher_restarts_after_close(self, client):
+        client.set_project("project1")
+        cache = client.enable_feature_set_cache(ttl=600, refresh_interval=600)
+        assert cache.refreshing
+
+        client.close()
+        assert not cache.refreshing
+
+        client.list_feature_sets()
+        assert cache.refreshing
+
+        client.disable_feature_set_cache()
+        assert not cache.refreshing
+
     @pytest.mark.parametrize(
         "dataframe,test_client",
         [
@@ -604,6 +859,111 @@ class TestClient:
             # Ingest data into Feast
             test_client.ingest("driver-feature-set", dataframe)
 
+    @pytest.mark.parametrize("source_format", ["dataframe", "parquet", "csv"])
+    def test_feature_set_ingest_stream_success(
+        self, client, source_format, tmp_path, mocker, capsys, caplog
+    ):
+        client.set_project("project1")
+        driver_fs = FeatureSet(
+            "driver-feature-set", source=KafkaSource(brokers="kafka:9092", topic="test")
+        )
+        driver_fs.add(Feature(name="feature_1", dtype=ValueType.FLOAT))
+        driver_fs.add(Feature(name="feature_2", dtype=ValueType.STRING))
+        driver_fs.add(Feature(name="feature_3", dtype=ValueType.INT64))
+        driver_fs.add(Entity(name="entity_id", dtype=ValueType.INT64))
+
+        # Register with Feast core
+        client.apply(driver_fs)
+        driver_fs = driver_fs.to_proto()
+        driver_fs.meta.status = FeatureSetStatusProto.STATUS_READY
+
+        mocker.patch.object(
+            client._core_service_stub,
+            "GetFeatureSet",
+            return_value=GetFeatureSetResponse(feature_set=driver_fs),
+        )
+
+        source = dataframes.GOOD
+        if source_format == "parquet":
+            source = str(tmp_path / "source.parquet")
+            dataframes.GOOD.to_parquet(source, row_group_size=2)
+        elif source_format == "csv":
+            source = str(tmp_path / "source.csv")
+            dataframes.GOOD.to_csv(source, index=False)
+
+        # Need to create a mock producer
+        with patch("feast.client.get_producer") as mocked_get_producer:
+            # Ingest data into Feast
+            with caplog.at_level(logging.DEBUG, logger="feast.client"):
+                client.ingest("driver-feature-set", source, chunk_size=2, stream=True)
+
+        # Stage timings are only logged for debugging
+        assert "Stage timings" not in capsys.readouterr().out
+        assert "Stage timings" in caplog.text
+
+        produced = [
+            FeatureRow.FromString(call.args[1])
+            for call in mocked_get_producer.return_value.produce.call_args_list
+        ]
+        assert [
+            field.value.int64_val
+            for row in produced
+            for field in row.fields
+            if field.name == "entity_id"
+        ] == list(dataframes.GOOD["entity_id"])
+
+        # Encoding workers are kept running until the client is closed
+        assert not client._encoding_pool.closed
+        client.close()
+        assert client._encoding_pool is None
+
+    def test_encoding_pool_staging_dir(self, tmp_path):
+        client = Client(core_url=CORE_URL, ingestion_staging_dir=str(tmp_path))
+
+        assert client._get_encoding_pool(1).staging_dir == str(tmp_path)
+        assert Client(core_url=CORE_URL)._get_encoding_pool(1).staging_dir in (
+            "/dev/shm",
+            None,
+        )
+
+    @pytest.mark.parametrize("source_format", ["dataframe", "parquet"])
+    def test_feature_set_ingest_stream_empty_source_force_update(
+        self, client, source_format, tmp_path, mocker
+    ):
+        client.set_project("project1")
+        driver_fs = FeatureSet(
+            "driver-feature-set", source=KafkaSource(brokers="kafka:9092", topic="test")
+        )
+        driver_fs.add(Entity(name="entity_id", dtype=ValueType.INT64))
+
+        ready_fs = driver_fs.to_proto()
+        ready_fs.meta.status = FeatureSetStatusProto.STATUS_READY
+        client._connect_core()
+        mocker.patch.object(
+            client._core_service_stub,
+            "GetFeatureSet",
+            return_value=GetFeatureSetResponse(feature_set=ready_fs),
+        )
+
+        # Empty string columns have no type to infer
+        dataframe = dataframes.GOOD.iloc[:0].drop(columns="feature_2")
+        source = dataframe
+        if source_format == "parquet":
+            source = str(tmp_path / "source.parquet")
+            dataframe.to_parquet(source)
+
+        with patch("feast.client.get_producer") as mocked_get_producer:
+            client.ingest(driver_fs, source, stream=True, force_update=True)
+
+        # The fields are inferred from the schema of the source
+        assert {name: field.dtype for name, field in driver_fs.fields.items()} == {
+            "entity_id": ValueType.INT64,
+            "feature_1": ValueType.DOUBLE,
+            "feature_3": ValueType.INT64,
+        }
+        assert not mocked_get_producer.return_value.produce.called
+        client.close()
+
     @pytest.mark.parametrize(
         "dataframe,exception,test_client",
         [
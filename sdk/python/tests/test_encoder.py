@@ -0,0 +1,257 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import time
+from datetime import datetime
+
+import dataframes
+import pyarrow as pa
+import pytest
+import pytz
+
+from feast.constants import DATETIME_COLUMN
+from feast.loaders.encoder import encode_pa_table, pa_column_to_timestamp_buffers
+from feast.type_map import (
+    pa_column_to_proto_column,
+    pa_column_to_timestamp_proto_column,
+)
+from feast.types import Field_pb2 as FieldProto
+from feast.types.FeatureRow_pb2 import FeatureRow
+from feast.value_type import ValueType
+
+FEATURE_SET_REF = "project/all_types:1"
+INGESTION_ID = "3f5bd7a2-aa8f-3f1c-a2f0-8a83e5d54d4b"
+
+ALL_TYPES_FIELDS = {
+    "user_id": ValueType.INT64,
+    "int32_feature": ValueType.INT32,
+    "int64_feature": ValueType.INT64,
+    "float_feature": ValueType.FLOAT,
+    "double_feature": ValueType.DOUBLE,
+    "string_feature": ValueType.STRING,
+    "bytes_feature": ValueType.BYTES,
+    "bool_feature": ValueType.BOOL,
+    "int32_list_feature": ValueType.INT32_LIST,
+    "int64_list_feature": ValueType.INT64_LIST,
+    "float_list_feature": ValueType.FLOAT_LIST,
+    "double_list_feature": ValueType.DOUBLE_LIST,
+    "string_list_feature": ValueType.STRING_LIST,
+    "bytes_list_feature": ValueType.BYTES_LIST,
+}
+
+
+def _encode_row_by_row(table, feature_set, fields, ingestion_id):
+    # Reference implementation that builds a FeatureRow message for every row
+    datetime_col = pa_column_to_timestamp_proto_column(table.column(DATETIME_COLUMN))
+    proto_columns = {
+        name: pa_column_to_proto_column(dtype, table.column(name))
+        for name, dtype in fields.items()
+    }
+    feature_rows = []
+    for row_idx in range(table.num_rows):
+        feature_row = FeatureRow(
+            event_timestamp=datetime_col[row_idx],
+            feature_set=feature_set,
+            ingestion_id=ingestion_id,
+        )
+        for name, column in proto_columns.items():
+            feature_row.fields.extend(
+                [FieldProto.Field(name=name, value=column[row_idx])]
+            )
+        feature_rows.append(feature_row.SerializeToString())
+    return feature_rows
+
+
+def _timestamps(count):
+    return pa.array(
+        [
+            datetime(2020, 1, 1, 12, 0, i, i * 1234, tzinfo=pytz.utc)
+            for i in range(count)
+        ],
+        type=pa.timestamp("us", tz="UTC"),
+    )
+
+
+@pytest.fixture
+def local_timezone(monkeypatch):
+    def set_local_timezone(name):
+        monkeypatch.setenv("TZ", name)
+        time.tzset()
+
+    yield set_local_timezone
+    monkeypatch.undo()
+    time.tzset()
+
+
+class TestEncoder:
+    def test_all_types_byte_identical(self):
+        table = pa.Table.from_pandas(dataframes.ALL_TYPES)
+        fields = {
+            name: dtype
+            for name, dtype in ALL_TYPES_FIELDS.items()
+            if name in table.column_names
+        }
+
+        assert encode_pa_table(
+            table, FEATURE_SET_REF, fields, INGESTION_ID
+        ) == _encode_row_by_row(table, FEATURE_SET_REF, fields, INGESTION_ID)
+
+    @pytest.mark.parametrize(
+        "dtype,values",
+        [
+            (ValueType.INT32, [0, -1, 2 ** 31 - 1, -(2 ** 31), None]),
+            (ValueType.INT64, [0, -1, 2 ** 63 - 1, -(2 ** 63), 300, None]),
+            (ValueType.FLOAT, [0.0, -1.5, 3.4e38, float("nan"), None]),
+            (ValueType.DOUBLE, [0.0, -1.5, 1e308, float("-inf"), None]),
+            (ValueType.BOOL, [True, False, None]),
+            (ValueType.STRING, ["", "ascii", "ünïcödé", "x" * 300, None]),
+            (ValueType.BYTES, [b"", b"\x00\xff", b"y" * 200, None]),
+            (ValueType.INT32_LIST, [[], [0, -1, 7], [2 ** 31 - 1], None]),
+            (ValueType.INT64_LIST, [[], [0, -(2 ** 63)], list(range(200)), None]),
+            (ValueType.FLOAT_LIST, [[], [1.5, -2.25], [0.0] * 40, None]),
+            (ValueType.DOUBLE_LIST, [[], [1e-300, -2.25], None]),
+            (ValueType.BOOL_LIST, [[], [True, False, True], None]),
+            (ValueType.STRING_LIST, [[], ["", "a", "ü" * 100], None]),
+            (ValueType.BYTES_LIST, [[], [b"", b"\x01\x02"], None]),
+        ],
+    )
+    def test_single_type_byte_identical(self, dtype, values):
+        arrow_type = {
+            ValueType.INT32: pa.int32(),
+            ValueType.FLOAT: pa.float32(),
+            ValueType.INT32_LIST: pa.list_(pa.int32()),
+            ValueType.FLOAT_LIST: pa.list_(pa.float32()),
+        }.get(dtype)
+        table = pa.Table.from_arrays(
+            [_timestamps(len(values)), pa.array(values, type=arrow_type)],
+            names=[DATETIME_COLUMN, "feature"],
+        )
+        fields = {"feature": dtype}
+
+        assert encode_pa_table(
+            table, FEATURE_SET_REF, fields, INGESTION_ID
+        ) == _encode_row_by_row(table, FEATURE_SET_REF, fields, INGESTION_ID)
+
+    def test_sliced_and_chunked_columns(self):
+        values = pa.array([[1, 2], None, [3], [], [4, 5, 6]], type=pa.list_(pa.int64()))
+        strings = pa.array(["a", None, "bc", "", "def"])
+        table = pa.Table.from_arrays(
+            [
+                pa.chunked_array([_timestamps(5)[:2], _timestamps(5)[2:]]),
+                pa.chunked_array([values[:1], values[1:4], values[4:]]),
+                pa.chunked_array([strings[1:3], strings[3:], strings[:1]]),
+            ],
+            names=[DATETIME_COLUMN, "list_feature", "string_feature"],
+        )
+        fields = {
+            "list_feature": ValueType.INT64_LIST,
+            "string_feature": ValueType.STRING,
+        }
+
+        assert encode_pa_table(
+            table, FEATURE_SET_REF, fields, INGESTION_ID
+        ) == _encode_row_by_row(table, FEATURE_SET_REF, fields, INGESTION_ID)
+
+    def test_column_cast_to_field_type(self):
+        table = pa.Table.from_arrays(
+            [_timestamps(3), pa.array([1, -2, 3], type=pa.int64())],
+            names=[DATETIME_COLUMN, "feature"],
+        )
+        encoded = encode_pa_table(
+            table, FEATURE_SET_REF, {"feature": ValueType.INT32}, INGESTION_ID
+        )
+
+        assert [
+            FeatureRow.FromString(row).fields[0].value.int32_val for row in encoded
+        ] == [1, -2, 3]
+
+    def test_empty_table(self):
+        table = pa.Table.from_arrays(
+            [_timestamps(0), pa.array([], type=pa.int64())],
+            names=[DATETIME_COLUMN, "feature"],
+        )
+
+        assert (
+            encode_pa_table(
+                table, FEATURE_SET_REF, {"feature": ValueType.INT64}, INGESTION_ID
+            )
+            == []
+        )
+
+
+class TestTimestampBuffers:
+    @pytest.mark.parametrize("tz", [None, "UTC", "Asia/Jakarta"])
+    @pytest.mark.parametrize(
+        "unit,values",
+        [
+            ("s", [-2, 0, 1_577_880_000]),
+            ("ms", [-1_501, 0, 1_577_880_000_123]),
+            ("us", [-1_500_001, 0, 1_577_880_000_123_456]),
+            ("ns", [-1_500_000_600, 0, 1_577_880_000_123_456_789]),
+        ],
+    )
+    def test_time_units_and_zones(self, unit, values, tz, local_timezone):
+        # Timestamps without a time zone are in the local time zone
+        local_timezone("UTC")
+        column = pa.chunked_array(
+            [
+                pa.array(values[:1], type=pa.timestamp(unit, tz=tz)),
+                pa.array(values[1:], type=pa.timestamp(unit, tz=tz)),
+            ]
+        )
+
+        seconds, nanos = pa_column_to_timestamp_buffers(column)
+
+        # Nanoseconds are rounded to the nearest microsecond
+        expected = {
+            "s": [(-2, 0), (0, 0), (1_577_880_000, 0)],
+            "ms": [(-2, 499_000_000), (0, 0), (1_577_880_000, 123_000_000)],
+            "us": [(-2, 499_999_000), (0, 0), (1_577_880_000, 123_456_000)],
+            "ns": [(-2, 499_999_000), (0, 0), (1_577_880_000, 123_457_000)],
+        }[unit]
+        assert list(zip(seconds.tolist(), nanos.tolist())) == expected
+        assert [
+            (ts.seconds, ts.nanos) for ts in pa_column_to_timestamp_proto_column(column)
+        ] == expected
+
+    @pytest.mark.parametrize("unit", ["s", "us", "ns"])
+    def test_naive_timestamps_are_local(self, unit, local_timezone):
+        local_timezone("America/New_York")
+        values = [
+            datetime(2020, 1, 1),
+            datetime(2020, 7, 1, 12, 30),
+            # Skipped and repeated by daylight saving time transitions
+            datetime(2020, 3, 8, 2, 30),
+            datetime(2020, 11, 1, 1, 30),
+        ]
+        column = pa.chunked_array([pa.array(values, type=pa.timestamp(unit))])
+
+        seconds, nanos = pa_column_to_timestamp_buffers(column)
+
+        assert seconds[0] == 1_577_854_800
+        assert seconds.tolist() == [int(value.timestamp()) for value in values]
+        assert nanos.tolist() == [0, 0, 0, 0]
+
+    def test_same_as_python_datetimes(self):
+        column = _timestamps(60)
+
+        seconds, nanos = pa_column_to_timestamp_buffers(column)
+
+        expected = [int(value.as_py().timestamp() * 1_000_000) for value in column]
+        assert (seconds * 1_000_000 + nanos // 1000).tolist() == expected
+
+    def test_null_timestamps(self):
+        with pytest.raises(ValueError, match="null"):
+            pa_column_to_timestamp_buffers(
+                pa.chunked_array([pa.array([0, None], type=pa.timestamp("us"))])
+            )
@@ -16,13 +16,17 @@ from concurrent import futures
 from datetime import datetime
 
 import grpc
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 import pytz
 from google.protobuf import json_format
 
 import dataframes
 import feast.core.CoreService_pb2_grpc as Core
+import feast.feature_set
 from feast.client import Client
 from feast.entity import Entity
 from feast.feature_set import (
@@ -176,6 +180,143 @@ class TestFeatureSet:
         assert len(my_feature_set.features) == feature_count
         assert len(my_feature_set.entities) == entity_count
 
+    def test_infer_fields_from_df_types(self):
+        rows = 200
+        df = pd.DataFrame(
+            {
+                "datetime": pd.date_range("2020-01-01", periods=rows, tz="UTC"),
+                "int32": np.arange(rows, dtype=np.int32),
+                "uint8": np.arange(rows, dtype=np.uint8),
+                "float32": np.ones(rows, dtype=np.float32),
+                "bool": np.arange(rows) % 2 == 0,
+                "string": ["a"] * rows,
+                "bytes": [b"a"] * rows,
+                "embedding": [np.ones(4, dtype=np.float32)] * rows,
+                "ids": [np.arange(2, dtype=np.int32)] * rows,
+                "names": [np.array(["a", "b"])] * rows,
+            }
+        )
+        feature_set = FeatureSet("my_feature_set")
+
+        feature_set.infer_fields_from_df(df)
+
+        # Pandas iterates over the values of numeric columns as Python values
+        assert {name: field.dtype for name, field in feature_set.fields.items()} == {
+            "int32": ValueType.INT64,
+            "uint8": ValueType.INT64,
+            "float32": ValueType.DOUBLE,
+            "bool": ValueType.BOOL,
+            "string": ValueType.STRING,
+            "bytes": ValueType.BYTES,
+            "embedding": ValueType.DOUBLE_LIST,
+            "ids": ValueType.INT64_LIST,
+            "names": ValueType.STRING_LIST,
+        }
+
+    def test_infer_fields_from_df_samples_object_columns(self, mocker):
+        df = pd.DataFrame(
+            {
+                "datetime": pd.date_range("2020-01-01", periods=100, tz="UTC"),
+                "rating": np.ones(100),
+                "city": ["jakarta"] * 10 + [1] * 90,
+            }
+        )
+        infer = mocker.spy(feast.feature_set, "python_type_to_feast_value_type")
+        feature_set = FeatureSet("my_feature_set")
+
+        feature_set.infer_fields_from_df(df, rows_to_sample=10)
+
+        assert feature_set.fields["city"].dtype == ValueType.STRING
+        assert infer.call_count == 10
+
+    def test_infer_fields_from_parquet(self, tmp_path, mocker):
+        rows = 10
+        table = pa.table(
+            {
+                "datetime": pa.array(
+                    pd.date_range("2020-01-01", periods=rows, tz="UTC")
+                ),
+                "driver_id": pa.array(np.arange(rows)),
+                "rating": pa.array(np.ones(rows, dtype=np.float32)),
+                "city": pa.array(["jakarta"] * rows),
+                "embedding": pa.array([[1.5, 2.5]] * rows),
+            }
+        )
+        path = str(tmp_path / "driver.parquet")
+        pq.write_table(table, path, row_group_size=2)
+        read_row_group = mocker.spy(pq.ParquetFile, "read_row_group")
+        feature_set = FeatureSet("my_feature_set")
+
+        feature_set.infer_fields_from_parquet(
+            path, entities=[Entity(name="driver_id", dtype=ValueType.INT64)]
+        )
+
+        assert {name: field.dtype for name, field in feature_set.fields.items()} == {
+            "driver_id": ValueType.INT64,
+            "rating": ValueType.FLOAT,
+            "city": ValueType.STRING,
+            "embedding": ValueType.DOUBLE_LIST,
+        }
+        assert [entity.name for entity in feature_set.entities] == ["driver_id"]
+        assert read_row_group.call_count == 0
+
+        # Same fields as inferred from the table itself
+        from_table = FeatureSet("my_feature_set")
+        from_table.infer_fields_from_pa(
+            pq.read_table(path),
+            entities=[Entity(name="driver_id", dtype=ValueType.INT64)],
+        )
+        assert from_table.fields == feature_set.fields
+
+    def test_infer_fields_from_parquet_dataset(self, tmp_path):
+        timestamps = pa.array(pd.date_range("2020-01-01", periods=2, tz="UTC"))
+        pq.write_table(
+            pa.table({"datetime": timestamps, "rating": pa.array([1.5, 2.5])}),
+            str(tmp_path / "part-0.parquet"),
+        )
+        pq.write_table(
+            pa.table({"datetime": timestamps, "trips": pa.array([1, 2])}),
+            str(tmp_path / "part-1.parquet"),
+        )
+        paths = [str(tmp_path / "part-0.parquet"), str(tmp_path / "part-1.parquet")]
+
+        for path in [str(tmp_path), paths]:
+            feature_set = FeatureSet("my_feature_set")
+            feature_set.infer_fields_from_parquet(path)
+
+            assert {
+                name: field.dtype for name, field in feature_set.fields.items()
+            } == {"rating": ValueType.DOUBLE, "trips": ValueType.INT64}
+
+        pq.write_table(
+            pa.table({"datetime": timestamps, "trips": pa.array(["1", "2"])}),
+            str(tmp_path / "part-2.parquet"),
+        )
+        with pytest.raises(pa.ArrowInvalid):
+            FeatureSet("my_feature_set").infer_fields_from_parquet(str(tmp_path))
+
+    def test_infer_fields_from_pa_schema(self):
+        schema = pa.schema(
+            [
+                ("datetime", pa.timestamp("ns", tz="UTC")),
+                ("trips", pa.int32()),
+                ("names", pa.list_(pa.field("element", pa.string()))),
+            ]
+        )
+        feature_set = FeatureSet("my_feature_set")
+
+        feature_set.infer_fields_from_pa_schema(schema)
+
+        assert {name: field.dtype for name, field in feature_set.fields.items()} == {
+            "trips": ValueType.INT32,
+            "names": ValueType.STRING_LIST,
+        }
+
+        with pytest.raises(Exception, match="datetime"):
+            feature_set.infer_fields_from_pa_schema(
+                pa.schema([("datetime", pa.int64()), ("trips", pa.int32())])
+            )
+
     def test_import_tfx_schema(self):
         tests_folder = pathlib.Path(__file__).parent
         test_input_schema_json = open(
@@ -247,6 +388,52 @@ class TestFeatureSet:
         for actual, expected in zip(actual_schema.feature, expected_schema.feature):
             assert actual.SerializeToString() == expected.SerializeToString()
 
+    def test_from_proto_builds_fields_on_access(self, mocker):
+        feature_set = FeatureSet(
+            name="driver",
+            project="project",
+            entities=[Entity(name="driver_id", dtype=ValueType.INT64)],
+            features=[
+                Feature(name="rating", dtype=ValueType.FLOAT),
+                Feature(name="city", dtype=ValueType.STRING),
+            ],
+        )
+        feature_set.features[0].float_domain = schema_pb2.FloatDomain(min=1, max=5)
+        proto = feature_set.to_proto()
+        from_proto = mocker.spy(Feature, "from_proto")
+
+        lazy = FeatureSet.from_proto(proto)
+
+        assert lazy.to_proto().spec.features == proto.spec.features
+        assert from_proto.call_count == 0
+        assert lazy.fields == feature_set.fields
+        assert [feature.name for feature in lazy.features] == ["rating", "city"]
+        assert lazy.features[0].float_domain.max == 5
+        assert from_proto.call_count == 2
+        assert lazy.to_proto().spec.features == proto.spec.features
+        assert lazy.to_proto().spec.entities == proto.spec.entities
+
+    def test_from_proto_does_not_share_proto(self):
+        feature_set = FeatureSet(
+            name="driver",
+            entities=[Entity(name="driver_id", dtype=ValueType.INT64)],
+            features=[Feature(name="rating", dtype=ValueType.FLOAT)],
+        )
+        proto = feature_set.to_proto()
+
+        lazy = FeatureSet.from_proto(proto)
+        proto.spec.features[0].name = "renamed"
+        lazy.add(Feature(name="city", dtype=ValueType.STRING))
+
+        assert [feature.name for feature in lazy.features] == ["rating", "city"]
+        assert len(lazy.to_proto().spec.features) == 2
+
+    def test_fields_have_no_dict(self):
+        with pytest.raises(AttributeError):
+            Feature(name="rating", dtype=ValueType.FLOAT).rating = 5
+        with pytest.raises(AttributeError):
+            Entity(name="driver_id", dtype=ValueType.INT64).__dict__
+
 
 def make_tfx_schema_domain_info_inline(schema):
     # Copy top-level domain info defined in the schema to inline definition.
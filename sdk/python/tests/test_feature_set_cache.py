@@ -0,0 +1,162 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+import pytest
+
+from feast.core.FeatureSet_pb2 import FeatureSet as FeatureSetProto
+from feast.core.FeatureSet_pb2 import FeatureSetMeta as FeatureSetMetaProto
+from feast.core.FeatureSet_pb2 import FeatureSetSpec as FeatureSetSpecProto
+from feast.core.FeatureSet_pb2 import FeatureSetStatus
+from feast.core.FeatureSet_pb2 import FeatureSpec as FeatureSpecProto
+from feast.feature_set import FeatureSetRef
+from feast.feature_set_cache import FeatureSetCache
+from feast.types.Value_pb2 import ValueType as ValueTypeProto
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _proto(name, version, project="project", status=FeatureSetStatus.STATUS_READY):
+    return FeatureSetProto(
+        spec=FeatureSetSpecProto(
+            project=project,
+            name=name,
+            version=version,
+            features=[
+                FeatureSpecProto(name="feature", value_type=ValueTypeProto.FLOAT)
+            ],
+        ),
+        meta=FeatureSetMetaProto(status=status),
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return FeatureSetCache(ttl=10, clock=clock)
+
+
+class TestFeatureSetCache:
+    def test_get_until_expired(self, cache, clock):
+        feature_set = cache.put(_proto("driver", 2), latest=True)
+
+        assert cache.get(FeatureSetRef("project", "driver", 2)) == feature_set
+        assert cache.get(FeatureSetRef("project", "driver")) == feature_set
+        assert cache.get(FeatureSetRef("project", "driver", 1)) is None
+        clock.now = 10
+        assert cache.get(FeatureSetRef("project", "driver", 2)) is None
+        assert (cache.stats.hits, cache.stats.misses) == (2, 2)
+        assert cache.stats.expirations == 1
+
+    def test_only_ready_feature_sets_are_cached(self, cache):
+        proto = _proto("driver", 1, status=FeatureSetStatus.STATUS_PENDING)
+
+        assert cache.put(proto).status == FeatureSetStatus.STATUS_PENDING
+        assert len(cache) == 0
+        cache.put_listing(("project", "*", "*"), [_proto("customer", 1), proto])
+        assert cache.get_listing(("project", "*", "*")) is None
+
+    def test_lookups_return_new_feature_sets(self, cache):
+        proto = _proto("driver", 1)
+        cache.put(proto, latest=True)
+        cache.put_listing(("project", "*", "*"), [proto])
+        proto.spec.features[0].name = "renamed"
+
+        feature_set = cache.get(FeatureSetRef("project", "driver", 1))
+        feature_set.drop("feature")
+        feature_set.max_age.seconds = 10
+        cache.get_listing(("project", "*", "*"))[0].drop("feature")
+
+        for feature_set in [
+            cache.get(FeatureSetRef("project", "driver", 1)),
+            cache.get(FeatureSetRef("project", "driver")),
+            cache.get_listing(("project", "*", "*"))[0],
+        ]:
+            assert list(feature_set.fields) == ["feature"]
+            assert feature_set.max_age.seconds == 0
+
+    def test_listing(self, cache, clock):
+        listing = cache.put_listing(
+            ("project", "*", "*"), [_proto("driver", 1), _proto("customer", 1)]
+        )
+
+        assert cache.get_listing(("project", "*", "*")) == listing
+        assert cache.get_listing(("project", "driver", "*")) is None
+        clock.now = 10
+        assert cache.get_listing(("project", "*", "*")) is None
+
+    def test_invalidate(self, cache):
+        cache.put(_proto("driver", 1), latest=True)
+        cache.put(_proto("customer", 1))
+        cache.put(_proto("driver", 1, project="other"))
+        cache.put_listing(("project", "*", "*"), [_proto("customer", 1)])
+
+        cache.invalidate("project", "driver")
+
+        assert cache.get(FeatureSetRef("project", "driver", 1)) is None
+        assert cache.get(FeatureSetRef("project", "driver")) is None
+        assert cache.get(FeatureSetRef("project", "customer", 1)) is not None
+        assert cache.get(FeatureSetRef("other", "driver", 1)) is not None
+        assert cache.get_listing(("project", "*", "*")) is None
+        cache.invalidate()
+        assert len(cache) == 0
+
+    def test_refresh(self, cache, clock):
+        cache.put(_proto("driver", 1), latest=True)
+        cache.put(_proto("customer", 1))
+        cache.put_listing(("project", "driver", "*"), [_proto("driver", 1)])
+        changed = _proto("customer", 1)
+        changed.spec.features[0].name = "renamed"
+        listed = []
+
+        def list_feature_sets(listing_filter):
+            listed.append(listing_filter)
+            return [_proto("driver", 1), _proto("driver", 2), changed]
+
+        clock.now = 5
+        assert cache.refresh(list_feature_sets) == 1
+
+        assert listed == [("project", "*", "*")]
+        clock.now = 14
+        assert cache.get(FeatureSetRef("project", "driver", 1)) is not None
+        customer = cache.get(FeatureSetRef("project", "customer", 1))
+        assert list(customer.fields) == ["renamed"]
+        assert cache.get(FeatureSetRef("project", "driver")).version == 2
+        listing = cache.get_listing(("project", "driver", "*"))
+        assert [feature_set.version for feature_set in listing] == [1, 2]
+
+    def test_refresher(self, cache):
+        refreshed = threading.Event()
+        cache.put(_proto("driver", 1))
+
+        def list_feature_sets(listing_filter):
+            refreshed.set()
+            return [_proto("driver", 1)]
+
+        cache.start_refresher(list_feature_sets, interval=0.01)
+        try:
+            assert refreshed.wait(10)
+        finally:
+            cache.stop_refresher()
+        assert cache.get(FeatureSetRef("project", "driver", 1)) is not None
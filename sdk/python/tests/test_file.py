@@ -0,0 +1,99 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from datetime import datetime
+from urllib.parse import urlparse
+
+import fastavro
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+import feast.loaders.file
+from feast.loaders.file import export_source_to_staging_location
+
+
+@pytest.fixture
+def entity_rows():
+    return pd.DataFrame(
+        {
+            "datetime": [
+                datetime(2020, 1, 1, tzinfo=pytz.utc) + pd.Timedelta(seconds=i)
+                for i in range(10)
+            ],
+            "customer_id": np.arange(10, dtype=np.int64),
+            # Only the second half of the rows has a value
+            "country": [None] * 5 + ["SG"] * 5,
+        }
+    )
+
+
+def _read_avro(uris):
+    records = []
+    for uri in uris:
+        with open(urlparse(uri).path, "rb") as file:
+            records.extend(fastavro.reader(file))
+    return records
+
+
+class TestExportSourceToStagingLocation:
+    def test_shards_dataframe(self, entity_rows, tmp_path):
+        staging_location = f"file://{tmp_path}/"
+
+        uris = export_source_to_staging_location(
+            entity_rows, staging_location, num_shards=3, max_workers=2
+        )
+
+        assert len(uris) == 3
+        assert all(uri.startswith(staging_location) for uri in uris)
+        records = _read_avro(uris)
+        assert [record["customer_id"] for record in records] == list(range(10))
+        assert [record["country"] for record in records] == [None] * 5 + ["SG"] * 5
+        assert records[0]["event_timestamp"] == entity_rows["datetime"][0]
+        # The DataFrame of the caller is left unchanged
+        assert list(entity_rows.columns) == ["datetime", "customer_id", "country"]
+
+    def test_small_dataframe_is_one_file(self, entity_rows, tmp_path):
+        uris = export_source_to_staging_location(entity_rows, f"file://{tmp_path}/")
+
+        assert len(uris) == 1
+        assert len(_read_avro(uris)) == 10
+
+    def test_uploads_shards_to_gcs(self, entity_rows, mocker):
+        uploads = []
+
+        def upload_file_to_gcs(local_path, bucket, remote_path):
+            assert os.path.exists(local_path)
+            uploads.append((bucket, remote_path))
+
+        mocker.patch.object(
+            feast.loaders.file, "upload_file_to_gcs", side_effect=upload_file_to_gcs
+        )
+
+        uris = export_source_to_staging_location(
+            entity_rows, "gs://bucket/staging/", num_shards=4
+        )
+
+        assert len(uris) == 4
+        assert sorted(uploads) == sorted(
+            ("bucket", urlparse(uri).path.lstrip("/")) for uri in uris
+        )
+
+    def test_at_most_one_shard_per_row(self, entity_rows, tmp_path):
+        uris = export_source_to_staging_location(
+            entity_rows.head(2), f"file://{tmp_path}/", num_shards=8
+        )
+
+        assert len(uris) == 2
@@ -0,0 +1,156 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import time
+
+import pytest
+
+import feast.job
+from feast.core.CoreService_pb2 import ListIngestionJobsResponse
+from feast.core.IngestionJob_pb2 import IngestionJob as IngestJobProto
+from feast.core.IngestionJob_pb2 import IngestionJobStatus
+from feast.job import IngestJob, RetrievalJob, as_completed, wait_all
+from feast.loaders.retrieval import LocalStorageClient
+from feast.serving.ServingService_pb2 import (
+    DATA_FORMAT_AVRO,
+    JOB_STATUS_DONE,
+    JOB_STATUS_RUNNING,
+    GetJobResponse,
+)
+from feast.serving.ServingService_pb2 import Job as JobProto
+
+
+class FakeServing:
+    """
+    Serving stub whose jobs are done after a number of GetJob calls.
+    """
+
+    def __init__(self, polls_until_done):
+        self.polls_until_done = polls_until_done
+        self.polls = {job_id: 0 for job_id in polls_until_done}
+
+    def GetJob(self, request):
+        job_id = request.job.id
+        self.polls[job_id] += 1
+        done = self.polls[job_id] >= self.polls_until_done[job_id]
+        return GetJobResponse(
+            job=JobProto(
+                id=job_id,
+                status=JOB_STATUS_DONE if done else JOB_STATUS_RUNNING,
+                data_format=DATA_FORMAT_AVRO,
+            )
+        )
+
+
+class FakeCore:
+    """
+    Core stub whose ingestion jobs are running after a number of
+    ListIngestionJobs calls.
+    """
+
+    def __init__(self, polls_until_running):
+        self.polls_until_running = polls_until_running
+        self.polls = 0
+
+    def ListIngestionJobs(self, request):
+        self.polls += 1
+        running = self.polls >= self.polls_until_running
+        status = IngestionJobStatus.RUNNING if running else IngestionJobStatus.PENDING
+        return ListIngestionJobsResponse(
+            jobs=[IngestJobProto(id=request.filter.id, status=status)]
+        )
+
+
+def _retrieval_jobs(polls_until_done):
+    serving = FakeServing(polls_until_done)
+    return [
+        RetrievalJob(
+            JobProto(id=job_id, status=JOB_STATUS_RUNNING),
+            serving,
+            storage_client=LocalStorageClient(""),
+        )
+        for job_id in polls_until_done
+    ]
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(feast.job, "MIN_WAIT_INTERVAL_SEC", 0.001)
+
+
+class TestWait:
+    def test_wait_all(self):
+        jobs = _retrieval_jobs({"slow": 6, "fast": 2, "done": 1})
+        done = []
+
+        result = wait_all(
+            jobs, timeout_sec=10, callback=done.append, min_interval_sec=0
+        )
+
+        assert result == jobs
+        assert [job.id for job in done] == ["done", "fast", "slow"]
+        assert all(job.status == JOB_STATUS_DONE for job in jobs)
+        assert jobs[0].serving_stub.polls == {"slow": 6, "fast": 2, "done": 1}
+
+    def test_as_completed_timeout(self):
+        jobs = _retrieval_jobs({"done": 1, "never": 10 ** 9})
+
+        completed = as_completed(jobs, timeout_sec=0.05, min_interval_sec=0.01)
+
+        assert next(completed).id == "done"
+        with pytest.raises(TimeoutError, match="never"):
+            next(completed)
+
+    def test_polling_backs_off(self):
+        (job,) = _retrieval_jobs({"job": 10 ** 9})
+        start = time.monotonic()
+
+        with pytest.raises(TimeoutError):
+            wait_all([job], timeout_sec=0.3, min_interval_sec=0.05)
+
+        # Intervals of at least 40ms, jittered by up to 20%
+        assert time.monotonic() - start >= 0.3
+        assert 2 <= job.serving_stub.polls["job"] <= 9
+
+    def test_retrieval_job_wait_async(self):
+        jobs = _retrieval_jobs({"first": 3, "second": 2})
+
+        async def wait():
+            return await asyncio.gather(*(job.wait_async(10) for job in jobs))
+
+        assert asyncio.run(wait()) == jobs
+        assert all(job.status == JOB_STATUS_DONE for job in jobs)
+
+    def test_retrieval_job_wait_async_timeout(self):
+        (job,) = _retrieval_jobs({"job": 10 ** 9})
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(job.wait_async(0.05))
+
+    def test_get_avro_files_timeout(self):
+        (job,) = _retrieval_jobs({"job": 10 ** 9})
+
+        with pytest.raises(Exception, match="Timeout exceeded while waiting"):
+            job.get_avro_files(timeout_sec=0.05)
+
+    def test_ingest_job_wait(self):
+        core = FakeCore(polls_until_running=3)
+        job = IngestJob(IngestJobProto(id="ingest"), core)
+
+        job.wait(IngestionJobStatus.RUNNING, timeout_secs=10)
+
+        assert core.polls == 3
+        assert asyncio.run(job.wait_async(IngestionJobStatus.RUNNING, 10)) is job
+        with pytest.raises(TimeoutError, match="timed out"):
+            job.wait(IngestionJobStatus.ABORTED, timeout_secs=0.05)
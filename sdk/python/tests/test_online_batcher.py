@@ -0,0 +1,122 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from feast.online_batcher import OnlineRequestBatcher
+from feast.serving.ServingService_pb2 import (
+    FeatureReference,
+    GetOnlineFeaturesRequest,
+)
+from feast.types import Value_pb2 as ValueProto
+from feast_serving_server import ServingServicer
+
+FEATURES = [FeatureReference(project="project", name="feature_1")]
+
+
+def _entity_row(customer_id):
+    return GetOnlineFeaturesRequest.EntityRow(
+        fields={"customer_id": ValueProto.Value(int64_val=customer_id)}
+    )
+
+
+class RecordingServing:
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, features, entity_rows):
+        request = GetOnlineFeaturesRequest(features=features, entity_rows=entity_rows)
+        self.requests.append(request)
+        # Feast Serving does not keep the order of entity rows
+        request.entity_rows.reverse()
+        return ServingServicer().GetOnlineFeatures(request, None)
+
+
+def _get_concurrently(batcher, entity_rows_per_call):
+    barrier = threading.Barrier(len(entity_rows_per_call))
+
+    def get_online_features(entity_rows):
+        barrier.wait()
+        return batcher.get_online_features(FEATURES, entity_rows)
+
+    with ThreadPoolExecutor(len(entity_rows_per_call)) as executor:
+        return list(executor.map(get_online_features, entity_rows_per_call))
+
+
+def _customer_ids(response):
+    return [
+        field_values.fields["customer_id"].int64_val
+        for field_values in response.field_values
+    ]
+
+
+class TestOnlineRequestBatcher:
+    def test_coalesces_concurrent_requests(self):
+        serving = RecordingServing()
+        batcher = OnlineRequestBatcher(serving, max_wait_seconds=5, max_batch_size=10)
+        entity_rows_per_call = [
+            [_entity_row(customer_id)] for customer_id in range(7)
+        ] + [[_entity_row(8), _entity_row(7), _entity_row(8)]]
+
+        responses = _get_concurrently(batcher, entity_rows_per_call)
+
+        # The batch is sent as soon as it holds max_batch_size entity rows
+        assert len(serving.requests) == 1
+        assert (batcher.requests, batcher.batches) == (8, 1)
+        # Duplicate entity rows are only requested once
+        assert len(serving.requests[0].entity_rows) == 9
+        for entity_rows, response in zip(entity_rows_per_call, responses):
+            assert _customer_ids(response) == [
+                row.fields["customer_id"].int64_val for row in entity_rows
+            ]
+            for field_values in response.field_values:
+                assert "project/feature_1" in field_values.fields
+
+    def test_sends_after_max_wait(self):
+        serving = RecordingServing()
+        batcher = OnlineRequestBatcher(serving, max_wait_seconds=0.01)
+
+        response = batcher.get_online_features(FEATURES, [_entity_row(1)])
+
+        assert _customer_ids(response) == [1]
+        assert len(serving.requests) == 1
+
+    def test_max_batch_size(self):
+        serving = RecordingServing()
+        batcher = OnlineRequestBatcher(serving, max_wait_seconds=5, max_batch_size=1)
+
+        _get_concurrently(batcher, [[_entity_row(i)] for i in range(4)])
+
+        assert len(serving.requests) == 4
+        assert batcher.batches == 4
+
+    def test_error_is_raised_to_every_caller(self):
+        barrier = threading.Barrier(3)
+
+        def send(features, entity_rows):
+            raise ValueError("Serving failed")
+
+        batcher = OnlineRequestBatcher(send, max_wait_seconds=5, max_batch_size=3)
+
+        def get_online_features(customer_id):
+            barrier.wait()
+            with pytest.raises(ValueError, match="Serving failed"):
+                batcher.get_online_features(FEATURES, [_entity_row(customer_id)])
+
+        with ThreadPoolExecutor(3) as executor:
+            list(executor.map(get_online_features, range(3)))
+
+        assert batcher.batches == 1
@@ -0,0 +1,113 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+from google.protobuf.duration_pb2 import Duration
+
+from feast.online_cache import OnlineFeatureCache, entity_key, feature_ref_string
+from feast.serving.ServingService_pb2 import FeatureReference
+from feast.types import Value_pb2 as ValueProto
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _key(feature_ref, customer_id):
+    return (
+        feature_ref,
+        entity_key({"customer_id": ValueProto.Value(int64_val=customer_id)}),
+    )
+
+
+class TestOnlineFeatureCache:
+    def test_expires_after_feature_ttl(self):
+        clock = FakeClock()
+        cache = OnlineFeatureCache(default_ttl=10, clock=clock)
+        cache.set_feature_ttl("project/short_lived", 1)
+        value = ValueProto.Value(int64_val=1)
+        cache.put(_key("project/short_lived", 1), value)
+        cache.put(_key("project/long_lived", 1), value)
+
+        clock.now = 5
+        assert cache.get(_key("project/short_lived", 1)) is None
+        assert cache.get(_key("project/long_lived", 1)) == value
+        clock.now = 10
+        assert cache.get(_key("project/long_lived", 1)) is None
+
+        assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+        assert cache.stats.expirations == 2
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = OnlineFeatureCache(max_entries=2)
+        for customer_id in range(2):
+            cache.put(
+                _key("project/feature", customer_id),
+                ValueProto.Value(int64_val=customer_id),
+            )
+        cache.get(_key("project/feature", 0))
+        cache.put(_key("project/feature", 2), ValueProto.Value(int64_val=2))
+
+        assert cache.get(_key("project/feature", 1)) is None
+        assert cache.get(_key("project/feature", 0)).int64_val == 0
+        assert cache.get(_key("project/feature", 2)).int64_val == 2
+        assert cache.stats.evictions == 1
+        assert len(cache) == 2
+
+    def test_zero_ttl_disables_caching(self):
+        cache = OnlineFeatureCache()
+        cache.set_feature_ttl("project/feature", 0)
+        cache.put(_key("project/feature", 1), ValueProto.Value(int64_val=1))
+
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize(
+        "ttls,max_age,expected",
+        [
+            ({}, None, 60),
+            ({}, Duration(), 60),
+            ({}, Duration(seconds=30, nanos=500000000), 30.5),
+            ({"project/driver": 5}, Duration(seconds=30), 5),
+            ({"project/customer": 5}, Duration(seconds=30), 30),
+        ],
+    )
+    def test_feature_set_ttl(self, ttls, max_age, expected):
+        cache = OnlineFeatureCache(default_ttl=60, ttls=ttls)
+
+        assert cache.feature_set_ttl("project", "driver", max_age) == expected
+
+    def test_entity_key_ignores_field_order_and_features(self):
+        first = {
+            "driver_id": ValueProto.Value(int64_val=1),
+            "customer_id": ValueProto.Value(string_val="a"),
+        }
+        second = {
+            "customer_id": ValueProto.Value(string_val="a"),
+            "project/feature": ValueProto.Value(float_val=1.0),
+            "driver_id": ValueProto.Value(int64_val=1),
+        }
+
+        assert entity_key(first) == entity_key(second, {"driver_id", "customer_id"})
+        assert entity_key(first) != entity_key(second)
+
+    def test_feature_ref_string(self):
+        assert (
+            feature_ref_string(FeatureReference(project="p", name="f", version=2))
+            == "p/f:2"
+        )
+        assert feature_ref_string(FeatureReference(project="p", name="f")) == "p/f"
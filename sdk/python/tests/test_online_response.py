@@ -0,0 +1,203 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from feast.online_response import to_arrow, to_dataframe, to_numpy
+from feast.serving.ServingService_pb2 import GetOnlineFeaturesResponse
+from feast.types import Value_pb2 as ValueProto
+
+VALUES = {
+    "int32": [ValueProto.Value(int32_val=v) for v in [1, -2, 2 ** 31 - 1, 0]],
+    "int64": [ValueProto.Value(int64_val=v) for v in [1, -(2 ** 40), 300, 0]],
+    "float": [ValueProto.Value(float_val=v) for v in [1.5, -2.25, 0, 3]],
+    "double": [ValueProto.Value(double_val=v) for v in [1.5, -2.25, 0, 1e300]],
+    "bool": [ValueProto.Value(bool_val=v) for v in [True, False, True, False]],
+    "string": [ValueProto.Value(string_val=v) for v in ["a", "", "ü" * 100, "d"]],
+    "bytes": [ValueProto.Value(bytes_val=v) for v in [b"a", b"\x00", b"", b"d"]],
+    "int32_list": [
+        ValueProto.Value(int32_list_val=ValueProto.Int32List(val=v))
+        for v in [[1, -2], [], [3] * 100, [0]]
+    ],
+    "int64_list": [
+        ValueProto.Value(int64_list_val=ValueProto.Int64List(val=v))
+        for v in [[1, -(2 ** 40)], [], [2 ** 62], [0, 0]]
+    ],
+    "float_list": [
+        ValueProto.Value(float_list_val=ValueProto.FloatList(val=v))
+        for v in [[1.5, -2.5], [], [0.25] * 50, [3]]
+    ],
+    "double_list": [
+        ValueProto.Value(double_list_val=ValueProto.DoubleList(val=v))
+        for v in [[1.5], [], [0.25] * 50, [-3, 3]]
+    ],
+    "bool_list": [
+        ValueProto.Value(bool_list_val=ValueProto.BoolList(val=v))
+        for v in [[True, False], [], [True], [False]]
+    ],
+    "string_list": [
+        ValueProto.Value(string_list_val=ValueProto.StringList(val=v))
+        for v in [["a", "b"], [], ["c"], [""]]
+    ],
+    "bytes_list": [
+        ValueProto.Value(bytes_list_val=ValueProto.BytesList(val=v))
+        for v in [[b"a"], [], [b"c", b"d"], [b""]]
+    ],
+}
+
+
+def _response(fields_per_row):
+    response = GetOnlineFeaturesResponse()
+    for fields in fields_per_row:
+        response.field_values.add(fields=fields)
+    return response
+
+
+def _expected(values):
+    """
+    Decodes a column of Value messages one by one
+    """
+    python_values = []
+    for value in values:
+        value_field = value.WhichOneof("val")
+        if value_field is None:
+            python_values.append(None)
+        elif value_field.endswith("_list_val"):
+            python_values.append(list(getattr(value, value_field).val))
+        else:
+            python_values.append(getattr(value, value_field))
+    return python_values
+
+
+def _column_values(column):
+    if column.offsets is None:
+        return [
+            value if valid else None
+            for value, valid in zip(column.values.tolist(), column.validity)
+        ]
+    return [
+        column.values[start:end].tolist() if valid else None
+        for start, end, valid in zip(
+            column.offsets[:-1], column.offsets[1:], column.validity
+        )
+    ]
+
+
+class TestOnlineResponse:
+    @pytest.mark.parametrize("value_type", list(VALUES))
+    def test_to_numpy_decodes_every_type(self, value_type):
+        # Interleave missing values with the values of the type, which are
+        # exactly representable as float32
+        values = []
+        for value in VALUES[value_type]:
+            values.extend([value, ValueProto.Value()])
+        response = _response(
+            [
+                {"entity": ValueProto.Value(int64_val=i), "project/feature": value}
+                for i, value in enumerate(values)
+            ]
+        )
+
+        column = to_numpy(response)["project/feature"]
+
+        assert column.value_field == f"{value_type}_val"
+        assert _column_values(column) == _expected(values)
+        assert column.to_arrow().to_pylist() == _expected(values)
+
+    def test_to_numpy_without_values(self):
+        response = _response(
+            [
+                {"project/feature": ValueProto.Value()},
+                {"project/feature_2": ValueProto.Value()},
+            ]
+        )
+
+        columns = to_numpy(response)
+
+        assert list(columns) == ["project/feature", "project/feature_2"]
+        for column in columns.values():
+            assert column.value_field is None
+            assert not column.validity.any()
+            assert column.to_arrow().to_pylist() == [None, None]
+
+    def test_to_numpy_with_fields(self):
+        response = _response(
+            [
+                {
+                    "entity": ValueProto.Value(int64_val=i),
+                    "project/feature": ValueProto.Value(double_val=i / 2),
+                    "project/other": ValueProto.Value(string_val="a"),
+                }
+                for i in range(3)
+            ]
+        )
+
+        columns = to_numpy(
+            response.SerializeToString(), ["project/feature", "entity", "missing"]
+        )
+
+        assert list(columns) == ["project/feature", "entity", "missing"]
+        assert columns["project/feature"].values.tolist() == [0, 0.5, 1]
+        assert columns["entity"].values.dtype == np.int64
+        assert columns["entity"].values.tolist() == [0, 1, 2]
+        assert not columns["missing"].validity.any()
+
+    def test_to_numpy_decodes_unpacked_lists(self):
+        # Lists may be serialized unpacked, with a tag for every element
+        unpacked = b"\x72\x04" + b"\x08\x05\x08\x06"
+        values = [
+            ValueProto.Value.FromString(unpacked),
+            ValueProto.Value(int64_list_val=ValueProto.Int64List(val=[7])),
+        ]
+        assert list(values[0].int64_list_val.val) == [5, 6]
+
+        column = to_numpy(_response([{"feature": value} for value in values]))[
+            "feature"
+        ]
+
+        assert _column_values(column) == [[5, 6], [7]]
+
+    def test_to_numpy_mixed_types(self):
+        response = _response(
+            [
+                {"project/feature": ValueProto.Value(int64_val=1)},
+                {"project/feature": ValueProto.Value(string_val="1")},
+            ]
+        )
+
+        with pytest.raises(ValueError, match="more than one type"):
+            to_numpy(response)
+
+    def test_to_arrow_and_to_dataframe(self):
+        response = _response(
+            [
+                {
+                    "entity": ValueProto.Value(int64_val=1),
+                    "project/feature": ValueProto.Value(
+                        float_list_val=ValueProto.FloatList(val=[1, 2])
+                    ),
+                },
+                {"entity": ValueProto.Value(int64_val=2)},
+            ]
+        )
+
+        table = to_arrow(response)
+        dataframe = to_dataframe(response)
+
+        assert table.schema.field("project/feature").type == pa.list_(pa.float32())
+        assert table.column("project/feature").to_pylist() == [[1, 2], None]
+        assert dataframe["entity"].tolist() == [1, 2]
+        assert dataframe["project/feature"][0].tolist() == [1, 2]
+        assert dataframe["project/feature"][1] is None
@@ -0,0 +1,127 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+
+import pyarrow as pa
+import pytest
+
+from feast.loaders.pipeline import IngestionPipeline
+
+
+def _tables(count, rows=3):
+    return [
+        pa.Table.from_arrays(
+            [pa.array(range(i * rows, (i + 1) * rows))], names=["value"]
+        )
+        for i in range(count)
+    ]
+
+
+def _encode(tables):
+    for table in tables:
+        yield [str(value).encode() for value in table.column("value").to_pylist()]
+
+
+class Recorder:
+    def __init__(self):
+        self.produced = []
+        self.flushed_at = []
+
+    def produce(self, value):
+        self.produced.append(value)
+
+    def flush(self):
+        self.flushed_at.append(len(self.produced))
+
+
+class TestIngestionPipeline:
+    def test_produces_rows_in_order_and_flushes_at_end(self):
+        recorder = Recorder()
+        pipeline = IngestionPipeline(
+            _tables(5), _encode, recorder.produce, recorder.flush
+        )
+
+        assert pipeline.run() == 15
+        assert recorder.produced == [str(i).encode() for i in range(15)]
+        assert recorder.flushed_at == [15]
+        assert pipeline.timings["read"].chunks == 5
+        assert pipeline.timings["encode"].chunks == 5
+        assert pipeline.timings["produce"].chunks == 5
+        assert pipeline.timings["flush"].chunks == 1
+
+    def test_flushes_at_checkpoints(self):
+        recorder = Recorder()
+        pipeline = IngestionPipeline(
+            _tables(5), _encode, recorder.produce, recorder.flush, checkpoint_rows=5
+        )
+
+        pipeline.run()
+
+        assert recorder.flushed_at == [6, 12, 15]
+
+    def test_backpressure_bounds_chunks_in_flight(self):
+        read = []
+        recorder = Recorder()
+
+        def tables():
+            for table in _tables(20):
+                read.append(table)
+                yield table
+
+        def slow_produce(value):
+            # Rows read but not yet produced can only be held by the two
+            # queues and the three stages
+            assert len(read) * 3 - len(recorder.produced) <= 3 * (2 + 3)
+            time.sleep(0.001)
+            recorder.produce(value)
+
+        pipeline = IngestionPipeline(
+            tables(), _encode, slow_produce, recorder.flush, max_in_flight_chunks=1
+        )
+
+        assert pipeline.run() == 60
+        assert pipeline.timings["read"].output_wait_seconds > 0
+
+    @pytest.mark.parametrize("stage", ["read", "encode", "produce"])
+    def test_errors_stop_the_pipeline(self, stage):
+        recorder = Recorder()
+
+        def tables():
+            yield from _tables(2)
+            if stage == "read":
+                raise IOError("read failed")
+            yield from _tables(100)
+
+        def encode(tables):
+            for chunk in _encode(tables):
+                if stage == "encode":
+                    raise ValueError("encode failed")
+                yield chunk
+
+        def produce(value):
+            if stage == "produce":
+                raise RuntimeError("produce failed")
+            recorder.produce(value)
+
+        pipeline = IngestionPipeline(tables(), encode, produce, recorder.flush)
+
+        with pytest.raises((IOError, ValueError, RuntimeError), match=stage):
+            pipeline.run()
+        assert recorder.flushed_at == []
+        assert not [
+            thread
+            for thread in threading.enumerate()
+            if thread.name.startswith("feast-ingest")
+        ]
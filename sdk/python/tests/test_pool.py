@@ -0,0 +1,146 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import errno
+import os
+
+import dataframes
+import pyarrow as pa
+import pytest
+
+import feast.loaders.pool
+from feast.loaders.encoder import encode_pa_table
+from feast.loaders.pool import EncodingPool
+from feast.value_type import ValueType
+
+FEATURE_SET_REF = "project/all_types:1"
+INGESTION_ID = "3f5bd7a2-aa8f-3f1c-a2f0-8a83e5d54d4b"
+
+FIELDS = {
+    "user_id": ValueType.INT64,
+    "int32_feature": ValueType.INT32,
+    "float_feature": ValueType.FLOAT,
+    "string_feature": ValueType.STRING,
+    "bytes_feature": ValueType.BYTES,
+    "int64_list_feature": ValueType.INT64_LIST,
+    "string_list_feature": ValueType.STRING_LIST,
+}
+
+
+@pytest.fixture
+def table():
+    return pa.Table.from_pandas(dataframes.ALL_TYPES)
+
+
+@pytest.fixture
+def pool():
+    with EncodingPool(2) as pool:
+        yield pool
+
+
+class TestEncodingPool:
+    def test_imap_matches_encoder(self, pool, table):
+        tables = [table.slice(offset, 1) for offset in range(table.num_rows)] + [
+            table.slice(0, 0)
+        ]
+
+        chunks = list(
+            pool.imap(tables, FEATURE_SET_REF, FIELDS, INGESTION_ID, max_in_flight=2)
+        )
+
+        assert chunks == [
+            encode_pa_table(t, FEATURE_SET_REF, FIELDS, INGESTION_ID) for t in tables
+        ]
+
+    def test_workers_are_reused(self, pool, table):
+        list(pool.imap([table], FEATURE_SET_REF, FIELDS, INGESTION_ID))
+        workers = pool._pool
+
+        list(pool.imap([table], FEATURE_SET_REF, FIELDS, INGESTION_ID))
+
+        assert pool._pool is workers
+        assert os.listdir(pool._dir_path) == []
+
+    def test_close_removes_shared_memory(self, table):
+        pool = EncodingPool(1)
+        list(pool.imap([table], FEATURE_SET_REF, FIELDS, INGESTION_ID))
+        dir_path = pool._dir_path
+
+        pool.close()
+
+        assert pool.closed
+        assert not os.path.exists(dir_path)
+
+        # The pool is started again when it is used next
+        assert len(list(pool.imap([table], FEATURE_SET_REF, FIELDS, INGESTION_ID))) == 1
+        pool.close()
+
+    def test_worker_errors_are_raised(self, pool, table):
+        with pytest.raises(KeyError):
+            list(
+                pool.imap(
+                    [table], FEATURE_SET_REF, {"missing": ValueType.INT64}, INGESTION_ID
+                )
+            )
+        assert os.listdir(pool._dir_path) == []
+
+    def test_staging_dir(self, table, tmp_path):
+        with EncodingPool(1, staging_dir=str(tmp_path)) as pool:
+            chunks = list(pool.imap([table], FEATURE_SET_REF, FIELDS, INGESTION_ID))
+
+            assert os.path.dirname(pool._dir_path) == str(tmp_path)
+            assert os.listdir(pool._dir_path) == []
+        assert chunks == [encode_pa_table(table, FEATURE_SET_REF, FIELDS, INGESTION_ID)]
+
+    def test_tables_too_large_for_staging_dir(self, table, tmp_path, mocker):
+        mocker.patch(
+            "feast.loaders.pool.shutil.disk_usage", return_value=mocker.Mock(free=0)
+        )
+        write_table = mocker.spy(feast.loaders.pool, "_write_table")
+        with EncodingPool(1, staging_dir=str(tmp_path)) as pool:
+            chunks = list(pool.imap([table], FEATURE_SET_REF, FIELDS, INGESTION_ID))
+
+            # The table is not even tried to be written to the staging dir
+            (_, path), _ = write_table.call_args
+            assert os.path.dirname(path) == pool._fallback_dir_path
+        assert chunks == [encode_pa_table(table, FEATURE_SET_REF, FIELDS, INGESTION_ID)]
+
+    def test_staging_dir_out_of_space(self, table, tmp_path, mocker):
+        staging_dir = str(tmp_path)
+
+        def out_of_space(write, path_arg):
+            def write_or_fail(*args):
+                if args[path_arg].startswith(staging_dir):
+                    raise OSError(errno.ENOSPC, "No space left on device")
+                return write(*args)
+
+            return write_or_fail
+
+        # Workers are forked from this process, so they are patched too
+        mocker.patch.object(
+            feast.loaders.pool,
+            "_write_table",
+            side_effect=out_of_space(feast.loaders.pool._write_table, 1),
+        )
+        mocker.patch.object(
+            feast.loaders.pool,
+            "_write_rows",
+            side_effect=out_of_space(feast.loaders.pool._write_rows, 0),
+        )
+        with EncodingPool(1, staging_dir=staging_dir) as pool:
+            chunks = list(pool.imap([table], FEATURE_SET_REF, FIELDS, INGESTION_ID))
+
+            assert feast.loaders.pool._write_table.call_count == 2
+            assert os.listdir(pool._dir_path) == []
+            assert os.listdir(pool._fallback_dir_path) == []
+        assert chunks == [encode_pa_table(table, FEATURE_SET_REF, FIELDS, INGESTION_ID)]
@@ -0,0 +1,101 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+from mock import patch
+
+from feast.loaders.abstract_producer import (
+    BatchingOptions,
+    ConfluentProducer,
+    KafkaPythonProducer,
+)
+
+
+class TestBatchingOptions:
+    def test_confluent_config(self):
+        options = BatchingOptions(linger_ms=5, batch_size=1024, compression="gzip")
+
+        assert options.to_confluent_config() == {
+            "linger.ms": 5,
+            "batch.size": 1024,
+            "compression.codec": "gzip",
+        }
+
+    def test_kafka_python_config(self):
+        assert BatchingOptions(compression="none").to_kafka_python_config() == {
+            "linger_ms": 50,
+            "batch_size": 1048576,
+            "compression_type": None,
+        }
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"compression": "brotli"}, {"poll_every": 0}],
+    )
+    def test_invalid_options(self, kwargs):
+        with pytest.raises(ValueError):
+            BatchingOptions(**kwargs)
+
+
+class TestConfluentProducer:
+    @patch("confluent_kafka.Producer")
+    def test_polls_after_every_message_by_default(self, mocked_producer):
+        producer = ConfluentProducer("kafka:9092", 3, True)
+        for _ in range(3):
+            producer.produce("topic", b"row")
+
+        mocked_producer.assert_called_with({"bootstrap.servers": "kafka:9092"})
+        assert mocked_producer.return_value.poll.call_count == 3
+
+    @patch("confluent_kafka.Producer")
+    def test_batching_polls_every_n_messages(self, mocked_producer):
+        batching = BatchingOptions(linger_ms=10, compression="lz4", poll_every=4)
+        producer = ConfluentProducer("kafka:9092", 10, True, batching)
+        for _ in range(10):
+            producer.produce("topic", b"row")
+
+        mocked_producer.assert_called_with(
+            {
+                "bootstrap.servers": "kafka:9092",
+                "linger.ms": 10,
+                "batch.size": 1048576,
+                "compression.codec": "lz4",
+            }
+        )
+        assert mocked_producer.return_value.produce.call_count == 10
+        assert mocked_producer.return_value.poll.call_count == 2
+
+    @patch("confluent_kafka.Producer")
+    def test_retries_when_queue_is_full(self, mocked_producer):
+        mocked_producer.return_value.produce.side_effect = [BufferError(), None]
+        producer = ConfluentProducer("kafka:9092", 1, True, BatchingOptions())
+
+        producer.produce("topic", b"row")
+
+        assert mocked_producer.return_value.produce.call_count == 2
+        mocked_producer.return_value.poll.assert_called_once_with(1)
+        assert producer.error_count == 0
+
+
+class TestKafkaPythonProducer:
+    @patch("kafka.KafkaProducer")
+    def test_batching_options(self, mocked_producer):
+        KafkaPythonProducer(
+            "kafka:9092", 1, True, BatchingOptions(linger_ms=20, compression="gzip")
+        )
+
+        mocked_producer.assert_called_with(
+            bootstrap_servers=["kafka:9092"],
+            linger_ms=20,
+            batch_size=1048576,
+            compression_type="gzip",
+        )
@@ -0,0 +1,374 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import threading
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import fastavro
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from feast.job import RetrievalJob
+from feast.loaders.retrieval import (
+    BlobStream,
+    LocalStorageClient,
+    RetrievalReader,
+    avro_to_arrow_schema,
+    prefetch,
+)
+from feast.serving.ServingService_pb2 import DATA_FORMAT_AVRO, JOB_STATUS_DONE
+from feast.serving.ServingService_pb2 import Job as JobProto
+
+SCHEMA = fastavro.parse_schema(
+    {
+        "type": "record",
+        "name": "result",
+        "fields": [
+            {"name": "customer_id", "type": "long"},
+            {"name": "feature_1", "type": ["null", "double"]},
+        ],
+    }
+)
+
+
+@pytest.fixture
+def avro_files(tmp_path):
+    """
+    Writes three Avro files into the directory of the "bucket" bucket and
+    returns their gs:// URIs, their records and the storage root.
+    """
+    uris, records = [], []
+    os.makedirs(tmp_path / "bucket" / "result")
+    for file_idx in range(3):
+        file_records = [
+            {"customer_id": file_idx * 1000 + i, "feature_1": i / 2 if i % 3 else None}
+            for i in range(1000)
+        ]
+        path = tmp_path / "bucket" / "result" / f"part-{file_idx}.avro"
+        with open(path, "wb") as file:
+            fastavro.writer(file, SCHEMA, file_records, sync_interval=1024)
+        uris.append(f"gs://bucket/result/part-{file_idx}.avro")
+        records.extend(file_records)
+    return uris, records, str(tmp_path)
+
+
+class BlockingStorageClient(LocalStorageClient):
+    """
+    Local storage client whose downloads wait for a barrier before writing,
+    so they only proceed if enough of them run concurrently.
+    """
+
+    def __init__(self, root, parties):
+        super().__init__(root, chunk_size=512)
+        self.barrier = threading.Barrier(parties, timeout=10)
+
+    def download_blob_to_file(self, blob_or_uri, file_obj):
+        self.barrier.wait()
+        super().download_blob_to_file(blob_or_uri, file_obj)
+
+
+class TestRetrievalReader:
+    def test_reads_files_in_order(self, avro_files):
+        uris, records, root = avro_files
+        # Mix in a local file, which is read without downloading it
+        uris[1] = f"file://{root}/bucket/result/part-1.avro"
+
+        reader = RetrievalReader(
+            uris, LocalStorageClient(root, chunk_size=100), max_workers=2
+        )
+
+        assert list(reader) == records
+
+    def test_downloads_files_concurrently(self, avro_files):
+        uris, records, root = avro_files
+
+        reader = RetrievalReader(uris, BlockingStorageClient(root, 3), max_workers=3)
+
+        assert list(reader) == records
+
+    def test_reads_while_downloading(self, avro_files):
+        uris, records, root = avro_files
+        first_record_read = threading.Event()
+
+        class StreamingStorageClient(LocalStorageClient):
+            def download_blob_to_file(self, blob_or_uri, file_obj):
+                with open(os.path.join(root, "bucket/result/part-0.avro"), "rb") as f:
+                    data = f.read()
+                file_obj.write(data[: len(data) // 2])
+                # The rest only arrives after the reader parsed a record
+                assert first_record_read.wait(10)
+                file_obj.write(data[len(data) // 2 :])
+
+        reader = iter(RetrievalReader(uris[:1], StreamingStorageClient(root)))
+
+        assert next(reader) == records[0]
+        first_record_read.set()
+        assert list(reader) == records[1:1000]
+
+    def test_download_error_is_raised(self, avro_files):
+        uris, _, root = avro_files
+        uris[1] = "gs://bucket/result/missing.avro"
+
+        reader = iter(RetrievalReader(uris, LocalStorageClient(root)))
+
+        assert len([next(reader) for _ in range(1000)]) == 1000
+        with pytest.raises(FileNotFoundError):
+            next(reader)
+
+    def test_closing_stops_downloads(self, avro_files):
+        uris, records, root = avro_files
+        streams = []
+
+        class RecordingStorageClient(LocalStorageClient):
+            def download_blob_to_file(self, blob_or_uri, file_obj):
+                streams.append(file_obj)
+                super().download_blob_to_file(blob_or_uri, file_obj)
+
+        reader = iter(
+            RetrievalReader(
+                uris, RecordingStorageClient(root, chunk_size=64), max_buffered_bytes=64
+            )
+        )
+        assert next(reader) == records[0]
+        reader.close()
+
+        assert streams and all(stream.closed for stream in streams)
+
+    def test_record_batches(self, avro_files):
+        uris, records, root = avro_files
+        reader = RetrievalReader(uris, LocalStorageClient(root))
+
+        batches = list(reader.record_batches(batch_size=700))
+
+        # Batches span files, and are made of many Avro blocks
+        assert [batch.num_rows for batch in batches] == [700] * 4 + [200]
+        assert batches[0].schema == pa.schema(
+            [
+                pa.field("customer_id", pa.int64(), nullable=False),
+                pa.field("feature_1", pa.float64()),
+            ]
+        )
+        assert pa.Table.from_batches(batches).to_pylist() == records
+
+    def test_record_batches_without_records(self, tmp_path):
+        path = tmp_path / "empty.avro"
+        with open(path, "wb") as file:
+            fastavro.writer(file, SCHEMA, [])
+
+        table = RetrievalReader([f"file://{path}"], None).to_arrow()
+
+        assert table.num_rows == 0
+        assert table.schema.names == ["customer_id", "feature_1"]
+
+    def test_unsupported_uri(self):
+        with pytest.raises(Exception, match="Only gs:// and file:// supported"):
+            RetrievalReader(["s3://bucket/result.avro"], None)
+
+
+class TestPrefetch:
+    def test_prefetches_items_on_a_thread(self):
+        produced = []
+
+        def items():
+            for i in range(5):
+                produced.append(threading.current_thread())
+                yield i
+
+        assert list(prefetch(items(), 2)) == list(range(5))
+        assert threading.current_thread() not in produced
+
+    def test_stays_max_prefetched_ahead(self):
+        produced = threading.Semaphore(0)
+        count = []
+
+        def items():
+            for i in range(100):
+                count.append(i)
+                produced.release()
+                yield i
+
+        iterator = prefetch(items(), 2)
+        assert next(iterator) == 0
+        # One item was consumed, two are queued and one waits to be queued
+        for _ in range(4):
+            assert produced.acquire(timeout=10)
+        assert not produced.acquire(timeout=0.2)
+        iterator.close()
+        assert len(count) == 4
+
+    def test_error_is_raised_to_consumer(self):
+        def items():
+            yield 1
+            raise ValueError("Decoding failed")
+
+        iterator = prefetch(items(), 1)
+
+        assert next(iterator) == 1
+        with pytest.raises(ValueError, match="Decoding failed"):
+            next(iterator)
+
+
+class TestBlobStream:
+    def test_write_blocks_while_buffer_is_full(self):
+        stream = BlobStream(max_buffered_bytes=4)
+        stream.write(b"abc")
+        writer = threading.Thread(target=stream.write, args=(b"de",))
+        writer.start()
+
+        writer.join(0.1)
+        assert writer.is_alive()
+        assert stream.read(2) == b"ab"
+        writer.join(10)
+        stream.finish()
+        assert stream.readall() == b"cde"
+
+
+def test_avro_to_arrow_schema():
+    avro_schema = fastavro.parse_schema(
+        {
+            "type": "record",
+            "name": "result",
+            "namespace": "feast",
+            "fields": [
+                {
+                    "name": "event_timestamp",
+                    "type": {"type": "long", "logicalType": "timestamp-micros"},
+                },
+                {"name": "ids", "type": {"type": "array", "items": "int"}},
+                {
+                    "name": "location",
+                    "type": {
+                        "type": "record",
+                        "name": "location",
+                        "fields": [{"name": "city", "type": ["null", "string"]}],
+                    },
+                },
+                {"name": "previous_location", "type": ["null", "feast.location"]},
+                {
+                    "name": "status",
+                    "type": {"type": "enum", "name": "status", "symbols": ["A"]},
+                },
+                {
+                    "name": "price",
+                    "type": {
+                        "type": "bytes",
+                        "logicalType": "decimal",
+                        "precision": 5,
+                        "scale": 2,
+                    },
+                },
+            ],
+        }
+    )
+    location = pa.struct([pa.field("city", pa.string())])
+
+    schema = avro_to_arrow_schema(avro_schema)
+
+    assert schema == pa.schema(
+        [
+            pa.field("event_timestamp", pa.timestamp("us", tz="UTC"), nullable=False),
+            pa.field("ids", pa.list_(pa.int32()), nullable=False),
+            pa.field("location", location, nullable=False),
+            pa.field("previous_location", location),
+            pa.field("status", pa.string(), nullable=False),
+            pa.field("price", pa.decimal128(5, 2), nullable=False),
+        ]
+    )
+    record = {
+        "event_timestamp": datetime(2020, 1, 1, tzinfo=timezone.utc),
+        "ids": [1, 2],
+        "location": {"city": "jakarta"},
+        "previous_location": None,
+        "status": "A",
+        "price": Decimal("1.50"),
+    }
+    assert pa.RecordBatch.from_pylist([record], schema=schema).to_pylist() == [record]
+
+
+class TestRetrievalJob:
+    @pytest.fixture
+    def job(self, avro_files):
+        uris, _, root = avro_files
+        job_proto = JobProto(
+            id="job",
+            status=JOB_STATUS_DONE,
+            file_uris=uris,
+            data_format=DATA_FORMAT_AVRO,
+        )
+        return RetrievalJob(job_proto, None, storage_client=LocalStorageClient(root))
+
+    def test_result(self, job, avro_files):
+        assert list(job.result()) == avro_files[1]
+
+    def test_to_arrow(self, job, avro_files):
+        table = job.to_arrow()
+
+        assert table.num_rows == 3000
+        assert table.to_pylist() == avro_files[1]
+
+    def test_to_dataframe(self, job, avro_files):
+        expected = pd.DataFrame.from_records(avro_files[1])
+
+        pd.testing.assert_frame_equal(job.to_dataframe(), expected)
+
+    @pytest.mark.parametrize("prefetch_chunks", [0, 2])
+    @pytest.mark.parametrize(
+        "max_chunk_size,chunk_sizes",
+        [(700, [700] * 4 + [200]), (1000, [1000] * 3), (-1, [3000])],
+    )
+    def test_to_chunked_dataframe(
+        self, job, avro_files, max_chunk_size, chunk_sizes, prefetch_chunks
+    ):
+        chunks = list(
+            job.to_chunked_dataframe(
+                max_chunk_size=max_chunk_size, prefetch_chunks=prefetch_chunks
+            )
+        )
+
+        assert [len(chunk) for chunk in chunks] == chunk_sizes
+        pd.testing.assert_frame_equal(
+            pd.concat(chunks, ignore_index=True),
+            pd.DataFrame.from_records(avro_files[1]),
+        )
+
+    def test_to_chunked_arrow(self, job, avro_files):
+        chunks = list(job.to_chunked_arrow(max_chunk_size=1200, prefetch_chunks=1))
+
+        assert [chunk.num_rows for chunk in chunks] == [1200, 1200, 600]
+        assert pa.Table.from_batches(chunks).to_pylist() == avro_files[1]
+
+    def test_to_chunked_dataframe_without_records(self, tmp_path):
+        path = tmp_path / "empty.avro"
+        with open(path, "wb") as file:
+            fastavro.writer(file, SCHEMA, [])
+        job_proto = JobProto(
+            id="job",
+            status=JOB_STATUS_DONE,
+            file_uris=[f"file://{path}"],
+            data_format=DATA_FORMAT_AVRO,
+        )
+        job = RetrievalJob(job_proto, None, storage_client=LocalStorageClient(""))
+
+        assert list(job.to_chunked_dataframe(max_chunk_size=10)) == []
+
+    def test_to_parquet(self, job, avro_files, tmp_path):
+        path = str(tmp_path / "result.parquet")
+
+        job.to_parquet(path, row_group_size=1000)
+
+        assert pq.ParquetFile(path).num_row_groups == 3
+        assert pq.read_table(path).to_pylist() == avro_files[1]
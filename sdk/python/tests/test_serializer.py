@@ -0,0 +1,193 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from feast.loaders.serializer import ColumnBuffer, FeatureRowSerializer
+from feast.types import Field_pb2 as FieldProto
+from feast.types import Value_pb2 as ValueProto
+from feast.types.FeatureRow_pb2 import FeatureRow
+from feast.value_type import ValueType
+
+FEATURE_SET_REF = "project/driver:1"
+INGESTION_ID = "3f5bd7a2-aa8f-3f1c-a2f0-8a83e5d54d4b"
+
+SECONDS = np.array([1577880000, 0, -86400, 1577880001])
+NANOS = np.array([123000, 5, 0, 0])
+
+
+def _binary(values, validity=None):
+    encoded = [v.encode("utf-8") if isinstance(v, str) else v for v in values]
+    offsets = np.cumsum([0] + [len(v) for v in encoded])
+    return ColumnBuffer(
+        values=np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        value_offsets=offsets,
+        validity=validity,
+    )
+
+
+def _list(column, lists, validity=None):
+    return column._replace(
+        list_offsets=np.cumsum([0] + [len(v) for v in lists]), validity=validity
+    )
+
+
+# Columns of four rows together with the Value protos they should decode to
+COLUMNS = {
+    "int32": (
+        ValueType.INT32,
+        ColumnBuffer(np.array([0, -1, 2 ** 31 - 1, 7], dtype=np.int32)),
+        [ValueProto.Value(int32_val=v) for v in [0, -1, 2 ** 31 - 1, 7]],
+    ),
+    "int64": (
+        ValueType.INT64,
+        ColumnBuffer(
+            np.array([-(2 ** 63), 300, 0, 9], dtype=np.int64),
+            validity=np.array([True, True, True, False]),
+        ),
+        [ValueProto.Value(int64_val=v) for v in [-(2 ** 63), 300, 0]]
+        + [ValueProto.Value()],
+    ),
+    "float": (
+        ValueType.FLOAT,
+        ColumnBuffer(np.array([0.0, -1.5, 0.25, 3.0], dtype=np.float32)),
+        [ValueProto.Value(float_val=v) for v in [0.0, -1.5, 0.25, 3.0]],
+    ),
+    "double": (
+        ValueType.DOUBLE,
+        ColumnBuffer(np.array([1e308, -0.5, 0.0, 2.0])),
+        [ValueProto.Value(double_val=v) for v in [1e308, -0.5, 0.0, 2.0]],
+    ),
+    "bool": (
+        ValueType.BOOL,
+        ColumnBuffer(
+            np.array([True, False, True, False]),
+            validity=np.array([True, True, False, True]),
+        ),
+        [
+            ValueProto.Value(bool_val=True),
+            ValueProto.Value(bool_val=False),
+            ValueProto.Value(),
+            ValueProto.Value(bool_val=False),
+        ],
+    ),
+    "string": (
+        ValueType.STRING,
+        _binary(["", "ünïcödé", "x" * 300, "null"], np.array([1, 1, 1, 0], bool)),
+        [ValueProto.Value(string_val=v) for v in ["", "ünïcödé", "x" * 300]]
+        + [ValueProto.Value()],
+    ),
+    "bytes": (
+        ValueType.BYTES,
+        _binary([b"\x00\xff", b"", b"y" * 200, b"z"]),
+        [ValueProto.Value(bytes_val=v) for v in [b"\x00\xff", b"", b"y" * 200, b"z"]],
+    ),
+    "int64_list": (
+        ValueType.INT64_LIST,
+        _list(
+            ColumnBuffer(np.array([1, -2, 3, 4, 5], dtype=np.int64)),
+            [[1, -2], [], [3], [4, 5]],
+            np.array([True, True, True, False]),
+        ),
+        [
+            ValueProto.Value(int64_list_val=ValueProto.Int64List(val=v))
+            for v in [[1, -2], [], [3], []]
+        ],
+    ),
+    "double_list": (
+        ValueType.DOUBLE_LIST,
+        _list(ColumnBuffer(np.array([0.5, 1.5])), [[], [0.5], [], [1.5]]),
+        [
+            ValueProto.Value(double_list_val=ValueProto.DoubleList(val=v))
+            for v in [[], [0.5], [], [1.5]]
+        ],
+    ),
+    "string_list": (
+        ValueType.STRING_LIST,
+        _list(_binary(["a", "", "ü" * 100]), [["a", ""], [], ["ü" * 100], []]),
+        [
+            ValueProto.Value(string_list_val=ValueProto.StringList(val=v))
+            for v in [["a", ""], [], ["ü" * 100], []]
+        ],
+    ),
+    "bool_list": (
+        ValueType.BOOL_LIST,
+        _list(
+            ColumnBuffer(np.array([True, False, True])),
+            [[True], [False, True], [], []],
+        ),
+        [
+            ValueProto.Value(bool_list_val=ValueProto.BoolList(val=v))
+            for v in [[True], [False, True], [], []]
+        ],
+    ),
+}
+
+
+def _expected_rows(names):
+    rows = []
+    for row_idx in range(len(SECONDS)):
+        feature_row = FeatureRow(
+            event_timestamp=Timestamp(
+                seconds=int(SECONDS[row_idx]), nanos=int(NANOS[row_idx])
+            ),
+            feature_set=FEATURE_SET_REF,
+            ingestion_id=INGESTION_ID,
+        )
+        for name in names:
+            feature_row.fields.extend(
+                [FieldProto.Field(name=name, value=COLUMNS[name][2][row_idx])]
+            )
+        rows.append(feature_row)
+    return rows
+
+
+class TestFeatureRowSerializer:
+    @pytest.mark.parametrize("names", [[name] for name in COLUMNS] + [list(COLUMNS)])
+    def test_round_trip(self, names):
+        serializer = FeatureRowSerializer(
+            FEATURE_SET_REF, {name: COLUMNS[name][0] for name in names}, INGESTION_ID
+        )
+        serialized = serializer.serialize(
+            {name: COLUMNS[name][1] for name in names}, SECONDS, NANOS
+        )
+        expected = _expected_rows(names)
+
+        assert [FeatureRow.FromString(row) for row in serialized] == expected
+        assert serialized == [row.SerializeToString() for row in expected]
+
+    def test_serializer_is_reusable(self):
+        serializer = FeatureRowSerializer(
+            FEATURE_SET_REF, {"int32": ValueType.INT32}, INGESTION_ID
+        )
+        columns = {"int32": COLUMNS["int32"][1]}
+
+        assert serializer.serialize(columns, SECONDS, NANOS) == serializer.serialize(
+            columns, SECONDS, NANOS
+        )
+        assert (
+            serializer.serialize(
+                {"int32": ColumnBuffer(np.array([], dtype=np.int32))},
+                SECONDS[:0],
+                NANOS[:0],
+            )
+            == []
+        )
+
+    def test_unsupported_value_type(self):
+        with pytest.raises(ValueError):
+            FeatureRowSerializer(
+                FEATURE_SET_REF, {"unknown": ValueType.UNKNOWN}, INGESTION_ID
+            )
@@ -0,0 +1,161 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+from datetime import datetime
+from types import SimpleNamespace
+from urllib.parse import urlparse
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+import feast.loaders.file
+import feast.loaders.staging_cache
+from feast.loaders.staging_cache import StagingCache, hash_entity_rows
+
+
+@pytest.fixture
+def entity_rows():
+    return pd.DataFrame(
+        {
+            "datetime": [datetime(2020, 1, 1, tzinfo=pytz.utc)] * 10,
+            "customer_id": np.arange(10, dtype=np.int64),
+        }
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return StagingCache(str(tmp_path / "manifest" / "staging_manifest.json"))
+
+
+@pytest.fixture
+def export(mocker):
+    return mocker.spy(feast.loaders.staging_cache, "export_source_to_staging_location")
+
+
+class TestHashEntityRows:
+    def test_same_rows_same_hash(self, entity_rows):
+        assert hash_entity_rows(entity_rows) == hash_entity_rows(entity_rows.copy())
+
+    def test_values_names_and_types_change_hash(self, entity_rows):
+        digests = {
+            hash_entity_rows(entity_rows),
+            hash_entity_rows(entity_rows.assign(customer_id=np.arange(1, 11))),
+            hash_entity_rows(entity_rows.rename(columns={"customer_id": "driver_id"})),
+            hash_entity_rows(entity_rows.astype({"customer_id": np.int32})),
+            hash_entity_rows(entity_rows.iloc[::-1]),
+        }
+
+        assert len(digests) == 5
+
+    def test_unhashable_values(self, entity_rows):
+        assert hash_entity_rows(entity_rows.assign(ids=[[1]] * 10)) is None
+
+
+class TestStagingCache:
+    def test_reuses_staged_files(self, entity_rows, cache, export, tmp_path):
+        staging_location = f"file://{tmp_path}/staging/"
+        os.makedirs(tmp_path / "staging")
+
+        first = cache.stage(entity_rows, staging_location)
+        second = cache.stage(entity_rows.copy(), staging_location)
+
+        assert first == second
+        assert export.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+        digest = hash_entity_rows(entity_rows)
+        assert first == [f"{staging_location}entities_{digest}.avro"]
+        with open(cache.manifest_path) as file:
+            entries = json.load(file)["entries"]
+        assert entries[f"file://{tmp_path}/staging/{digest}"]["files"] == first
+
+    def test_manifest_is_shared(self, entity_rows, cache, export, tmp_path):
+        staging_location = f"file://{tmp_path}/"
+        cache.stage(entity_rows, staging_location)
+
+        other = StagingCache(cache.manifest_path)
+        other.stage(entity_rows, staging_location)
+
+        assert export.call_count == 1
+        assert other.hits == 1
+
+    def test_restages_missing_files(self, entity_rows, cache, export, tmp_path):
+        staging_location = f"file://{tmp_path}/"
+        (staged_file,) = cache.stage(entity_rows, staging_location)
+        os.remove(urlparse(staged_file).path)
+
+        assert cache.stage(entity_rows, staging_location) == [staged_file]
+        assert export.call_count == 2
+        assert os.path.exists(urlparse(staged_file).path)
+
+    def test_different_rows_or_location(self, entity_rows, cache, export, tmp_path):
+        os.makedirs(tmp_path / "other")
+
+        cache.stage(entity_rows, f"file://{tmp_path}/")
+        cache.stage(entity_rows.head(5), f"file://{tmp_path}/")
+        cache.stage(entity_rows, f"file://{tmp_path}/other/")
+
+        assert export.call_count == 3
+        assert cache.hits == 0
+
+    def test_unhashable_rows_are_staged(self, entity_rows, cache, export, tmp_path):
+        entity_rows["ids"] = [[1]] * 10
+
+        cache.stage(entity_rows, f"file://{tmp_path}/")
+        cache.stage(entity_rows, f"file://{tmp_path}/")
+
+        assert export.call_count == 2
+        assert not os.path.exists(cache.manifest_path)
+
+    def test_max_entries(self, entity_rows, tmp_path):
+        cache = StagingCache(str(tmp_path / "manifest.json"), max_entries=2)
+
+        for rows in range(1, 4):
+            cache.record(f"gs://bucket/{rows}", "digest", [f"gs://bucket/{rows}/a"])
+
+        assert cache.lookup("gs://bucket/1", "digest") is None
+        assert cache.lookup("gs://bucket/3/", "digest") == ["gs://bucket/3/a"]
+
+    def test_gcs_staging_location(self, entity_rows, cache, mocker):
+        uploaded = set()
+
+        def upload_file_to_gcs(local_path, bucket, remote_path):
+            uploaded.add(remote_path)
+
+        def list_blobs(bucket, prefix):
+            return [
+                SimpleNamespace(name=name)
+                for name in uploaded
+                if name.startswith(prefix)
+            ]
+
+        mocker.patch.object(
+            feast.loaders.file, "upload_file_to_gcs", side_effect=upload_file_to_gcs
+        )
+        storage_client = mocker.patch.object(
+            feast.loaders.staging_cache.storage, "Client"
+        )
+        storage_client.return_value.list_blobs.side_effect = list_blobs
+
+        files = cache.stage(entity_rows, "gs://bucket/staging/", num_shards=2)
+        assert cache.stage(entity_rows, "gs://bucket/staging/") == files
+        assert len(files) == 2 and cache.hits == 1
+
+        # Files removed by the retention policy of the bucket are uploaded again
+        uploaded.clear()
+        assert cache.stage(entity_rows, "gs://bucket/staging/", num_shards=2) == files
+        assert len(uploaded) == 2 and cache.misses == 2
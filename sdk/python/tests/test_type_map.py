@@ -0,0 +1,154 @@
+# Copyright 2020 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from feast.entity import Entity
+from feast.feature_set import Feature, FeatureSet
+from feast.type_map import (
+    _python_value_to_proto_value,
+    convert_df_to_feature_row_protos,
+    convert_dict_to_proto_values,
+    pa_column_to_proto_column,
+)
+from feast.types.Value_pb2 import Value as ProtoValue
+from feast.value_type import ValueType
+
+
+@pytest.fixture
+def feature_set():
+    feature_set = FeatureSet(
+        "driver",
+        project="project",
+        entities=[Entity(name="driver_id", dtype=ValueType.INT64)],
+        features=[
+            Feature(name="trips", dtype=ValueType.INT32),
+            Feature(name="completed", dtype=ValueType.INT64),
+            Feature(name="rating", dtype=ValueType.FLOAT),
+            Feature(name="earnings", dtype=ValueType.DOUBLE),
+            Feature(name="active", dtype=ValueType.BOOL),
+            Feature(name="city", dtype=ValueType.STRING),
+            Feature(name="scores", dtype=ValueType.FLOAT_LIST),
+        ],
+    )
+    feature_set.version = 2
+    return feature_set
+
+
+def _dataframe(timestamps):
+    rows = len(timestamps)
+    return pd.DataFrame(
+        {
+            "datetime": timestamps,
+            "driver_id": np.arange(rows),
+            "trips": np.arange(rows, dtype=np.int32),
+            "completed": pd.Series(
+                [None if i % 3 == 0 else i for i in range(rows)], dtype="Int64"
+            ),
+            "rating": np.linspace(0, 5, rows, dtype=np.float32),
+            "earnings": [np.nan if i % 2 else i * 1.5 for i in range(rows)],
+            "active": np.arange(rows) % 2 == 0,
+            "city": [None if i % 4 == 0 else f"city_{i}" for i in range(rows)],
+            "scores": [np.arange(i % 3, dtype=np.float32) for i in range(rows)],
+        }
+    )
+
+
+def _convert_row_by_row(df, feature_set):
+    feature_rows = []
+    for row_idx in range(len(df)):
+        # Values with the types of their column, except booleans which are
+        # only accepted as Python booleans
+        row = {name: df[name].iloc[row_idx] for name in df.columns}
+        row["active"] = bool(row["active"])
+        feature_rows.append(
+            convert_dict_to_proto_values(row, df["datetime"].dtype, feature_set)
+        )
+    return feature_rows
+
+
+class TestConvertDfToFeatureRowProtos:
+    @pytest.mark.parametrize(
+        "timestamps",
+        [
+            pd.date_range("1969-12-31 23:59:58.5", periods=10, freq="333ms"),
+            pd.date_range("2020-01-01", periods=10, freq="333ms", tz="UTC"),
+            pd.date_range("2020-01-01", periods=10, freq="1H", tz="Asia/Jakarta"),
+            np.arange(10) * 1.7,
+        ],
+    )
+    def test_same_as_row_by_row(self, feature_set, timestamps):
+        df = _dataframe(timestamps)
+
+        feature_rows = convert_df_to_feature_row_protos(df, feature_set)
+
+        assert feature_rows == _convert_row_by_row(df, feature_set)
+        assert feature_rows[0].feature_set == "project/driver:2"
+
+    def test_null_timestamps(self, feature_set):
+        df = _dataframe(pd.Series([pd.Timestamp("2020-01-01"), pd.NaT]))
+
+        with pytest.raises(ValueError, match="datetime"):
+            convert_df_to_feature_row_protos(df, feature_set)
+
+    def test_empty_dataframe(self, feature_set):
+        df = _dataframe(pd.date_range("2020-01-01", periods=0, tz="UTC"))
+
+        assert convert_df_to_feature_row_protos(df, feature_set) == []
+
+
+class TestListValues:
+    @pytest.mark.parametrize(
+        "dtype,value_field,array",
+        [
+            (ValueType.FLOAT_LIST, "float_list_val", np.ones(128, np.float32) / 3),
+            (ValueType.DOUBLE_LIST, "double_list_val", np.ones(4, np.float32)),
+            (ValueType.INT32_LIST, "int32_list_val", np.arange(4, dtype=np.int32)),
+            (ValueType.INT64_LIST, "int64_list_val", np.arange(4, dtype=np.int32)),
+            (ValueType.STRING_LIST, "string_list_val", np.array(["a", "ü"])),
+            (ValueType.BOOL_LIST, "bool_list_val", np.array([True, False])),
+            (ValueType.BYTES_LIST, "bytes_list_val", np.array([b"a", b"\x00"])),
+        ],
+    )
+    def test_numpy_arrays(self, dtype, value_field, array):
+        proto_value = _python_value_to_proto_value(dtype, array)
+
+        # Same as converting the elements one by one
+        assert proto_value == _python_value_to_proto_value(dtype, list(array))
+        assert list(getattr(proto_value, value_field).val) == array.tolist()
+
+    @pytest.mark.parametrize(
+        "dtype,value",
+        [
+            (ValueType.FLOAT_LIST, np.arange(4)),
+            (ValueType.INT32_LIST, np.arange(4, dtype=np.int64)),
+            (ValueType.STRING_LIST, np.array(["a", 1], dtype=object)),
+            (ValueType.FLOAT_LIST, [np.float32(1), 2.0]),
+        ],
+    )
+    def test_invalid_elements(self, dtype, value):
+        with pytest.raises(ValueError, match="is of type"):
+            _python_value_to_proto_value(dtype, value)
+
+    def test_arrow_list_columns(self):
+        array = pa.array(
+            [[1.5, 2.5], None, [], [3.5], [4.5, 5.5, 6.5]], type=pa.list_(pa.float32())
+        )
+        column = pa.chunked_array([array[2:], array[:0], array[:2]])
+
+        assert pa_column_to_proto_column(ValueType.FLOAT_LIST, column) == [
+            ProtoValue(float_list_val={"val": value.as_py()}) for value in column
+        ]